@@ -0,0 +1,1300 @@
+# CMAKE generated file: DO NOT EDIT!
+# Generated by CMake Version 3.25
+cmake_policy(SET CMP0009 NEW)
+
+# ASSET_FILES at CMakeLists.txt:125 (file)
+file(GLOB_RECURSE NEW_GLOB LIST_DIRECTORIES false "/root/package/procgen/data/assets/*.png")
+set(OLD_GLOB
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set1_background.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set1_hills.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set1_tiles.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set2_background.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set2_hills.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set2_tiles.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set3_background.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set3_hills.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set3_tiles.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set4_background.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set4_hills.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Backgrounds/set4_tiles.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFloating_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFloating_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFloating_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFloating_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlyingAlt_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlyingAlt_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlyingAlt_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlyingAlt_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlying_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlying_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlying_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyFlying_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySpikey_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySpikey_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySpikey_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySpikey_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySwimming_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySwimming_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySwimming_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemySwimming_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyWalking_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyWalking_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyWalking_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Enemies/enemyWalking_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/ .png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/!.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/#.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/$.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/%.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/&.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/=.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/L.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/S.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/^.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/a.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/b.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Blue/default.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/ .png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/!.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/#.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/$.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/%.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/&.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/=.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/L.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/S.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/^.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/a.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/b.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Brown/default.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/ .png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/!.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/#.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/$.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/%.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/&.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/=.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/L.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/S.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/^.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/a.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/b.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Green/default.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/ .png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/!.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/#.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/$.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/%.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/&.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/=.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/L.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/S.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/^.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/a.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/b.png"
+  "/root/package/procgen/data/assets/kenney-abstract/GroundThemes/Yellow/default.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/blueCrystal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/blueGem.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/blueJewel.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/discGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/discRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/greenCrystal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/greenGem.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/greenJewel.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/keyGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/keyRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineCrystal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineDisc.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineDisc_alt.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineGem.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineJewel.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlineKey.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/outlinePuzzle.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/puzzleGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/puzzleRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/redCrystal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/redGem.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/redJewel.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/yellowCrystal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/yellowGem.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Items/yellowJewel.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockBrown.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockBrown_broken.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGreen_key.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGreen_lock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGreen_puzzle.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGrey.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockGrey_broken.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockRed_key.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockRed_lock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/blockRed_puzzle.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonFloor.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonFloor_pressed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonGreen_pressed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/buttonRed_pressed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorGreen_lock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorGreen_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorOpen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorOpen_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorRed_lock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/doorRed_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fence.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fenceBroken.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fenceLeft.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fenceMid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fenceOpen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fenceRight.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/flagGreen_down.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/flagGreen_up.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/flagRed_down.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/flagRed_up.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidBlue.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidBlue_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidBrown.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidBrown_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidGreen_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/fluidRed_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/ladderNarrow_mid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/ladderNarrow_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/ladderWide_mid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/ladderWide_top.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreen.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenBottom.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenLeft.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenLock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenMid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenRight.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockGreenTop.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRed.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedBottom.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedLeft.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedLock.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedMid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedRight.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/lockRedTop.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBlue_6.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBottom_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantBottom_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantDark_6.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantGreen_6.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantLeaves_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantLeaves_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantRed_6.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_Tleft.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_Tright.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_cornerLeft.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_cornerRight.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_cross.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_horizontal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantStem_vertical.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantThorns_horizontal.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantThorns_vertical.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantTop_blue.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantTop_leaves.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantTop_red.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/plantTop_yellow.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_BL.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_BR.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_TL.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_TR.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_down.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_left.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_right.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signArrow_up.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signLarge.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signSmall.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/signpost.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/spikesHigh.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/spikesLow.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchGreen_left.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchGreen_mid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchGreen_off.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchGreen_on.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchGreen_right.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchRed_left.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchRed_mid.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchRed_off.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchRed_on.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/switchRed_right.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/vine.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/vine_bottom.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Other/vine_bottomAlt.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_dead.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_duck.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_fall.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_hit.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_roll.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_stand.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_swim1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_swim2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_switch1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_switch2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_up1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_up2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_up3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_walk1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_walk2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_walk3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_walk4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Blue/playerBlue_walk5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_dead.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_duck.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_fall.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_hit.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_roll.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_stand.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_swim1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_swim2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_switch1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_switch2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_up1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_up2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_up3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_walk1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_walk2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_walk3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_walk4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Green/playerGreen_walk5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_dead.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_duck.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_fall.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_hit.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_roll.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_stand.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_swim1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_swim2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_switch1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_switch2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_up1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_up2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_up3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_walk1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_walk2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_walk3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_walk4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Grey/playerGrey_walk5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_dead.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_duck.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_fall.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_hit.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_roll.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_stand.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_swim1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_swim2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_switch1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_switch2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_up1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_up2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_up3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_walk1.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_walk2.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_walk3.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_walk4.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Players/Player Red/playerRed_walk5.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_01.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_02.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_03.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_04.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_05.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_06.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_07.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_08.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_09.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_10.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_11.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_12.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_13.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_14.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_15.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_16.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_17.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_18.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_19.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_20.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_21.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_22.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_23.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_24.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_25.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_26.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Blue tiles/tileBlue_27.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_01.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_02.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_03.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_04.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_05.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_06.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_07.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_08.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_09.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_10.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_11.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_12.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_13.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_14.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_15.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_16.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_17.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_18.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_19.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_20.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_21.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_22.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_23.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_24.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_25.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_26.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Brown tiles/tileBrown_27.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_01.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_02.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_03.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_04.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_05.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_06.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_07.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_08.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_09.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_10.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_11.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_12.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_13.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_14.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_15.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_16.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_17.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_18.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_19.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_20.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_21.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_22.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_23.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_24.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_25.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_26.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Green tiles/tileGreen_27.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_01.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_02.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_03.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_04.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_05.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_06.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_07.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_08.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_09.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_10.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_11.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_12.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_13.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_14.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_15.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_16.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_17.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_18.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_19.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_20.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_21.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_22.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_23.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_24.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_25.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_26.png"
+  "/root/package/procgen/data/assets/kenney-abstract/Tiles/Yellow tiles/tileYellow_27.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/blue_desert.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/blue_grass.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/blue_land.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/blue_shroom.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/colored_desert.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/colored_grass.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/colored_land.png"
+  "/root/package/procgen/data/assets/kenney/Backgrounds/colored_shroom.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/barnacle.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/barnacle_attack.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/barnacle_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/bee.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/bee_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/bee_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishBlue.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishBlue_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishBlue_fall.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishGreen.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishGreen_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishGreen_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishPink.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishPink_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fishPink_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fly.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fly_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/fly_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/frog.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/frog_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/frog_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/ladybug.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/ladybug_fly.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/ladybug_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/mouse.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/mouse_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/mouse_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/saw.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/sawHalf.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/sawHalf_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/sawHalf_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/saw_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/saw_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlock.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlock_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlock_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlue.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlue_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlue_hit.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeBlue_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeGreen.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeGreen_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeGreen_hit.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimeGreen_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimePurple.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimePurple_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimePurple_hit.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/slimePurple_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/snail.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/snail_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/snail_shell.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormGreen.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormGreen_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormGreen_move.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormPink.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormPink_dead.png"
+  "/root/package/procgen/data/assets/kenney/Enemies/wormPink_move.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirt.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCenter_rounded.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCorner_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Dirt/dirtRight.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grass.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCenter_round.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCorner_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Grass/grassRight.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planet.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCenter_rounded.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCorner_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Planet/planetRight.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sand.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCenter_rounded.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCorner_leftg.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Sand/sandRight.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snow.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCenter_rounded.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCorner_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Snow/snowRight.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stone.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCenter.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCenter_rounded.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCliffAlt_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCliffAlt_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCliff_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCliff_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCorner_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneCorner_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHalf.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHalf_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHalf_mid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHalf_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHill_left.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneHill_right.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneLeft.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneMid.png"
+  "/root/package/procgen/data/assets/kenney/Ground/Stone/stoneRight.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud0.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud1.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud2.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud3.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud4.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud5.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud6.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud7.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud8.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hud9.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudCoin.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudHeart_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudHeart_full.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudHeart_half.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_blue.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_blue_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_green.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_green_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_red.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_red_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_yellow.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudJewel_yellow_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_blue.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_blue_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_green.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_green_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_red.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_red_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_yellow.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudKey_yellow_empty.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudPlayer_beige.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudPlayer_blue.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudPlayer_green.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudPlayer_pink.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudPlayer_yellow.png"
+  "/root/package/procgen/data/assets/kenney/HUD/hudX.png"
+  "/root/package/procgen/data/assets/kenney/Items/coinBronze.png"
+  "/root/package/procgen/data/assets/kenney/Items/coinGold.png"
+  "/root/package/procgen/data/assets/kenney/Items/coinSilver.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagBlue1.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagBlue2.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagBlue_down.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagGreen1.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagGreen2.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagGreen_down.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagRed1.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagRed2.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagRed_down.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagYellow1.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagYellow2.png"
+  "/root/package/procgen/data/assets/kenney/Items/flagYellow_down.png"
+  "/root/package/procgen/data/assets/kenney/Items/gemBlue.png"
+  "/root/package/procgen/data/assets/kenney/Items/gemGreen.png"
+  "/root/package/procgen/data/assets/kenney/Items/gemRed.png"
+  "/root/package/procgen/data/assets/kenney/Items/gemYellow.png"
+  "/root/package/procgen/data/assets/kenney/Items/keyBlue.png"
+  "/root/package/procgen/data/assets/kenney/Items/keyGreen.png"
+  "/root/package/procgen/data/assets/kenney/Items/keyRed.png"
+  "/root/package/procgen/data/assets/kenney/Items/keyYellow.png"
+  "/root/package/procgen/data/assets/kenney/Items/star.png"
+  "/root/package/procgen/data/assets/kenney/Particles/brickBrown.png"
+  "/root/package/procgen/data/assets/kenney/Particles/brickGrey.png"
+  "/root/package/procgen/data/assets/kenney/Particles/fireball.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Beige/alienBeige_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Blue/alienBlue_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Green/alienGreen_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Pink/alienPink_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/128x256/Yellow/alienYellow_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Beige/alienBiege_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Blue/alienBlue_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Green/alienGreen_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Pink/alienPink_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_climb1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_climb2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_duck.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_front.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_hit.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_jump.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_stand.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_swim1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_swim2.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_walk1.png"
+  "/root/package/procgen/data/assets/kenney/Players/Variable sizes/Yellow/alienYellow_walk2.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/bomb.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/bombWhite.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCoin.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCoin_boxed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCoin_disabled.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCoin_disabled_boxed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCrate.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCrate_double.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCrate_single.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxCrate_warning.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxExplosive.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxExplosive_disabled.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxExplosive_used.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxItem.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxItem_boxed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxItem_disabled.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/boxItem_disabled_boxed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/brickBrown.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/brickGrey.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/bridgeA.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/bridgeB.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/bush.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/cactus.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/chain.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/doorClosed_mid.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/doorClosed_top.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/doorOpen_mid.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/doorOpen_top.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/fence.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/fenceBroken.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/grass.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/ladderMid.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/ladderTop.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lava.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lavaTop_high.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lavaTop_low.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/leverLeft.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/leverMid.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/leverRight.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lockBlue.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lockGreen.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lockRed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/lockYellow.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/mushroomBrown.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/mushroomRed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/plantPurple.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/rock.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/sign.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/signExit.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/signLeft.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/signRight.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/snow.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/spikes.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/spring.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/sprung.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchBlue.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchBlue_pressed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchGreen.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchGreen_pressed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchRed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchRed_pressed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchYellow.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/switchYellow_pressed.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/torch1.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/torch2.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/torchOff.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/water.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/waterTop_high.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/waterTop_low.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/weight.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/weightAttached.png"
+  "/root/package/procgen/data/assets/kenney/Tiles/window.png"
+  "/root/package/procgen/data/assets/misc_assets/ball_soccer1.png"
+  "/root/package/procgen/data/assets/misc_assets/ball_soccer2.png"
+  "/root/package/procgen/data/assets/misc_assets/ball_tennis1.png"
+  "/root/package/procgen/data/assets/misc_assets/ball_volley2.png"
+  "/root/package/procgen/data/assets/misc_assets/blockGreen.png"
+  "/root/package/procgen/data/assets/misc_assets/blockRed.png"
+  "/root/package/procgen/data/assets/misc_assets/bomb.png"
+  "/root/package/procgen/data/assets/misc_assets/bunny2_jump.png"
+  "/root/package/procgen/data/assets/misc_assets/bunny2_ready.png"
+  "/root/package/procgen/data/assets/misc_assets/bunny2_stand.png"
+  "/root/package/procgen/data/assets/misc_assets/bunny2_walk1.png"
+  "/root/package/procgen/data/assets/misc_assets/bunny2_walk2.png"
+  "/root/package/procgen/data/assets/misc_assets/cannonBall.png"
+  "/root/package/procgen/data/assets/misc_assets/car_black_1.png"
+  "/root/package/procgen/data/assets/misc_assets/car_black_2.png"
+  "/root/package/procgen/data/assets/misc_assets/car_black_3.png"
+  "/root/package/procgen/data/assets/misc_assets/car_black_4.png"
+  "/root/package/procgen/data/assets/misc_assets/car_black_5.png"
+  "/root/package/procgen/data/assets/misc_assets/car_blue_1.png"
+  "/root/package/procgen/data/assets/misc_assets/car_blue_2.png"
+  "/root/package/procgen/data/assets/misc_assets/car_blue_3.png"
+  "/root/package/procgen/data/assets/misc_assets/car_blue_4.png"
+  "/root/package/procgen/data/assets/misc_assets/car_blue_5.png"
+  "/root/package/procgen/data/assets/misc_assets/car_green_1.png"
+  "/root/package/procgen/data/assets/misc_assets/car_green_2.png"
+  "/root/package/procgen/data/assets/misc_assets/car_green_3.png"
+  "/root/package/procgen/data/assets/misc_assets/car_green_4.png"
+  "/root/package/procgen/data/assets/misc_assets/car_green_5.png"
+  "/root/package/procgen/data/assets/misc_assets/car_red_1.png"
+  "/root/package/procgen/data/assets/misc_assets/car_red_2.png"
+  "/root/package/procgen/data/assets/misc_assets/car_red_3.png"
+  "/root/package/procgen/data/assets/misc_assets/car_red_4.png"
+  "/root/package/procgen/data/assets/misc_assets/car_red_5.png"
+  "/root/package/procgen/data/assets/misc_assets/car_yellow_1.png"
+  "/root/package/procgen/data/assets/misc_assets/car_yellow_2.png"
+  "/root/package/procgen/data/assets/misc_assets/car_yellow_3.png"
+  "/root/package/procgen/data/assets/misc_assets/car_yellow_4.png"
+  "/root/package/procgen/data/assets/misc_assets/car_yellow_5.png"
+  "/root/package/procgen/data/assets/misc_assets/carrot.png"
+  "/root/package/procgen/data/assets/misc_assets/character1.png"
+  "/root/package/procgen/data/assets/misc_assets/character10.png"
+  "/root/package/procgen/data/assets/misc_assets/character11.png"
+  "/root/package/procgen/data/assets/misc_assets/character12.png"
+  "/root/package/procgen/data/assets/misc_assets/character13.png"
+  "/root/package/procgen/data/assets/misc_assets/character2.png"
+  "/root/package/procgen/data/assets/misc_assets/character3.png"
+  "/root/package/procgen/data/assets/misc_assets/character4.png"
+  "/root/package/procgen/data/assets/misc_assets/character5.png"
+  "/root/package/procgen/data/assets/misc_assets/character6.png"
+  "/root/package/procgen/data/assets/misc_assets/character7.png"
+  "/root/package/procgen/data/assets/misc_assets/character8.png"
+  "/root/package/procgen/data/assets/misc_assets/character9.png"
+  "/root/package/procgen/data/assets/misc_assets/cheese.png"
+  "/root/package/procgen/data/assets/misc_assets/dirt.png"
+  "/root/package/procgen/data/assets/misc_assets/dirt_2.png"
+  "/root/package/procgen/data/assets/misc_assets/doorOpen_mid.png"
+  "/root/package/procgen/data/assets/misc_assets/doorOpen_top.png"
+  "/root/package/procgen/data/assets/misc_assets/elementStone007.png"
+  "/root/package/procgen/data/assets/misc_assets/elementWood044.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFloating_1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFloating_1b.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFloating_2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFloating_3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFloating_4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFlying_1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFlying_2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFlying_3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyFlying_4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlack1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlack2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlack3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlack4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlack5.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlue1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlue2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlue3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlue4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipBlue5.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipGreen1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipGreen2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipGreen3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipGreen4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipGreen5.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipRed1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipRed2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipRed3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipRed4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyShipRed5.png"
+  "/root/package/procgen/data/assets/misc_assets/enemySpikey_1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemySpikey_1b.png"
+  "/root/package/procgen/data/assets/misc_assets/enemySpikey_2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemySpikey_3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemySpikey_4.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyWalking_1.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyWalking_1b.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyWalking_2.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyWalking_3.png"
+  "/root/package/procgen/data/assets/misc_assets/enemyWalking_4.png"
+  "/root/package/procgen/data/assets/misc_assets/explosion1.png"
+  "/root/package/procgen/data/assets/misc_assets/explosion2.png"
+  "/root/package/procgen/data/assets/misc_assets/explosion3.png"
+  "/root/package/procgen/data/assets/misc_assets/explosion4.png"
+  "/root/package/procgen/data/assets/misc_assets/explosion5.png"
+  "/root/package/procgen/data/assets/misc_assets/fenceYellow.png"
+  "/root/package/procgen/data/assets/misc_assets/fence_single.png"
+  "/root/package/procgen/data/assets/misc_assets/finish.png"
+  "/root/package/procgen/data/assets/misc_assets/finish2.png"
+  "/root/package/procgen/data/assets/misc_assets/fire1.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_1.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_2.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_3.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_4.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_5.png"
+  "/root/package/procgen/data/assets/misc_assets/fire_6.png"
+  "/root/package/procgen/data/assets/misc_assets/fireball.png"
+  "/root/package/procgen/data/assets/misc_assets/fishTile_072.png"
+  "/root/package/procgen/data/assets/misc_assets/fishTile_074.png"
+  "/root/package/procgen/data/assets/misc_assets/fishTile_076.png"
+  "/root/package/procgen/data/assets/misc_assets/fishTile_078.png"
+  "/root/package/procgen/data/assets/misc_assets/fishTile_080.png"
+  "/root/package/procgen/data/assets/misc_assets/food1.png"
+  "/root/package/procgen/data/assets/misc_assets/food2.png"
+  "/root/package/procgen/data/assets/misc_assets/food3.png"
+  "/root/package/procgen/data/assets/misc_assets/food4.png"
+  "/root/package/procgen/data/assets/misc_assets/food5.png"
+  "/root/package/procgen/data/assets/misc_assets/food6.png"
+  "/root/package/procgen/data/assets/misc_assets/frog1.png"
+  "/root/package/procgen/data/assets/misc_assets/frog2.png"
+  "/root/package/procgen/data/assets/misc_assets/frog3.png"
+  "/root/package/procgen/data/assets/misc_assets/frog4.png"
+  "/root/package/procgen/data/assets/misc_assets/frog5.png"
+  "/root/package/procgen/data/assets/misc_assets/frog6.png"
+  "/root/package/procgen/data/assets/misc_assets/frog7.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit1.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit2.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit3.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit4.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit5.png"
+  "/root/package/procgen/data/assets/misc_assets/fruit6.png"
+  "/root/package/procgen/data/assets/misc_assets/gemBlue.png"
+  "/root/package/procgen/data/assets/misc_assets/gemYellow.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_001.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_002.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_003.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_004.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_005.png"
+  "/root/package/procgen/data/assets/misc_assets/genericItem_color_006.png"
+  "/root/package/procgen/data/assets/misc_assets/groundA.png"
+  "/root/package/procgen/data/assets/misc_assets/groundB.png"
+  "/root/package/procgen/data/assets/misc_assets/groundC.png"
+  "/root/package/procgen/data/assets/misc_assets/iconCircle_white.png"
+  "/root/package/procgen/data/assets/misc_assets/keyBlue.png"
+  "/root/package/procgen/data/assets/misc_assets/keyGreen.png"
+  "/root/package/procgen/data/assets/misc_assets/keyRed.png"
+  "/root/package/procgen/data/assets/misc_assets/keyRed2.png"
+  "/root/package/procgen/data/assets/misc_assets/ladder_small.png"
+  "/root/package/procgen/data/assets/misc_assets/laserBlue02.png"
+  "/root/package/procgen/data/assets/misc_assets/laserBlue09.png"
+  "/root/package/procgen/data/assets/misc_assets/laserGreen14.png"
+  "/root/package/procgen/data/assets/misc_assets/laserRed11.png"
+  "/root/package/procgen/data/assets/misc_assets/lockRed2.png"
+  "/root/package/procgen/data/assets/misc_assets/lock_blue.png"
+  "/root/package/procgen/data/assets/misc_assets/lock_green.png"
+  "/root/package/procgen/data/assets/misc_assets/lock_red.png"
+  "/root/package/procgen/data/assets/misc_assets/manBlue_silencer.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorBrown_big1.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorBrown_big2.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorBrown_big3.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorBrown_big4.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorGrey_big1.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorGrey_big2.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorGrey_big3.png"
+  "/root/package/procgen/data/assets/misc_assets/meteorGrey_big4.png"
+  "/root/package/procgen/data/assets/misc_assets/panel_wood.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip1_blue.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip1_green.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip1_orange.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip1_red.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip2_blue.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip2_green.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip2_orange.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip2_red.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip3_blue.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip3_green.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip3_orange.png"
+  "/root/package/procgen/data/assets/misc_assets/playerShip3_red.png"
+  "/root/package/procgen/data/assets/misc_assets/powerupRed_star.png"
+  "/root/package/procgen/data/assets/misc_assets/present1.png"
+  "/root/package/procgen/data/assets/misc_assets/present2.png"
+  "/root/package/procgen/data/assets/misc_assets/present3.png"
+  "/root/package/procgen/data/assets/misc_assets/roadTile6.png"
+  "/root/package/procgen/data/assets/misc_assets/roadTile6b.png"
+  "/root/package/procgen/data/assets/misc_assets/robot_3Dblue.png"
+  "/root/package/procgen/data/assets/misc_assets/robot_greenDrive1.png"
+  "/root/package/procgen/data/assets/misc_assets/saw.png"
+  "/root/package/procgen/data/assets/misc_assets/shield2.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_1.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_2.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_3.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_4.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_5.png"
+  "/root/package/procgen/data/assets/misc_assets/ship_6.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceAstronauts_008.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect1.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect2.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect3.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect4.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect5.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect6.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect7.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect8.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceEffect9.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceMeteors_001.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceMeteors_002.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceMeteors_003.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceMeteors_004.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceRockets_001.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceRockets_002.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceRockets_003.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceRockets_004.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_001.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_002.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_003.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_004.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_005.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_006.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_007.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_008.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceShips_009.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceStation_018.png"
+  "/root/package/procgen/data/assets/misc_assets/spaceStation_019.png"
+  "/root/package/procgen/data/assets/misc_assets/spikeMan_stand.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_bigRed.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_blue.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_dark.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_darkLarge.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_green.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_huge.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_red.png"
+  "/root/package/procgen/data/assets/misc_assets/tank_sand.png"
+  "/root/package/procgen/data/assets/misc_assets/target_red2.png"
+  "/root/package/procgen/data/assets/misc_assets/terrainTile6.png"
+  "/root/package/procgen/data/assets/misc_assets/tileStone_slope.png"
+  "/root/package/procgen/data/assets/misc_assets/tileStone_slope2.png"
+  "/root/package/procgen/data/assets/misc_assets/tile_316.png"
+  "/root/package/procgen/data/assets/misc_assets/tile_318.png"
+  "/root/package/procgen/data/assets/misc_assets/tile_bricksGrey.png"
+  "/root/package/procgen/data/assets/misc_assets/tile_bricksGrown.png"
+  "/root/package/procgen/data/assets/misc_assets/tile_bricksRed.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile203.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile270.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile295.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile296.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile297.png"
+  "/root/package/procgen/data/assets/misc_assets/towerDefense_tile298.png"
+  "/root/package/procgen/data/assets/misc_assets/ufoGreen.png"
+  "/root/package/procgen/data/assets/misc_assets/ufoGreen2.png"
+  "/root/package/procgen/data/assets/misc_assets/ufoRed.png"
+  "/root/package/procgen/data/assets/misc_assets/ufoRed2.png"
+  "/root/package/procgen/data/assets/misc_assets/window.png"
+  "/root/package/procgen/data/assets/misc_assets/yellowCrystal.png"
+  "/root/package/procgen/data/assets/misc_assets/zombie2_silencer.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/airadventurelevel1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/airadventurelevel2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/airadventurelevel3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/airadventurelevel4.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/alien_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/another_world_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/back_cave.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback10.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback4.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback5.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback6.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback7.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback8.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/battleback9.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/blue_desert.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/blue_grass.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/blue_land.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/blue_shroom.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/cave_background.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/caverns.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/colored_desert.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/colored_grass.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/colored_land.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/colored_shroom.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/cyberpunk_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/landscape1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/landscape2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/landscape3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/landscape4.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/living_tissue_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/parallax_forest.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/scifi2_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/scifi_bg.png"
+  "/root/package/procgen/data/assets/platform_backgrounds/sunrise.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/beach1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/beach2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/beach3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/beach4.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/candy1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/candy2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/candy3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/candy4.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/fantasy1.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/fantasy2.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/fantasy3.png"
+  "/root/package/procgen/data/assets/platform_backgrounds_2/fantasy4.png"
+  "/root/package/procgen/data/assets/platformer/blueCrystal.png"
+  "/root/package/procgen/data/assets/platformer/enemySwimming_1.png"
+  "/root/package/procgen/data/assets/platformer/enemySwimming_2.png"
+  "/root/package/procgen/data/assets/platformer/enemySwimming_3.png"
+  "/root/package/procgen/data/assets/platformer/enemySwimming_4.png"
+  "/root/package/procgen/data/assets/platformer/fireball.png"
+  "/root/package/procgen/data/assets/platformer/greenCrystal.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_dead.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_duck.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_fall.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_hit.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_roll.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_stand.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_swim1.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_swim2.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_switch1.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_switch2.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_up1.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_up2.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_up3.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_walk1.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_walk2.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_walk3.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_walk4.png"
+  "/root/package/procgen/data/assets/platformer/playerBlue_walk5.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_dead.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_duck.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_fall.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_hit.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_roll.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_stand.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_swim1.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_swim2.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_switch1.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_switch2.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_up1.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_up2.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_up3.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_walk1.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_walk2.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_walk3.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_walk4.png"
+  "/root/package/procgen/data/assets/platformer/playerGreen_walk5.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_dead.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_duck.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_fall.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_hit.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_roll.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_stand.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_swim1.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_swim2.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_switch1.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_switch2.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_up1.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_up2.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_up3.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_walk1.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_walk2.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_walk3.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_walk4.png"
+  "/root/package/procgen/data/assets/platformer/playerGrey_walk5.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_dead.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_duck.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_fall.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_hit.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_roll.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_stand.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_swim1.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_swim2.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_switch1.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_switch2.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_up1.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_up2.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_up3.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_walk1.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_walk2.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_walk3.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_walk4.png"
+  "/root/package/procgen/data/assets/platformer/playerRed_walk5.png"
+  "/root/package/procgen/data/assets/platformer/redCrystal.png"
+  "/root/package/procgen/data/assets/platformer/shroom1.png"
+  "/root/package/procgen/data/assets/platformer/shroom2.png"
+  "/root/package/procgen/data/assets/platformer/shroom3.png"
+  "/root/package/procgen/data/assets/platformer/shroom4.png"
+  "/root/package/procgen/data/assets/platformer/shroom5.png"
+  "/root/package/procgen/data/assets/platformer/shroom6.png"
+  "/root/package/procgen/data/assets/platformer/tileBlue_05.png"
+  "/root/package/procgen/data/assets/platformer/tileBlue_08.png"
+  "/root/package/procgen/data/assets/platformer/tileBrown_06.png"
+  "/root/package/procgen/data/assets/platformer/tileBrown_09.png"
+  "/root/package/procgen/data/assets/platformer/tileGreen_05.png"
+  "/root/package/procgen/data/assets/platformer/tileGreen_08.png"
+  "/root/package/procgen/data/assets/platformer/tileYellow_06.png"
+  "/root/package/procgen/data/assets/platformer/tileYellow_09.png"
+  "/root/package/procgen/data/assets/platformer/yellowCrystal.png"
+  "/root/package/procgen/data/assets/platformer/zombie_idle.png"
+  "/root/package/procgen/data/assets/platformer/zombie_jump.png"
+  "/root/package/procgen/data/assets/platformer/zombie_walk1.png"
+  "/root/package/procgen/data/assets/platformer/zombie_walk2.png"
+  "/root/package/procgen/data/assets/space_backgrounds/Background-1.png"
+  "/root/package/procgen/data/assets/space_backgrounds/Background-2.png"
+  "/root/package/procgen/data/assets/space_backgrounds/Background-3.png"
+  "/root/package/procgen/data/assets/space_backgrounds/Background-4.png"
+  "/root/package/procgen/data/assets/space_backgrounds/deep_sky_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/deep_space_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/eye_nebula_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/ez_space_lite_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/meyespace_v1_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/milky_way_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/parallax-space-backgound.png"
+  "/root/package/procgen/data/assets/space_backgrounds/space_nebula_01.png"
+  "/root/package/procgen/data/assets/space_backgrounds/spacegen_01.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed1.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed2.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed3.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed4.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed5.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed6.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed7.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/backgrounddetailed8.png"
+  "/root/package/procgen/data/assets/topdown_backgrounds/floortiles.png"
+  "/root/package/procgen/data/assets/water_backgrounds/underwater1.png"
+  "/root/package/procgen/data/assets/water_backgrounds/underwater2.png"
+  "/root/package/procgen/data/assets/water_backgrounds/underwater3.png"
+  "/root/package/procgen/data/assets/water_backgrounds/water1.png"
+  "/root/package/procgen/data/assets/water_backgrounds/water2.png"
+  "/root/package/procgen/data/assets/water_backgrounds/water3.png"
+  "/root/package/procgen/data/assets/water_backgrounds/water4.png"
+  )
+if(NOT "${NEW_GLOB}" STREQUAL "${OLD_GLOB}")
+  message("-- GLOB mismatch!")
+  file(TOUCH_NOCREATE "/root/package/procgen/.build/relwithdebinfo-qpainter-trace/CMakeFiles/cmake.verify_globs")
+endif()
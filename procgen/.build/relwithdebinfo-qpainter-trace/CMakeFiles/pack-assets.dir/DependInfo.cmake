@@ -0,0 +1,25 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/procgen/Qt/pngdecoder.cpp" "CMakeFiles/pack-assets.dir/Qt/pngdecoder.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/Qt/pngdecoder.cpp.o.d"
+  "/root/package/procgen/Qt/qimage.cpp" "CMakeFiles/pack-assets.dir/Qt/qimage.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/Qt/qimage.cpp.o.d"
+  "/root/package/procgen/src/cpp-utils.cpp" "CMakeFiles/pack-assets.dir/src/cpp-utils.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/src/cpp-utils.cpp.o.d"
+  "/root/package/procgen/src/mappedfile.cpp" "CMakeFiles/pack-assets.dir/src/mappedfile.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/src/mappedfile.cpp.o.d"
+  "/root/package/procgen/src/pack-assets.cpp" "CMakeFiles/pack-assets.dir/src/pack-assets.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/src/pack-assets.cpp.o.d"
+  "/root/package/procgen/src/randgen.cpp" "CMakeFiles/pack-assets.dir/src/randgen.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/src/randgen.cpp.o.d"
+  "/root/package/procgen/src/resources.cpp" "CMakeFiles/pack-assets.dir/src/resources.cpp.o" "gcc" "CMakeFiles/pack-assets.dir/src/resources.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/asset-atlas"
+  "assets.atlas"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/asset-atlas.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
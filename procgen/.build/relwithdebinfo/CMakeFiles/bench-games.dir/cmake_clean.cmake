@@ -0,0 +1,87 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/bench-games.dir/Qt/pngdecoder.cpp.o"
+  "CMakeFiles/bench-games.dir/Qt/pngdecoder.cpp.o.d"
+  "CMakeFiles/bench-games.dir/Qt/qimage.cpp.o"
+  "CMakeFiles/bench-games.dir/Qt/qimage.cpp.o.d"
+  "CMakeFiles/bench-games.dir/Qt/qpainter.cpp.o"
+  "CMakeFiles/bench-games.dir/Qt/qpainter.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/assetgen.cpp.o"
+  "CMakeFiles/bench-games.dir/src/assetgen.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/basic-abstract-game.cpp.o"
+  "CMakeFiles/bench-games.dir/src/basic-abstract-game.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/bench-games.cpp.o"
+  "CMakeFiles/bench-games.dir/src/bench-games.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/cpp-utils.cpp.o"
+  "CMakeFiles/bench-games.dir/src/cpp-utils.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/distancefield.cpp.o"
+  "CMakeFiles/bench-games.dir/src/distancefield.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/entity.cpp.o"
+  "CMakeFiles/bench-games.dir/src/entity.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/entitygrid.cpp.o"
+  "CMakeFiles/bench-games.dir/src/entitygrid.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/entitypool.cpp.o"
+  "CMakeFiles/bench-games.dir/src/entitypool.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/game-registry.cpp.o"
+  "CMakeFiles/bench-games.dir/src/game-registry.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/game.cpp.o"
+  "CMakeFiles/bench-games.dir/src/game.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/bigfish.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/bigfish.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/bossfight.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/bossfight.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/caveflyer.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/caveflyer.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/chaser.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/chaser.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/climber.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/climber.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/coinrun.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/coinrun.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/coinrun_old.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/coinrun_old.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/dodgeball.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/dodgeball.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/fruitbot.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/fruitbot.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/heist.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/heist.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/jumper.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/jumper.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/leaper.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/leaper.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/maze.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/maze.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/miner.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/miner.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/ninja.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/ninja.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/plunder.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/plunder.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/games/starpilot.cpp.o"
+  "CMakeFiles/bench-games.dir/src/games/starpilot.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/levelcache.cpp.o"
+  "CMakeFiles/bench-games.dir/src/levelcache.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/lz.cpp.o"
+  "CMakeFiles/bench-games.dir/src/lz.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/mappedfile.cpp.o"
+  "CMakeFiles/bench-games.dir/src/mappedfile.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/mazegen.cpp.o"
+  "CMakeFiles/bench-games.dir/src/mazegen.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/obstransform.cpp.o"
+  "CMakeFiles/bench-games.dir/src/obstransform.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/randgen.cpp.o"
+  "CMakeFiles/bench-games.dir/src/randgen.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/resources.cpp.o"
+  "CMakeFiles/bench-games.dir/src/resources.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/roomgen.cpp.o"
+  "CMakeFiles/bench-games.dir/src/roomgen.cpp.o.d"
+  "CMakeFiles/bench-games.dir/src/vecoptions.cpp.o"
+  "CMakeFiles/bench-games.dir/src/vecoptions.cpp.o.d"
+  "bench-games"
+  "bench-games.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/bench-games.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,57 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/procgen/Qt/pngdecoder.cpp" "CMakeFiles/env.dir/Qt/pngdecoder.cpp.o" "gcc" "CMakeFiles/env.dir/Qt/pngdecoder.cpp.o.d"
+  "/root/package/procgen/Qt/qimage.cpp" "CMakeFiles/env.dir/Qt/qimage.cpp.o" "gcc" "CMakeFiles/env.dir/Qt/qimage.cpp.o.d"
+  "/root/package/procgen/Qt/qpainter.cpp" "CMakeFiles/env.dir/Qt/qpainter.cpp.o" "gcc" "CMakeFiles/env.dir/Qt/qpainter.cpp.o.d"
+  "/root/package/procgen/src/assetgen.cpp" "CMakeFiles/env.dir/src/assetgen.cpp.o" "gcc" "CMakeFiles/env.dir/src/assetgen.cpp.o.d"
+  "/root/package/procgen/src/basic-abstract-game.cpp" "CMakeFiles/env.dir/src/basic-abstract-game.cpp.o" "gcc" "CMakeFiles/env.dir/src/basic-abstract-game.cpp.o.d"
+  "/root/package/procgen/src/cpp-utils.cpp" "CMakeFiles/env.dir/src/cpp-utils.cpp.o" "gcc" "CMakeFiles/env.dir/src/cpp-utils.cpp.o.d"
+  "/root/package/procgen/src/distancefield.cpp" "CMakeFiles/env.dir/src/distancefield.cpp.o" "gcc" "CMakeFiles/env.dir/src/distancefield.cpp.o.d"
+  "/root/package/procgen/src/entity.cpp" "CMakeFiles/env.dir/src/entity.cpp.o" "gcc" "CMakeFiles/env.dir/src/entity.cpp.o.d"
+  "/root/package/procgen/src/entitygrid.cpp" "CMakeFiles/env.dir/src/entitygrid.cpp.o" "gcc" "CMakeFiles/env.dir/src/entitygrid.cpp.o.d"
+  "/root/package/procgen/src/entitypool.cpp" "CMakeFiles/env.dir/src/entitypool.cpp.o" "gcc" "CMakeFiles/env.dir/src/entitypool.cpp.o.d"
+  "/root/package/procgen/src/game-registry.cpp" "CMakeFiles/env.dir/src/game-registry.cpp.o" "gcc" "CMakeFiles/env.dir/src/game-registry.cpp.o.d"
+  "/root/package/procgen/src/game.cpp" "CMakeFiles/env.dir/src/game.cpp.o" "gcc" "CMakeFiles/env.dir/src/game.cpp.o.d"
+  "/root/package/procgen/src/games/bigfish.cpp" "CMakeFiles/env.dir/src/games/bigfish.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/bigfish.cpp.o.d"
+  "/root/package/procgen/src/games/bossfight.cpp" "CMakeFiles/env.dir/src/games/bossfight.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/bossfight.cpp.o.d"
+  "/root/package/procgen/src/games/caveflyer.cpp" "CMakeFiles/env.dir/src/games/caveflyer.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/caveflyer.cpp.o.d"
+  "/root/package/procgen/src/games/chaser.cpp" "CMakeFiles/env.dir/src/games/chaser.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/chaser.cpp.o.d"
+  "/root/package/procgen/src/games/climber.cpp" "CMakeFiles/env.dir/src/games/climber.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/climber.cpp.o.d"
+  "/root/package/procgen/src/games/coinrun.cpp" "CMakeFiles/env.dir/src/games/coinrun.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/coinrun.cpp.o.d"
+  "/root/package/procgen/src/games/coinrun_old.cpp" "CMakeFiles/env.dir/src/games/coinrun_old.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/coinrun_old.cpp.o.d"
+  "/root/package/procgen/src/games/dodgeball.cpp" "CMakeFiles/env.dir/src/games/dodgeball.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/dodgeball.cpp.o.d"
+  "/root/package/procgen/src/games/fruitbot.cpp" "CMakeFiles/env.dir/src/games/fruitbot.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/fruitbot.cpp.o.d"
+  "/root/package/procgen/src/games/heist.cpp" "CMakeFiles/env.dir/src/games/heist.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/heist.cpp.o.d"
+  "/root/package/procgen/src/games/jumper.cpp" "CMakeFiles/env.dir/src/games/jumper.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/jumper.cpp.o.d"
+  "/root/package/procgen/src/games/leaper.cpp" "CMakeFiles/env.dir/src/games/leaper.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/leaper.cpp.o.d"
+  "/root/package/procgen/src/games/maze.cpp" "CMakeFiles/env.dir/src/games/maze.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/maze.cpp.o.d"
+  "/root/package/procgen/src/games/miner.cpp" "CMakeFiles/env.dir/src/games/miner.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/miner.cpp.o.d"
+  "/root/package/procgen/src/games/ninja.cpp" "CMakeFiles/env.dir/src/games/ninja.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/ninja.cpp.o.d"
+  "/root/package/procgen/src/games/plunder.cpp" "CMakeFiles/env.dir/src/games/plunder.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/plunder.cpp.o.d"
+  "/root/package/procgen/src/games/starpilot.cpp" "CMakeFiles/env.dir/src/games/starpilot.cpp.o" "gcc" "CMakeFiles/env.dir/src/games/starpilot.cpp.o.d"
+  "/root/package/procgen/src/levelcache.cpp" "CMakeFiles/env.dir/src/levelcache.cpp.o" "gcc" "CMakeFiles/env.dir/src/levelcache.cpp.o.d"
+  "/root/package/procgen/src/lz.cpp" "CMakeFiles/env.dir/src/lz.cpp.o" "gcc" "CMakeFiles/env.dir/src/lz.cpp.o.d"
+  "/root/package/procgen/src/mappedfile.cpp" "CMakeFiles/env.dir/src/mappedfile.cpp.o" "gcc" "CMakeFiles/env.dir/src/mappedfile.cpp.o.d"
+  "/root/package/procgen/src/mazegen.cpp" "CMakeFiles/env.dir/src/mazegen.cpp.o" "gcc" "CMakeFiles/env.dir/src/mazegen.cpp.o.d"
+  "/root/package/procgen/src/obstransform.cpp" "CMakeFiles/env.dir/src/obstransform.cpp.o" "gcc" "CMakeFiles/env.dir/src/obstransform.cpp.o.d"
+  "/root/package/procgen/src/randgen.cpp" "CMakeFiles/env.dir/src/randgen.cpp.o" "gcc" "CMakeFiles/env.dir/src/randgen.cpp.o.d"
+  "/root/package/procgen/src/resources.cpp" "CMakeFiles/env.dir/src/resources.cpp.o" "gcc" "CMakeFiles/env.dir/src/resources.cpp.o.d"
+  "/root/package/procgen/src/roomgen.cpp" "CMakeFiles/env.dir/src/roomgen.cpp.o" "gcc" "CMakeFiles/env.dir/src/roomgen.cpp.o.d"
+  "/root/package/procgen/src/vecgame.cpp" "CMakeFiles/env.dir/src/vecgame.cpp.o" "gcc" "CMakeFiles/env.dir/src/vecgame.cpp.o.d"
+  "/root/package/procgen/src/vecoptions.cpp" "CMakeFiles/env.dir/src/vecoptions.cpp.o" "gcc" "CMakeFiles/env.dir/src/vecoptions.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
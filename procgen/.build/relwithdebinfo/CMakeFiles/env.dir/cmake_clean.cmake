@@ -0,0 +1,87 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/env.dir/Qt/pngdecoder.cpp.o"
+  "CMakeFiles/env.dir/Qt/pngdecoder.cpp.o.d"
+  "CMakeFiles/env.dir/Qt/qimage.cpp.o"
+  "CMakeFiles/env.dir/Qt/qimage.cpp.o.d"
+  "CMakeFiles/env.dir/Qt/qpainter.cpp.o"
+  "CMakeFiles/env.dir/Qt/qpainter.cpp.o.d"
+  "CMakeFiles/env.dir/src/assetgen.cpp.o"
+  "CMakeFiles/env.dir/src/assetgen.cpp.o.d"
+  "CMakeFiles/env.dir/src/basic-abstract-game.cpp.o"
+  "CMakeFiles/env.dir/src/basic-abstract-game.cpp.o.d"
+  "CMakeFiles/env.dir/src/cpp-utils.cpp.o"
+  "CMakeFiles/env.dir/src/cpp-utils.cpp.o.d"
+  "CMakeFiles/env.dir/src/distancefield.cpp.o"
+  "CMakeFiles/env.dir/src/distancefield.cpp.o.d"
+  "CMakeFiles/env.dir/src/entity.cpp.o"
+  "CMakeFiles/env.dir/src/entity.cpp.o.d"
+  "CMakeFiles/env.dir/src/entitygrid.cpp.o"
+  "CMakeFiles/env.dir/src/entitygrid.cpp.o.d"
+  "CMakeFiles/env.dir/src/entitypool.cpp.o"
+  "CMakeFiles/env.dir/src/entitypool.cpp.o.d"
+  "CMakeFiles/env.dir/src/game-registry.cpp.o"
+  "CMakeFiles/env.dir/src/game-registry.cpp.o.d"
+  "CMakeFiles/env.dir/src/game.cpp.o"
+  "CMakeFiles/env.dir/src/game.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/bigfish.cpp.o"
+  "CMakeFiles/env.dir/src/games/bigfish.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/bossfight.cpp.o"
+  "CMakeFiles/env.dir/src/games/bossfight.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/caveflyer.cpp.o"
+  "CMakeFiles/env.dir/src/games/caveflyer.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/chaser.cpp.o"
+  "CMakeFiles/env.dir/src/games/chaser.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/climber.cpp.o"
+  "CMakeFiles/env.dir/src/games/climber.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/coinrun.cpp.o"
+  "CMakeFiles/env.dir/src/games/coinrun.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/coinrun_old.cpp.o"
+  "CMakeFiles/env.dir/src/games/coinrun_old.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/dodgeball.cpp.o"
+  "CMakeFiles/env.dir/src/games/dodgeball.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/fruitbot.cpp.o"
+  "CMakeFiles/env.dir/src/games/fruitbot.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/heist.cpp.o"
+  "CMakeFiles/env.dir/src/games/heist.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/jumper.cpp.o"
+  "CMakeFiles/env.dir/src/games/jumper.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/leaper.cpp.o"
+  "CMakeFiles/env.dir/src/games/leaper.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/maze.cpp.o"
+  "CMakeFiles/env.dir/src/games/maze.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/miner.cpp.o"
+  "CMakeFiles/env.dir/src/games/miner.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/ninja.cpp.o"
+  "CMakeFiles/env.dir/src/games/ninja.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/plunder.cpp.o"
+  "CMakeFiles/env.dir/src/games/plunder.cpp.o.d"
+  "CMakeFiles/env.dir/src/games/starpilot.cpp.o"
+  "CMakeFiles/env.dir/src/games/starpilot.cpp.o.d"
+  "CMakeFiles/env.dir/src/levelcache.cpp.o"
+  "CMakeFiles/env.dir/src/levelcache.cpp.o.d"
+  "CMakeFiles/env.dir/src/lz.cpp.o"
+  "CMakeFiles/env.dir/src/lz.cpp.o.d"
+  "CMakeFiles/env.dir/src/mappedfile.cpp.o"
+  "CMakeFiles/env.dir/src/mappedfile.cpp.o.d"
+  "CMakeFiles/env.dir/src/mazegen.cpp.o"
+  "CMakeFiles/env.dir/src/mazegen.cpp.o.d"
+  "CMakeFiles/env.dir/src/obstransform.cpp.o"
+  "CMakeFiles/env.dir/src/obstransform.cpp.o.d"
+  "CMakeFiles/env.dir/src/randgen.cpp.o"
+  "CMakeFiles/env.dir/src/randgen.cpp.o.d"
+  "CMakeFiles/env.dir/src/resources.cpp.o"
+  "CMakeFiles/env.dir/src/resources.cpp.o.d"
+  "CMakeFiles/env.dir/src/roomgen.cpp.o"
+  "CMakeFiles/env.dir/src/roomgen.cpp.o.d"
+  "CMakeFiles/env.dir/src/vecgame.cpp.o"
+  "CMakeFiles/env.dir/src/vecgame.cpp.o.d"
+  "CMakeFiles/env.dir/src/vecoptions.cpp.o"
+  "CMakeFiles/env.dir/src/vecoptions.cpp.o.d"
+  "libenv.pdb"
+  "libenv.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/env.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,23 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/pack-assets.dir/Qt/pngdecoder.cpp.o"
+  "CMakeFiles/pack-assets.dir/Qt/pngdecoder.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/Qt/qimage.cpp.o"
+  "CMakeFiles/pack-assets.dir/Qt/qimage.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/src/cpp-utils.cpp.o"
+  "CMakeFiles/pack-assets.dir/src/cpp-utils.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/src/mappedfile.cpp.o"
+  "CMakeFiles/pack-assets.dir/src/mappedfile.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/src/pack-assets.cpp.o"
+  "CMakeFiles/pack-assets.dir/src/pack-assets.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/src/randgen.cpp.o"
+  "CMakeFiles/pack-assets.dir/src/randgen.cpp.o.d"
+  "CMakeFiles/pack-assets.dir/src/resources.cpp.o"
+  "CMakeFiles/pack-assets.dir/src/resources.cpp.o.d"
+  "pack-assets"
+  "pack-assets.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/pack-assets.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -1,11 +1,20 @@
 #pragma once
 
-#include <cheerp/client.h>
 #include "../QRect"
 #include "../QRectF"
 #include "../QImage"
 #include "../QColor"
 
+#if defined(__CHEERP__)
+#include <cheerp/client.h>
+#else
+#include <vector>
+#if defined(PROCGEN_QPAINTER_TRACE)
+#include <cstdio>
+#include <string>
+#endif
+#endif
+
 class QBrush {
 public:
 	QBrush(const QColor& c) noexcept:
@@ -59,6 +68,8 @@ private:
 };
 
 
+#if defined(__CHEERP__)
+
 class QPainter {
 public:
     enum RenderHint {
@@ -142,3 +153,102 @@ private:
 	client::HTMLCanvasElement* canvas;
 	client::CanvasRenderingContext2D* ctx;
 };
+
+#else
+
+// Software rasterizer drawing into a QImage, see qpainter.cpp
+//
+// Only the subset of the QPainter API used by the games is implemented. Rendering is aliased by
+// default: a pixel is covered when its center lies inside the shape, and images are sampled with
+// the nearest source pixel. The Antialiasing hint enables edge coverage for shapes and the
+// SmoothPixmapTransform hint enables bilinear sampling for images.
+//
+// Built with PROCGEN_QPAINTER_TRACE (the PROCGEN_QPAINTER_TRACE cmake option, only used by
+// procgen/render_test.py), a painter can also record its calls so that Qt can replay them.
+
+class QPainter {
+public:
+    enum RenderHint {
+        Antialiasing = 0x01,
+        SmoothPixmapTransform = 0x04,
+    };
+    enum CompositionMode {
+        CompositionMode_SourceOver,
+        CompositionMode_Source,
+    };
+    explicit QPainter(QImage *img);
+    QPainter(const QPainter &) = delete;
+    QPainter &operator=(const QPainter &) = delete;
+    void setPen(const QPen &pen);
+    void setPen(Qt::PenStyle style);
+    void setBrush(const QBrush &brush);
+    void drawEllipse(const QRect &r);
+    void drawEllipse(const QRectF &r);
+    void drawLine(int x1, int y1, int x2, int y2);
+    void drawImage(const QRectF &r, const QImage &image);
+    void drawImage(const QPoint &p, const QImage &image);
+    void restore();
+    void save();
+    void setRenderHint(RenderHint hint, bool on = true);
+    bool testRenderHint(RenderHint hint) const;
+    void fillRect(const QRectF &r, const QColor &color);
+    void fillRect(const QRect &r, const QColor &color);
+    void setOpacity(qreal opacity);
+    void translate(qreal dx, qreal dy);
+    void rotate(qreal a);
+    void setCompositionMode(CompositionMode mode);
+
+#if defined(PROCGEN_QPAINTER_TRACE)
+    ~QPainter();
+    // append every call made on this painter to directory/trace.txt, with the device before and
+    // after and the images drawn saved next to it, so that Qt can replay the drawing, see
+    // procgen/render_test.py
+    void traceTo(const std::string &directory);
+#endif
+
+private:
+    struct State {
+        // affine transform from user to device coordinates:
+        // x' = m11 * x + m21 * y + dx
+        // y' = m12 * x + m22 * y + dy
+        qreal m11 = 1;
+        qreal m12 = 0;
+        qreal m21 = 0;
+        qreal m22 = 1;
+        qreal dx = 0;
+        qreal dy = 0;
+        qreal opacity = 1;
+        QColor pen_color = QColor(0, 0, 0);
+        qreal pen_width = 1;
+        Qt::PenStyle pen_style = Qt::SolidLine;
+        QColor brush_color;
+        bool has_brush = false;
+        CompositionMode composition_mode = CompositionMode_SourceOver;
+        int render_hints = 0;
+    };
+
+    QImage *device;
+    State state;
+    std::vector<State> saved_states;
+#if defined(PROCGEN_QPAINTER_TRACE)
+    FILE *trace = nullptr;
+    std::string trace_dir;
+#endif
+
+    bool is_axis_aligned() const;
+    bool is_integer_translation() const;
+    qreal transform_scale() const;
+    void map_rect(const QRectF &r, qreal *x0, qreal *y0, qreal *x1, qreal *y1) const;
+    void blend_pixel(uint *dst, uint src, int coverage) const;
+    void blend_image_pixel(uint *dst, uint src, int alpha) const;
+    bool draw_small_image(const QRectF &r, const QImage &image, int alpha);
+    // the drawing of the public overloads, which only differ in what they add to the trace
+    void fill_rect(const QRectF &r, const QColor &color);
+    void draw_image(const QRectF &r, const QImage &image);
+    void draw_ellipse(const QRectF &r);
+#if defined(PROCGEN_QPAINTER_TRACE)
+    void trace_image(const QImage &image);
+#endif
+};
+
+#endif
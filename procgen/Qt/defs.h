@@ -12,6 +12,12 @@ typedef unsigned short ushort;
 typedef unsigned char uchar;
 typedef unsigned int uint;
 
+// rounds halves up, like Qt's qRound(), the rounding of the edges of the rects its raster engine
+// fills and draws images into
+inline int qRound(qreal d) {
+    return d >= 0 ? int(d + 0.5) : int(d - qreal(int(d - 1)) + 0.5) + int(d - 1);
+}
+
 #include <cstring>
 #include <vector>
 #include <map>
@@ -0,0 +1,577 @@
+#include "pngdecoder.h"
+
+#include <cstdlib>
+#include <cstring>
+#include <cstdio>
+
+namespace {
+
+// zlib/deflate (RFC 1950/1951)
+
+const int FAST_BITS = 9;
+const int MAX_CODE_BITS = 15;
+
+const uint16_t LENGTH_BASE[29] = {3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31, 35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258};
+const uint8_t LENGTH_EXTRA[29] = {0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0};
+const uint16_t DIST_BASE[30] = {1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193, 257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577};
+const uint8_t DIST_EXTRA[30] = {0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13};
+const uint8_t CODE_LENGTH_ORDER[19] = {16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15};
+
+struct BitReader {
+    const uint8_t *data;
+    size_t size;
+    size_t pos = 0;
+    uint64_t bitbuf = 0;
+    int bitcount = 0;
+
+    BitReader(const uint8_t *data, size_t size)
+        : data(data), size(size) {
+    }
+
+    // bytes past the end of the stream read as zero, overrun() reports whether any were consumed
+    void refill() {
+        while (bitcount <= 56) {
+            uint64_t byte = pos < size ? data[pos] : 0;
+            pos++;
+            bitbuf |= byte << bitcount;
+            bitcount += 8;
+        }
+    }
+
+    uint32_t bits(int n) {
+        if (n == 0)
+            return 0;
+        if (bitcount < n)
+            refill();
+        uint32_t v = (uint32_t)(bitbuf & ((1ull << n) - 1));
+        bitbuf >>= n;
+        bitcount -= n;
+        return v;
+    }
+
+    void align_to_byte() {
+        bits(bitcount % 8);
+    }
+
+    bool overrun() const {
+        return pos - bitcount / 8 > size;
+    }
+};
+
+struct Huffman {
+    // (code length << 9) | symbol for every code of at most FAST_BITS bits, indexed by bit-reversed code
+    uint16_t fast[1 << FAST_BITS];
+    uint16_t counts[MAX_CODE_BITS + 1];
+    uint16_t symbols[288];
+};
+
+bool build_huffman(Huffman &h, const uint8_t *lengths, int n) {
+    memset(h.counts, 0, sizeof(h.counts));
+    memset(h.fast, 0, sizeof(h.fast));
+
+    for (int i = 0; i < n; i++) {
+        h.counts[lengths[i]]++;
+    }
+    h.counts[0] = 0;
+
+    int left = 1;
+    for (int len = 1; len <= MAX_CODE_BITS; len++) {
+        left <<= 1;
+        left -= h.counts[len];
+        if (left < 0)
+            return false;
+    }
+
+    uint16_t offsets[MAX_CODE_BITS + 2];
+    offsets[1] = 0;
+    for (int len = 1; len <= MAX_CODE_BITS; len++) {
+        offsets[len + 1] = offsets[len] + h.counts[len];
+    }
+
+    for (int sym = 0; sym < n; sym++) {
+        if (lengths[sym] != 0) {
+            h.symbols[offsets[lengths[sym]]++] = (uint16_t)sym;
+        }
+    }
+
+    int code = 0;
+    int index = 0;
+    for (int len = 1; len <= FAST_BITS; len++) {
+        for (int k = 0; k < h.counts[len]; k++) {
+            int reversed = 0;
+            for (int b = 0; b < len; b++) {
+                reversed |= ((code >> b) & 1) << (len - 1 - b);
+            }
+            for (int r = reversed; r < (1 << FAST_BITS); r += 1 << len) {
+                h.fast[r] = (uint16_t)((len << 9) | h.symbols[index]);
+            }
+            index++;
+            code++;
+        }
+        code <<= 1;
+    }
+
+    return true;
+}
+
+int decode_symbol(BitReader &br, const Huffman &h) {
+    if (br.bitcount < MAX_CODE_BITS)
+        br.refill();
+
+    uint16_t entry = h.fast[br.bitbuf & ((1 << FAST_BITS) - 1)];
+    if (entry != 0) {
+        br.bits(entry >> 9);
+        return entry & 511;
+    }
+
+    // canonical decoding one bit at a time for long codes
+    int code = 0;
+    int first = 0;
+    int index = 0;
+    for (int len = 1; len <= MAX_CODE_BITS; len++) {
+        code |= br.bits(1);
+        int count = h.counts[len];
+        if (code - count < first) {
+            return h.symbols[index + (code - first)];
+        }
+        index += count;
+        first += count;
+        first <<= 1;
+        code <<= 1;
+    }
+
+    return -1;
+}
+
+bool inflate_codes(BitReader &br, const Huffman &lencode, const Huffman &distcode, std::vector<uint8_t> &out, size_t max_size) {
+    while (true) {
+        int sym = decode_symbol(br, lencode);
+
+        if (sym < 0) {
+            return false;
+        } else if (sym < 256) {
+            if (out.size() >= max_size)
+                return false;
+            out.push_back((uint8_t)sym);
+        } else if (sym == 256) {
+            return true;
+        } else {
+            sym -= 257;
+            if (sym >= 29)
+                return false;
+            size_t len = LENGTH_BASE[sym] + br.bits(LENGTH_EXTRA[sym]);
+
+            int dsym = decode_symbol(br, distcode);
+            if (dsym < 0 || dsym >= 30)
+                return false;
+            size_t dist = DIST_BASE[dsym] + br.bits(DIST_EXTRA[dsym]);
+
+            if (dist > out.size() || out.size() + len > max_size)
+                return false;
+
+            size_t start = out.size() - dist;
+            for (size_t i = 0; i < len; i++) {
+                out.push_back(out[start + i]);
+            }
+        }
+
+        if (br.overrun())
+            return false;
+    }
+}
+
+bool inflate_fixed(BitReader &br, std::vector<uint8_t> &out, size_t max_size) {
+    static Huffman lencode;
+    static Huffman distcode;
+    static bool built = [] {
+        uint8_t lengths[288];
+        for (int i = 0; i < 144; i++)
+            lengths[i] = 8;
+        for (int i = 144; i < 256; i++)
+            lengths[i] = 9;
+        for (int i = 256; i < 280; i++)
+            lengths[i] = 7;
+        for (int i = 280; i < 288; i++)
+            lengths[i] = 8;
+        build_huffman(lencode, lengths, 288);
+        for (int i = 0; i < 30; i++)
+            lengths[i] = 5;
+        build_huffman(distcode, lengths, 30);
+        return true;
+    }();
+    (void)built;
+
+    return inflate_codes(br, lencode, distcode, out, max_size);
+}
+
+bool inflate_dynamic(BitReader &br, std::vector<uint8_t> &out, size_t max_size) {
+    int nlen = br.bits(5) + 257;
+    int ndist = br.bits(5) + 1;
+    int ncode = br.bits(4) + 4;
+
+    if (nlen > 286 || ndist > 30)
+        return false;
+
+    uint8_t lengths[320];
+    memset(lengths, 0, sizeof(lengths));
+
+    for (int i = 0; i < ncode; i++) {
+        lengths[CODE_LENGTH_ORDER[i]] = (uint8_t)br.bits(3);
+    }
+
+    Huffman lencode;
+    if (!build_huffman(lencode, lengths, 19))
+        return false;
+
+    int index = 0;
+    while (index < nlen + ndist) {
+        int sym = decode_symbol(br, lencode);
+        if (sym < 0)
+            return false;
+
+        if (sym < 16) {
+            lengths[index++] = (uint8_t)sym;
+        } else {
+            uint8_t len = 0;
+            int repeat;
+            if (sym == 16) {
+                if (index == 0)
+                    return false;
+                len = lengths[index - 1];
+                repeat = 3 + br.bits(2);
+            } else if (sym == 17) {
+                repeat = 3 + br.bits(3);
+            } else {
+                repeat = 11 + br.bits(7);
+            }
+            if (index + repeat > nlen + ndist)
+                return false;
+            while (repeat--) {
+                lengths[index++] = len;
+            }
+        }
+    }
+
+    // the end of block code must be present
+    if (lengths[256] == 0)
+        return false;
+
+    Huffman distcode;
+    if (!build_huffman(lencode, lengths, nlen))
+        return false;
+    if (!build_huffman(distcode, lengths + nlen, ndist))
+        return false;
+
+    return inflate_codes(br, lencode, distcode, out, max_size);
+}
+
+bool inflate_zlib(const uint8_t *data, size_t size, std::vector<uint8_t> &out, size_t max_size) {
+    if (size < 2)
+        return false;
+
+    int cmf = data[0];
+    int flg = data[1];
+    if ((cmf & 15) != 8 || ((cmf << 8) | flg) % 31 != 0 || (flg & 32) != 0)
+        return false;
+
+    BitReader br(data + 2, size - 2);
+    out.clear();
+    out.reserve(max_size);
+
+    bool is_final = false;
+    while (!is_final) {
+        is_final = br.bits(1) != 0;
+        int type = br.bits(2);
+
+        if (type == 0) {
+            br.align_to_byte();
+            uint32_t len = br.bits(16);
+            uint32_t nlen = br.bits(16);
+            if ((len ^ 0xffff) != nlen || out.size() + len > max_size)
+                return false;
+            for (uint32_t i = 0; i < len; i++) {
+                out.push_back((uint8_t)br.bits(8));
+            }
+        } else if (type == 1) {
+            if (!inflate_fixed(br, out, max_size))
+                return false;
+        } else if (type == 2) {
+            if (!inflate_dynamic(br, out, max_size))
+                return false;
+        } else {
+            return false;
+        }
+
+        if (br.overrun())
+            return false;
+    }
+
+    return true;
+}
+
+// PNG
+
+uint32_t read_be32(const uint8_t *p) {
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) | ((uint32_t)p[2] << 8) | (uint32_t)p[3];
+}
+
+int paeth(int a, int b, int c) {
+    int p = a + b - c;
+    int pa = abs(p - a);
+    int pb = abs(p - b);
+    int pc = abs(p - c);
+    if (pa <= pb && pa <= pc)
+        return a;
+    if (pb <= pc)
+        return b;
+    return c;
+}
+
+bool unfilter(uint8_t *data, int height, size_t rowbytes, int pixel_bytes) {
+    const uint8_t *prior = nullptr;
+
+    for (int y = 0; y < height; y++) {
+        uint8_t *row = data + y * (rowbytes + 1);
+        int filter = row[0];
+        uint8_t *cur = row + 1;
+
+        for (size_t i = 0; i < rowbytes; i++) {
+            int a = i >= (size_t)pixel_bytes ? cur[i - pixel_bytes] : 0;
+            int b = prior != nullptr ? prior[i] : 0;
+            int c = (prior != nullptr && i >= (size_t)pixel_bytes) ? prior[i - pixel_bytes] : 0;
+
+            switch (filter) {
+            case 0:
+                break;
+            case 1:
+                cur[i] = (uint8_t)(cur[i] + a);
+                break;
+            case 2:
+                cur[i] = (uint8_t)(cur[i] + b);
+                break;
+            case 3:
+                cur[i] = (uint8_t)(cur[i] + ((a + b) >> 1));
+                break;
+            case 4:
+                cur[i] = (uint8_t)(cur[i] + paeth(a, b, c));
+                break;
+            default:
+                return false;
+            }
+        }
+
+        prior = cur;
+    }
+
+    return true;
+}
+
+// read sample n of a row, returned at the image bit depth
+int read_sample(const uint8_t *row, size_t n, int bit_depth) {
+    if (bit_depth == 8) {
+        return row[n];
+    } else if (bit_depth == 16) {
+        return (row[2 * n] << 8) | row[2 * n + 1];
+    }
+    size_t bit = n * bit_depth;
+    int shift = 8 - bit_depth - (int)(bit % 8);
+    return (row[bit / 8] >> shift) & ((1 << bit_depth) - 1);
+}
+
+int scale_to_8bit(int v, int bit_depth) {
+    if (bit_depth == 16)
+        return v >> 8;
+    return v * 255 / ((1 << bit_depth) - 1);
+}
+
+} // namespace
+
+bool png_decode_rgba(const std::vector<uint8_t> &file_data, std::vector<uint8_t> &rgba, int *width, int *height, std::string *error) {
+    static const uint8_t SIGNATURE[8] = {137, 80, 78, 71, 13, 10, 26, 10};
+
+    auto fail = [error](const char *msg) {
+        if (error != nullptr)
+            *error = msg;
+        return false;
+    };
+
+    if (file_data.size() < 8 || memcmp(file_data.data(), SIGNATURE, 8) != 0)
+        return fail("not a png file");
+
+    int w = 0;
+    int h = 0;
+    int bit_depth = 0;
+    int color_type = -1;
+    int interlace = 0;
+    std::vector<uint8_t> palette;
+    std::vector<uint8_t> palette_alpha;
+    bool has_trns_key = false;
+    int trns_key[3] = {0, 0, 0};
+    std::vector<uint8_t> idat;
+
+    size_t pos = 8;
+    bool seen_iend = false;
+    while (!seen_iend) {
+        if (pos + 12 > file_data.size())
+            return fail("truncated chunk");
+
+        uint32_t len = read_be32(&file_data[pos]);
+        const uint8_t *type = &file_data[pos + 4];
+        const uint8_t *chunk = &file_data[pos + 8];
+        if (len > file_data.size() - pos - 12)
+            return fail("truncated chunk");
+
+        if (memcmp(type, "IHDR", 4) == 0) {
+            if (len != 13)
+                return fail("invalid IHDR");
+            w = (int)read_be32(chunk);
+            h = (int)read_be32(chunk + 4);
+            bit_depth = chunk[8];
+            color_type = chunk[9];
+            interlace = chunk[12];
+            if (chunk[10] != 0 || chunk[11] != 0)
+                return fail("unknown compression or filter method");
+        } else if (memcmp(type, "PLTE", 4) == 0) {
+            palette.assign(chunk, chunk + len);
+        } else if (memcmp(type, "tRNS", 4) == 0) {
+            if (color_type == 3) {
+                palette_alpha.assign(chunk, chunk + len);
+            } else if (color_type == 0 && len >= 2) {
+                has_trns_key = true;
+                trns_key[0] = (chunk[0] << 8) | chunk[1];
+            } else if (color_type == 2 && len >= 6) {
+                has_trns_key = true;
+                for (int c = 0; c < 3; c++) {
+                    trns_key[c] = (chunk[2 * c] << 8) | chunk[2 * c + 1];
+                }
+            }
+        } else if (memcmp(type, "IDAT", 4) == 0) {
+            idat.insert(idat.end(), chunk, chunk + len);
+        } else if (memcmp(type, "IEND", 4) == 0) {
+            seen_iend = true;
+        }
+
+        pos += 12 + len;
+    }
+
+    if (w <= 0 || h <= 0 || w > (1 << 16) || h > (1 << 16))
+        return fail("invalid image dimensions");
+    if (interlace != 0)
+        return fail("interlaced png files are not supported");
+
+    int channels;
+    switch (color_type) {
+    case 0:
+        channels = 1;
+        break;
+    case 2:
+        channels = 3;
+        break;
+    case 3:
+        channels = 1;
+        break;
+    case 4:
+        channels = 2;
+        break;
+    case 6:
+        channels = 4;
+        break;
+    default:
+        return fail("invalid color type");
+    }
+
+    if (bit_depth != 1 && bit_depth != 2 && bit_depth != 4 && bit_depth != 8 && bit_depth != 16)
+        return fail("invalid bit depth");
+    if (color_type == 3 && (bit_depth > 8 || palette.size() < 3))
+        return fail("invalid palette");
+
+    int bits_per_pixel = channels * bit_depth;
+    size_t rowbytes = ((size_t)w * bits_per_pixel + 7) / 8;
+    int pixel_bytes = bits_per_pixel >= 8 ? bits_per_pixel / 8 : 1;
+    size_t raw_size = (rowbytes + 1) * h;
+
+    std::vector<uint8_t> raw;
+    if (!inflate_zlib(idat.data(), idat.size(), raw, raw_size) || raw.size() != raw_size)
+        return fail("corrupt image data");
+    if (!unfilter(raw.data(), h, rowbytes, pixel_bytes))
+        return fail("invalid filter type");
+
+    int num_palette = (int)(palette.size() / 3);
+
+    rgba.resize((size_t)w * h * 4);
+    uint8_t *dst = rgba.data();
+
+    for (int y = 0; y < h; y++) {
+        const uint8_t *row = raw.data() + y * (rowbytes + 1) + 1;
+
+        for (int x = 0; x < w; x++) {
+            int r, g, b, a = 255;
+
+            if (color_type == 3) {
+                int idx = read_sample(row, x, bit_depth);
+                if (idx >= num_palette)
+                    return fail("palette index out of range");
+                r = palette[3 * idx];
+                g = palette[3 * idx + 1];
+                b = palette[3 * idx + 2];
+                if (idx < (int)(palette_alpha.size()))
+                    a = palette_alpha[idx];
+            } else if (color_type == 0 || color_type == 4) {
+                int v = read_sample(row, x * channels, bit_depth);
+                r = g = b = scale_to_8bit(v, bit_depth);
+                if (color_type == 4) {
+                    a = scale_to_8bit(read_sample(row, x * channels + 1, bit_depth), bit_depth);
+                } else if (has_trns_key && v == trns_key[0]) {
+                    a = 0;
+                }
+            } else {
+                int v[4];
+                for (int c = 0; c < channels; c++) {
+                    v[c] = read_sample(row, (size_t)x * channels + c, bit_depth);
+                }
+                r = scale_to_8bit(v[0], bit_depth);
+                g = scale_to_8bit(v[1], bit_depth);
+                b = scale_to_8bit(v[2], bit_depth);
+                if (color_type == 6) {
+                    a = scale_to_8bit(v[3], bit_depth);
+                } else if (has_trns_key && v[0] == trns_key[0] && v[1] == trns_key[1] && v[2] == trns_key[2]) {
+                    a = 0;
+                }
+            }
+
+            dst[0] = (uint8_t)r;
+            dst[1] = (uint8_t)g;
+            dst[2] = (uint8_t)b;
+            dst[3] = (uint8_t)a;
+            dst += 4;
+        }
+    }
+
+    *width = w;
+    *height = h;
+    return true;
+}
+
+bool png_load_rgba(const std::string &path, std::vector<uint8_t> &rgba, int *width, int *height, std::string *error) {
+    std::vector<uint8_t> file_data;
+    FILE *f = fopen(path.c_str(), "rb");
+    bool ok = f != nullptr;
+
+    if (ok) {
+        uint8_t chunk[1 << 16];
+        size_t n;
+        while ((n = fread(chunk, 1, sizeof(chunk), f)) > 0) {
+            file_data.insert(file_data.end(), chunk, chunk + n);
+        }
+        ok = ferror(f) == 0;
+        fclose(f);
+    }
+
+    if (!ok) {
+        if (error != nullptr)
+            *error = "could not read file";
+        return false;
+    }
+
+    return png_decode_rgba(file_data, rgba, width, height, error);
+}
@@ -0,0 +1,17 @@
+#pragma once
+
+/*
+
+Minimal self-contained PNG decoder used by the native QImage implementation
+
+Supports non-interlaced images of every color type and bit depth in the PNG spec, plus tRNS
+transparency. The output is always 8-bit RGBA, row-major, without padding.
+
+*/
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+bool png_decode_rgba(const std::vector<uint8_t> &file_data, std::vector<uint8_t> &rgba, int *width, int *height, std::string *error);
+bool png_load_rgba(const std::string &path, std::vector<uint8_t> &rgba, int *width, int *height, std::string *error);
@@ -0,0 +1,144 @@
+#include "qimage.h"
+#include "pngdecoder.h"
+
+/*
+
+Native QImage, the pixel buffer used by the software rasterizer
+
+*/
+
+namespace {
+
+inline uint mul_255(uint x, uint a) {
+    uint t = x * a + 128;
+    return (t + (t >> 8)) >> 8;
+}
+
+inline uint premultiply(uint r, uint g, uint b, uint a) {
+    return (a << 24) | (mul_255(r, a) << 16) | (mul_255(g, a) << 8) | mul_255(b, a);
+}
+
+// drop the alpha channel the way Qt does when converting ARGB32 to RGB32, which keeps the
+// (non-premultiplied) color of each pixel
+inline uint to_opaque(uint p) {
+    uint a = p >> 24;
+    if (a == 255) {
+        return p;
+    }
+    if (a == 0) {
+        return 0xff000000;
+    }
+    uint r = (((p >> 16) & 0xff) * 255 + a / 2) / a;
+    uint g = (((p >> 8) & 0xff) * 255 + a / 2) / a;
+    uint b = ((p & 0xff) * 255 + a / 2) / a;
+    return 0xff000000 | (r << 16) | (g << 8) | b;
+}
+
+} // namespace
+
+QImage::QImage(const std::string &fileName)
+    : QImage() {
+    std::vector<uint8_t> rgba;
+    int width, height;
+    // a file that fails to load results in a null image, which has a width of 0
+    if (!png_load_rgba(fileName, rgba, &width, &height, nullptr)) {
+        return;
+    }
+    *this = QImage(width, height, Format_ARGB32);
+    const uint8_t *src = rgba.data();
+    for (int i = 0; i < width * height; i++) {
+        pixels[i] = premultiply(src[0], src[1], src[2], src[3]);
+        src += 4;
+    }
+}
+
+QImage::QImage(int width, int height, Format format)
+    : w(width), h(height), stride(width), fmt(format), storage(width * height, 0) {
+    pixels = storage.data();
+    if (format == Format_RGB32) {
+        fill(0xff000000);
+    }
+}
+
+QImage::QImage(uchar *data, int width, int height, int bytesPerLine, Format format)
+    : w(width), h(height), stride(bytesPerLine / 4), fmt(format), pixels(reinterpret_cast<uint *>(data)) {
+}
+
+QImage::QImage(const QImage &other)
+    : w(other.w), h(other.h), stride(other.stride), fmt(other.fmt), storage(other.storage), pixels(other.pixels) {
+    // images that own their pixels are deep copied, images wrapping a buffer share it
+    if (!other.storage.empty()) {
+        pixels = storage.data();
+    }
+}
+
+QImage::QImage(QImage &&other) noexcept
+    : w(other.w), h(other.h), stride(other.stride), fmt(other.fmt), storage(std::move(other.storage)), pixels(other.pixels) {
+    other.w = other.h = other.stride = 0;
+    other.pixels = nullptr;
+}
+
+QImage &QImage::operator=(const QImage &other) {
+    if (this != &other) {
+        *this = QImage(other);
+    }
+    return *this;
+}
+
+QImage &QImage::operator=(QImage &&other) noexcept {
+    if (this != &other) {
+        w = other.w;
+        h = other.h;
+        stride = other.stride;
+        fmt = other.fmt;
+        storage = std::move(other.storage);
+        pixels = other.pixels;
+        other.w = other.h = other.stride = 0;
+        other.pixels = nullptr;
+    }
+    return *this;
+}
+
+QImage QImage::mirrored(bool horizontally, bool vertically) const {
+    QImage other(w, h, fmt);
+    for (int y = 0; y < h; y++) {
+        const uint *src = pixels + (vertically ? h - 1 - y : y) * stride;
+        uint *dst = other.pixels + y * other.stride;
+        if (horizontally) {
+            for (int x = 0; x < w; x++) {
+                dst[x] = src[w - 1 - x];
+            }
+        } else {
+            memcpy(dst, src, w * sizeof(uint));
+        }
+    }
+    return other;
+}
+
+QImage QImage::convertToFormat(Format f) const {
+    QImage other(w, h, f);
+    for (int y = 0; y < h; y++) {
+        const uint *src = pixels + y * stride;
+        uint *dst = other.pixels + y * other.stride;
+        if (f == Format_RGB32 && fmt != Format_RGB32) {
+            for (int x = 0; x < w; x++) {
+                dst[x] = to_opaque(src[x]);
+            }
+        } else {
+            memcpy(dst, src, w * sizeof(uint));
+        }
+    }
+    return other;
+}
+
+void QImage::fill(uint pixel) {
+    if (fmt == Format_RGB32) {
+        pixel |= 0xff000000;
+    }
+    for (int y = 0; y < h; y++) {
+        uint *row = pixels + y * stride;
+        for (int x = 0; x < w; x++) {
+            row[x] = pixel;
+        }
+    }
+}
@@ -2,9 +2,14 @@
 
 #include "defs.h"
 
+#include <string>
+
+#if defined(__CHEERP__)
+
+// Cheerp build: images are backed by a browser canvas
+
 #include "../src/loadinghelper.h"
 
-#include <string>
 #include <cheerp/client.h>
 
 class Q_GUI_EXPORT QImage
@@ -65,3 +70,82 @@ private:
     client::HTMLCanvasElement* canvas;
     Format format;
 };
+
+#else
+
+// Native build: images are plain 32-bit pixel buffers drawn by the software rasterizer in qpainter.cpp
+//
+// Pixels are always stored as premultiplied 0xAARRGGBB words, so the bytes of a pixel in memory
+// are B, G, R, A on little endian machines, which is the layout bgr32_to_rgb888 expects.
+// For Format_RGB32 images the alpha channel is kept at 0xff.
+// The format is recorded for compatibility with the Qt API, but it does not change the memory layout.
+
+#include <vector>
+
+class Q_GUI_EXPORT QImage
+{
+public:
+    enum Format {
+        Format_RGB32,
+        Format_ARGB32,
+        Format_ARGB32_Premultiplied,
+    };
+    QImage() noexcept
+        : w(0), h(0), stride(0), fmt(Format_ARGB32), pixels(nullptr)
+    {
+    }
+    explicit QImage(const std::string &fileName);
+    QImage(int width, int height, Format format);
+    // wrap an existing buffer, the buffer must stay alive for as long as the image is used
+    QImage(uchar *data, int width, int height, int bytesPerLine, Format format);
+    QImage(const QImage &other);
+    QImage(QImage &&other) noexcept;
+    QImage &operator=(const QImage &other);
+    QImage &operator=(QImage &&other) noexcept;
+
+    QImage mirrored(bool horizontally = false, bool vertically = true) const;
+    QImage convertToFormat(Format f) const;
+    void fill(uint pixel);
+
+    int width() const {
+        return w;
+    }
+    int height() const {
+        return h;
+    }
+    Format format() const {
+        return fmt;
+    }
+    bool isNull() const {
+        return pixels == nullptr;
+    }
+    int bytesPerLine() const {
+        return stride * 4;
+    }
+    uchar *bits() {
+        return reinterpret_cast<uchar *>(pixels);
+    }
+    const uchar *constBits() const {
+        return reinterpret_cast<const uchar *>(pixels);
+    }
+    uchar *scanLine(int y) {
+        return reinterpret_cast<uchar *>(pixels + y * stride);
+    }
+    const uchar *constScanLine(int y) const {
+        return reinterpret_cast<const uchar *>(pixels + y * stride);
+    }
+    uint pixel(int x, int y) const {
+        return pixels[y * stride + x];
+    }
+
+private:
+    int w;
+    int h;
+    // row stride in pixels
+    int stride;
+    Format fmt;
+    std::vector<uint> storage;
+    uint *pixels;
+};
+
+#endif
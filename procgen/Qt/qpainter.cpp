@@ -0,0 +1,1141 @@
+#include "QtGui/qpainter.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <cstdlib>
+
+/*
+
+Native QPainter, a small CPU rasterizer for the subset of the Qt API used by the games
+
+All drawing works the same way: the bounding box of the shape in device coordinates is clipped to
+the image, then every pixel center in that box is mapped back to user coordinates with the inverse
+transform and tested against the shape. Axis aligned rectangles and images, which account for
+nearly all of the drawing done by the games, have a fast path that avoids the per pixel transform.
+
+Colors are blended in premultiplied 0xAARRGGBB form with the same 8-bit arithmetic as Qt's raster
+engine. The drawing done for observations (aliased, without smooth pixmap transforms, pens of at
+most one pixel) follows the code paths of Qt 5.15 down to their rounding: images are scaled with
+the fixed point stepping of qt_scale_image_32bit(), small rotated images are filled like
+QRasterizer::rasterizeLine(), ellipses and lines use the midpoint algorithm and the cosmetic
+stroker, and opacity goes through Qt's 0-256 integer opacity. render_test.py checks the frames of
+every game against Qt. Antialiased drawing, bilinear sampling and wide pens are approximations.
+
+*/
+
+namespace {
+
+const qreal PI = 3.14159265358979323846;
+
+inline uint byte_mul(uint x, uint a) {
+    uint t = (x & 0xff00ff) * a;
+    t = (t + ((t >> 8) & 0xff00ff) + 0x800080) >> 8;
+    t &= 0xff00ff;
+    x = ((x >> 8) & 0xff00ff) * a;
+    x = (x + ((x >> 8) & 0xff00ff) + 0x800080);
+    x &= 0xff00ff00;
+    return x | t;
+}
+
+inline uint interpolate_255(uint x, uint a, uint y, uint b) {
+    uint t = (x & 0xff00ff) * a + (y & 0xff00ff) * b;
+    t = (t + ((t >> 8) & 0xff00ff) + 0x800080) >> 8;
+    t &= 0xff00ff;
+    x = ((x >> 8) & 0xff00ff) * a + ((y >> 8) & 0xff00ff) * b;
+    x = (x + ((x >> 8) & 0xff00ff) + 0x800080);
+    x &= 0xff00ff00;
+    return x | t;
+}
+
+inline int to_alpha(qreal a) {
+    return std::max(0, std::min(255, int(a * 255 + 0.5)));
+}
+
+// the opacity of Qt's raster engine, which truncates it to 0-256
+inline int int_opacity(qreal opacity) {
+    return int(opacity * 256);
+}
+
+// like Qt's solid brushes, the color is combined with the 0-256 integer opacity and premultiplied
+// with 16 bits per channel, then rounded to 8 bits
+inline uint premultiplied_color(const QColor &c, qreal opacity) {
+    uint a = (uint(c.alpha()) * 257 * uint(int_opacity(opacity))) >> 8;
+    auto channel = [a](int v) {
+        uint x = uint(v) * 257 * a;
+        x = (x + (x >> 16) + 0x8000) >> 16;
+        return (x + 128 - ((x + 128) >> 8)) >> 8;
+    };
+    uint a8 = (a + 128 - ((a + 128) >> 8)) >> 8;
+    return (a8 << 24) | (channel(c.red()) << 16) | (channel(c.green()) << 8) | channel(c.blue());
+}
+
+inline qreal clamp01(qreal v) {
+    return v < 0 ? 0 : (v > 1 ? 1 : v);
+}
+
+// index of the first pixel whose center is at or after the device coordinate x
+inline int first_pixel(qreal x) {
+    return int(std::ceil(x - 0.5));
+}
+
+// length of the intersection of [a0, a1) with the pixel [i, i + 1)
+inline qreal pixel_overlap(int i, qreal a0, qreal a1) {
+    return clamp01(std::min(a1, qreal(i + 1)) - std::max(a0, qreal(i)));
+}
+
+inline uint bilinear_sample(const QImage &image, qreal sx, qreal sy) {
+    sx -= 0.5;
+    sy -= 0.5;
+    int x0 = int(std::floor(sx));
+    int y0 = int(std::floor(sy));
+    int fx = int((sx - x0) * 256);
+    int fy = int((sy - y0) * 256);
+    int x1 = std::min(x0 + 1, image.width() - 1);
+    int y1 = std::min(y0 + 1, image.height() - 1);
+    x0 = std::max(x0, 0);
+    y0 = std::max(y0, 0);
+    x1 = std::max(x1, 0);
+    y1 = std::max(y1, 0);
+    uint tl = image.pixel(x0, y0);
+    uint tr = image.pixel(x1, y0);
+    uint bl = image.pixel(x0, y1);
+    uint br = image.pixel(x1, y1);
+    // weights are in 1/256ths, scale them down to the 0-255 range expected by interpolate_255
+    uint wx = fx * 255 / 256;
+    uint wy = fy * 255 / 256;
+    uint top = interpolate_255(tl, 255 - wx, tr, wx);
+    uint bottom = interpolate_255(bl, 255 - wx, br, wx);
+    return interpolate_255(top, 255 - wy, bottom, wy);
+}
+
+// the device pixels first to first + count of one axis of an image scaled to [t0, t1) in device
+// coordinates, t1 < t0 when the axis is flipped, with the source pixel of the i-th one being
+// (base + step * i) >> 16
+struct ScaleSpan {
+    int first;
+    int count;
+    uint32_t base;
+    uint32_t step;
+};
+
+// the alpha that Qt's raster engine multiplies images by for an opacity
+inline int image_alpha(qreal opacity) {
+    int a = int_opacity(opacity);
+    return a >= 256 ? 255 : (a * 255) >> 8;
+}
+
+// one axis of qt_scale_image_32bit(), returns false when no pixel is covered
+bool scale_span(qreal t0, qreal t1, int src_size, int device_size, ScaleSpan *span) {
+    qreal scale = (t1 - t0) / src_size;
+    int step = int(0x00010000 / scale);
+    int p0 = qRound(t0);
+    int p1 = qRound(t1);
+    if (p1 < p0) {
+        std::swap(p0, p1);
+    }
+    p0 = std::max(p0, 0);
+    p1 = std::min(p1, device_size);
+    if (p0 >= p1) {
+        return false;
+    }
+    int count = p1 - p0;
+    uint32_t base;
+    if (scale < 0) {
+        base = uint32_t(src_size * 65536) + uint32_t(int(std::floor((p0 + qreal(0.5) - t1) * step)) + 1);
+        if ((int)(base >> 16) >= src_size) {
+            base += step;
+            count--;
+        }
+    } else {
+        base = uint32_t(int(std::ceil((p0 + qreal(0.5) - t0) * step)) - 1);
+    }
+    int last = (int)((base + (uint32_t)(step) * (uint32_t)(count - 1)) >> 16);
+    if (last < 0 || last >= src_size) {
+        count--;
+    }
+    if (count <= 0) {
+        return false;
+    }
+    span->first = p0;
+    span->count = count;
+    span->base = base;
+    span->step = (uint32_t)(step);
+    return true;
+}
+
+} // namespace
+
+QPainter::QPainter(QImage *img)
+    : device(img) {
+}
+
+#if defined(PROCGEN_QPAINTER_TRACE)
+QPainter::~QPainter() {
+    if (trace != nullptr) {
+        fprintf(trace, "end");
+        trace_image(*device);
+        fprintf(trace, "\n");
+        fclose(trace);
+    }
+}
+
+void QPainter::traceTo(const std::string &directory) {
+    trace_dir = directory;
+    trace = fopen((directory + "/trace.txt").c_str(), "a");
+    if (trace == nullptr) {
+        return;
+    }
+    fprintf(trace, "begin");
+    trace_image(*device);
+    fprintf(trace, "\n");
+}
+
+// write " name width height" to the trace, the premultiplied pixels of the image are saved once in
+// name.argb, named after their hash
+void QPainter::trace_image(const QImage &image) {
+    uint64_t hash = 0xcbf29ce484222325ULL;
+    for (int y = 0; y < image.height(); y++) {
+        const uchar *row = image.constScanLine(y);
+        for (int i = 0; i < image.width() * 4; i++) {
+            hash = (hash ^ row[i]) * 0x100000001b3ULL;
+        }
+    }
+    char name[32];
+    snprintf(name, sizeof(name), "%016llx", (unsigned long long)(hash));
+    fprintf(trace, " %s %d %d", name, image.width(), image.height());
+
+    std::string path = trace_dir + "/" + name + ".argb";
+    FILE *f = fopen(path.c_str(), "rb");
+    if (f == nullptr) {
+        f = fopen(path.c_str(), "wb");
+        for (int y = 0; y < image.height() && f != nullptr; y++) {
+            fwrite(image.constScanLine(y), 4, image.width(), f);
+        }
+    }
+    if (f != nullptr) {
+        fclose(f);
+    }
+}
+#endif
+
+void QPainter::setPen(const QPen &pen) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        const QColor &c = pen.color();
+        fprintf(trace, "pen %d %d %d %d %.17g %d\n", c.red(), c.green(), c.blue(), c.alpha(), pen.width(), int(pen.style()));
+    }
+#endif
+    state.pen_color = pen.color();
+    state.pen_width = pen.width();
+    state.pen_style = pen.style();
+}
+
+void QPainter::setPen(Qt::PenStyle style) {
+    setPen(QPen(style));
+}
+
+void QPainter::setBrush(const QBrush &brush) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        const QColor &c = brush.color();
+        fprintf(trace, "brush %d %d %d %d\n", c.red(), c.green(), c.blue(), c.alpha());
+    }
+#endif
+    state.brush_color = brush.color();
+    state.has_brush = true;
+}
+
+void QPainter::restore() {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "restore\n");
+    }
+#endif
+    if (saved_states.empty()) {
+        return;
+    }
+    state = saved_states.back();
+    saved_states.pop_back();
+}
+
+void QPainter::save() {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "save\n");
+    }
+#endif
+    saved_states.push_back(state);
+}
+
+void QPainter::setRenderHint(RenderHint hint, bool on) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "hint %d %d\n", int(hint), int(on));
+    }
+#endif
+    if (on) {
+        state.render_hints |= hint;
+    } else {
+        state.render_hints &= ~hint;
+    }
+}
+
+bool QPainter::testRenderHint(RenderHint hint) const {
+    return (state.render_hints & hint) != 0;
+}
+
+void QPainter::setOpacity(qreal opacity) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "opacity %.17g\n", opacity);
+    }
+#endif
+    state.opacity = clamp01(opacity);
+}
+
+void QPainter::translate(qreal dx, qreal dy) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "translate %.17g %.17g\n", dx, dy);
+    }
+#endif
+    state.dx += dx * state.m11 + dy * state.m21;
+    state.dy += dx * state.m12 + dy * state.m22;
+}
+
+void QPainter::rotate(qreal a) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "rotate %.17g\n", a);
+    }
+#endif
+    // like QTransform::rotate(), these angles give exact matrices, and images rotated by 180
+    // degrees are only flipped
+    qreal s = 0;
+    qreal c = 0;
+    if (a == 90 || a == -270) {
+        s = 1;
+    } else if (a == 270 || a == -90) {
+        s = -1;
+    } else if (a == 180) {
+        c = -1;
+    } else {
+        qreal rad = a * PI / 180;
+        s = std::sin(rad);
+        c = std::cos(rad);
+    }
+    qreal m11 = c * state.m11 + s * state.m21;
+    qreal m12 = c * state.m12 + s * state.m22;
+    qreal m21 = -s * state.m11 + c * state.m21;
+    qreal m22 = -s * state.m12 + c * state.m22;
+    state.m11 = m11;
+    state.m12 = m12;
+    state.m21 = m21;
+    state.m22 = m22;
+}
+
+void QPainter::setCompositionMode(CompositionMode mode) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "composition %s\n", mode == CompositionMode_Source ? "source" : "source_over");
+    }
+#endif
+    state.composition_mode = mode;
+}
+
+bool QPainter::is_axis_aligned() const {
+    return state.m12 == 0 && state.m21 == 0;
+}
+
+bool QPainter::is_integer_translation() const {
+    return state.m11 == 1 && state.m12 == 0 && state.m21 == 0 && state.m22 == 1 && state.dx == std::floor(state.dx) && state.dy == std::floor(state.dy);
+}
+
+// how much a unit length in user space is scaled in device space, used for pen widths
+qreal QPainter::transform_scale() const {
+    return std::sqrt(std::fabs(state.m11 * state.m22 - state.m12 * state.m21));
+}
+
+void QPainter::map_rect(const QRectF &r, qreal *x0, qreal *y0, qreal *x1, qreal *y1) const {
+    qreal xs[4] = {r.left(), r.right(), r.left(), r.right()};
+    qreal ys[4] = {r.top(), r.top(), r.bottom(), r.bottom()};
+    *x0 = *y0 = INFINITY;
+    *x1 = *y1 = -INFINITY;
+    for (int i = 0; i < 4; i++) {
+        qreal x = state.m11 * xs[i] + state.m21 * ys[i] + state.dx;
+        qreal y = state.m12 * xs[i] + state.m22 * ys[i] + state.dy;
+        *x0 = std::min(*x0, x);
+        *y0 = std::min(*y0, y);
+        *x1 = std::max(*x1, x);
+        *y1 = std::max(*y1, y);
+    }
+}
+
+// composite a premultiplied source pixel onto dst, coverage is in the range 0-255
+void QPainter::blend_pixel(uint *dst, uint src, int coverage) const {
+    if (coverage <= 0) {
+        return;
+    }
+    if (state.composition_mode == CompositionMode_Source) {
+        if (coverage >= 255) {
+            *dst = src;
+        } else {
+            *dst = interpolate_255(src, coverage, *dst, 255 - coverage);
+        }
+    } else {
+        if (coverage < 255) {
+            src = byte_mul(src, coverage);
+        }
+        *dst = src + byte_mul(*dst, 255 - (src >> 24));
+    }
+    if (device->format() == QImage::Format_RGB32) {
+        *dst |= 0xff000000;
+    }
+}
+
+// composite a premultiplied image pixel onto dst with the image alpha
+void QPainter::blend_image_pixel(uint *dst, uint src, int alpha) const {
+    if (alpha < 255) {
+        src = byte_mul(src, alpha);
+    }
+    if (state.composition_mode != CompositionMode_Source && (src >> 24) == 0) {
+        return;
+    }
+    blend_pixel(dst, src, 255);
+}
+
+// Qt's raster engine draws transformed images smaller than 16 pixels as a line as thick as the
+// image, through the middles of its left and right edges, with QRasterizer::rasterizeLine(): the
+// line is clipped to the device, the corners of the quad are snapped down to 1/64 of a pixel, and
+// the edges are stepped down the rows in 16.16 fixed point from the top corner, the spans between
+// them are filled with the source pixels stepped through in 16.16 fixed point along the row.
+// Returns false for horizontal and vertical lines, which are filled like rects
+bool QPainter::draw_small_image(const QRectF &r, const QImage &image, int alpha) {
+    qreal mid_y = (r.top() + r.bottom()) * 0.5;
+    qreal ax = state.m11 * r.left() + state.m21 * mid_y + state.dx;
+    qreal ay = state.m12 * r.left() + state.m22 * mid_y + state.dy;
+    qreal bx = state.m11 * r.right() + state.m21 * mid_y + state.dx;
+    qreal by = state.m12 * r.right() + state.m22 * mid_y + state.dy;
+    qreal width = r.height() / r.width();
+
+    qreal offs_x = std::fabs(by - ay) * width * 0.5;
+    qreal offs_y = std::fabs(bx - ax) * width * 0.5;
+    qreal low[2] = {-offs_x, -offs_y};
+    qreal high[2] = {device->width() + offs_x, device->height() + offs_y};
+    if (!(ax >= low[0] && ax <= high[0] && ay >= low[1] && ay <= high[1]) || !(bx >= low[0] && bx <= high[0] && by >= low[1] && by <= high[1])) {
+        qreal t1 = 0;
+        qreal t2 = 1;
+        qreal o[2] = {ax, ay};
+        qreal d[2] = {bx - ax, by - ay};
+        for (int i = 0; i < 2; i++) {
+            if (d[i] == 0) {
+                if (o[i] <= low[i] || o[i] >= high[i]) {
+                    return true;
+                }
+                continue;
+            }
+            qreal d_inv = 1 / d[i];
+            qreal t_low = (low[i] - o[i]) * d_inv;
+            qreal t_high = (high[i] - o[i]) * d_inv;
+            if (t_low > t_high) {
+                std::swap(t_low, t_high);
+            }
+            t1 = std::max(t1, t_low);
+            t2 = std::min(t2, t_high);
+            if (t1 >= t2) {
+                return true;
+            }
+        }
+        qreal pax = ax + d[0] * t1;
+        qreal pay = ay + d[1] * t1;
+        qreal pbx = ax + d[0] * t2;
+        qreal pby = ay + d[1] * t2;
+        qreal w0 = d[0] * d[0] + d[1] * d[1];
+        qreal w1 = (pax - pbx) * (pax - pbx) + (pay - pby) * (pay - pby);
+        if (w1 == 0) {
+            return true;
+        }
+        width = width * std::sqrt(w0 / w1);
+        ax = pax;
+        ay = pay;
+        bx = pbx;
+        by = pby;
+    }
+    // qFuzzyCompare()
+    auto fuzzy_equal = [](qreal p1, qreal p2) {
+        return std::fabs(p1 - p2) * 1000000000000. <= std::min(std::fabs(p1), std::fabs(p2));
+    };
+    if (fuzzy_equal(ax, bx) || fuzzy_equal(ay, by)) {
+        return false;
+    }
+    if (ay > by) {
+        std::swap(ax, bx);
+        std::swap(ay, by);
+    }
+    qreal delta_x = (bx - ax) * (0.5 * width);
+    qreal delta_y = (by - ay) * (0.5 * width);
+    // the corners of the quad, snapped down to 1/64 of a pixel
+    qreal top[2], left[2], right[2], bottom[2];
+    auto set_corner = [](qreal *c, qreal x, qreal y) {
+        c[0] = std::floor(x * 64) * (1 / qreal(64));
+        c[1] = std::floor(y * 64) * (1 / qreal(64));
+    };
+    if (ax < bx) {
+        set_corner(top, ax + delta_y, ay - delta_x);
+        set_corner(left, ax - delta_y, ay + delta_x);
+        set_corner(right, bx + delta_y, by - delta_x);
+        set_corner(bottom, bx - delta_y, by + delta_x);
+    } else {
+        set_corner(top, ax - delta_y, ay + delta_x);
+        set_corner(left, bx - delta_y, by + delta_x);
+        set_corner(right, ax + delta_y, ay - delta_x);
+        set_corner(bottom, bx + delta_y, by - delta_x);
+    }
+
+    qreal fixed_scale = 65536;
+    // the x step of an edge per row, 0 for horizontal edges like qSafeDivide()
+    auto slope = [&](const qreal *a, const qreal *b) {
+        qreal dy = b[1] - a[1];
+        return dy == 0 ? 0 : (b[0] - a[0]) / dy;
+    };
+    qreal top_left = slope(top, left);
+    qreal top_right = slope(top, right);
+    qreal bottom_left = slope(left, bottom);
+    qreal bottom_right = slope(right, bottom);
+    // where an edge crosses the middle of row y, moved by half a pixel inwards
+    auto intersect = [&](const qreal *c, qreal s, int y, qreal half) {
+        return int((c[0] + half + (y + qreal(0.5) - c[1]) * s) * fixed_scale);
+    };
+    int clip_bottom = device->height();
+    int i_top = std::max(0, int(std::min(std::max(top[1], qreal(0)), qreal(clip_bottom - 1)) + qreal(0.5)));
+    int i_bottom = std::min(clip_bottom, int(std::min(std::max(bottom[1], qreal(0)), qreal(clip_bottom)) + qreal(0.5)));
+    int i_left = int(left[1] + qreal(0.5));
+    int i_right = int(right[1] + qreal(0.5));
+
+    // the inverse of the transform from source pixels to device pixels, moved by 1/65536 of a
+    // source pixel like Qt's QSpanData::setupMatrix()
+    qreal sx = r.width() / image.width();
+    qreal sy = r.height() / image.height();
+    qreal m11 = state.m11 * sx;
+    qreal m12 = state.m12 * sx;
+    qreal m21 = state.m21 * sy;
+    qreal m22 = state.m22 * sy;
+    qreal dx = state.dx + r.left() * state.m11 + r.top() * state.m21;
+    qreal dy = state.dy + r.top() * state.m22 + r.left() * state.m12;
+    dx += (1 / qreal(65536)) * m11 + (1 / qreal(65536)) * m21;
+    dy += (1 / qreal(65536)) * m12 + (1 / qreal(65536)) * m22;
+    qreal inv_det = 1 / (m11 * m22 - m21 * m12);
+    qreal i11 = m22 * inv_det;
+    qreal i12 = -m12 * inv_det;
+    qreal i21 = -m21 * inv_det;
+    qreal i22 = m11 * inv_det;
+    qreal idx = (m21 * dy - m22 * dx) * inv_det;
+    qreal idy = (m12 * dx - m11 * dy) * inv_det;
+    int fdx = int(i11 * fixed_scale);
+    int fdy = int(i12 * fixed_scale);
+
+    auto span = [&](int fixed_left, int fixed_right, int y) {
+        int x0 = std::max(0, fixed_left >> 16);
+        int x1 = std::min(device->width() - 1, fixed_right >> 16);
+        if (y < 0 || y >= device->height() || x1 < x0) {
+            return;
+        }
+        qreal cx = x0 + qreal(0.5);
+        qreal cy = y + qreal(0.5);
+        int fx = int((i21 * cy + i11 * cx + idx) * fixed_scale);
+        int fy = int((i22 * cy + i12 * cx + idy) * fixed_scale);
+        uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+        for (int x = x0; x <= x1; x++) {
+            int px = std::max(0, std::min(image.width() - 1, fx >> 16));
+            int py = std::max(0, std::min(image.height() - 1, fy >> 16));
+            blend_image_pixel(row + x, image.pixel(px, py), alpha);
+            fx += fdx;
+            fy += fdy;
+        }
+    };
+
+    // the rows above the left and right corners, then the rows down to the lower of the two, then
+    // the rows down to the bottom corner
+    int y = i_top;
+    int left_a = intersect(top, top_left, y, 0.5);
+    int right_a = intersect(top, top_right, y, -0.5);
+    int left_b, right_b;
+    for (; y < std::min(i_left, i_right); y++) {
+        span(left_a, right_a, y);
+        left_a += int(top_left * fixed_scale);
+        right_a += int(top_right * fixed_scale);
+    }
+    if (i_left < i_right) {
+        left_b = intersect(left, bottom_left, y, 0.5);
+        for (; y < i_right; y++) {
+            span(left_b, right_a, y);
+            left_b += int(bottom_left * fixed_scale);
+            right_a += int(top_right * fixed_scale);
+        }
+        right_b = intersect(right, bottom_right, y, -0.5);
+    } else {
+        right_b = intersect(right, bottom_right, y, -0.5);
+        for (; y < i_left; y++) {
+            span(left_a, right_b, y);
+            left_a += int(top_left * fixed_scale);
+            right_b += int(bottom_right * fixed_scale);
+        }
+        left_b = intersect(left, bottom_left, y, 0.5);
+    }
+    for (; y < i_bottom; y++) {
+        span(left_b, right_b, y);
+        left_b += int(bottom_left * fixed_scale);
+        right_b += int(bottom_right * fixed_scale);
+    }
+    return true;
+}
+
+namespace {
+
+// iterate over the pixels of the clipped device space box [x0, x1) x [y0, y1), calling
+// fn(dst, u, v) with the pixel center mapped back to user coordinates
+template <typename Fn>
+void for_each_pixel(QImage *device, qreal x0, qreal y0, qreal x1, qreal y1, const qreal inv[6], Fn fn) {
+    int ix0 = std::max(0, int(std::floor(x0)));
+    int iy0 = std::max(0, int(std::floor(y0)));
+    int ix1 = std::min(device->width(), int(std::ceil(x1)));
+    int iy1 = std::min(device->height(), int(std::ceil(y1)));
+    for (int y = iy0; y < iy1; y++) {
+        uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+        qreal py = y + 0.5;
+        for (int x = ix0; x < ix1; x++) {
+            qreal px = x + 0.5;
+            qreal u = inv[0] * px + inv[2] * py + inv[4];
+            qreal v = inv[1] * px + inv[3] * py + inv[5];
+            fn(row + x, u, v);
+        }
+    }
+}
+
+// the spans of Qt's drawEllipse_midpoint_i(), for aliased ellipses in a whole pixel rect, calls
+// span(x, y, length, outline) for the spans of the fill and then of the outline of each row pair
+template <typename Fn>
+void midpoint_ellipse(int rx, int ry, int rw, int rh, Fn span) {
+    int midx = rx + (rw + 1) / 2;
+    int midy = ry + (rh + 1) / 2;
+
+    auto points = [&](int x, int y, int length) {
+        if (length == 0) {
+            return;
+        }
+        x += midx;
+        y = midy - y;
+        int left = midx + (midx - x) - (length - 1) - (rw & 1);
+        int left_length = std::min(length, x - left);
+        int bottom = midy + (midy - y) - (rh & 1);
+        if (left + left_length < x) {
+            int fill = left + left_length - 1;
+            span(fill, y, std::max(0, x - fill), false);
+            if (y < bottom) {
+                span(fill, bottom, std::max(0, x - fill), false);
+            }
+        }
+        span(left, y, left_length, true);
+        span(x, y, length, true);
+        if (y < bottom) {
+            span(left, bottom, left_length, true);
+            span(x, bottom, length, true);
+        }
+    };
+
+    qreal a = qreal(rw) / 2;
+    qreal b = qreal(rh) / 2;
+    qreal d = b * b - (a * a * b) + 0.25 * a * a;
+    int x = 0;
+    int y = (rh + 1) / 2;
+    int start_x = x;
+
+    while (a * a * (2 * y - 1) > 2 * b * b * (x + 1)) {
+        if (d < 0) {
+            d += b * b * (2 * x + 3);
+            ++x;
+        } else {
+            d += b * b * (2 * x + 3) + a * a * (-2 * y + 2);
+            points(start_x, y, x - start_x + 1);
+            start_x = ++x;
+            --y;
+        }
+    }
+    points(start_x, y, x - start_x + 1);
+
+    d = b * b * (x + 0.5) * (x + 0.5) + a * a * ((y - 1) * (y - 1) - b * b);
+    int min_y = rh & 1;
+    while (y > min_y) {
+        if (d < 0) {
+            d += b * b * (2 * x + 2) + a * a * (-2 * y + 3);
+            ++x;
+        } else {
+            d += a * a * (-2 * y + 3);
+        }
+        --y;
+        points(x, y, 1);
+    }
+}
+
+} // namespace
+
+void QPainter::fillRect(const QRectF &r, const QColor &color) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "fill_rect_f %.17g %.17g %.17g %.17g %d %d %d %d\n", r.x(), r.y(), r.width(), r.height(), color.red(), color.green(), color.blue(), color.alpha());
+    }
+#endif
+    fill_rect(r, color);
+}
+
+void QPainter::fill_rect(const QRectF &r, const QColor &color) {
+    if (device->isNull() || r.width() <= 0 || r.height() <= 0) {
+        return;
+    }
+    uint src = premultiplied_color(color, state.opacity);
+    bool antialiasing = state.render_hints & Antialiasing;
+
+    if (is_axis_aligned()) {
+        qreal x0, y0, x1, y1;
+        map_rect(r, &x0, &y0, &x1, &y1);
+        if (!antialiasing) {
+            int ix0 = std::max(0, first_pixel(x0));
+            int iy0 = std::max(0, first_pixel(y0));
+            int ix1 = std::min(device->width(), first_pixel(x1));
+            int iy1 = std::min(device->height(), first_pixel(y1));
+            bool opaque = (src >> 24) == 255 || state.composition_mode == CompositionMode_Source;
+            for (int y = iy0; y < iy1; y++) {
+                uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+                if (opaque && device->format() != QImage::Format_RGB32) {
+                    std::fill(row + ix0, row + ix1, src);
+                } else {
+                    for (int x = ix0; x < ix1; x++) {
+                        blend_pixel(row + x, src, 255);
+                    }
+                }
+            }
+            return;
+        }
+        int ix0 = std::max(0, int(std::floor(x0)));
+        int iy0 = std::max(0, int(std::floor(y0)));
+        int ix1 = std::min(device->width(), int(std::ceil(x1)));
+        int iy1 = std::min(device->height(), int(std::ceil(y1)));
+        for (int y = iy0; y < iy1; y++) {
+            uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+            qreal cy = pixel_overlap(y, y0, y1);
+            for (int x = ix0; x < ix1; x++) {
+                blend_pixel(row + x, src, to_alpha(cy * pixel_overlap(x, x0, x1)));
+            }
+        }
+        return;
+    }
+
+    qreal det = state.m11 * state.m22 - state.m12 * state.m21;
+    if (det == 0) {
+        return;
+    }
+    qreal inv[6];
+    inv[0] = state.m22 / det;
+    inv[1] = -state.m12 / det;
+    inv[2] = -state.m21 / det;
+    inv[3] = state.m11 / det;
+    inv[4] = (state.m21 * state.dy - state.m22 * state.dx) / det;
+    inv[5] = (state.m12 * state.dx - state.m11 * state.dy) / det;
+    qreal scale = transform_scale();
+    qreal x0, y0, x1, y1;
+    map_rect(r, &x0, &y0, &x1, &y1);
+    for_each_pixel(device, x0, y0, x1, y1, inv, [&](uint *dst, qreal u, qreal v) {
+        if (antialiasing) {
+            // distance to the nearest edge in device pixels
+            qreal du = std::min(u - r.left(), r.right() - u) * scale;
+            qreal dv = std::min(v - r.top(), r.bottom() - v) * scale;
+            blend_pixel(dst, src, to_alpha(clamp01(du + 0.5) * clamp01(dv + 0.5)));
+        } else if (u >= r.left() && u < r.right() && v >= r.top() && v < r.bottom()) {
+            blend_pixel(dst, src, 255);
+        }
+    });
+}
+
+void QPainter::fillRect(const QRect &r, const QColor &color) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "fill_rect %d %d %d %d %d %d %d %d\n", r.x(), r.y(), r.width(), r.height(), color.red(), color.green(), color.blue(), color.alpha());
+    }
+#endif
+    fill_rect(QRectF(r), color);
+}
+
+void QPainter::drawImage(const QRectF &r, const QImage &image) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "draw_image_f %.17g %.17g %.17g %.17g", r.x(), r.y(), r.width(), r.height());
+        trace_image(image);
+        fprintf(trace, "\n");
+    }
+#endif
+    draw_image(r, image);
+}
+
+void QPainter::draw_image(const QRectF &r, const QImage &image) {
+    if (device->isNull() || image.isNull() || r.width() <= 0 || r.height() <= 0) {
+        return;
+    }
+    int alpha = image_alpha(state.opacity);
+    if (alpha == 0) {
+        return;
+    }
+    bool smooth = state.render_hints & SmoothPixmapTransform;
+    qreal sx_scale = image.width() / r.width();
+    qreal sy_scale = image.height() / r.height();
+
+
+    if (is_axis_aligned() && !smooth) {
+        // the pixels and source pixels of Qt's raster engine (qt_scale_image_32bit()): the
+        // device rect is rounded to whole pixels and the source is stepped through in 16.16
+        // fixed point, a source edge that falls on a pixel center goes to the pixel before it
+        ScaleSpan xs;
+        ScaleSpan ys;
+        if (!scale_span(state.m11 * r.left() + state.dx, state.m11 * r.right() + state.dx, image.width(), device->width(), &xs) ||
+            !scale_span(state.m22 * r.top() + state.dy, state.m22 * r.bottom() + state.dy, image.height(), device->height(), &ys)) {
+            return;
+        }
+        std::vector<int> src_x(xs.count);
+        for (int i = 0; i < xs.count; i++) {
+            src_x[i] = (int)((xs.base + xs.step * (uint32_t)(i)) >> 16);
+        }
+        for (int j = 0; j < ys.count; j++) {
+            int sy = (int)((ys.base + ys.step * (uint32_t)(j)) >> 16);
+            const uint *src_row = reinterpret_cast<const uint *>(image.constScanLine(sy));
+            uint *row = reinterpret_cast<uint *>(device->scanLine(ys.first + j)) + xs.first;
+            for (int i = 0; i < xs.count; i++) {
+                blend_image_pixel(row + i, src_row[src_x[i]], alpha);
+            }
+        }
+        return;
+    }
+
+    qreal det = state.m11 * state.m22 - state.m12 * state.m21;
+    if (det == 0) {
+        return;
+    }
+    qreal inv[6];
+    inv[0] = state.m22 / det;
+    inv[1] = -state.m12 / det;
+    inv[2] = -state.m21 / det;
+    inv[3] = state.m11 / det;
+    inv[4] = (state.m21 * state.dy - state.m22 * state.dx) / det;
+    inv[5] = (state.m12 * state.dx - state.m11 * state.dy) / det;
+    qreal x0, y0, x1, y1;
+    map_rect(r, &x0, &y0, &x1, &y1);
+
+    if (!smooth && (x1 - x0 < 16 || y1 - y0 < 16) && draw_small_image(r, image, alpha)) {
+        return;
+    }
+
+    for_each_pixel(device, x0, y0, x1, y1, inv, [&](uint *dst, qreal u, qreal v) {
+        if (u < r.left() || u >= r.right() || v < r.top() || v >= r.bottom()) {
+            return;
+        }
+        qreal sx = (u - r.left()) * sx_scale;
+        qreal sy = (v - r.top()) * sy_scale;
+        if (smooth) {
+            blend_image_pixel(dst, bilinear_sample(image, sx, sy), alpha);
+        } else {
+            int ix = std::min(image.width() - 1, int(sx));
+            int iy = std::min(image.height() - 1, int(sy));
+            blend_image_pixel(dst, image.pixel(ix, iy), alpha);
+        }
+    });
+}
+
+void QPainter::drawImage(const QPoint &p, const QImage &image) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "draw_image %d %d", p.x(), p.y());
+        trace_image(image);
+        fprintf(trace, "\n");
+    }
+#endif
+    if (!is_integer_translation()) {
+        draw_image(QRectF(p.x(), p.y(), image.width(), image.height()), image);
+        return;
+    }
+    if (device->isNull() || image.isNull()) {
+        return;
+    }
+    int alpha = image_alpha(state.opacity);
+    if (alpha == 0) {
+        return;
+    }
+    // every device pixel maps to exactly one source pixel, so this is a plain blit
+    int left = p.x() + int(state.dx);
+    int top = p.y() + int(state.dy);
+    int ix0 = std::max(0, left);
+    int iy0 = std::max(0, top);
+    int ix1 = std::min(device->width(), left + image.width());
+    int iy1 = std::min(device->height(), top + image.height());
+    bool source = state.composition_mode == CompositionMode_Source;
+    uint opaque_bits = device->format() == QImage::Format_RGB32 ? 0xff000000 : 0;
+    for (int y = iy0; y < iy1; y++) {
+        const uint *src_row = reinterpret_cast<const uint *>(image.constScanLine(y - top));
+        uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+        for (int x = ix0; x < ix1; x++) {
+            uint src = src_row[x - left];
+            if (alpha < 255) {
+                src = byte_mul(src, alpha);
+            }
+            uint a = src >> 24;
+            if (source || a == 255) {
+                row[x] = src | opaque_bits;
+            } else if (a != 0) {
+                row[x] = (src + byte_mul(row[x], 255 - a)) | opaque_bits;
+            }
+        }
+    }
+}
+
+void QPainter::drawEllipse(const QRect &r) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "draw_ellipse %d %d %d %d\n", r.x(), r.y(), r.width(), r.height());
+    }
+#endif
+    draw_ellipse(QRectF(r));
+}
+
+void QPainter::drawEllipse(const QRectF &r) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "draw_ellipse_f %.17g %.17g %.17g %.17g\n", r.x(), r.y(), r.width(), r.height());
+    }
+#endif
+    draw_ellipse(r);
+}
+
+void QPainter::draw_ellipse(const QRectF &r) {
+    bool has_pen = state.pen_style != Qt::NoPen;
+    if (device->isNull() || (!has_pen && !state.has_brush)) {
+        return;
+    }
+    qreal det = state.m11 * state.m22 - state.m12 * state.m21;
+    if (det == 0) {
+        return;
+    }
+    qreal inv[6];
+    inv[0] = state.m22 / det;
+    inv[1] = -state.m12 / det;
+    inv[2] = -state.m21 / det;
+    inv[3] = state.m11 / det;
+    inv[4] = (state.m21 * state.dy - state.m22 * state.dx) / det;
+    inv[5] = (state.m12 * state.dx - state.m11 * state.dy) / det;
+
+    bool antialiasing = state.render_hints & Antialiasing;
+    uint pen_src = premultiplied_color(state.pen_color, state.opacity);
+    uint brush_src = premultiplied_color(state.brush_color, state.opacity);
+
+    if (!antialiasing && is_axis_aligned() && (!has_pen || state.pen_width * std::max(std::fabs(state.m11), std::fabs(state.m22)) <= 1)) {
+        // like Qt, an ellipse in a whole pixel rect with a pen of at most one pixel is drawn
+        // with the midpoint algorithm
+        qreal x0, y0, x1, y1;
+        map_rect(r, &x0, &y0, &x1, &y1);
+        int ix = int(x0);
+        int iy = int(y0);
+        if (ix == x0 && iy == y0 && int(x1) == x1 && int(y1) == y1) {
+            midpoint_ellipse(ix, iy, int(x1) - ix, int(y1) - iy, [&](int x, int y, int length, bool outline) {
+                if ((outline ? !has_pen : !state.has_brush) || y < 0 || y >= device->height()) {
+                    return;
+                }
+                uint *row = reinterpret_cast<uint *>(device->scanLine(y));
+                uint src = outline ? pen_src : brush_src;
+                for (int i = std::max(x, 0); i < std::min(x + length, device->width()); i++) {
+                    blend_pixel(row + i, src, 255);
+                }
+            });
+            return;
+        }
+    }
+
+    qreal scale = transform_scale();
+    // a pen width of 0 is a cosmetic pen that is always 1 device pixel wide
+    qreal half_pen = has_pen ? (state.pen_width > 0 ? state.pen_width / 2 : 0.5 / scale) : 0;
+    qreal cx = r.left() + r.width() / 2;
+    qreal cy = r.top() + r.height() / 2;
+    qreal a = std::fabs(r.width()) / 2;
+    qreal b = std::fabs(r.height()) / 2;
+
+    // approximate signed distance in device pixels from (u, v) to the ellipse with radii (ra, rb)
+    auto distance = [&](qreal u, qreal v, qreal ra, qreal rb) -> qreal {
+        if (ra <= 0 || rb <= 0) {
+            return INFINITY;
+        }
+        qreal nu = u / ra;
+        qreal nv = v / rb;
+        qreal f = nu * nu + nv * nv;
+        qreal grad = 2 * std::sqrt(nu * nu / (ra * ra) + nv * nv / (rb * rb));
+        if (grad == 0) {
+            return -std::min(ra, rb) * scale;
+        }
+        return (f - 1) / grad * scale;
+    };
+    auto coverage = [&](qreal d) -> qreal {
+        if (antialiasing) {
+            return clamp01(0.5 - d);
+        }
+        return d <= 0 ? 1 : 0;
+    };
+
+    QRectF bounds(r.left() - half_pen - 1, r.top() - half_pen - 1, r.width() + 2 * half_pen + 2, r.height() + 2 * half_pen + 2);
+    qreal x0, y0, x1, y1;
+    map_rect(bounds, &x0, &y0, &x1, &y1);
+    for_each_pixel(device, x0, y0, x1, y1, inv, [&](uint *dst, qreal u, qreal v) {
+        u -= cx;
+        v -= cy;
+        if (state.has_brush) {
+            blend_pixel(dst, brush_src, to_alpha(coverage(distance(u, v, a, b))));
+        }
+        if (has_pen) {
+            qreal outer = coverage(distance(u, v, a + half_pen, b + half_pen));
+            qreal inner = coverage(distance(u, v, a - half_pen, b - half_pen));
+            blend_pixel(dst, pen_src, to_alpha(outer * (1 - inner)));
+        }
+    });
+}
+
+void QPainter::drawLine(int x1, int y1, int x2, int y2) {
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (trace != nullptr) {
+        fprintf(trace, "draw_line %d %d %d %d\n", x1, y1, x2, y2);
+    }
+#endif
+    if (device->isNull() || state.pen_style == Qt::NoPen) {
+        return;
+    }
+    qreal px1 = state.m11 * x1 + state.m21 * y1 + state.dx;
+    qreal py1 = state.m12 * x1 + state.m22 * y1 + state.dy;
+    qreal px2 = state.m11 * x2 + state.m21 * y2 + state.dx;
+    qreal py2 = state.m12 * x2 + state.m22 * y2 + state.dy;
+    bool antialiasing = state.render_hints & Antialiasing;
+    uint src = premultiplied_color(state.pen_color, state.opacity);
+
+    qreal pen_scale = std::sqrt(std::max(state.m11 * state.m11 + state.m21 * state.m21, state.m12 * state.m12 + state.m22 * state.m22));
+    if (!antialiasing && (state.pen_width == 0 || state.pen_width * pen_scale == 1)) {
+        // like Qt's QCosmeticStroker, lines of one pixel are stepped through along their major
+        // axis in fixed point, from the rounded ends extended by half a pixel for the square caps
+        if (px1 == px2 && py1 == py2) {
+            int x = int(std::floor(px1 + 0.5));
+            int y = int(std::floor(py1 + 0.5));
+            if (x >= 0 && x < device->width() && y >= 0 && y < device->height()) {
+                blend_pixel(reinterpret_cast<uint *>(device->scanLine(y)) + x, src, 255);
+            }
+            return;
+        }
+        // the ends are first clipped to one pixel outside of the device, which moves them along
+        // the line
+        qreal xmin = -1;
+        qreal xmax = device->width() + 1;
+        qreal ymin = -1;
+        qreal ymax = device->height() + 1;
+        if (px1 < xmin) {
+            if (px2 <= xmin) {
+                return;
+            }
+            py1 += (py2 - py1) / (px2 - px1) * (xmin - px1);
+            px1 = xmin;
+        } else if (px1 > xmax) {
+            if (px2 >= xmax) {
+                return;
+            }
+            py1 += (py2 - py1) / (px2 - px1) * (xmax - px1);
+            px1 = xmax;
+        }
+        if (px2 < xmin) {
+            py2 += (py2 - py1) / (px2 - px1) * (xmin - px2);
+            px2 = xmin;
+        } else if (px2 > xmax) {
+            py2 += (py2 - py1) / (px2 - px1) * (xmax - px2);
+            px2 = xmax;
+        }
+        if (py1 < ymin) {
+            if (py2 <= ymin) {
+                return;
+            }
+            px1 += (px2 - px1) / (py2 - py1) * (ymin - py1);
+            py1 = ymin;
+        } else if (py1 > ymax) {
+            if (py2 >= ymax) {
+                return;
+            }
+            px1 += (px2 - px1) / (py2 - py1) * (ymax - py1);
+            py1 = ymax;
+        }
+        if (py2 < ymin) {
+            px2 += (px2 - px1) / (py2 - py1) * (ymin - py2);
+            py2 = ymin;
+        } else if (py2 > ymax) {
+            px2 += (px2 - px1) / (py2 - py1) * (ymax - py2);
+            py2 = ymax;
+        }
+
+        int fx1 = int(px1 * 64);
+        int fy1 = int(py1 * 64);
+        int fx2 = int(px2 * 64);
+        int fy2 = int(py2 * 64);
+        bool vertical = std::abs(fx2 - fx1) < std::abs(fy2 - fy1);
+        if (vertical) {
+            std::swap(fx1, fy1);
+            std::swap(fx2, fy2);
+        }
+        if (fx1 == fx2) {
+            return;
+        }
+        if (fx1 > fx2) {
+            std::swap(fx1, fx2);
+            std::swap(fy1, fy2);
+        }
+        int inc = (int)(((int64_t)(fy2 - fy1) << 16) / (fx2 - fx1));
+        int minor = fy1 * (1 << 10) - (inc >> 1);
+        fx1 -= 32;
+        fx2 += 32;
+        int major = (fx1 + 32) >> 6;
+        int major_end = (fx2 + 32) >> 6;
+        int round = inc > 0 ? 32 : 0;
+        minor += (int)(((int64_t)(major * (1 << 6)) + round - fx1) * inc >> 6);
+        for (; major < major_end; major++, minor += inc) {
+            int x = vertical ? minor >> 16 : major;
+            int y = vertical ? major : minor >> 16;
+            if (x >= 0 && x < device->width() && y >= 0 && y < device->height()) {
+                blend_pixel(reinterpret_cast<uint *>(device->scanLine(y)) + x, src, 255);
+            }
+        }
+        return;
+    }
+
+    qreal half = state.pen_width > 0 ? state.pen_width * transform_scale() / 2 : 0.5;
+    half = std::max(half, qreal(0.5));
+    qreal dx = px2 - px1;
+    qreal dy = py2 - py1;
+    qreal len = std::sqrt(dx * dx + dy * dy);
+    // lines use Qt's default square cap, which extends the line by half the pen width at both ends
+    qreal tx = len > 0 ? dx / len : 1;
+    qreal ty = len > 0 ? dy / len : 0;
+
+    qreal identity[6] = {1, 0, 0, 1, 0, 0};
+    qreal bx0 = std::min(px1, px2) - half - 1;
+    qreal by0 = std::min(py1, py2) - half - 1;
+    qreal bx1 = std::max(px1, px2) + half + 1;
+    qreal by1 = std::max(py1, py2) + half + 1;
+    for_each_pixel(device, bx0, by0, bx1, by1, identity, [&](uint *dst, qreal x, qreal y) {
+        qreal rx = x - px1;
+        qreal ry = y - py1;
+        // distance along and across the line
+        qreal along = rx * tx + ry * ty;
+        qreal across = std::fabs(-rx * ty + ry * tx);
+        qreal d = std::max(across - half, std::max(-half - along, along - len - half));
+        if (antialiasing) {
+            blend_pixel(dst, src, to_alpha(clamp01(0.5 - d)));
+        } else if (d < 0) {
+            blend_pixel(dst, src, 255);
+        }
+    });
+}
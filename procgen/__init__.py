@@ -5,8 +5,19 @@ version_path = os.path.join(SCRIPT_DIR, "version.txt")
 __version__ = open(version_path).read()
 
 from .env import ProcgenEnv, ProcgenGym3Env
+from .rollout import RolloutBuffer
+from .sharded import ShardedProcgenGym3Env
+from .trajectory import Trajectory, TrajectoryRecorder, replay_frames
 from .gym_registration import register_environments
 
 register_environments()
 
-__all__ = ["ProcgenEnv", "ProcgenGym3Env"]
+__all__ = [
+    "ProcgenEnv",
+    "ProcgenGym3Env",
+    "RolloutBuffer",
+    "ShardedProcgenGym3Env",
+    "Trajectory",
+    "TrajectoryRecorder",
+    "replay_frames",
+]
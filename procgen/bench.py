@@ -0,0 +1,390 @@
+#!/usr/bin/env python
+"""
+Throughput benchmarks of the procgen environments
+
+    python -m procgen.bench run --output results.json
+    python -m procgen.bench compare baseline.json results.json
+
+`run` measures every combination of the swept settings and writes the results to a JSON file
+together with information about the machine. `compare` matches the results of two files by their
+settings and exits with a nonzero status when a metric got worse by more than the threshold, so it
+can gate an upgrade of this package on the machine the baseline was measured on.
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from procgen import ProcgenGym3Env, __version__
+
+from .env import DISTRIBUTION_MODE_DICT, ENV_NAMES, EXPLORATION_LEVEL_SEEDS, SCRIPT_DIR
+
+# should match the checks of the distribution mode in Game::parse_options()
+EXTREME_MODE_ENV_NAMES = ["chaser", "dodgeball", "leaper", "starpilot"]
+MEMORY_MODE_ENV_NAMES = ["caveflyer", "dodgeball", "heist", "jumper", "maze", "miner"]
+
+# "rgb" only renders the observations, "human" also renders the large rgb image into the info
+RENDER_MODES = {"rgb": None, "human": "rgb_array"}
+
+# the settings that identify a result, and whether a larger value is better for each metric
+RESULT_KEYS = ["env_name", "distribution_mode", "num", "num_threads", "render_mode"]
+METRICS = {
+    "steps_per_second": True,
+    "reset_seconds": False,
+    "observe_seconds": False,
+    "get_state_per_second": True,
+    "set_state_per_second": True,
+}
+
+
+def supports_distribution_mode(env_name, distribution_mode):
+    if distribution_mode == "extreme":
+        return env_name in EXTREME_MODE_ENV_NAMES
+    if distribution_mode == "memory":
+        return env_name in MEMORY_MODE_ENV_NAMES
+    if distribution_mode == "exploration":
+        return env_name in EXPLORATION_LEVEL_SEEDS
+    return distribution_mode in DISTRIBUTION_MODE_DICT
+
+
+def make_env(env_name, distribution_mode="hard", num=16, num_threads=0, render_mode="rgb"):
+    return ProcgenGym3Env(
+        num=num,
+        env_name=env_name,
+        distribution_mode=distribution_mode,
+        num_threads=num_threads,
+        render_mode=RENDER_MODES[render_mode],
+        rand_seed=0,
+    )
+
+
+def random_actions(env, num_steps, seed=0):
+    rng = np.random.RandomState(seed)
+    return rng.randint(
+        low=0, high=env.ac_space.eltype.n, size=(num_steps, env.num), dtype=np.int32
+    )
+
+
+# the workloads that are timed, each returns the number of items it processed
+
+
+def run_steps(env, actions):
+    for ac in actions:
+        env.act(ac)
+        env.observe()
+    return len(actions) * env.num
+
+
+def run_reset(env):
+    # an action of -1 makes every game reset on its next step
+    env.act(np.full(env.num, -1, dtype=np.int32))
+    env.observe()
+    return 1
+
+
+def run_observe(env):
+    env.observe()
+    return 1
+
+
+def run_get_state(env):
+    env.get_state()
+    return env.num
+
+
+def run_set_state(env, states):
+    env.set_state(states)
+    return env.num
+
+
+def time_per_item(fn, min_seconds, min_rounds=3):
+    """
+    Call fn() repeatedly for at least min_seconds and min_rounds after one call to warm up, and
+    return the median time per item processed
+    """
+    fn()
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_rounds or time.perf_counter() - start < min_seconds:
+        round_start = time.perf_counter()
+        num_items = fn()
+        times.append((time.perf_counter() - round_start) / num_items)
+    return float(np.median(times))
+
+
+def measure(
+    env_name,
+    distribution_mode="hard",
+    num=16,
+    num_threads=0,
+    render_mode="rgb",
+    num_steps=32,
+    min_seconds=1.0,
+):
+    """
+    Measure the throughput of one combination of settings, returns a dict with the settings and
+    the metrics in METRICS
+    """
+    env = make_env(
+        env_name,
+        distribution_mode=distribution_mode,
+        num=num,
+        num_threads=num_threads,
+        render_mode=render_mode,
+    )
+    actions = random_actions(env, num_steps)
+    # play a while first so that the levels are past their initial state
+    run_steps(env, actions)
+
+    result = {
+        "env_name": env_name,
+        "distribution_mode": distribution_mode,
+        "num": num,
+        "num_threads": num_threads,
+        "render_mode": render_mode,
+    }
+    result["steps_per_second"] = 1 / time_per_item(
+        lambda: run_steps(env, actions), min_seconds
+    )
+    result["reset_seconds"] = time_per_item(lambda: run_reset(env), min_seconds)
+    result["observe_seconds"] = time_per_item(lambda: run_observe(env), min_seconds)
+    states = env.get_state()
+    result["state_bytes"] = float(np.mean([len(state) for state in states]))
+    result["get_state_per_second"] = 1 / time_per_item(
+        lambda: run_get_state(env), min_seconds
+    )
+    result["set_state_per_second"] = 1 / time_per_item(
+        lambda: run_set_state(env, states), min_seconds
+    )
+    return result
+
+
+def get_cpu_model():
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def get_git_commit():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], cwd=SCRIPT_DIR, stderr=subprocess.DEVNULL
+            )
+            .decode("ascii")
+            .strip()
+        )
+    except Exception:
+        return None
+
+
+def get_machine_info():
+    if hasattr(os, "sched_getaffinity"):
+        num_usable_cpus = len(os.sched_getaffinity(0))
+    else:
+        num_usable_cpus = os.cpu_count()
+    return {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_model": get_cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "usable_cpu_count": num_usable_cpus,
+        "python_version": platform.python_version(),
+        "numpy_version": np.__version__,
+        "procgen_version": __version__.strip(),
+        "git_commit": get_git_commit(),
+        "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def run(args):
+    combos = [
+        combo
+        for combo in itertools.product(
+            args.env_names,
+            args.distribution_modes,
+            args.nums,
+            args.num_threads,
+            args.render_modes,
+        )
+        if supports_distribution_mode(combo[0], combo[1])
+    ]
+
+    results = []
+    for i, (env_name, distribution_mode, num, num_threads, render_mode) in enumerate(combos):
+        result = measure(
+            env_name,
+            distribution_mode=distribution_mode,
+            num=num,
+            num_threads=num_threads,
+            render_mode=render_mode,
+            num_steps=args.num_steps,
+            min_seconds=args.min_seconds,
+        )
+        results.append(result)
+        print(
+            f"[{i + 1}/{len(combos)}] {format_key(result)}: "
+            f"{result['steps_per_second']:.0f} steps/s",
+            flush=True,
+        )
+
+    output = {
+        "machine": get_machine_info(),
+        "settings": {"num_steps": args.num_steps, "min_seconds": args.min_seconds},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(output, f, indent=2)
+    print(f"wrote {len(results)} results to {args.output}")
+    return 0
+
+
+def format_key(result):
+    return " ".join(f"{key}={result[key]}" for key in RESULT_KEYS)
+
+
+def find_regressions(baseline, current, threshold):
+    """
+    Compare the results of two result files, returns a list of (result, metric, baseline value,
+    current value) for every metric that got worse by more than the fraction threshold
+    """
+    baseline_results = {
+        tuple(r[key] for key in RESULT_KEYS): r for r in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        baseline_result = baseline_results.get(tuple(result[key] for key in RESULT_KEYS))
+        if baseline_result is None:
+            continue
+        for metric, larger_is_better in METRICS.items():
+            old = baseline_result[metric]
+            new = result[metric]
+            if larger_is_better:
+                is_worse = new < old * (1 - threshold)
+            else:
+                is_worse = new > old * (1 + threshold)
+            if is_worse:
+                regressions.append((result, metric, old, new))
+    return regressions
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    for name in ["cpu_model", "usable_cpu_count", "platform"]:
+        if baseline["machine"].get(name) != current["machine"].get(name):
+            print(
+                f"warning: {name} differs, {baseline['machine'].get(name)!r} in the baseline "
+                f"and {current['machine'].get(name)!r} now"
+            )
+
+    baseline_keys = {tuple(r[key] for key in RESULT_KEYS) for r in baseline["results"]}
+    num_matched = sum(
+        tuple(r[key] for key in RESULT_KEYS) in baseline_keys for r in current["results"]
+    )
+    print(f"compared {num_matched} of {len(current['results'])} results with the baseline")
+
+    regressions = find_regressions(baseline, current, args.threshold)
+    for result, metric, old, new in regressions:
+        print(f"REGRESSION {format_key(result)} {metric}: {old:.6g} -> {new:.6g}")
+    if len(regressions) > 0:
+        print(f"{len(regressions)} regressions of more than {args.threshold:.0%}")
+        return 1
+    print(f"no regressions of more than {args.threshold:.0%}")
+    return 0
+
+
+def main():
+    default_str = "(default: %(default)s)"
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the procgen environments"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser(
+        "run", help="measure every combination of the given settings"
+    )
+    run_parser.add_argument(
+        "--output", default="procgen-bench.json", help="file to write the results to " + default_str
+    )
+    run_parser.add_argument(
+        "--env-names",
+        nargs="+",
+        default=ENV_NAMES,
+        choices=ENV_NAMES,
+        help="games to measure (default: all of them)",
+    )
+    run_parser.add_argument(
+        "--distribution-modes",
+        nargs="+",
+        default=["easy", "hard", "extreme", "memory", "exploration"],
+        choices=list(DISTRIBUTION_MODE_DICT),
+        help="distribution modes to measure, modes a game doesn't support are skipped " + default_str,
+    )
+    run_parser.add_argument(
+        "--nums", nargs="+", type=int, default=[1, 64], help="numbers of environments " + default_str
+    )
+    run_parser.add_argument(
+        "--num-threads",
+        nargs="+",
+        type=int,
+        default=[0, 4],
+        help="numbers of stepping threads " + default_str,
+    )
+    run_parser.add_argument(
+        "--render-modes",
+        nargs="+",
+        default=list(RENDER_MODES),
+        choices=list(RENDER_MODES),
+        help="rgb renders the observations only, human also renders the info image " + default_str,
+    )
+    run_parser.add_argument(
+        "--num-steps",
+        type=int,
+        default=32,
+        help="steps of every environment per timed round " + default_str,
+    )
+    run_parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=1.0,
+        help="minimum time spent measuring each metric " + default_str,
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="flag the regressions of a result file compared to a baseline"
+    )
+    compare_parser.add_argument("baseline", help="result file of the baseline")
+    compare_parser.add_argument("current", help="result file to check")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fraction a metric may get worse before it is a regression " + default_str,
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
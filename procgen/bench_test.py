@@ -0,0 +1,150 @@
+import copy
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from . import bench
+from .env import ENV_NAMES
+
+
+@pytest.mark.parametrize("render_mode", list(bench.RENDER_MODES))
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_step_speed(env_name, render_mode, benchmark):
+    num_envs = 4
+    num_steps = 8
+    env = bench.make_env(env_name, num=num_envs, render_mode=render_mode)
+    actions = bench.random_actions(env, num_steps)
+    benchmark(bench.run_steps, env, actions)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_reset_speed(env_name, benchmark):
+    env = bench.make_env(env_name, num=4)
+    benchmark(bench.run_reset, env)
+    benchmark.extra_info["reset_seconds"] = benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_observe_speed(env_name, benchmark):
+    env = bench.make_env(env_name, num=16)
+    benchmark(bench.run_observe, env)
+    benchmark.extra_info["observe_seconds"] = benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_get_state_speed(env_name, benchmark):
+    num_envs = 16
+    env = bench.make_env(env_name, num=num_envs)
+    bench.run_steps(env, bench.random_actions(env, 32))
+    benchmark(bench.run_get_state, env)
+    benchmark.extra_info["get_state_per_second"] = num_envs / benchmark.stats.stats.mean
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_set_state_speed(env_name, benchmark):
+    num_envs = 16
+    env = bench.make_env(env_name, num=num_envs)
+    bench.run_steps(env, bench.random_actions(env, 32))
+    states = env.get_state()
+    benchmark(bench.run_set_state, env, states)
+    benchmark.extra_info["set_state_per_second"] = num_envs / benchmark.stats.stats.mean
+
+
+def make_result(env_name, **metrics):
+    result = {
+        "env_name": env_name,
+        "distribution_mode": "hard",
+        "num": 1,
+        "num_threads": 0,
+        "render_mode": "rgb",
+        "steps_per_second": 1000.0,
+        "reset_seconds": 0.01,
+        "observe_seconds": 0.001,
+        "get_state_per_second": 100.0,
+        "set_state_per_second": 100.0,
+    }
+    result.update(metrics)
+    return result
+
+
+def test_find_regressions():
+    baseline = {"results": [make_result("coinrun"), make_result("maze")]}
+    current = {
+        "results": [
+            # within the threshold
+            make_result("coinrun", steps_per_second=950.0, reset_seconds=0.0105),
+            make_result("maze", steps_per_second=800.0, observe_seconds=0.002),
+            # not in the baseline
+            make_result("heist", steps_per_second=1.0),
+        ]
+    }
+    regressions = bench.find_regressions(baseline, current, threshold=0.1)
+    assert [(r["env_name"], metric) for r, metric, _, _ in regressions] == [
+        ("maze", "steps_per_second"),
+        ("maze", "observe_seconds"),
+    ]
+    assert bench.find_regressions(baseline, current, threshold=1.5) == []
+
+
+def test_bench_cli(tmp_path):
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run_bench(*args):
+        return subprocess.run(
+            [sys.executable, "-m", "procgen.bench"] + list(args),
+            stdout=subprocess.PIPE,
+            cwd=repo_dir,
+        )
+
+    baseline_path = str(tmp_path / "baseline.json")
+    proc = run_bench(
+        "run",
+        "--output",
+        baseline_path,
+        "--env-names",
+        "coinrun",
+        "maze",
+        "--distribution-modes",
+        "hard",
+        "memory",
+        "--nums",
+        "2",
+        "--num-threads",
+        "0",
+        "--render-modes",
+        "rgb",
+        "--num-steps",
+        "2",
+        "--min-seconds",
+        "0",
+    )
+    assert proc.returncode == 0
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    assert "cpu_model" in baseline["machine"]
+    # coinrun doesn't support memory mode
+    assert [(r["env_name"], r["distribution_mode"]) for r in baseline["results"]] == [
+        ("coinrun", "hard"),
+        ("maze", "hard"),
+        ("maze", "memory"),
+    ]
+    for result in baseline["results"]:
+        for metric in bench.METRICS:
+            assert result[metric] > 0
+
+    assert run_bench("compare", baseline_path, baseline_path).returncode == 0
+
+    current = copy.deepcopy(baseline)
+    current["results"][1]["steps_per_second"] /= 2
+    current_path = str(tmp_path / "current.json")
+    with open(current_path, "w") as f:
+        json.dump(current, f)
+    proc = run_bench("compare", baseline_path, current_path)
+    assert proc.returncode == 1
+    assert b"REGRESSION env_name=maze distribution_mode=hard" in proc.stdout
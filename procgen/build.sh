@@ -1,5 +1,5 @@
 #!/bin/bash
 cd ~/research/procgen-experiment/procgen/
-cmake -B jsbuild -DCMAKE_TOOLCHAIN_FILE=/opt/cheerp/share/cmake/Modules/CheerpToolchain.cmake .
+cmake -B jsbuild -DCMAKE_TOOLCHAIN_FILE=/opt/cheerp/share/cmake/Modules/CheerpToolchain.cmake -DPROCGEN_TARGET=cheerp .
 cmake --build jsbuild 
 cmake --install jsbuild
\ No newline at end of file
@@ -49,7 +49,7 @@ def check(proc, verbose):
         print(f"RUN {proc.args}:\n{proc.stdout}")
 
 
-def _attempt_configure(build_type, package):
+def _attempt_configure(build_type, package, qpainter_trace):
     if "PROCGEN_CMAKE_PREFIX_PATH" in os.environ:
         cmake_prefix_paths = [os.environ["PROCGEN_CMAKE_PREFIX_PATH"]]
     else:
@@ -79,10 +79,14 @@ def _attempt_configure(build_type, package):
         *extra_configure_options,
         "-DCMAKE_PREFIX_PATH=" + ";".join(cmake_prefix_paths),
         f"-DLIBENV_DIR={gym3.libenv.get_header_dir()}",
+        # the python package always uses the native libenv library, not the cheerp build
+        "-DPROCGEN_TARGET=native",
         "../..",
     ]
     if package:
         configure_cmd.append("-DPROCGEN_PACKAGE=ON")
+    if qpainter_trace:
+        configure_cmd.append("-DPROCGEN_QPAINTER_TRACE=ON")
     if platform.system() != "Windows":
         # this is not used on windows, the option needs to be passed to cmake --build instead
         configure_cmd.append(f"-DCMAKE_BUILD_TYPE={build_type}")
@@ -90,9 +94,12 @@ def _attempt_configure(build_type, package):
     check(run(configure_cmd), verbose=package)
 
 
-def build(package=False, debug=False):
+def build(package=False, debug=False, qpainter_trace=False):
     """
     Build the requested environment in a process-safe manner and only once per process.
+
+    With qpainter_trace, the library is built with QPainter tracing in a directory of its own,
+    see procgen/render_test.py
     """
     build_dir = os.path.join(SCRIPT_DIR, ".build")
     os.makedirs(build_dir, exist_ok=True)
@@ -100,10 +107,13 @@ def build(package=False, debug=False):
     build_type = "relwithdebinfo"
     if debug:
         build_type = "debug"
+    build_name = build_type
+    if qpainter_trace:
+        build_name += "-qpainter-trace"
 
     with chdir(build_dir), global_build_lock:
         # check if we have built yet in this process
-        if build_type not in global_builds:
+        if build_name not in global_builds:
             if package:
                 # avoid the filelock dependency when building from setup.py
                 lock_ctx = nullcontext()
@@ -116,29 +126,29 @@ def build(package=False, debug=False):
                 sys.stdout.write("building procgen...")
                 sys.stdout.flush()
                 try:
-                    os.makedirs(build_type, exist_ok=True)
-                    with chdir(build_type):
-                        _attempt_configure(build_type, package)
+                    os.makedirs(build_name, exist_ok=True)
+                    with chdir(build_name):
+                        _attempt_configure(build_type, package, qpainter_trace)
                 except RunFailure:
                     # cmake can get into a weird state, so nuke the build directory and retry once
                     sys.stdout.write("retrying configure due to failure...")
                     sys.stdout.flush()
-                    shutil.rmtree(build_type)
-                    os.makedirs(build_type, exist_ok=True)
-                    with chdir(build_type):
-                        _attempt_configure(build_type, package)
+                    shutil.rmtree(build_name)
+                    os.makedirs(build_name, exist_ok=True)
+                    with chdir(build_name):
+                        _attempt_configure(build_type, package, qpainter_trace)
 
                 if "MAKEFLAGS" not in os.environ:
                     os.environ["MAKEFLAGS"] = f"-j{mp.cpu_count()}"
 
-                with chdir(build_type):
+                with chdir(build_name):
                     build_cmd = ["cmake", "--build", ".", "--config", build_type]
                     check(run(build_cmd), verbose=package)
                 print("done")
 
-            global_builds.add(build_type)
+            global_builds.add(build_name)
 
-    lib_dir = os.path.join(build_dir, build_type)
+    lib_dir = os.path.join(build_dir, build_name)
     if platform.system() == "Windows":
         # the built library is in a different location on windows
         lib_dir = os.path.join(lib_dir, build_type)
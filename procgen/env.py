@@ -7,10 +7,18 @@ import numpy as np
 from gym3.libenv import CEnv
 
 from .builder import build
+from .rollout import RolloutBuffer
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-MAX_STATE_SIZE = 2**20
+# made by the build next to the environment library, see src/resources.h
+ASSET_ATLAS_NAME = "assets.atlas"
+
+# should match src/profiler.h
+NUM_PROFILE_BUCKETS = 40
+GAME_PROFILE_PHASES = ["reset", "step", "render", "convert", "render_hires"]
+THREAD_PROFILE_PHASES = ["busy", "idle"]
+SCHEDULER_PROFILE_PHASES = ["wait", "straggler"]
 
 ENV_NAMES = [
     "bigfish",
@@ -85,6 +93,67 @@ def create_random_seed():
 class BaseProcgenEnv(CEnv):
     """
     Base procedurally generated environment
+
+    :param render_mode: None, "rgb_array" to also render a high resolution frame into the "rgb"
+        info, or "none" to skip rendering entirely. With "none" the "rgb" observation stays all
+        zeros and only infos are written, which for maze, miner and heist include the latent
+        state ("grid", "grid_size", "agent_pos" and "exit_pos").
+    :param pipelined: step environments in the background so that simulation overlaps with the
+        caller's work. `act()` waits for the previous step, starts stepping with the new actions
+        and returns immediately, and `observe()`/`get_info()` return the results of the last
+        *completed* step. This means everything observed lags one step behind: after
+        `act(a_t)`, `observe()` returns the observation that `a_t` was chosen from, and the
+        observation resulting from `a_t` is only returned after the following `act()`.
+        `get_state()` and `set_state()` wait for the step in progress, so a saved state is one
+        step ahead of the last observation. After `set_state()`, the restored observation is
+        returned right away.
+    :param num_pipeline_buffers: number of output buffer sets to rotate through when pipelined,
+        at least 2. A buffer set is only overwritten again `num_pipeline_buffers - 1` calls to
+        `act()` after it was returned.
+    :param use_asset_atlas: load the assets by mapping the pre-decoded asset atlas built with
+        the environment library, instead of decoding every image file. This makes startup much
+        faster and lets processes share the memory of the assets. The atlas is only used with the
+        default `resource_root`, and like `resource_root` this only has an effect for the first
+        environment created in a process.
+    :param level_cache_mb: memory budget in megabytes for a cache of the states of levels right
+        after they are generated, shared by all the environments of this object. Levels that are
+        played again are restored from the cache instead of generated again, which gives the same
+        result bit for bit, so this only makes sense with a limited number of levels
+        (`num_levels`). The least recently used levels are evicted first. Levels are not cached
+        with `use_generated_assets`.
+    :param level_cache_dir: directory where cached levels are also stored, one file per level, so
+        that they are shared by all processes using the same directory. Levels missing from memory
+        are looked for there before they are generated.
+    :param distance_infos: add "exit_dist" and "key_dist" infos laid out like "grid", with the
+        number of moves from every cell to the exit and to the nearest key, or -1 for cells
+        without a path and walls. Only maze, miner and heist write these. In miner the diamonds
+        count as keys, in heist doors block the path until their key has been picked up. The
+        distances are kept up to date in C++ as the grid changes, only searching again around the
+        cells that changed.
+    :param force_entity_grid: always find the entities that collide with the uniform grid of
+        entities, which is otherwise only used once there are many of them, for testing that
+        it gives the same results as testing every pair
+    :param env_offset: create the environments that have indices `env_offset` onwards in an
+        object with more environments and the same `rand_seed`, they play the same levels and
+        have the same states. This is how `ShardedProcgenGym3Env` splits environments across
+        processes. Must be a multiple of the number of games in `env_name`.
+    :param profile: measure where the time goes, see `get_profile()`. This costs a couple of
+        clock reads per phase of every step, and nothing but a branch when disabled.
+    :param obs_grayscale: convert the "rgb" observation to a single grayscale channel, with the
+        ITU-R 601 luma weights
+    :param obs_downsample: shrink the "rgb" observation by this factor, averaging blocks of
+        `obs_downsample` by `obs_downsample` pixels, which must divide 64
+    :param obs_channels_first: lay out the "rgb" observation as (channels, height, width)
+    :param obs_frame_stack: make the "rgb" observation the last `obs_frame_stack` frames,
+        concatenated along the channels with the oldest first. Frames from before the start of
+        an episode are zeros. States include the previous frames, states of environments with
+        other obs_* options restore only the current frame.
+
+        These transforms are done by the stepping threads right after rendering, in this order:
+        downsampling, grayscale, layout and stacking, and `ob_space` has the resulting shape.
+    :param qpainter_trace_dir: use a separate build of the library with QPainter tracing, which
+        appends every drawing call of the observations to `qpainter_trace_dir`/trace.txt, to
+        compare the rendering with Qt, see render_test.py. Requires `num_threads=0`.
     """
 
     def __init__(
@@ -101,10 +170,26 @@ class BaseProcgenEnv(CEnv):
         resource_root=None,
         num_threads=4,
         render_mode=None,
+        pipelined=False,
+        num_pipeline_buffers=2,
+        use_asset_atlas=True,
+        level_cache_mb=0,
+        level_cache_dir=None,
+        distance_infos=False,
+        force_entity_grid=False,
+        env_offset=0,
+        profile=False,
+        obs_grayscale=False,
+        obs_downsample=1,
+        obs_channels_first=False,
+        obs_frame_stack=1,
+        qpainter_trace_dir=None,
     ):
         if resource_root is None:
             resource_root = os.path.join(SCRIPT_DIR, "data", "assets") + os.sep
             assert os.path.exists(resource_root)
+        else:
+            use_asset_atlas = False
 
         lib_dir = os.path.join(SCRIPT_DIR, "data", "prebuilt")
         if os.path.exists(lib_dir):
@@ -115,16 +200,25 @@ class BaseProcgenEnv(CEnv):
                 ]
             ), "package is installed, but the prebuilt environment library is missing"
             assert not debug, "debug has no effect for pre-compiled library"
+            assert qpainter_trace_dir is None, "the pre-compiled library cannot trace QPainter"
         else:
             # only compile if we don't find a pre-built binary
-            lib_dir = build(debug=debug)
+            lib_dir = build(debug=debug, qpainter_trace=qpainter_trace_dir is not None)
+
+        asset_atlas = ""
+        if use_asset_atlas and os.path.exists(os.path.join(lib_dir, ASSET_ATLAS_NAME)):
+            asset_atlas = os.path.join(lib_dir, ASSET_ATLAS_NAME)
 
         self.combos = self.get_combos()
 
+        render_rgb = True
         if render_mode is None:
             render_human = False
         elif render_mode == "rgb_array":
             render_human = True
+        elif render_mode == "none":
+            render_human = False
+            render_rgb = False
         else:
             raise Exception(f"invalid render mode {render_mode}")
 
@@ -142,11 +236,28 @@ class BaseProcgenEnv(CEnv):
                 "rand_seed": rand_seed,
                 "num_threads": num_threads,
                 "render_human": render_human,
+                "render_rgb": render_rgb,
+                "level_cache_mb": level_cache_mb,
+                "level_cache_dir": "" if level_cache_dir is None else str(level_cache_dir),
+                "distance_infos": bool(distance_infos),
+                "force_entity_grid": bool(force_entity_grid),
+                "env_offset": env_offset,
+                "profile": bool(profile),
+                "obs_grayscale": bool(obs_grayscale),
+                "obs_downsample": obs_downsample,
+                "obs_channels_first": bool(obs_channels_first),
+                "obs_frame_stack": obs_frame_stack,
                 # these will only be used the first time an environment is created in a process
                 "resource_root": resource_root,
+                "asset_atlas": asset_atlas,
             }
         )
 
+        if qpainter_trace_dir is not None:
+            # the games append to the same trace, so they must not render at the same time
+            assert num_threads == 0, "qpainter_trace_dir requires num_threads=0"
+            options["qpainter_trace_dir"] = str(qpainter_trace_dir)
+
         self.options = options
 
         super().__init__(
@@ -156,25 +267,573 @@ class BaseProcgenEnv(CEnv):
             c_func_defs=[
                 "int get_state(libenv_env *, int, char *, int);",
                 "void set_state(libenv_env *, int, char *, int);",
+                "int64_t serialize_states(libenv_env *, int, const int *);",
+                "void copy_states(libenv_env *, char *, int64_t *);",
+                "void deserialize_states(libenv_env *, int, const int *, const char *, const int64_t *);",
+                "void fork_games(libenv_env *, int, const int *, const int *, int);",
+                "int add_buffers(libenv_env *, struct libenv_buffers *);",
+                "void remove_buffers(libenv_env *, int);",
+                "void act_into(libenv_env *, int);",
+                "void select_buffers(libenv_env *, int);",
+                "void set_hires_envs(libenv_env *, int, const int *, int);",
+                "void get_asset_cache_stats(libenv_env *, int64_t *);",
+                "void get_level_cache_stats(libenv_env *, int64_t *);",
+                "void get_entity_pool_stats(libenv_env *, int64_t *);",
+                "void get_profile(libenv_env *, int64_t *);",
             ],
         )
         # don't use the dict space for actions
         self.ac_space = self.ac_space["action"]
 
+        self._profile = profile
+        self._render_human = render_human
+        self._num_threads = num_threads
+        # the arrays the environments allocated, see restore_output_arrays()
+        self._own_outputs = (self._rew, self._ob, self._first, self._info)
+        # the buffer sets of set_output_arrays() or set_rollout_buffer() and their c buffers
+        self._output_keepalives = {}
+        self._output_arrays_idx = None
+        self._rollout_buffer = None
+        # the number of act() calls since the rollout buffer was set
+        self._rollout_step = 0
+        self._checked_outs = {}
+
+        self.pipelined = pipelined
+        if pipelined:
+            assert num_pipeline_buffers >= 2, "pipelining needs at least 2 buffer sets"
+            self._init_pipeline(num_pipeline_buffers)
+
+    def _init_pipeline(self, num_buffers):
+        # buffer set 0 is the one allocated by CEnv, the actions are always read from its buffer
+        self._buffer_sets = [(self._ob, self._rew, self._first, self._info)]
+        self._buffer_keepalives = []
+        _, ob_specs = self._get_space(self._c_lib.LIBENV_SPACE_OBSERVATION)
+        _, info_specs = self._get_space(self._c_lib.LIBENV_SPACE_INFO)
+        for _ in range(num_buffers - 1):
+            ob, c_ob_buffers = self._allocate_specs(self.num, ob_specs)
+            info, c_info_buffers = self._allocate_specs(self.num, info_specs)
+            rew, c_rew_buffer = self._allocate_array(self.num, np.dtype("float32"))
+            first, c_first_buffer = self._allocate_array(self.num, np.dtype("bool"))
+            c_buffers = self._ffi.new("struct libenv_buffers *")
+            c_buffers.rew = self._ffi.cast("float *", c_rew_buffer)
+            c_buffers.ob = c_ob_buffers
+            c_buffers.first = self._ffi.cast("uint8_t *", c_first_buffer)
+            c_buffers.ac = self._c_ac_buffers
+            c_buffers.info = c_info_buffers
+            buffer_idx = self.call_c_func("add_buffers", c_buffers)
+            assert buffer_idx == len(self._buffer_sets)
+            self._buffer_sets.append((ob, rew, first, info))
+            self._buffer_keepalives.append(
+                (c_ob_buffers, c_info_buffers, c_rew_buffer, c_first_buffer, c_buffers)
+            )
+        # the set the stepping threads are writing into and the last completed one, before the
+        # first act() both are the set holding the initial observation
+        self._writing_buffer_idx = 0
+        self._ready_buffer_idx = None
+
+    def set_output_arrays(self, rew, ob, first, info):
+        """
+        Make the environments write into the given arrays instead of the ones they allocated,
+        for instance arrays in shared memory that another process reads
+
+        The arrays must have the shapes and dtypes of the ones returned by `observe()`, with info
+        a dict of arrays of all the infos, indexed by environment first. They have to stay alive
+        as long as the environment. The current observations and infos are written into them
+        right away, and `observe()` and `get_info()` return copies of them from then on. Arrays
+        set before are replaced, `restore_output_arrays()` goes back to the arrays of the
+        environments. Not supported with `pipelined` or a rollout buffer.
+        """
+        assert not self.pipelined, "output arrays can't be set when pipelined"
+        assert self._rollout_buffer is None, "output arrays can't be set with a rollout buffer"
+        buffer_idx = self._add_output_arrays(rew, ob, first, info)
+        self.call_c_func("select_buffers", buffer_idx)
+        self._ob, self._rew, self._first, self._info = ob, rew, first, info
+        if self._output_arrays_idx is not None:
+            self._remove_output_arrays(self._output_arrays_idx)
+        self._output_arrays_idx = buffer_idx
+
+    def restore_output_arrays(self):
+        """
+        Make the environments write into the arrays they allocated again, instead of those of
+        `set_output_arrays()` or the rollout buffer of `set_rollout_buffer()`, which the
+        environments no longer hold on to. The current observations and infos are written into
+        them right away.
+        """
+        if self._output_arrays_idx is None and self._rollout_buffer is None:
+            return
+        # select_buffers waits for the step in progress, after which the other sets are unused
+        self.call_c_func("select_buffers", 0)
+        self._rew, self._ob, self._first, self._info = self._own_outputs
+        if self._output_arrays_idx is not None:
+            self._remove_output_arrays(self._output_arrays_idx)
+            self._output_arrays_idx = None
+        if self._rollout_buffer is not None:
+            self._rollout_buffer.step[self._rollout_buffer.slot] = self._rollout_step
+            for buffer_idx in self._rollout_buffer_idxs:
+                self._remove_output_arrays(buffer_idx)
+            self._rollout_buffer = None
+            self._rollout_buffer_idxs = None
+
+    def _add_output_arrays(self, rew, ob, first, info):
+        # register the arrays as a buffer set of the VecGame, returns its index
+        _, ob_specs = self._get_space(self._c_lib.LIBENV_SPACE_OBSERVATION)
+        _, info_specs = self._get_space(self._c_lib.LIBENV_SPACE_INFO)
+
+        def make_pointers(arrays, specs):
+            assert sorted(arrays) == sorted(spec.name for spec in specs)
+            pointers = self._ffi.new(f"void *[{len(specs) * self.num}]")
+            for space_idx, spec in enumerate(specs):
+                arr = arrays[spec.name]
+                self._check_output_array(arr, spec.shape, spec.dtype)
+                for env_idx in range(self.num):
+                    pointers[space_idx * self.num + env_idx] = self._ffi.from_buffer(
+                        arr[env_idx : env_idx + 1]
+                    )
+            return pointers
+
+        self._check_output_array(rew, (), np.dtype("float32"))
+        self._check_output_array(first, (), np.dtype("bool"))
+        c_ob_buffers = make_pointers(ob, ob_specs)
+        c_info_buffers = make_pointers(info, info_specs)
+        c_rew_buffer = self._ffi.from_buffer(rew)
+        c_first_buffer = self._ffi.from_buffer(first)
+        c_buffers = self._ffi.new("struct libenv_buffers *")
+        c_buffers.rew = self._ffi.cast("float *", c_rew_buffer)
+        c_buffers.ob = c_ob_buffers
+        c_buffers.first = self._ffi.cast("uint8_t *", c_first_buffer)
+        c_buffers.ac = self._c_ac_buffers
+        c_buffers.info = c_info_buffers
+        buffer_idx = self.call_c_func("add_buffers", c_buffers)
+        self._output_keepalives[buffer_idx] = (
+            c_ob_buffers,
+            c_info_buffers,
+            c_rew_buffer,
+            c_first_buffer,
+            c_buffers,
+        )
+        return buffer_idx
+
+    def _remove_output_arrays(self, buffer_idx):
+        self.call_c_func("remove_buffers", buffer_idx)
+        del self._output_keepalives[buffer_idx]
+
+    def make_rollout_buffer(self, num_steps, shared=False):
+        """
+        Allocate a RolloutBuffer for num_steps steps of these environments, in shared memory
+        (/dev/shm on linux) if shared is True, see set_rollout_buffer()
+        """
+        _, ob_specs = self._get_space(self._c_lib.LIBENV_SPACE_OBSERVATION)
+        _, info_specs = self._get_space(self._c_lib.LIBENV_SPACE_INFO)
+        specs = [(("ob", spec.name), spec.shape, spec.dtype.str) for spec in ob_specs]
+        specs += [(("info", spec.name), spec.shape, spec.dtype.str) for spec in info_specs]
+        return RolloutBuffer(num_steps, self.num, specs, shared=shared)
+
+    def set_rollout_buffer(self, buffer):
+        """
+        Make the stepping threads write the outputs of every step straight into the next slot of
+        buffer, a RolloutBuffer made with make_rollout_buffer(), so that collecting a rollout
+        doesn't copy anything
+
+        The current observations and infos are written into slot 0 right away, and each `act()`
+        moves on to the next slot, going back to slot 0 after the last one. `buffer.slot` is the
+        slot of the latest outputs, which `observe()` and `get_info()` return copies of, and the
+        actions passed to `act()` are saved in the slot of the outputs they were chosen from.
+
+        `act()` returns while the stepping threads write into the new `buffer.slot`, call
+        `wait()` before reading the slot from the buffer, `buffer.step` tells other processes
+        which slots are complete, see RolloutBuffer.
+
+        A rollout buffer set before is replaced, `restore_output_arrays()` goes back to the
+        arrays of the environments. Not supported with `pipelined` or output arrays.
+        """
+        assert not self.pipelined, "a rollout buffer can't be used when pipelined"
+        assert self._output_arrays_idx is None, "a rollout buffer can't be set with output arrays"
+        assert buffer.num == self.num
+        self.restore_output_arrays()
+        self._rollout_buffer_idxs = [
+            self._add_output_arrays(*buffer.get_slot(slot)) for slot in range(buffer.num_steps)
+        ]
+        self._rollout_buffer = buffer
+        self._rollout_step = 0
+        buffer.step[:] = -1
+        # select_buffers waits for the outputs it writes, slot 0 is complete right away
+        self.call_c_func("select_buffers", self._rollout_buffer_idxs[0])
+        self._use_rollout_slot(0)
+        buffer.step[0] = 0
+
+    def wait(self):
+        """
+        Wait for the step started by the last `act()` to be written, like `observe()` does but
+        without copying anything, so that the arrays of `observe_views()`, `get_info_views()` and
+        the current slot of a rollout buffer can be read
+        """
+        self._wait_for_outputs()
+
+    def _use_rollout_slot(self, slot):
+        self._rollout_buffer.slot = slot
+        self._rew, self._ob, self._first, self._info = self._rollout_buffer.get_slot(slot)
+
+    def _check_output_array(self, arr, shape, dtype):
+        expected_shape = (self.num,) + tuple(shape)
+        assert arr.shape == expected_shape, f"expected shape {expected_shape}"
+        assert arr.dtype == dtype, f"expected dtype {dtype}"
+        assert arr.flags.c_contiguous and arr.flags.writeable
+
+    def _select_ready_buffers(self):
+        if self._ready_buffer_idx in (None, self._writing_buffer_idx):
+            # wait for the initial reset, and render what the games haven't written into the
+            # buffers they write into: the environments forked with defer_render, and the "rgb"
+            # infos after set_state() or set_hires_render()
+            self._c_lib.libenv_observe(self._c_env)
+            self._ready_buffer_idx = self._writing_buffer_idx
+        ob, rew, first, info = self._buffer_sets[self._ready_buffer_idx]
+        self._ob, self._rew, self._first, self._info = ob, rew, first, info
+
+    def _wait_for_outputs(self):
+        if self.pipelined:
+            self._select_ready_buffers()
+        else:
+            # waits for the step in progress, and renders the environments forked with
+            # defer_render and the "rgb" infos of render_mode="rgb_array"
+            self._c_lib.libenv_observe(self._c_env)
+            if self._rollout_buffer is not None:
+                self._rollout_buffer.step[self._rollout_buffer.slot] = self._rollout_step
+
+    def observe(self, out=None):
+        """
+        Like gym3's observe(), returns copies of the reward, observation and first arrays
+
+        :param out: a (rew, ob, first) tuple of arrays to copy into instead of allocating new
+            ones, with the shapes and dtypes of the arrays observe() returns, contiguous and
+            writeable. They are checked the first time they are passed, and only the copy is
+            done as long as the same arrays are passed again. Returns out.
+        """
+        if out is None and not self.pipelined and self._rollout_buffer is None:
+            return super().observe()
+        rew, ob, first = self.observe_views()
+        if out is None:
+            return (
+                self._maybe_copy_ndarray(rew),
+                self._maybe_copy_dict(ob),
+                self._maybe_copy_ndarray(first),
+            )
+        out_rew, out_ob, out_first = out
+        if not self._is_checked_out(out, "observe"):
+            self._check_output_array(out_rew, (), rew.dtype)
+            self._check_output_array(out_first, (), first.dtype)
+            self._check_out_dict(out_ob, ob)
+            self._checked_outs["observe"] = (out_rew, dict(out_ob), out_first)
+        np.copyto(out_rew, rew)
+        for name, arr in ob.items():
+            np.copyto(out_ob[name], arr)
+        np.copyto(out_first, first)
+        return out
+
+    def get_info(self):
+        if not self.pipelined and self._rollout_buffer is None:
+            return super().get_info()
+        self._wait_for_outputs()
+        infos = [{} for _ in range(self.num)]
+        info = self._maybe_copy_dict(self._info)
+        for key, values in info.items():
+            for env_idx in range(self.num):
+                infos[env_idx][key] = values[env_idx]
+        return infos
+
+    def get_info_arrays(self, out=None):
+        """
+        The infos as a dict of arrays indexed by environment first, rather than the list of a
+        dict per environment returned by get_info(), which has to index every array for every
+        environment
+
+        :param out: a dict of arrays to copy into instead of allocating new ones, like the out
+            argument of observe(). Returns out.
+        """
+        info = self.get_info_views()
+        if out is None:
+            return {name: arr.copy() for name, arr in info.items()}
+        if not self._is_checked_out((out,), "get_info_arrays"):
+            self._check_out_dict(out, info)
+            self._checked_outs["get_info_arrays"] = (dict(out),)
+        for name, arr in info.items():
+            np.copyto(out[name], arr)
+        return out
+
+    def observe_views(self):
+        """
+        The rew, ob and first arrays that the environments write into, without copying them
+
+        These are numpy arrays, so other libraries can use them without copies through the
+        `__array_interface__` or DLPack (`__dlpack__`, for instance `torch.from_dlpack()`).
+        Don't write into them. How long they hold the last observation depends on the mode:
+
+        * by default, until the next `act()`, after which the stepping threads write the next
+          step into the same arrays while `act()` returns, so they can't be read until the next
+          `observe()` or `observe_views()`, which returns the same arrays
+        * with `pipelined`, for `num_pipeline_buffers - 1` calls to `act()`, the next calls
+          return the arrays of the other buffer sets in turn
+        * with a rollout buffer, these are the arrays of the current slot, which hold the last
+          observation for `num_steps - 1` calls to `act()`, the next call writes the slot again
+
+        `get_state()` and `fork()` leave the arrays valid, `set_state()` and
+        `set_packed_state()` write the restored observations into them.
+        """
+        self._wait_for_outputs()
+        return self._rew, self._ob, self._first
+
+    def get_info_views(self):
+        """
+        The info arrays that the environments write into, without copying them, indexed by
+        environment first, see observe_views() for how long they hold the last infos
+        """
+        self._wait_for_outputs()
+        return self._info
+
+    def _is_checked_out(self, out, name):
+        # whether these are the arrays that were checked the last time, which holds them so that
+        # their ids can't be reused by other arrays
+        checked = self._checked_outs.get(name)
+        if checked is None or len(checked) != len(out):
+            return False
+        for arr, checked_arr in zip(out, checked):
+            if isinstance(arr, dict):
+                if arr.keys() != checked_arr.keys() or any(
+                    arr[key] is not checked_arr[key] for key in arr
+                ):
+                    return False
+            elif arr is not checked_arr:
+                return False
+        return True
+
+    def _check_out_dict(self, out, arrays):
+        assert sorted(out) == sorted(arrays), f"expected arrays for {sorted(arrays)}"
+        for name, arr in arrays.items():
+            self._check_output_array(out[name], arr.shape[1:], arr.dtype)
+
     def get_state(self):
-        length = MAX_STATE_SIZE
-        buf = self._ffi.new(f"char[{length}]")
-        result = []
-        for env_idx in range(self.num):
-            n = self.call_c_func("get_state", env_idx, buf, length)
-            result.append(bytes(self._ffi.buffer(buf, n)))
-        return result
+        states, offsets = self.get_packed_state()
+        return [
+            bytes(states[offsets[i] : offsets[i + 1]]) for i in range(len(offsets) - 1)
+        ]
 
     def set_state(self, states):
         assert len(states) == self.num
-        for env_idx in range(self.num):
-            state = states[env_idx]
-            self.call_c_func("set_state", env_idx, state, len(state))
+        offsets = np.zeros(len(states) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(state) for state in states])
+        self.set_packed_state(np.frombuffer(b"".join(states), dtype=np.uint8), offsets)
+
+    def _env_idxs_array(self, env_idxs):
+        if env_idxs is None:
+            return np.arange(self.num, dtype=np.int32)
+        env_idxs = np.ascontiguousarray(env_idxs, dtype=np.int32)
+        assert env_idxs.ndim == 1
+        assert np.all((env_idxs >= 0) & (env_idxs < self.num)), "invalid env index"
+        return env_idxs
+
+    def get_packed_state(self, env_idxs=None):
+        """
+        Serialize the state of all environments, or only of env_idxs, in parallel
+
+        Returns a uint8 array containing all the states back to back, and an int64 array of
+        len(env_idxs) + 1 offsets into it, the state of the i-th environment is
+        states[offsets[i]:offsets[i + 1]]
+        """
+        env_idxs = self._env_idxs_array(env_idxs)
+        size = self.call_c_func(
+            "serialize_states",
+            len(env_idxs),
+            self._ffi.cast("int *", self._ffi.from_buffer(env_idxs)),
+        )
+        states = np.empty(size, dtype=np.uint8)
+        offsets = np.empty(len(env_idxs) + 1, dtype=np.int64)
+        self.call_c_func(
+            "copy_states",
+            self._ffi.cast("char *", self._ffi.from_buffer(states)),
+            self._ffi.cast("int64_t *", self._ffi.from_buffer(offsets)),
+        )
+        return states, offsets
+
+    def set_packed_state(self, states, offsets, env_idxs=None):
+        """
+        Restore states in the format returned by get_packed_state(), in parallel
+
+        The i-th state is restored into environment env_idxs[i], or environment i if env_idxs
+        is None
+        """
+        env_idxs = self._env_idxs_array(env_idxs)
+        states = np.ascontiguousarray(states, dtype=np.uint8)
+        offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        assert len(np.unique(env_idxs)) == len(env_idxs), "duplicate env index"
+        assert len(offsets) == len(env_idxs) + 1
+        assert offsets[0] >= 0 and offsets[-1] <= len(states)
+        assert np.all(np.diff(offsets) >= 0)
+        self.call_c_func(
+            "deserialize_states",
+            len(env_idxs),
+            self._ffi.cast("int *", self._ffi.from_buffer(env_idxs)),
+            self._ffi.cast("char *", self._ffi.from_buffer(states)),
+            self._ffi.cast("int64_t *", self._ffi.from_buffer(offsets)),
+        )
+        if self.pipelined:
+            # restoring writes the restored observation into the buffers currently being stepped
+            # into, which are complete now that the step has been waited for
+            self._ready_buffer_idx = self._writing_buffer_idx
+
+    def fork(self, src_env_idxs, dst_env_idxs, defer_render=False):
+        """
+        Replace environment dst_env_idxs[i] with a copy of environment src_env_idxs[i]
+
+        The games are copied directly on the stepping threads, which is much faster than
+        get_state() followed by set_state(). An environment can be copied to several destinations,
+        and can be both a source and a destination.
+
+        With defer_render=True the observations and infos of the copies are not written until the
+        next observe(), which saves rendering copies that are stepped before being observed.
+        """
+        src_env_idxs = self._env_idxs_array(src_env_idxs)
+        dst_env_idxs = self._env_idxs_array(dst_env_idxs)
+        assert len(src_env_idxs) == len(dst_env_idxs)
+        assert len(np.unique(dst_env_idxs)) == len(dst_env_idxs), "duplicate env index"
+        self.call_c_func(
+            "fork_games",
+            len(src_env_idxs),
+            self._ffi.cast("int *", self._ffi.from_buffer(src_env_idxs)),
+            self._ffi.cast("int *", self._ffi.from_buffer(dst_env_idxs)),
+            int(defer_render),
+        )
+        if self.pipelined:
+            # the copies write into the buffers currently being stepped into, like set_state()
+            self._ready_buffer_idx = None
+
+    def set_hires_render(self, env_idxs=None, interval=1):
+        """
+        Choose which environments get the high resolution "rgb" info of render_mode="rgb_array",
+        and on which steps, by default all of them on every step
+
+        The images are rendered in parallel by the stepping threads, when a step is observed, or
+        along with the step when pipelined. Those of the other environments, and of the steps in
+        between, are not written, so the "rgb" info of an environment only shows its current
+        state on the steps it is rendered.
+
+        :param env_idxs: the environments to render, all of them when None, none when empty
+        :param interval: only render every interval steps, the steps being counted from the
+            creation of this object, so with the default of 1 every step. The current step is
+            rendered on the next `observe()` or `get_info()` if it is one of them, except with
+            `pipelined` where the last completed step has already been left behind.
+        """
+        assert self._render_human, 'only render_mode="rgb_array" renders the "rgb" info'
+        assert interval > 0
+        env_idxs = self._env_idxs_array(env_idxs)
+        self.call_c_func(
+            "set_hires_envs",
+            len(env_idxs),
+            self._ffi.cast("int *", self._ffi.from_buffer(env_idxs)),
+            interval,
+        )
+
+    def get_asset_cache_stats(self):
+        """
+        Statistics of the process wide cache of game assets, which every environment in the
+        process shares
+
+        Returns a dict with the number of cached assets, the number of bytes of pixel data they
+        hold (images loaded from files are not counted), and the number of cache hits and misses.
+        """
+        stats = np.zeros(4, dtype=np.int64)
+        self.call_c_func(
+            "get_asset_cache_stats", self._ffi.cast("int64_t *", self._ffi.from_buffer(stats))
+        )
+        return dict(zip(["num_assets", "num_bytes", "hits", "misses"], stats.tolist()))
+
+    def get_level_cache_stats(self):
+        """
+        Statistics of the level cache enabled with `level_cache_mb` or `level_cache_dir`
+
+        Returns a dict with the number of levels in memory and their size in bytes, the number of
+        hits (levels restored from the cache), the number of those hits that loaded the level
+        from `level_cache_dir`, the number of misses (levels generated), and the number of levels
+        evicted from memory. Everything is 0 if the cache is disabled.
+        """
+        stats = np.zeros(6, dtype=np.int64)
+        self.call_c_func(
+            "get_level_cache_stats", self._ffi.cast("int64_t *", self._ffi.from_buffer(stats))
+        )
+        return dict(
+            zip(
+                ["num_levels", "num_bytes", "hits", "disk_hits", "misses", "evictions"],
+                stats.tolist(),
+            )
+        )
+
+    def get_entity_pool_stats(self):
+        """
+        Statistics of the pools the entities of the games are allocated from, summed over the
+        environments
+
+        Returns a dict with the number of entities allocated, how many of those reused the memory
+        of a freed entity, the number of chunks of memory the pools allocated to hold entities,
+        and the number of entities that are currently allocated. The counts start over for
+        environments replaced by `fork()`.
+        """
+        stats = np.zeros(4, dtype=np.int64)
+        self.call_c_func(
+            "get_entity_pool_stats", self._ffi.cast("int64_t *", self._ffi.from_buffer(stats))
+        )
+        return dict(zip(["num_allocs", "num_reuses", "num_chunks", "num_live"], stats.tolist()))
+
+    def get_profile(self):
+        """
+        Time spent in each phase of running the environments, enabled with `profile=True`
+
+        Returns a dict with:
+
+        * "games": a list with a dict per environment, mapping each phase of its game to its
+          stats: "reset" (`Game::reset()`, mostly level generation, including the resets at the
+          end of episodes), "step" (simulation of a step), "render" (drawing the observation),
+          "convert" (converting it to rgb) and "render_hires" (the image of
+          `render_mode="rgb_array"`). The stats stay with the environment index when the game is
+          replaced by `fork()`.
+        * "threads": a list with a dict per stepping thread followed by one for the python
+          thread, which runs steps itself while it waits for them or when `num_threads=0`,
+          mapping "busy" (running a chunk of environments) and "idle" (waiting for work after
+          running out, stepping threads only) to their stats.
+        * "scheduler": a dict mapping "wait" (the python thread waiting for a batch of steps,
+          including the steps it runs itself) and "straggler" (the time between the first thread
+          running out of work and the end of a batch, a measure of load imbalance) to their stats.
+
+        The stats of a phase are a dict with the number of times it ran ("count"), its total time
+        in seconds ("seconds"), and a histogram of its latencies ("histogram"), an array where
+        element b is the number of times it took from 2**b up to 2**(b + 1) nanoseconds, the first
+        and last elements also counting the shorter and longer times.
+        """
+        assert self._profile, "profiling is disabled, create the environment with profile=True"
+        num_threads = self._num_threads + 1
+        num_phases = (
+            self.num * len(GAME_PROFILE_PHASES)
+            + num_threads * len(THREAD_PROFILE_PHASES)
+            + len(SCHEDULER_PROFILE_PHASES)
+        )
+        data = np.zeros((num_phases, 2 + NUM_PROFILE_BUCKETS), dtype=np.int64)
+        self.call_c_func("get_profile", self._ffi.cast("int64_t *", self._ffi.from_buffer(data)))
+
+        rows = iter(data)
+
+        def read_phases(names):
+            result = {}
+            for name in names:
+                row = next(rows)
+                result[name] = {
+                    "count": int(row[0]),
+                    "seconds": row[1] / 1e9,
+                    "histogram": row[2:],
+                }
+            return result
+
+        return {
+            "games": [read_phases(GAME_PROFILE_PHASES) for _ in range(self.num)],
+            "threads": [read_phases(THREAD_PROFILE_PHASES) for _ in range(num_threads)],
+            "scheduler": read_phases(SCHEDULER_PROFILE_PHASES),
+        }
 
     def get_combos(self):
         return [
@@ -223,7 +882,31 @@ class BaseProcgenEnv(CEnv):
     def act(self, ac):
         # tensorflow may return int64 actions (https://github.com/openai/gym/blob/master/gym/spaces/discrete.py#L13)
         # so always cast actions to int32
-        return super().act({"action": ac.astype(np.int32)})
+        if self._rollout_buffer is not None:
+            ac = ac.astype(np.int32)
+            assert self._ac["action"].shape == ac.shape
+            self._ac["action"][:] = ac
+            buffer = self._rollout_buffer
+            buffer.action[buffer.slot] = ac
+            prev_slot = buffer.slot
+            slot = (prev_slot + 1) % buffer.num_steps
+            buffer.step[slot] = -1
+            # act_into waits for the previous step and steps into the buffer set of the slot
+            self.call_c_func("act_into", self._rollout_buffer_idxs[slot])
+            if slot != prev_slot:
+                buffer.step[prev_slot] = self._rollout_step
+            self._rollout_step += 1
+            self._use_rollout_slot(slot)
+            return
+        if not self.pipelined:
+            return super().act({"action": ac.astype(np.int32)})
+        ac = ac.astype(np.int32)
+        assert self._ac["action"].shape == ac.shape
+        self._ac["action"][:] = ac
+        # act_into waits for the step in progress, which makes its buffer set the ready one
+        self._ready_buffer_idx = self._writing_buffer_idx
+        self._writing_buffer_idx = (self._writing_buffer_idx + 1) % len(self._buffer_sets)
+        self.call_c_func("act_into", self._writing_buffer_idx)
 
 
 class ProcgenGym3Env(BaseProcgenEnv):
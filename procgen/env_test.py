@@ -1,3 +1,10 @@
+import collections
+import json
+import os
+import subprocess
+import sys
+import time
+
 import numpy as np
 import pytest
 from .env import ENV_NAMES
@@ -66,4 +73,886 @@ def test_multi_speed(env_name, num_envs, benchmark):
             env.observe()
             step_count += 1
 
-    benchmark(lambda: rollout(1000))
\ No newline at end of file
+    benchmark(lambda: rollout(1000))
+
+@pytest.mark.parametrize("env_name", ["coinrun", "miner"])
+def test_thread_count_determinism(env_name):
+    def collect_observations(num_threads):
+        rng = np.random.RandomState(0)
+        env = ProcgenGym3Env(
+            num=37, env_name=env_name, rand_seed=23, num_threads=num_threads
+        )
+        _, obs, first = env.observe()
+        obses = [obs["rgb"]]
+        firsts = [first]
+        for _ in range(64):
+            env.act(
+                rng.randint(
+                    low=0, high=env.ac_space.eltype.n, size=(env.num,), dtype=np.int32
+                )
+            )
+            _, obs, first = env.observe()
+            obses.append(obs["rgb"])
+            firsts.append(first)
+        return np.array(obses), np.array(firsts)
+
+    obs0, first0 = collect_observations(0)
+    for num_threads in [1, 3, 8]:
+        obs, first = collect_observations(num_threads)
+        assert np.array_equal(obs0, obs)
+        assert np.array_equal(first0, first)
+
+
+@pytest.mark.parametrize("num_threads", [0, 1, 2, 4, 8, 16])
+def test_thread_scaling(num_threads, benchmark):
+    num_envs = 128
+    num_steps = 50
+    env = ProcgenGym3Env(num=num_envs, env_name="coinrun", num_threads=num_threads)
+
+    actions = np.zeros([env.num])
+
+    def rollout(max_steps):
+        for _ in range(max_steps):
+            env.act(actions)
+            env.observe()
+
+    benchmark(lambda: rollout(num_steps))
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.parametrize("num_pipeline_buffers", [2, 3])
+def test_pipelined_lag(num_pipeline_buffers):
+    kwargs = dict(num=4, env_name="coinrun", rand_seed=5, render_mode="rgb_array")
+    env = ProcgenGym3Env(**kwargs)
+    pipelined_env = ProcgenGym3Env(
+        pipelined=True, num_pipeline_buffers=num_pipeline_buffers, **kwargs
+    )
+    rng = np.random.RandomState(0)
+
+    _, obs, _ = env.observe()
+    _, pipelined_obs, _ = pipelined_env.observe()
+    assert np.array_equal(obs["rgb"], pipelined_obs["rgb"])
+
+    for _ in range(32):
+        rew, obs, first = env.observe()
+        info = env.get_info()
+        ac = rng.randint(low=0, high=env.ac_space.eltype.n, size=(env.num,))
+        env.act(ac)
+        pipelined_env.act(ac)
+        # after act, the pipelined env reports the observation the action was chosen from
+        pipelined_rew, pipelined_obs, pipelined_first = pipelined_env.observe()
+        pipelined_info = pipelined_env.get_info()
+        assert np.array_equal(rew, pipelined_rew)
+        assert np.array_equal(obs["rgb"], pipelined_obs["rgb"])
+        assert np.array_equal(first, pipelined_first)
+        for env_info, pipelined_env_info in zip(info, pipelined_info):
+            assert np.array_equal(env_info["rgb"], pipelined_env_info["rgb"])
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_pipelined_speed(pipelined, benchmark):
+    env = ProcgenGym3Env(num=64, env_name="coinrun", pipelined=pipelined)
+
+    actions = np.zeros([env.num])
+
+    def rollout(max_steps):
+        for _ in range(max_steps):
+            env.act(actions)
+            env.observe()
+            # stand in for policy inference, which pipelining overlaps with stepping
+            time.sleep(0.002)
+
+    benchmark(lambda: rollout(100))
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_render_mode_none(env_name):
+    kwargs = dict(num=4, env_name=env_name, rand_seed=0)
+    env = ProcgenGym3Env(**kwargs)
+    latent_env = ProcgenGym3Env(render_mode="none", **kwargs)
+    rng = np.random.RandomState(0)
+
+    # skipping rendering doesn't change what happens in the game
+    for _ in range(100):
+        rew, _, first = env.observe()
+        latent_rew, latent_obs, latent_first = latent_env.observe()
+        assert np.array_equal(rew, latent_rew)
+        assert np.array_equal(first, latent_first)
+        assert not latent_obs["rgb"].any()
+        for info, latent_info in zip(env.get_info(), latent_env.get_info()):
+            assert sorted(info.keys()) == sorted(latent_info.keys())
+            for key in info:
+                assert np.array_equal(info[key], latent_info[key])
+        ac = rng.randint(low=0, high=env.ac_space.eltype.n, size=(env.num,))
+        env.act(ac)
+        latent_env.act(ac)
+
+
+@pytest.mark.parametrize("render_mode", [None, "none"])
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_render_mode_none_speed(env_name, render_mode, benchmark):
+    num_envs = 16
+    num_steps = 100
+    env = ProcgenGym3Env(
+        num=num_envs, env_name=env_name, render_mode=render_mode, num_threads=0
+    )
+
+    actions = np.zeros([env.num])
+
+    def rollout(max_steps):
+        for _ in range(max_steps):
+            env.act(actions)
+            env.observe()
+
+    benchmark(lambda: rollout(num_steps))
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+def get_rss_bytes():
+    # resident set size of this process, only available on linux
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+@pytest.mark.parametrize("use_generated_assets", [False, True])
+@pytest.mark.parametrize("env_name", ["coinrun", "miner"])
+def test_shared_assets(env_name, use_generated_assets):
+    def make_env():
+        env = ProcgenGym3Env(
+            num=2,
+            env_name=env_name,
+            rand_seed=0,
+            use_generated_assets=use_generated_assets,
+        )
+        env.observe()
+        return env
+
+    env1 = make_env()
+    stats1 = env1.get_asset_cache_stats()
+    env2 = make_env()
+    stats2 = env2.get_asset_cache_stats()
+    # the second env finds all its assets in the cache
+    assert stats2["num_assets"] == stats1["num_assets"]
+    assert stats2["misses"] == stats1["misses"]
+    assert stats2["hits"] > stats1["hits"]
+
+    # sharing assets doesn't change the observations or the game states
+    rng = np.random.RandomState(0)
+    for _ in range(50):
+        actions = rng.randint(
+            low=0, high=env1.ac_space.eltype.n, size=(env1.num,), dtype=np.int32
+        )
+        env1.act(actions)
+        env2.act(actions)
+        assert np.array_equal(env1.observe()[1]["rgb"], env2.observe()[1]["rgb"])
+    # games with generated assets can't be serialized
+    if not use_generated_assets:
+        assert env1.get_state() == env2.get_state()
+
+
+@pytest.mark.parametrize("num_envs", [1, 64, 1024])
+def test_construction_speed(num_envs, benchmark):
+    def make_env():
+        env = ProcgenGym3Env(num=num_envs, env_name="coinrun")
+        # the games are reset and rendered on the first observe()
+        env.observe()
+        return env
+
+    benchmark.pedantic(make_env, rounds=3)
+
+    rss_before = get_rss_bytes()
+    env = make_env()
+    rss_after = get_rss_bytes()
+    if rss_before is not None:
+        benchmark.extra_info["rss_bytes_per_env"] = (rss_after - rss_before) / num_envs
+    benchmark.extra_info.update(env.get_asset_cache_stats())
+
+
+STARTUP_SCRIPT = """
+import json, resource, sys, time
+from procgen import ProcgenGym3Env
+from procgen.builder import build
+
+build()
+start = time.perf_counter()
+env = ProcgenGym3Env(num=1, env_name="coinrun", use_asset_atlas=sys.argv[1] == "1")
+env.observe()
+elapsed = time.perf_counter() - start
+# ru_maxrss is in kilobytes on linux
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+print(json.dumps({"startup_seconds": elapsed, "max_rss_bytes": max_rss}))
+"""
+
+
+@pytest.mark.parametrize("use_asset_atlas", [False, True])
+def test_startup_speed(use_asset_atlas, benchmark):
+    # assets are loaded once per process, so every round starts a new process
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+
+    def start_process():
+        proc = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, str(int(use_asset_atlas))],
+            stdout=subprocess.PIPE,
+            cwd=repo_dir,
+            check=True,
+        )
+        results.append(json.loads(proc.stdout.decode("utf8").splitlines()[-1]))
+
+    benchmark.pedantic(start_process, rounds=3)
+    benchmark.extra_info["startup_seconds"] = min(r["startup_seconds"] for r in results)
+    benchmark.extra_info["max_rss_bytes"] = min(r["max_rss_bytes"] for r in results)
+
+
+# games with their own serialize_carryover(), or with slow level generation
+LEVEL_CACHE_ENV_NAMES = ["bossfight", "caveflyer", "jumper", "maze", "miner", "ninja"]
+
+
+def assert_same_steps(env, other_env, num_steps):
+    rng = np.random.RandomState(0)
+    for _ in range(num_steps):
+        ac = rng.randint(low=0, high=env.ac_space.eltype.n, size=(env.num,), dtype=np.int32)
+        env.act(ac)
+        other_env.act(ac)
+        rew, obs, first = env.observe()
+        other_rew, other_obs, other_first = other_env.observe()
+        assert np.array_equal(rew, other_rew)
+        assert np.array_equal(first, other_first)
+        assert np.array_equal(obs["rgb"], other_obs["rgb"])
+    assert env.get_state() == other_env.get_state()
+
+
+@pytest.mark.parametrize("env_name", LEVEL_CACHE_ENV_NAMES)
+def test_level_cache(env_name):
+    kwargs = dict(num=4, env_name=env_name, num_levels=2, rand_seed=0)
+    env = ProcgenGym3Env(**kwargs)
+    cached_env = ProcgenGym3Env(level_cache_mb=16, **kwargs)
+    # restored levels continue exactly like generated ones
+    assert_same_steps(env, cached_env, 500)
+    assert cached_env.get_level_cache_stats()["hits"] > 0
+    assert env.get_level_cache_stats()["misses"] == 0
+
+    # once every level has been generated, all resets are restored from the cache
+    reset_actions = np.full(env.num, -1, dtype=np.int32)
+    for _ in range(10):
+        cached_env.act(reset_actions)
+    misses = cached_env.get_level_cache_stats()["misses"]
+    for _ in range(10):
+        cached_env.act(reset_actions)
+    assert cached_env.get_level_cache_stats()["misses"] == misses
+
+
+def test_level_cache_dir(tmp_path):
+    kwargs = dict(num=4, env_name="maze", num_levels=3, rand_seed=0, num_threads=0)
+    writer_env = ProcgenGym3Env(level_cache_dir=tmp_path, **kwargs)
+    assert_same_steps(ProcgenGym3Env(**kwargs), writer_env, 100)
+    assert len(list(tmp_path.iterdir())) == writer_env.get_level_cache_stats()["misses"]
+
+    # levels are loaded from the directory, even without a memory budget
+    reader_env = ProcgenGym3Env(level_cache_dir=tmp_path, **kwargs)
+    assert_same_steps(ProcgenGym3Env(**kwargs), reader_env, 100)
+    stats = reader_env.get_level_cache_stats()
+    assert stats["misses"] == 0
+    assert stats["disk_hits"] == stats["hits"] > 0
+    assert stats["num_levels"] == 0
+
+
+def test_level_cache_eviction():
+    env = ProcgenGym3Env(num=4, env_name="maze", level_cache_mb=1, rand_seed=0)
+    # every reset picks a new level
+    for _ in range(100):
+        env.act(np.full(env.num, -1, dtype=np.int32))
+    stats = env.get_level_cache_stats()
+    assert stats["evictions"] > 0
+    assert stats["num_bytes"] <= 2**20
+
+
+@pytest.mark.parametrize("level_cache", [False, True])
+@pytest.mark.parametrize("env_name", LEVEL_CACHE_ENV_NAMES)
+def test_reset_speed(env_name, level_cache, benchmark):
+    num_envs = 16
+    num_steps = 100
+    env = ProcgenGym3Env(
+        num=num_envs,
+        env_name=env_name,
+        num_levels=10,
+        level_cache_mb=64 if level_cache else 0,
+        render_mode="none",
+        num_threads=0,
+    )
+    # an action of -1 makes a game reset on its next step
+    reset_actions = np.full(num_envs, -1, dtype=np.int32)
+    for _ in range(num_steps):
+        env.act(reset_actions)
+
+    def reset_loop():
+        for _ in range(num_steps):
+            env.act(reset_actions)
+
+    benchmark(reset_loop)
+    benchmark.extra_info["resets_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+    benchmark.extra_info.update(env.get_level_cache_stats())
+
+
+@pytest.mark.parametrize(
+    "env_name,distribution_mode",
+    [
+        ("maze", "easy"),
+        ("maze", "hard"),
+        ("maze", "memory"),
+        ("heist", "easy"),
+        ("heist", "hard"),
+        ("heist", "memory"),
+        ("chaser", "easy"),
+        ("chaser", "hard"),
+    ],
+)
+def test_maze_reset_speed(env_name, distribution_mode, benchmark):
+    # the distribution mode sets the largest maze size a game generates
+    num_envs = 16
+    num_steps = 100
+    env = ProcgenGym3Env(
+        num=num_envs,
+        env_name=env_name,
+        distribution_mode=distribution_mode,
+        render_mode="none",
+        num_threads=0,
+    )
+    reset_actions = np.full(num_envs, -1, dtype=np.int32)
+
+    def reset_loop():
+        for _ in range(num_steps):
+            env.act(reset_actions)
+
+    benchmark(reset_loop)
+    benchmark.extra_info["resets_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+DISTANCE_ENV_NAMES = ["maze", "miner", "heist"]
+
+
+def bfs_distances(passable, targets):
+    # passable is a 2d array indexed by [y, x], cells without a path are -1
+    h, w = passable.shape
+    dist = np.full(passable.shape, -1, dtype=np.int32)
+    queue = collections.deque()
+    for x, y in targets:
+        if passable[y, x] and dist[y, x] == -1:
+            dist[y, x] = 0
+            queue.append((x, y))
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
+            if 0 <= nx < w and 0 <= ny < h and passable[ny, nx] and dist[ny, nx] == -1:
+                dist[ny, nx] = dist[y, x] + 1
+                queue.append((nx, ny))
+    return dist
+
+
+def expected_distance_infos(env_name, info):
+    # the distances worked out from the "grid" info, using the object ids of each game
+    w, h = info["grid_size"]
+    grid = info["grid"][: w * h].reshape(h, w)
+    exit_cells = [tuple(info["exit_pos"])]
+    if env_name == "maze":
+        wall = 51
+        passable = grid != wall
+        key_cells = []
+    elif env_name == "miner":
+        boulder, diamond, moving_boulder, moving_diamond, oob_wall = 1, 2, 3, 4, 10
+        passable = ~np.isin(grid, [boulder, moving_boulder, oob_wall])
+        key_cells = [(x, y) for y, x in zip(*np.nonzero(np.isin(grid, [diamond, moving_diamond])))]
+    elif env_name == "heist":
+        wall, door, key = 51, 200, 300
+        passable = grid != wall
+        # a door stops blocking once its key has been picked up
+        for y, x in zip(*np.nonzero((grid > door) & (grid < key))):
+            if np.any(grid == key + grid[y, x] - door):
+                passable[y, x] = False
+        key_cells = [(x, y) for y, x in zip(*np.nonzero(grid > key))]
+    return bfs_distances(passable, exit_cells), bfs_distances(passable, key_cells)
+
+
+@pytest.mark.parametrize("distribution_mode", ["easy", "hard", "memory"])
+@pytest.mark.parametrize("env_name", DISTANCE_ENV_NAMES)
+def test_distance_infos(env_name, distribution_mode):
+    env = ProcgenGym3Env(
+        num=4,
+        env_name=env_name,
+        distribution_mode=distribution_mode,
+        distance_infos=True,
+        rand_seed=0,
+    )
+    rng = np.random.RandomState(0)
+    for _ in range(200):
+        for info in env.get_info():
+            w, h = info["grid_size"]
+            exit_dist, key_dist = expected_distance_infos(env_name, info)
+            assert np.array_equal(info["exit_dist"][: w * h].reshape(h, w), exit_dist)
+            assert np.array_equal(info["key_dist"][: w * h].reshape(h, w), key_dist)
+            assert np.all(info["exit_dist"][w * h :] == -1)
+        env.act(rng.randint(low=0, high=env.ac_space.eltype.n, size=(env.num,), dtype=np.int32))
+
+
+@pytest.mark.parametrize("distance_infos", [False, True])
+@pytest.mark.parametrize("env_name", DISTANCE_ENV_NAMES)
+def test_distance_infos_speed(env_name, distance_infos, benchmark):
+    num_envs = 16
+    num_steps = 100
+    env = ProcgenGym3Env(
+        num=num_envs,
+        env_name=env_name,
+        distance_infos=distance_infos,
+        render_mode="none",
+        num_threads=0,
+    )
+    rng = np.random.RandomState(0)
+    actions = rng.randint(
+        low=0, high=env.ac_space.eltype.n, size=(num_steps, num_envs), dtype=np.int32
+    )
+
+    def rollout():
+        for step in range(num_steps):
+            env.act(actions[step])
+            env.get_info()
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+def test_entity_pool_stats():
+    num_envs = 4
+    env = ProcgenGym3Env(
+        num=num_envs, env_name="bossfight", render_mode="none", num_threads=0, rand_seed=0
+    )
+    rng = np.random.RandomState(0)
+    for _ in range(500):
+        env.act(rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32))
+
+    stats = env.get_entity_pool_stats()
+    assert 0 < stats["num_live"] < stats["num_allocs"]
+    # erased entities make room for new ones, so the pools hardly grow after the first levels
+    assert stats["num_reuses"] > stats["num_allocs"] // 2
+    assert stats["num_chunks"] < stats["num_allocs"] // 100
+
+
+@pytest.mark.parametrize(
+    "env_name", ["bigfish", "bossfight", "caveflyer", "dodgeball", "plunder", "starpilot"]
+)
+def test_entity_grid(env_name):
+    # the entity grid finds the same collisions as testing every pair, in the same order
+    num_envs = 4
+    num_steps = 1000
+    kwargs = dict(num=num_envs, env_name=env_name, render_mode="none", rand_seed=0)
+    env = ProcgenGym3Env(**kwargs)
+    grid_env = ProcgenGym3Env(force_entity_grid=True, **kwargs)
+    rng = np.random.RandomState(0)
+    for step in range(num_steps):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        grid_env.act(actions)
+        if step % 100 == 99:
+            assert grid_env.get_state() == env.get_state()
+
+
+@pytest.mark.parametrize(
+    "env_name", ["bigfish", "bossfight", "caveflyer", "dodgeball", "plunder", "starpilot"]
+)
+def test_entity_step_speed(env_name, benchmark):
+    # games with many moving entities, where collision checks are a large part of a step
+    num_envs = 16
+    num_steps = 100
+    env = ProcgenGym3Env(
+        num=num_envs, env_name=env_name, render_mode="none", num_threads=0, rand_seed=0
+    )
+    rng = np.random.RandomState(0)
+    actions = rng.randint(
+        low=0, high=env.ac_space.eltype.n, size=(num_steps, num_envs), dtype=np.int32
+    )
+    # play a while first so that levels have filled up with entities
+    for step in range(num_steps):
+        env.act(actions[step])
+
+    def rollout():
+        for step in range(num_steps):
+            env.act(actions[step])
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+    benchmark.extra_info.update(env.get_entity_pool_stats())
+
+
+@pytest.mark.parametrize("num_threads", [0, 3])
+def test_profile(num_threads):
+    num_envs = 8
+    num_steps = 100
+    kwargs = dict(
+        num=num_envs,
+        env_name="coinrun",
+        num_threads=num_threads,
+        rand_seed=0,
+        render_mode="rgb_array",
+    )
+    env = ProcgenGym3Env(**kwargs)
+    profiled_env = ProcgenGym3Env(profile=True, **kwargs)
+    rng = np.random.RandomState(0)
+    for _ in range(num_steps):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        profiled_env.act(actions)
+        # profiling doesn't change what the games do
+        _, obs, first = env.observe()
+        _, profiled_obs, profiled_first = profiled_env.observe()
+        assert np.array_equal(obs["rgb"], profiled_obs["rgb"])
+        assert np.array_equal(first, profiled_first)
+
+    profile = profiled_env.get_profile()
+    assert len(profile["games"]) == num_envs
+    for game in profile["games"]:
+        assert game["step"]["count"] == num_steps
+        # the initial reset and render, then one per step
+        assert game["render"]["count"] == num_steps + 1
+        assert game["convert"]["count"] == num_steps + 1
+        # rendered by observe()
+        assert game["render_hires"]["count"] == num_steps
+        assert game["reset"]["count"] >= 1
+        for phase in game.values():
+            assert phase["histogram"].sum() == phase["count"]
+            assert (phase["seconds"] > 0) == (phase["count"] > 0)
+
+    assert len(profile["threads"]) == num_threads + 1
+    busy_count = sum(thread["busy"]["count"] for thread in profile["threads"])
+    assert busy_count >= num_steps
+    if num_threads > 0:
+        assert profile["scheduler"]["straggler"]["count"] > 0
+    else:
+        assert profile["threads"][-1]["busy"]["count"] >= num_steps
+        assert profile["scheduler"]["wait"]["count"] == 0
+
+    with pytest.raises(AssertionError):
+        env.get_profile()
+
+
+@pytest.mark.parametrize("profile", [False, True])
+def test_profile_speed(profile, benchmark):
+    num_envs = 16
+    num_steps = 50
+    env = ProcgenGym3Env(num=num_envs, env_name="coinrun", rand_seed=0, profile=profile)
+    actions = np.zeros([env.num])
+
+    def rollout():
+        for _ in range(num_steps):
+            env.act(actions)
+            env.observe()
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_observe_out(pipelined):
+    num_envs = 3
+    kwargs = dict(num=num_envs, env_name="heist", rand_seed=4, render_mode="rgb_array")
+    env = ProcgenGym3Env(**kwargs)
+    out_env = ProcgenGym3Env(pipelined=pipelined, **kwargs)
+    rew, ob, first = env.observe()
+    out = (np.zeros_like(rew), {"rgb": np.zeros_like(ob["rgb"])}, np.zeros_like(first))
+    info_out = {name: np.zeros_like(arr) for name, arr in out_env.get_info_arrays().items()}
+    prev_rew, prev_ob, prev_first = rew, ob, first
+
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        result = out_env.observe(out=out)
+        assert result is out
+        rew, ob, first = env.observe()
+        out_rew, out_ob, out_first = out
+        if pipelined:
+            # the pipelined environment lags one step behind
+            rew, ob, first = prev_rew, prev_ob, prev_first
+        assert np.array_equal(out_rew, rew)
+        assert np.array_equal(out_ob["rgb"], ob["rgb"])
+        assert np.array_equal(out_first, first)
+
+        view_rew, view_ob, view_first = out_env.observe_views()
+        assert np.array_equal(view_ob["rgb"], ob["rgb"])
+        assert np.array_equal(view_rew, rew)
+        # numpy arrays support DLPack, so these can be passed to other libraries without copies
+        assert np.from_dlpack(view_ob["rgb"]).ctypes.data == view_ob["rgb"].ctypes.data
+
+        info = out_env.get_info_arrays(out=info_out)
+        assert info is info_out
+        views = out_env.get_info_views()
+        for name, arr in info.items():
+            assert np.array_equal(arr, views[name])
+        if not pipelined:
+            for env_idx, env_info in enumerate(env.get_info()):
+                for name, value in env_info.items():
+                    assert np.array_equal(info[name][env_idx], value)
+
+        prev_rew, prev_ob, prev_first = env.observe()
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        out_env.act(actions)
+
+    with pytest.raises(AssertionError):
+        out_env.observe(out=(np.zeros(num_envs, dtype=np.float64), out[1], out[2]))
+    with pytest.raises(AssertionError):
+        out_env.get_info_arrays(out={"rgb": info_out["rgb"]})
+
+
+@pytest.mark.parametrize("mode", ["copy", "out", "views"])
+def test_observe_out_speed(mode, benchmark):
+    num_envs = 256
+    env = ProcgenGym3Env(num=num_envs, env_name="coinrun", rand_seed=0)
+    rew, ob, first = env.observe()
+    out = (np.zeros_like(rew), {"rgb": np.zeros_like(ob["rgb"])}, np.zeros_like(first))
+
+    def observe():
+        for _ in range(10):
+            if mode == "copy":
+                env.observe()
+            elif mode == "out":
+                env.observe(out=out)
+            else:
+                env.observe_views()
+
+    benchmark(observe)
+
+
+def transform_obs(rgb, grayscale, downsample, channels_first):
+    """
+    The transforms of ProcgenGym3Env's obs_* options on a batch of rgb observations
+    """
+    n, h, w, _ = rgb.shape
+    blocks = rgb.reshape(n, h // downsample, downsample, w // downsample, downsample, 3)
+    block_size = downsample * downsample
+    rgb = (blocks.astype(np.int32).sum(axis=(2, 4)) + block_size // 2) // block_size
+    if grayscale:
+        rgb = (77 * rgb[..., :1] + 150 * rgb[..., 1:2] + 29 * rgb[..., 2:] + 128) >> 8
+    if channels_first:
+        rgb = rgb.transpose(0, 3, 1, 2)
+    return rgb.astype(np.uint8)
+
+
+OBS_TRANSFORMS = [
+    (True, 1, False, 1),
+    (False, 2, True, 1),
+    (True, 4, False, 3),
+    (False, 1, True, 2),
+]
+
+
+@pytest.mark.parametrize("grayscale,downsample,channels_first,frame_stack", OBS_TRANSFORMS)
+def test_obs_transforms(grayscale, downsample, channels_first, frame_stack):
+    num_envs = 4
+    kwargs = dict(num=num_envs, env_name="coinrun", rand_seed=4)
+    env = ProcgenGym3Env(**kwargs)
+    transformed_env = ProcgenGym3Env(
+        obs_grayscale=grayscale,
+        obs_downsample=downsample,
+        obs_channels_first=channels_first,
+        obs_frame_stack=frame_stack,
+        **kwargs,
+    )
+    _, ob, _ = env.observe()
+    frame_shape = transform_obs(ob["rgb"], grayscale, downsample, channels_first).shape
+    frames = [np.zeros(frame_shape, dtype=np.uint8) for _ in range(frame_stack)]
+
+    def check_same(stepped=True):
+        _, ob, first = env.observe()
+        frame = transform_obs(ob["rgb"], grayscale, downsample, channels_first)
+        if stepped:
+            frames.pop(0)
+            frames.append(frame)
+            for prev_frame in frames[:-1]:
+                prev_frame[first] = 0
+        else:
+            frames[-1] = frame
+        expected = np.concatenate(frames, axis=1 if channels_first else 3)
+        _, transformed_ob, _ = transformed_env.observe()
+        assert transformed_env.ob_space["rgb"].shape == expected.shape[1:]
+        assert np.array_equal(transformed_ob["rgb"], expected)
+
+    rng = np.random.RandomState(0)
+    check_same()
+    for _ in range(200):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        transformed_env.act(actions)
+        check_same()
+
+    # copies get the previous frames of their sources
+    env.fork([1], [2])
+    transformed_env.fork([1], [2])
+    for frame in frames:
+        frame[2] = frame[1]
+    check_same(stepped=False)
+
+    # states of environments that don't stack frames start a new stack
+    states = env.get_state()
+    env.set_state(states)
+    transformed_env.set_state(states)
+    for frame in frames:
+        frame[:] = 0
+    check_same(stepped=False)
+
+
+def test_obs_frame_stack_state():
+    num_envs = 4
+    kwargs = dict(
+        num=num_envs, env_name="coinrun", rand_seed=4, obs_grayscale=True, obs_frame_stack=4
+    )
+    env = ProcgenGym3Env(**kwargs)
+    restored_env = ProcgenGym3Env(**kwargs)
+    other_transform_env = ProcgenGym3Env(**dict(kwargs, obs_grayscale=False))
+
+    rng = np.random.RandomState(0)
+    for _ in range(5):
+        env.act(rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32))
+
+    # states of environments that stack frames include the previous frames
+    states = env.get_state()
+    restored_env.set_state(states)
+    for _ in range(5):
+        _, ob, _ = env.observe()
+        _, restored_ob, _ = restored_env.observe()
+        assert np.array_equal(restored_ob["rgb"], ob["rgb"])
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        restored_env.act(actions)
+
+    # the frames of another transform don't fit, only the restored frame is kept
+    other_transform_env.set_state(states)
+    _, ob, _ = other_transform_env.observe()
+    assert not ob["rgb"][..., :-3].any()
+    assert ob["rgb"][..., -3:].any()
+
+
+def test_obs_transforms_pipelined():
+    num_envs = 4
+    kwargs = dict(
+        num=num_envs, env_name="coinrun", rand_seed=4, obs_grayscale=True, obs_frame_stack=4
+    )
+    env = ProcgenGym3Env(**kwargs)
+    pipelined_env = ProcgenGym3Env(pipelined=True, num_pipeline_buffers=3, **kwargs)
+
+    # the frames are kept by the games, whichever buffer set they write into
+    rng = np.random.RandomState(0)
+    _, prev_ob, _ = env.observe()
+    for _ in range(100):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        _, ob, _ = env.observe()
+        _, pipelined_ob, _ = pipelined_env.observe()
+        assert np.array_equal(pipelined_ob["rgb"], prev_ob["rgb"])
+        prev_ob = ob
+        env.act(actions)
+        pipelined_env.act(actions)
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_obs_transforms_speed(native, benchmark):
+    num_envs = 64
+    num_steps = 32
+    kwargs = dict(num=num_envs, env_name="coinrun", rand_seed=0)
+    if native:
+        env = ProcgenGym3Env(
+            obs_grayscale=True,
+            obs_downsample=2,
+            obs_channels_first=True,
+            obs_frame_stack=4,
+            **kwargs,
+        )
+    else:
+        env = ProcgenGym3Env(**kwargs)
+    actions = np.zeros(num_envs, dtype=np.int32)
+    frames = np.zeros((num_envs, 4, 32, 32), dtype=np.uint8)
+
+    def rollout():
+        for _ in range(num_steps):
+            env.act(actions)
+            _, ob, first = env.observe()
+            if not native:
+                # what a python wrapper does
+                frames[:, :-1] = frames[:, 1:]
+                frames[first] = 0
+                frames[:, -1] = transform_obs(ob["rgb"], True, 2, True)[:, 0]
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_hires_render_subset(pipelined):
+    num_envs = 6
+    interval = 3
+    hires_env_idxs = [4, 1]
+    kwargs = dict(num=num_envs, env_name="coinrun", rand_seed=2, render_mode="rgb_array")
+    env = ProcgenGym3Env(**kwargs)
+    subset_env = ProcgenGym3Env(pipelined=pipelined, **kwargs)
+    subset_env.set_hires_render(hires_env_idxs, interval=interval)
+
+    rng = np.random.RandomState(0)
+    infos = [env.get_info()]
+    subset_env.get_info()
+    for step in range(1, 13):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        subset_env.act(actions)
+        infos.append(env.get_info())
+        # pipelined environments return the infos of the previous step
+        observed_step = step - 1 if pipelined else step
+        subset_infos = subset_env.get_info()
+        if observed_step % interval == 0:
+            for env_idx in hires_env_idxs:
+                assert np.array_equal(
+                    subset_infos[env_idx]["rgb"], infos[observed_step][env_idx]["rgb"]
+                )
+
+    # on demand for the current step
+    env_idx = 2
+    subset_env.set_hires_render([env_idx], interval=1)
+    if pipelined:
+        subset_env.set_state(env.get_state())
+    assert np.array_equal(subset_env.get_info()[env_idx]["rgb"], env.get_info()[env_idx]["rgb"])
+
+    with pytest.raises(AssertionError):
+        ProcgenGym3Env(num=1, env_name="coinrun").set_hires_render()
+
+
+@pytest.mark.parametrize("num_hires_envs", [None, 1, 0])
+def test_hires_render_speed(num_hires_envs, benchmark):
+    num_envs = 16
+    num_steps = 10
+    env = ProcgenGym3Env(num=num_envs, env_name="coinrun", rand_seed=0, render_mode="rgb_array")
+    if num_hires_envs is not None:
+        env.set_hires_render(range(num_hires_envs))
+    actions = np.zeros(num_envs, dtype=np.int32)
+
+    def rollout():
+        for _ in range(num_steps):
+            env.act(actions)
+            env.observe()
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
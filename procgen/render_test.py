@@ -0,0 +1,198 @@
+"""
+Pixel-diff tests for the native software rasterizer in procgen/Qt
+
+Each game is stepped with a fixed level seed and a fixed sequence of random actions, and the
+observations at a few points are compared with reference frames stored in
+procgen/testdata/reference_frames.npz.
+
+Tolerance: a channel may differ by at most MAX_CHANNEL_DIFF, and at most MAX_DIFF_FRACTION of
+the values in a frame may differ at all. Aliased drawing is exact integer arithmetic, but
+rotated sprites and bilinear sampling go through floating point, so a different compiler or
+-march setting may flip the rounding of a few edge pixels.
+
+Assets are drawn through a per-game cache of copies resampled to the exact size and sub-pixel
+offset they are drawn at (see BasicAbstractGame::draw_scaled_asset()). The copies are made by the
+same rasterizer code with the same device coordinates, so the cache adds no tolerance of its own:
+frames are bit identical with and without it, which test_scaled_asset_cache checks by comparing an
+env that has been rendering for a while with fresh envs that start from the same states.
+
+The reference frames are snapshots of this rasterizer, so on their own they only catch
+regressions. The rasterizer itself is checked against Qt 5.15's raster engine by
+test_qt_reference, which needs PyQt5: the frames are rendered again with qpainter_trace_dir set,
+which uses a build of the library with PROCGEN_QPAINTER_TRACE that writes every QPainter call
+made while rendering to a trace together with the images it draws (see QPainter::traceTo()), and
+each frame is drawn again from the trace by a real QPainter. All games match Qt exactly, and the
+trace build renders the same frames as the normal one. The drawing done only for the high
+resolution render modes (antialiasing, bilinear sampling, wide pens) is not covered.
+
+To regenerate the reference frames after an intentional rendering change, run:
+
+    python -m procgen.render_test
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from .env import ENV_NAMES
+from procgen import ProcgenGym3Env
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REFERENCE_PATH = os.path.join(SCRIPT_DIR, "testdata", "reference_frames.npz")
+
+CAPTURE_STEPS = [0, 10, 50]
+MAX_CHANNEL_DIFF = 2
+MAX_DIFF_FRACTION = 0.005
+
+
+def render_frames(env_name, **kwargs):
+    env = ProcgenGym3Env(
+        num=1,
+        env_name=env_name,
+        num_levels=1,
+        start_level=0,
+        distribution_mode="hard",
+        rand_seed=0,
+        num_threads=0,
+        **kwargs,
+    )
+    rng = np.random.RandomState(0)
+    frames = []
+    for step in range(max(CAPTURE_STEPS) + 1):
+        if step in CAPTURE_STEPS:
+            _, obs, _ = env.observe()
+            frames.append(obs["rgb"][0].copy())
+        env.act(
+            rng.randint(
+                low=0, high=env.ac_space.eltype.n, size=(env.num,), dtype=np.int32
+            )
+        )
+    return np.array(frames)
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_reference_frames(env_name):
+    reference = np.load(REFERENCE_PATH)[env_name]
+    frames = render_frames(env_name)
+    assert frames.shape == reference.shape
+    diff = np.abs(frames.astype(np.int16) - reference.astype(np.int16))
+    assert diff.max() <= MAX_CHANNEL_DIFF
+    assert np.count_nonzero(diff) <= MAX_DIFF_FRACTION * diff.size
+
+
+def replay_trace(directory):
+    """
+    Draw the frames of a QPainter trace with Qt, returns a list of (qt_frame, frame) pairs of
+    the rgb pixels drawn by Qt and by the native rasterizer
+    """
+    from PyQt5.QtCore import QPoint, QRect, QRectF, Qt
+    from PyQt5.QtGui import QBrush, QColor, QImage, QPainter, QPen
+
+    images = {}
+
+    def load(name, width, height, fmt=QImage.Format_ARGB32_Premultiplied):
+        if name not in images:
+            with open(os.path.join(directory, name + ".argb"), "rb") as f:
+                data = f.read()
+            width, height = int(width), int(height)
+            images[name] = QImage(data, width, height, width * 4, fmt).copy()
+        return images[name]
+
+    def pixels(image):
+        data = image.constBits().asstring(image.byteCount())
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(image.height(), -1, 4)
+        return rows[:, : image.width(), 2::-1].copy()
+
+    frames = []
+    with open(os.path.join(directory, "trace.txt")) as f:
+        for line in f:
+            op, *args = line.split()
+            if op == "begin":
+                device = load(*args).convertToFormat(QImage.Format_RGB32)
+                p = QPainter(device)
+            elif op == "end":
+                p.end()
+                frames.append((pixels(device), pixels(load(*args))))
+            elif op == "pen":
+                color = QColor(*map(int, args[:4]))
+                p.setPen(QPen(QBrush(color), float(args[4])) if int(args[5]) else Qt.NoPen)
+            elif op == "brush":
+                p.setBrush(QBrush(QColor(*map(int, args))))
+            elif op == "save":
+                p.save()
+            elif op == "restore":
+                p.restore()
+            elif op == "hint":
+                p.setRenderHint(int(args[0]), bool(int(args[1])))
+            elif op == "opacity":
+                p.setOpacity(float(args[0]))
+            elif op == "translate":
+                p.translate(float(args[0]), float(args[1]))
+            elif op == "rotate":
+                p.rotate(float(args[0]))
+            elif op == "composition":
+                p.setCompositionMode(
+                    QPainter.CompositionMode_Source
+                    if args[0] == "source"
+                    else QPainter.CompositionMode_SourceOver
+                )
+            elif op == "fill_rect":
+                p.fillRect(QRect(*map(int, args[:4])), QColor(*map(int, args[4:])))
+            elif op == "fill_rect_f":
+                p.fillRect(QRectF(*map(float, args[:4])), QColor(*map(int, args[4:])))
+            elif op == "draw_image":
+                p.drawImage(QPoint(*map(int, args[:2])), load(*args[2:]))
+            elif op == "draw_image_f":
+                p.drawImage(QRectF(*map(float, args[:4])), load(*args[4:]))
+            elif op == "draw_ellipse":
+                p.drawEllipse(QRect(*map(int, args)))
+            elif op == "draw_ellipse_f":
+                p.drawEllipse(QRectF(*map(float, args)))
+            elif op == "draw_line":
+                p.drawLine(*map(int, args))
+            else:
+                raise ValueError(f"unknown trace op {op}")
+    return frames
+
+
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_qt_reference(env_name, tmpdir, monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    pytest.importorskip("PyQt5.QtGui")
+    traced_frames = render_frames(env_name, qpainter_trace_dir=str(tmpdir))
+    assert np.array_equal(traced_frames, render_frames(env_name))
+    frames = replay_trace(str(tmpdir))
+    assert len(frames) == max(CAPTURE_STEPS) + 2
+    for qt_frame, frame in frames:
+        assert np.array_equal(qt_frame, frame)
+
+
+@pytest.mark.parametrize("env_name", ["coinrun", "maze", "miner", "bigfish"])
+def test_scaled_asset_cache(env_name):
+    kwargs = dict(num=4, env_name=env_name, distribution_mode="hard", num_threads=0)
+    env = ProcgenGym3Env(rand_seed=0, **kwargs)
+    rng = np.random.RandomState(0)
+    for step in range(200):
+        env.act(
+            rng.randint(
+                low=0, high=env.ac_space.eltype.n, size=(env.num,), dtype=np.int32
+            )
+        )
+        if step % 50 == 49:
+            _, obs, _ = env.observe()
+            fresh_env = ProcgenGym3Env(rand_seed=1, **kwargs)
+            fresh_env.set_state(env.get_state())
+            _, fresh_obs, _ = fresh_env.observe()
+            assert np.array_equal(obs["rgb"], fresh_obs["rgb"])
+
+
+def main():
+    os.makedirs(os.path.dirname(REFERENCE_PATH), exist_ok=True)
+    np.savez_compressed(
+        REFERENCE_PATH, **{env_name: render_frames(env_name) for env_name in ENV_NAMES}
+    )
+
+
+if __name__ == "__main__":
+    main()
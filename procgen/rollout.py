@@ -0,0 +1,137 @@
+"""
+Rollout buffers that the stepping threads of an environment write into directly
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .sharedmem import make_layout, map_arrays
+
+
+class RolloutBuffer:
+    """
+    The outputs of num_steps steps of num environments, written by the stepping threads of a
+    ProcgenGym3Env without copies, see ProcgenGym3Env.set_rollout_buffer()
+
+    Every array is indexed by slot first and environment second:
+
+    * `rew`, `first`, `ob[name]` and `info[name]` hold in slot t what `observe()` and
+      `get_info()` return after the t-th `act()` since the buffer was set, modulo num_steps
+    * `action` holds in slot t the actions passed to the `act()` that followed, chosen from the
+      outputs in slot t
+
+    * `step` holds in slot t the number of `act()` calls after which its outputs were written,
+      or -1 while a step is writing into the slot
+
+    A slot is overwritten by the step num_steps steps later, so with num_steps one more than
+    the length of a rollout, the observation that ends a rollout is still there along with the
+    one that starts it.
+
+    `act()` returns while the stepping threads are still writing the step into its slot, call
+    ProcgenGym3Env.wait() (or `observe()`, `get_info()`) before reading it. The environment
+    publishes the step of a slot in `step` once the slot is complete, when it waits for the step
+    in `wait()`, `observe()`, `get_info()` or the next `act()`. Other processes can read a slot
+    while `step` holds the step they expect there, checking it again after reading in case the
+    slot was overwritten in the meantime.
+
+    With shared=True the arrays are in shared memory that other processes can map, for instance
+    a learner process, by passing `buffer.layout` to `RolloutBuffer.attach()`.
+
+    Use ProcgenGym3Env.make_rollout_buffer() to make one with the right specs.
+
+    :param num_steps: number of slots
+    :param num: number of environments
+    :param specs: list of (key, shape, dtype) of the observations and infos of one environment,
+        with keys ("ob", name) and ("info", name)
+    :param shared: allocate the arrays in shared memory
+    :param shm_name: map the existing shared memory of this name instead, see attach()
+    """
+
+    def __init__(self, num_steps, num, specs, shared=False, shm_name=None):
+        self.num_steps = num_steps
+        self.num = num
+        self.specs = list(specs)
+        # the slot of the latest outputs, kept up to date by the environment
+        self.slot = 0
+
+        all_specs = [
+            ("step", (), "int64"),
+            ("rew", (num,), "float32"),
+            ("first", (num,), "bool"),
+            ("action", (num,), "int32"),
+        ]
+        all_specs += [(key, (num,) + tuple(shape), dtype) for key, shape, dtype in self.specs]
+        offsets, size = make_layout(num_steps, all_specs)
+
+        self._shm = None
+        self._owns_shm = False
+        if shm_name is not None:
+            self._shm = shared_memory.SharedMemory(name=shm_name)
+            buf = self._shm.buf
+        elif shared:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._owns_shm = True
+            buf = self._shm.buf
+        else:
+            buf = np.zeros(size, dtype=np.uint8)
+        arrays = map_arrays(buf, num_steps, all_specs, offsets)
+        if shm_name is None:
+            arrays["step"][:] = -1
+
+        self.step = arrays["step"]
+        self.rew = arrays["rew"]
+        self.first = arrays["first"]
+        self.action = arrays["action"]
+        self.ob = {key[1]: arr for key, arr in arrays.items() if key[0] == "ob"}
+        self.info = {key[1]: arr for key, arr in arrays.items() if key[0] == "info"}
+
+    @property
+    def layout(self):
+        """
+        What attach() needs to map this buffer in another process, only for shared buffers
+        """
+        assert self._shm is not None, "only shared buffers can be attached to"
+        return dict(
+            num_steps=self.num_steps, num=self.num, specs=self.specs, shm_name=self._shm.name
+        )
+
+    @classmethod
+    def attach(cls, layout):
+        """
+        Map a shared buffer made in another process, from its `layout`
+        """
+        return cls(**layout)
+
+    @property
+    def completed_steps(self):
+        """
+        The number of steps whose outputs are complete, including the outputs from before the
+        first `act()`, the latest ones are in slot `(completed_steps - 1) % num_steps`
+        """
+        return int(self.step.max()) + 1
+
+    def get_slot(self, slot):
+        """
+        The rew, ob, first and info arrays of a slot, like those returned by `observe()`
+        """
+        return (
+            self.rew[slot],
+            {name: arr[slot] for name, arr in self.ob.items()},
+            self.first[slot],
+            {name: arr[slot] for name, arr in self.info.items()},
+        )
+
+    def close(self):
+        """
+        Release the shared memory, the arrays can't be used after this, and neither can an
+        environment that writes into them
+        """
+        if self._shm is None:
+            return
+        # the views have to go before the shared memory can be closed
+        self.step = self.rew = self.first = self.action = self.ob = self.info = None
+        self._shm.close()
+        if self._owns_shm:
+            self._shm.unlink()
+        self._shm = None
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from .env import ProcgenGym3Env
+from .rollout import RolloutBuffer
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_rollout_buffer(shared):
+    num_envs = 4
+    num_steps = 5
+    kwargs = dict(num=num_envs, env_name="miner", rand_seed=2, render_mode="rgb_array")
+    env = ProcgenGym3Env(**kwargs)
+    rollout_env = ProcgenGym3Env(**kwargs)
+    buffer = rollout_env.make_rollout_buffer(num_steps, shared=shared)
+    rollout_env.set_rollout_buffer(buffer)
+    assert buffer.ob["rgb"].shape == (num_steps, num_envs, 64, 64, 3)
+    assert buffer.info["grid"].shape == (num_steps, num_envs, 35 * 35)
+
+    rng = np.random.RandomState(0)
+    for step in range(2 * num_steps + 2):
+        slot = step % num_steps
+        assert buffer.slot == slot
+        # the oldest slot is complete, the current one only once the step is written into it
+        assert buffer.step[(slot + 1) % num_steps] == max(step + 1 - num_steps, -1)
+        rollout_env.wait()
+        assert buffer.step[slot] == step
+        assert buffer.completed_steps == step + 1
+        rew, ob, first = env.observe()
+        assert np.array_equal(buffer.rew[slot], rew)
+        assert np.array_equal(buffer.ob["rgb"][slot], ob["rgb"])
+        assert np.array_equal(buffer.first[slot], first)
+        for env_idx, info in enumerate(env.get_info()):
+            for key, value in info.items():
+                assert np.array_equal(buffer.info[key][slot, env_idx], value)
+        rollout_rew, rollout_ob, _ = rollout_env.observe()
+        assert np.array_equal(rollout_ob["rgb"], ob["rgb"])
+        assert np.array_equal(rollout_rew, rew)
+
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        rollout_env.act(actions)
+        assert np.array_equal(buffer.action[slot], actions)
+
+    if shared:
+        attached = RolloutBuffer.attach(buffer.layout)
+        assert np.array_equal(attached.step, buffer.step)
+        assert np.array_equal(attached.ob["rgb"], buffer.ob["rgb"])
+        assert np.array_equal(attached.info["grid"], buffer.info["grid"])
+        attached.close()
+        rollout_env.close()
+        buffer.close()
+
+
+def test_replace_output_arrays():
+    num_envs = 3
+    num_steps = 4
+    kwargs = dict(num=num_envs, env_name="coinrun", rand_seed=1)
+    env = ProcgenGym3Env(**kwargs)
+    reference_env = ProcgenGym3Env(**kwargs)
+    actions = np.zeros(num_envs, dtype=np.int32)
+
+    def check_same():
+        _, ob, _ = env.observe()
+        _, reference_ob, _ = reference_env.observe()
+        assert np.array_equal(ob["rgb"], reference_ob["rgb"])
+
+    # replaced buffers are released, their buffer sets are reused
+    for _ in range(3):
+        buffer = env.make_rollout_buffer(num_steps)
+        env.set_rollout_buffer(buffer)
+        assert sorted(env._output_keepalives) == list(range(1, num_steps + 1))
+        env.act(actions)
+        reference_env.act(actions)
+        check_same()
+
+    with pytest.raises(AssertionError):
+        rew, ob, first = env.observe()
+        env.set_output_arrays(rew, ob, first, env.get_info_arrays())
+
+    env.restore_output_arrays()
+    assert not env._output_keepalives
+    assert buffer.step[buffer.slot] == 1
+    check_same()
+
+    for _ in range(3):
+        rew, ob, first = env.observe()
+        env.set_output_arrays(rew, ob, first, env.get_info_arrays())
+        assert len(env._output_keepalives) == 1
+        env.act(actions)
+        reference_env.act(actions)
+        check_same()
+
+    with pytest.raises(AssertionError):
+        env.set_rollout_buffer(env.make_rollout_buffer(num_steps))
+
+    env.restore_output_arrays()
+    assert not env._output_keepalives
+    env.act(actions)
+    reference_env.act(actions)
+    check_same()
+
+
+@pytest.mark.parametrize("use_rollout_buffer", [False, True])
+def test_rollout_buffer_speed(use_rollout_buffer, benchmark):
+    num_envs = 64
+    num_steps = 32
+    env = ProcgenGym3Env(num=num_envs, env_name="coinrun", rand_seed=0)
+    actions = np.zeros(num_envs, dtype=np.int32)
+    if use_rollout_buffer:
+        buffer = env.make_rollout_buffer(num_steps)
+        env.set_rollout_buffer(buffer)
+
+        def rollout():
+            for _ in range(num_steps):
+                env.act(actions)
+
+    else:
+        obs = np.zeros((num_steps, num_envs, 64, 64, 3), dtype=np.uint8)
+        rews = np.zeros((num_steps, num_envs), dtype=np.float32)
+        firsts = np.zeros((num_steps, num_envs), dtype=bool)
+
+        def rollout():
+            for step in range(num_steps):
+                env.act(actions)
+                rews[step], ob, firsts[step] = env.observe()
+                obs[step] = ob["rgb"]
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
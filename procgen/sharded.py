@@ -0,0 +1,324 @@
+"""
+ProcgenGym3Env split across worker processes that write into shared memory
+"""
+
+import glob
+import multiprocessing
+import os
+import traceback
+from multiprocessing import shared_memory
+
+import gym3
+import numpy as np
+
+from .env import ProcgenGym3Env, create_random_seed
+from .sharedmem import make_layout, map_arrays
+
+
+def split_envs(num, num_shards, num_joint_games=1):
+    """
+    Split num environments into num_shards contiguous (start, end) ranges of nearly equal size,
+    with every boundary a multiple of num_joint_games
+    """
+    assert num % num_joint_games == 0
+    num_units = num // num_joint_games
+    assert 0 < num_shards <= num_units, "every shard needs at least one environment"
+    bounds = [num_joint_games * (num_units * i // num_shards) for i in range(num_shards + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def parse_cpu_list(text):
+    """
+    Parse a list of cpus in the format of /sys/devices/system/node/node*/cpulist, like "0-3,8"
+    """
+    cpus = []
+    for part in text.strip().split(","):
+        if part == "":
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def get_numa_node_cpus():
+    """
+    The cpus of each NUMA node that this process may run on, nodes without any are left out
+    """
+    allowed = os.sched_getaffinity(0)
+    nodes = []
+    paths = glob.glob("/sys/devices/system/node/node[0-9]*/cpulist")
+    for path in sorted(paths, key=lambda p: int(os.path.basename(os.path.dirname(p))[4:])):
+        with open(path) as f:
+            cpus = [cpu for cpu in parse_cpu_list(f.read()) if cpu in allowed]
+        if cpus:
+            nodes.append(cpus)
+    if not nodes:
+        # no NUMA information, treat the machine as a single node
+        nodes.append(sorted(allowed))
+    return nodes
+
+
+def get_shard_cpus(num_shards, cpu_affinity):
+    """
+    The cpus each shard is pinned to for a cpu_affinity of ShardedProcgenGym3Env, or None for
+    each shard if they aren't pinned
+    """
+    if cpu_affinity is None:
+        return [None] * num_shards
+    assert hasattr(
+        os, "sched_setaffinity"
+    ), "cpu_affinity needs os.sched_setaffinity, which is only available on linux"
+    if cpu_affinity == "cores":
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) < num_shards:
+            return [[cpus[i % len(cpus)]] for i in range(num_shards)]
+        return [block.tolist() for block in np.array_split(cpus, num_shards)]
+    elif cpu_affinity == "numa":
+        nodes = get_numa_node_cpus()
+        return [nodes[i % len(nodes)] for i in range(num_shards)]
+    else:
+        assert len(cpu_affinity) == num_shards, "cpu_affinity needs a list of cpus per shard"
+        return [sorted(cpus) for cpus in cpu_affinity]
+
+
+def shard_worker(conn, start, end, env_kwargs, cpus):
+    """
+    Run the environments start:end of a ShardedProcgenGym3Env, controlled through conn
+    """
+    try:
+        if cpus is not None:
+            # before the environment starts its stepping threads, which inherit the affinity
+            os.sched_setaffinity(0, cpus)
+        env = ProcgenGym3Env(num=end - start, env_offset=start, **env_kwargs)
+        _, ob, _ = env.observe()
+        info = env.get_info()[0]
+        ob_specs = [(name, arr.shape[1:], arr.dtype.str) for name, arr in ob.items()]
+        info_specs = [
+            (name, np.shape(value), np.asarray(value).dtype.str) for name, value in info.items()
+        ]
+        conn.send((True, (env.ob_space, env.ac_space, ob_specs, info_specs)))
+
+        shm_name, num, specs, offsets = conn.recv()
+        shm = shared_memory.SharedMemory(name=shm_name)
+        arrays = {
+            key: arr[start:end] for key, arr in map_arrays(shm.buf, num, specs, offsets).items()
+        }
+        env.set_output_arrays(
+            rew=arrays["rew"],
+            ob={name: arrays[("ob", name)] for name, _, _ in ob_specs},
+            first=arrays["first"],
+            info={name: arrays[("info", name)] for name, _, _ in info_specs},
+        )
+        actions = arrays["action"]
+        conn.send((True, None))
+    except Exception:
+        conn.send((False, traceback.format_exc()))
+        return
+
+    while True:
+        cmd, arg = conn.recv()
+        if cmd == "close":
+            break
+        try:
+            result = None
+            if cmd == "act":
+                env.act(actions)
+            elif cmd == "get_state":
+                result = env.get_state()
+            elif cmd == "set_state":
+                env.set_state(arg)
+            else:
+                raise Exception(f"unknown command {cmd}")
+            # wait for the step, and render the "rgb" info of render_mode="rgb_array" like
+            # get_info() of ProcgenGym3Env does
+            env.call_c_func("libenv_observe")
+        except Exception:
+            conn.send((False, traceback.format_exc()))
+            continue
+        conn.send((True, result))
+
+    env.close()
+    # the views have to go before the shared memory can be closed
+    del env, arrays, actions
+    shm.close()
+    conn.send((True, None))
+
+
+class ShardedProcgenGym3Env(gym3.Env):
+    """
+    ProcgenGym3Env with the environments split across worker processes, for when a single
+    process is limited by its memory bandwidth or by the python thread driving it
+
+    Each worker process (shard) steps a contiguous slice of the environments and writes the
+    observations, rewards, firsts and infos directly into one block of shared memory that
+    `observe()` and `get_info()` read, nothing but small commands are sent between the
+    processes. The shards step in the background between `act()` and the next `observe()`,
+    `get_info()`, `get_state()` or `set_state()`.
+
+    The environments are seeded as if they were all in a single ProcgenGym3Env: with the same
+    `num` and `rand_seed`, they play the same levels and have the same states whatever the
+    number of shards. When `rand_seed` is None, a seed is made once with
+    `create_random_seed()` for all the shards.
+
+    :param num: number of environments
+    :param env_name: name of the game, or comma separated names of games, like ProcgenGym3Env
+    :param num_shards: number of worker processes, with the boundaries between their
+        environments multiples of the number of games in `env_name`
+    :param rand_seed: seed of the levels of all the environments
+    :param cpu_affinity: pin the shards to cpus, None to leave them unpinned, "cores" to split
+        the cpus this process may run on into a contiguous block per shard, "numa" to assign the
+        shards to NUMA nodes in turn, each shard running on all the cpus of its node, or a list
+        with a list of cpus for each shard. The pages of shared memory each shard writes are
+        first touched by that shard, so they are allocated on its node. Linux only.
+    :param start_method: multiprocessing start method of the worker processes, the stepping
+        threads of environments in this process don't survive "fork"
+    :param kwargs: arguments of ProcgenGym3Env for every shard, except `pipelined`. Note that
+        `num_threads` is per shard.
+    """
+
+    def __init__(
+        self,
+        num,
+        env_name,
+        num_shards,
+        rand_seed=None,
+        cpu_affinity=None,
+        start_method="spawn",
+        **kwargs,
+    ):
+        assert not kwargs.get("pipelined"), "shards can't be pipelined"
+        assert "env_offset" not in kwargs, "the shards set env_offset"
+        if rand_seed is None:
+            rand_seed = create_random_seed()
+
+        self._shm = None
+        self._arrays = None
+        self._conns = []
+        self._processes = []
+        self._stepping = False
+        self.closed = False
+
+        self._shard_ranges = split_envs(num, num_shards, len(env_name.split(",")))
+        shard_cpus = get_shard_cpus(num_shards, cpu_affinity)
+        env_kwargs = dict(env_name=env_name, rand_seed=rand_seed, **kwargs)
+        ctx = multiprocessing.get_context(start_method)
+        for (start, end), cpus in zip(self._shard_ranges, shard_cpus):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=shard_worker,
+                args=(child_conn, start, end, env_kwargs, cpus),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+        try:
+            ob_space, ac_space, ob_specs, info_specs = self._recv_all()[0]
+            specs = [
+                ("rew", (), "float32"),
+                ("first", (), "bool"),
+                ("action", (), "int32"),
+            ]
+            specs += [(("ob", name), shape, dtype) for name, shape, dtype in ob_specs]
+            specs += [(("info", name), shape, dtype) for name, shape, dtype in info_specs]
+            offsets, size = make_layout(num, specs)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._arrays = map_arrays(self._shm.buf, num, specs, offsets)
+            self._ob_names = [name for name, _, _ in ob_specs]
+            self._info_names = [name for name, _, _ in info_specs]
+            for conn in self._conns:
+                conn.send((self._shm.name, num, specs, offsets))
+            self._recv_all()
+        except BaseException:
+            self.close()
+            raise
+
+        super().__init__(ob_space=ob_space, ac_space=ac_space, num=num)
+
+    def _recv_all(self):
+        results = []
+        for shard_idx, conn in enumerate(self._conns):
+            try:
+                ok, result = conn.recv()
+            except EOFError:
+                raise Exception(f"shard {shard_idx} exited") from None
+            if not ok:
+                raise Exception(f"shard {shard_idx} failed:\n{result}")
+            results.append(result)
+        return results
+
+    def _call_all(self, cmd, args=None):
+        self._wait()
+        if args is None:
+            args = [None] * len(self._conns)
+        for conn, arg in zip(self._conns, args):
+            conn.send((cmd, arg))
+        return self._recv_all()
+
+    def _wait(self):
+        if self._stepping:
+            self._stepping = False
+            self._recv_all()
+
+    def act(self, ac):
+        self._wait()
+        actions = self._arrays["action"]
+        assert ac.shape == actions.shape, f"expected actions of shape {actions.shape}"
+        actions[:] = ac
+        for conn in self._conns:
+            conn.send(("act", None))
+        self._stepping = True
+
+    def observe(self):
+        self._wait()
+        ob = {name: self._arrays[("ob", name)].copy() for name in self._ob_names}
+        return self._arrays["rew"].copy(), ob, self._arrays["first"].copy()
+
+    def get_info(self):
+        self._wait()
+        infos = [{} for _ in range(self.num)]
+        for name in self._info_names:
+            values = self._arrays[("info", name)].copy()
+            for env_idx in range(self.num):
+                infos[env_idx][name] = values[env_idx]
+        return infos
+
+    def get_state(self):
+        states = []
+        for shard_states in self._call_all("get_state"):
+            states.extend(shard_states)
+        return states
+
+    def set_state(self, states):
+        assert len(states) == self.num
+        self._call_all("set_state", [states[start:end] for start, end in self._shard_ranges])
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for conn, process in zip(self._conns, self._processes):
+            try:
+                if self._stepping:
+                    conn.recv()
+                conn.send(("close", None))
+                conn.recv()
+            except (EOFError, OSError):
+                pass
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._arrays = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __del__(self):
+        self.close()
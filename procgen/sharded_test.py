@@ -0,0 +1,93 @@
+import os
+
+import numpy as np
+import pytest
+
+from .env import ProcgenGym3Env
+from .sharded import ShardedProcgenGym3Env, get_shard_cpus, parse_cpu_list, split_envs
+
+
+def test_split_envs():
+    assert split_envs(6, 3) == [(0, 2), (2, 4), (4, 6)]
+    assert split_envs(7, 3) == [(0, 2), (2, 4), (4, 7)]
+    assert split_envs(8, 3, num_joint_games=2) == [(0, 2), (2, 4), (4, 8)]
+    with pytest.raises(AssertionError):
+        split_envs(2, 3)
+
+
+def test_get_shard_cpus():
+    assert parse_cpu_list("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert get_shard_cpus(2, None) == [None, None]
+    assert get_shard_cpus(2, [{3, 1}, [2]]) == [[1, 3], [2]]
+    cpus = get_shard_cpus(3, "cores")
+    assert len(cpus) == 3
+    for shard_cpus in cpus:
+        assert 0 < len(shard_cpus) and set(shard_cpus) <= os.sched_getaffinity(0)
+    assert len(get_shard_cpus(3, "numa")) == 3
+
+
+@pytest.mark.parametrize("env_name,num_shards", [("coinrun", 3), ("coinrun,miner", 3)])
+def test_sharded_matches_single(env_name, num_shards):
+    num_envs = 8
+    kwargs = dict(num=num_envs, env_name=env_name, rand_seed=5, render_mode="rgb_array")
+    env = ProcgenGym3Env(**kwargs)
+    sharded_env = ShardedProcgenGym3Env(
+        num_shards=num_shards, cpu_affinity="cores", num_threads=0, **kwargs
+    )
+    assert sharded_env.ob_space == env.ob_space
+    assert sharded_env.ac_space == env.ac_space
+
+    def check_same():
+        rew, ob, first = env.observe()
+        sharded_rew, sharded_ob, sharded_first = sharded_env.observe()
+        assert np.array_equal(rew, sharded_rew)
+        assert np.array_equal(ob["rgb"], sharded_ob["rgb"])
+        assert np.array_equal(first, sharded_first)
+        for info, sharded_info in zip(env.get_info(), sharded_env.get_info()):
+            assert sorted(info) == sorted(sharded_info)
+            for key in info:
+                assert np.array_equal(info[key], sharded_info[key])
+
+    rng = np.random.RandomState(0)
+    check_same()
+    for _ in range(50):
+        actions = rng.randint(low=0, high=env.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+        env.act(actions)
+        sharded_env.act(actions)
+        check_same()
+
+    states = env.get_state()
+    assert sharded_env.get_state() == states
+    for _ in range(10):
+        sharded_env.act(np.zeros(num_envs, dtype=np.int32))
+    sharded_env.set_state(states)
+    check_same()
+    sharded_env.close()
+
+
+def test_sharded_env_offset():
+    # the shards rely on env_offset seeding the environments like a larger environment object
+    env = ProcgenGym3Env(num=6, env_name="coinrun", rand_seed=1)
+    offset_env = ProcgenGym3Env(num=2, env_name="coinrun", rand_seed=1, env_offset=4)
+    assert offset_env.get_state() == env.get_state()[4:]
+
+
+@pytest.mark.parametrize("num_shards", [1, 2])
+def test_sharded_speed(num_shards, benchmark):
+    num_envs = 16
+    num_steps = 50
+    env = ShardedProcgenGym3Env(
+        num=num_envs, env_name="coinrun", num_shards=num_shards, rand_seed=0, cpu_affinity="cores"
+    )
+    actions = np.zeros(num_envs, dtype=np.int32)
+
+    def rollout():
+        for _ in range(num_steps):
+            env.act(actions)
+            env.observe()
+
+    benchmark(rollout)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
+    env.close()
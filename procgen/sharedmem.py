@@ -0,0 +1,32 @@
+"""
+Laying out numpy arrays in a single block of memory, such as shared memory
+"""
+
+import numpy as np
+
+# the arrays start on cache line boundaries
+ALIGNMENT = 64
+
+
+def make_layout(num, specs):
+    """
+    Lay out an array of num elements for each (key, shape, dtype) of specs in a single block of
+    memory, returns the offset of each key and the total size
+    """
+    offsets = {}
+    size = 0
+    for key, shape, dtype in specs:
+        size = (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+        offsets[key] = size
+        size += num * int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return offsets, max(size, 1)
+
+
+def map_arrays(buf, num, specs, offsets):
+    """
+    The arrays of a layout made by make_layout() in buf, indexed by the keys of specs
+    """
+    return {
+        key: np.ndarray(shape=(num,) + tuple(shape), dtype=dtype, buffer=buf, offset=offsets[key])
+        for key, shape, dtype in specs
+    }
@@ -2,6 +2,8 @@
 #include "resources.h"
 #include "assetgen.h"
 #include "qt-utils.h"
+#include <algorithm>
+#include <cmath>
 
 const float MAXVTHETA = 15 * PI / 180;
 const float MIXRATEROT = 0.5f;
@@ -19,6 +21,16 @@ const int USE_ASSET_THRESHOLD = 100;
 const int MAX_ASSETS = USE_ASSET_THRESHOLD;
 const int MAX_IMAGE_THEMES = 10;
 
+// assets drawn larger than this many pixels are sampled while drawing instead of being cached,
+// and the cache of scaled assets is cleared when it grows past either of the totals
+const int MAX_SCALED_ASSET_PIXELS = 64 * 64;
+const int MAX_SCALED_ASSETS_PIXELS = 64 * 64 * 16;
+const size_t MAX_SCALED_ASSETS = 4096;
+
+// game_step() finds colliding entities with the entity grid once there are this many pairs of a
+// colliding entity and another entity, below that testing every pair is faster
+const int MIN_ENTITY_GRID_PAIRS = 2048;
+
 BasicAbstractGame::BasicAbstractGame(std::string name)
     : Game(name) {
     char_dim = 5;
@@ -85,9 +97,6 @@ void BasicAbstractGame::initialize_asset_if_necessary(int img_idx) {
 
     theme = mask_theme_if_necessary(theme, type);
 
-    std::shared_ptr<QImage> asset_ptr = nullptr;
-    float aspect_ratio;
-    int num_themes;
     std::vector<std::string> names;
 
     if (!options.use_generated_assets) {
@@ -98,28 +107,44 @@ void BasicAbstractGame::initialize_asset_if_necessary(int img_idx) {
         }
     }
 
-    if (names.size() == 0) {
-        AssetGen pgen(&asset_rand_gen);
-        asset_rand_gen.seed(fixed_asset_seed + type);
+    bool is_generated = names.size() == 0;
 
-        std::shared_ptr<QImage> small_image(new QImage(64, 64, QImage::Format_ARGB32));
-        asset_ptr = small_image;
-        pgen.generate_resource(asset_ptr, 0, 5, use_block_asset(type));
+    // the key includes everything the asset depends on, so all games of the same kind with the
+    // same options share their assets, the seed only matters for generated assets
+    std::string key = game_name + " " + std::to_string(type + theme * MAX_ASSETS) + " " + std::to_string(is_generated ? fixed_asset_seed : 0);
 
-        num_themes = 1;
-        aspect_ratio = 1.0;
-    } else {
-        asset_ptr = get_asset_ptr(names[theme]);
-        num_themes = (int)(names.size());
-        aspect_ratio = asset_ptr->width() * 1.0 / asset_ptr->height();
-    }
+    auto shared = get_shared_asset(key, [&]() {
+        auto asset = std::make_shared<SharedAsset>();
+        asset->is_generated = is_generated;
 
-    basic_assets[img_idx] = asset_ptr;
-    asset_aspect_ratios[img_idx] = aspect_ratio;
-    asset_num_themes[type] = num_themes;
+        if (is_generated) {
+            AssetGen pgen(&asset->rand_gen);
+            asset->rand_gen.seed(fixed_asset_seed + type);
 
-    std::shared_ptr<QImage> reflection_ptr(new QImage(asset_ptr->mirrored(true, false)));
-    basic_reflections[img_idx] = reflection_ptr;
+            asset->image = std::make_shared<QImage>(64, 64, QImage::Format_ARGB32);
+            pgen.generate_resource(asset->image, 0, 5, use_block_asset(type));
+
+            asset->num_themes = 1;
+            asset->aspect_ratio = 1.0;
+        } else {
+            asset->image = get_asset_ptr(names[theme]);
+            asset->num_themes = (int)(names.size());
+            asset->aspect_ratio = asset->image->width() * 1.0 / asset->image->height();
+        }
+
+        asset->reflection = std::make_shared<QImage>(asset->image->mirrored(true, false));
+        return asset;
+    });
+
+    if (is_generated) {
+        // asset_rand_gen is part of the game state, leave it as if this game generated the asset
+        asset_rand_gen = shared->rand_gen;
+    }
+
+    basic_assets[img_idx] = shared->image;
+    basic_reflections[img_idx] = shared->reflection;
+    asset_aspect_ratios[img_idx] = shared->aspect_ratio;
+    asset_num_themes[type] = shared->num_themes;
 }
 
 void BasicAbstractGame::fill_elem(int x, int y, int dx, int dy, char elem) {
@@ -218,6 +243,26 @@ Grid<int> BasicAbstractGame::get_grid() {
     return Grid<int>(grid);
 }
 
+#if !defined(__CHEERP__)
+// update the distance fields and write them to the infos in the same layout as the "grid" info,
+// cells without a path and the padding after the grid are DistanceField::UNREACHABLE
+void BasicAbstractGame::write_distance_infos(const std::vector<bool> &passable, const std::vector<int> &exit_cells, const std::vector<int> &key_cells) {
+    exit_dist_field.update(grid.w, grid.h, passable, exit_cells);
+    key_dist_field.update(grid.w, grid.h, passable, key_cells);
+
+    int num_cells = grid.w * grid.h;
+    fassert(num_cells <= MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM);
+
+    int32_t *exit_dist_buf = (int32_t *)(info_bufs[info_name_to_offset.at("exit_dist")]);
+    std::copy(exit_dist_field.dist.begin(), exit_dist_field.dist.end(), exit_dist_buf);
+    std::fill(exit_dist_buf + num_cells, exit_dist_buf + MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM, DistanceField::UNREACHABLE);
+
+    int32_t *key_dist_buf = (int32_t *)(info_bufs[info_name_to_offset.at("key_dist")]);
+    std::copy(key_dist_field.dist.begin(), key_dist_field.dist.end(), key_dist_buf);
+    std::fill(key_dist_buf + num_cells, key_dist_buf + MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM, DistanceField::UNREACHABLE);
+}
+#endif
+
 void BasicAbstractGame::set_grid(Grid<int> &new_grid) {
     this->grid = new_grid;
 }
@@ -233,7 +278,7 @@ void BasicAbstractGame::set_obj(int x, int y, int elem) {
 std::shared_ptr<Entity> BasicAbstractGame::spawn_child(const std::shared_ptr<Entity> &src, int type, float obj_r, bool match_vel) {
     float vx = match_vel ? src->vx : 0;
     float vy = match_vel ? src->vy : 0;
-    auto child = std::make_shared<Entity>(src->x, src->y, vx, vy, obj_r, type);
+    auto child = entity_pool.make(src->x, src->y, vx, vy, obj_r, type);
     entities.push_back(child);
     return child;
 }
@@ -343,7 +388,7 @@ bool BasicAbstractGame::sub_step(const std::shared_ptr<Entity> &obj, float _vx,
     bool block2 = false;
 
     for (int i = (int)(entities.size()) - 1; i >= 0; i--) {
-        auto m = entities[i];
+        const auto &m = entities[i];
 
         if (m == obj || m->will_erase) {
             continue;
@@ -518,7 +563,7 @@ float BasicAbstractGame::get_agent_acceleration_scale() {
 */
 
 std::shared_ptr<Entity> BasicAbstractGame::spawn_entity_rxy(float rx, float ry, int type, float x, float y, float w, float h, bool check_collisions) {
-    std::shared_ptr<Entity> ent(new Entity(0, 0, 0, 0, rx, ry, type));
+    auto ent = entity_pool.make(0, 0, 0, 0, rx, ry, type);
 
     reposition(ent, x, y, w, h, check_collisions);
 
@@ -528,7 +573,7 @@ std::shared_ptr<Entity> BasicAbstractGame::spawn_entity_rxy(float rx, float ry,
 }
 
 bool BasicAbstractGame::agent_has_collision() {
-    for (auto ent : entities) {
+    for (const auto &ent : entities) {
         if (has_agent_collision(ent)) {
             return true;
         }
@@ -573,13 +618,13 @@ std::shared_ptr<Entity> BasicAbstractGame::spawn_entity(float r, int type, float
 }
 
 std::shared_ptr<Entity> BasicAbstractGame::add_entity(float x, float y, float vx, float vy, float r, int type) {
-    std::shared_ptr<Entity> ent(new Entity(x, y, vx, vy, r, r, type));
+    auto ent = entity_pool.make(x, y, vx, vy, r, r, type);
     entities.push_back(ent);
     return ent;
 }
 
 std::shared_ptr<Entity> BasicAbstractGame::add_entity_rxy(float x, float y, float vx, float vy, float rx, float ry, int type) {
-    std::shared_ptr<Entity> ent(new Entity(x, y, vx, vy, rx, ry, type));
+    auto ent = entity_pool.make(x, y, vx, vy, rx, ry, type);
     entities.push_back(ent);
     return ent;
 }
@@ -725,20 +770,47 @@ void BasicAbstractGame::game_step() {
 
     step_entities(entities);
 
-    for (int i = (int)(entities.size()) - 1; i >= 0; i--) {
+    // with many entities that collide with others, only test the pairs that share a cell of the
+    // entity grid, in the same order as testing every pair, which needs handle_collision() and
+    // handle_agent_collision() to leave the boxes of existing entities alone
+    int num_entities = (int)(entities.size());
+    bool use_entity_grid = force_entity_grid;
+    if (!use_entity_grid && num_entities * num_entities >= MIN_ENTITY_GRID_PAIRS) {
+        int num_colliding = 0;
+        for (const auto &ent : entities) {
+            num_colliding += ent->collides_with_entities ? 1 : 0;
+        }
+        use_entity_grid = num_colliding * num_entities >= MIN_ENTITY_GRID_PAIRS;
+    }
+    if (use_entity_grid) {
+        entity_grid.build(main_width, main_height, entities, num_entities);
+    }
+
+    for (int i = num_entities - 1; i >= 0; i--) {
         auto ent = entities[i];
 
         if (has_agent_collision(ent)) {
             handle_agent_collision(ent);
         }
 
-        if (ent->collides_with_entities) {
+        if (ent->collides_with_entities && use_entity_grid) {
+            entity_grid.query(*ent, ent->collision_margin, (int)(entities.size()), collision_candidates);
+            for (int j : collision_candidates) {
+                if (i == j)
+                    continue;
+                if (has_collision(ent, entities[j], ent->collision_margin) && !ent->will_erase && !entities[j]->will_erase) {
+                    // copied since handle_collision() may add entities, which moves the list
+                    auto ent2 = entities[j];
+                    handle_collision(ent, ent2);
+                }
+            }
+        } else if (ent->collides_with_entities) {
             for (int j = (int)(entities.size()) - 1; j >= 0; j--) {
                 if (i == j)
                     continue;
-                auto ent2 = entities[j];
-
-                if (has_collision(ent, ent2, ent->collision_margin) && !ent->will_erase && !ent2->will_erase) {
+                if (has_collision(ent, entities[j], ent->collision_margin) && !ent->will_erase && !entities[j]->will_erase) {
+                    // copied since handle_collision() may add entities, which moves the list
+                    auto ent2 = entities[j];
                     handle_collision(ent, ent2);
                 }
             }
@@ -755,13 +827,11 @@ void BasicAbstractGame::game_step() {
 }
 
 void BasicAbstractGame::erase_if_needed() {
-    for (int i = (int)(entities.size()) - 1; i >= 0; i--) {
-        auto e = entities[i];
-
-        if (e->will_erase || (e->auto_erase && is_out_of_bounds(e))) {
-            entities.erase(entities.begin() + i);
-        }
-    }
+    // moves the entities that are kept to the front in a single pass, keeping their order
+    auto is_erased = [this](const std::shared_ptr<Entity> &e) {
+        return e->will_erase || (e->auto_erase && is_out_of_bounds(e));
+    };
+    entities.erase(std::remove_if(entities.begin(), entities.end(), is_erased), entities.end());
 }
 
 void BasicAbstractGame::game_reset() {
@@ -794,7 +864,7 @@ void BasicAbstractGame::game_reset() {
         ay = a_r;
     }
 
-    auto _agent = std::make_shared<Entity>(ax, ay, 0, 0, a_r, PLAYER);
+    auto _agent = entity_pool.make(ax, ay, 0, 0, a_r, PLAYER);
     agent = _agent;
     agent->smart_step = true;
     agent->render_z = 1;
@@ -883,6 +953,87 @@ QImage *BasicAbstractGame::lookup_asset(int img_idx, bool is_reflected) {
     return assets->at(img_idx).get();
 }
 
+#if !defined(__CHEERP__)
+QImage *BasicAbstractGame::lookup_scaled_asset(const ScaledAssetKey &key, const QRectF &rect, int x, int y) {
+    // the sizes cached for one unit are rarely drawn again after it changes, which happens when
+    // a level with different dimensions starts
+    if (unit != scaled_assets_unit) {
+        scaled_assets.clear();
+        scaled_assets_pixels = 0;
+        scaled_assets_unit = unit;
+    }
+
+    auto it = scaled_assets.find(key);
+    if (it != scaled_assets.end() && it->second != nullptr) {
+        return it->second.get();
+    }
+
+    if (scaled_assets.size() >= MAX_SCALED_ASSETS || scaled_assets_pixels + key.w * key.h > MAX_SCALED_ASSETS_PIXELS) {
+        scaled_assets.clear();
+        scaled_assets_pixels = 0;
+        it = scaled_assets.end();
+    }
+
+    // when the view scrolls by a fraction of a pixel every step, most rects are drawn only once,
+    // so an asset is only scaled the second time it is drawn at the same position
+    if (it == scaled_assets.end()) {
+        scaled_assets[key] = nullptr;
+        return nullptr;
+    }
+
+    // the asset is drawn exactly as draw_scaled_asset() would draw it without the cache, but
+    // translated so that the first pixel it covers is at the origin
+    auto scaled = std::make_shared<QImage>(key.w, key.h, QImage::Format_ARGB32_Premultiplied);
+    QPainter p(scaled.get());
+    p.setCompositionMode(QPainter::CompositionMode_Source);
+    p.translate(-x, -y);
+    p.drawImage(rect, *lookup_asset(key.img_idx, key.is_reflected));
+
+    it->second = scaled;
+    scaled_assets_pixels += key.w * key.h;
+    return scaled.get();
+}
+#endif
+
+void BasicAbstractGame::draw_scaled_asset(QPainter &p, const QRectF &rect, int img_idx, bool is_reflected) {
+    // trace builds draw every asset itself, so that the trace shows how it is scaled rather than a
+    // copy from the cache, test_scaled_asset_cache checks that the copies give the same frames
+#if !defined(__CHEERP__) && !defined(PROCGEN_QPAINTER_TRACE)
+    if (!p.testRenderHint(QPainter::SmoothPixmapTransform)) {
+        // the pixels covered by QPainter::drawImage(), from the rounded left edge of rect to its
+        // rounded right edge, like Qt
+        int x0 = qRound(rect.left());
+        int y0 = qRound(rect.top());
+        int w = qRound(rect.right()) - x0;
+        int h = qRound(rect.bottom()) - y0;
+
+        if (w <= 0 || h <= 0) {
+            return;
+        }
+
+        // the sampling of an asset clipped on the left or top starts at the first visible pixel,
+        // which a copy scaled from its first covered pixel might not match exactly
+        if (x0 >= 0 && y0 >= 0 && (int64_t)(w) * h <= MAX_SCALED_ASSET_PIXELS) {
+            ScaledAssetKey key;
+            key.img_idx = img_idx;
+            key.is_reflected = is_reflected;
+            key.w = w;
+            key.h = h;
+            key.left = rect.left() - x0;
+            key.top = rect.top() - y0;
+            key.right = rect.right() - x0;
+            key.bottom = rect.bottom() - y0;
+            QImage *scaled = lookup_scaled_asset(key, rect, x0, y0);
+            if (scaled != nullptr) {
+                p.drawImage(QPoint(x0, y0), *scaled);
+                return;
+            }
+        }
+    }
+#endif
+    p.drawImage(rect, *lookup_asset(img_idx, is_reflected));
+}
+
 void BasicAbstractGame::draw_image(QPainter &p, QRectF &base_rect, float rotation, bool is_reflected, int base_type, int theme, float alpha, float tile_ratio) {
     int img_type = image_for_type(base_type);
 
@@ -905,7 +1056,9 @@ void BasicAbstractGame::draw_image(QPainter &p, QRectF &base_rect, float rotatio
             p.setOpacity(alpha);
         }
 
-        if (rotation == 0) {
+        if (rotation == 0 && tile_ratio == 0) {
+            draw_scaled_asset(p, adjusted_rect, img_idx, is_reflected);
+        } else if (rotation == 0) {
             tile_image(p, asset_ptr, adjusted_rect, tile_ratio);
         } else {
             p.save();
@@ -1120,9 +1273,10 @@ float BasicAbstractGame::rand_pos(float r, float max) {
     return rand_pos(r, 0, max);
 }
 
+// the games call this between moving entities, when the entity grid of game_step() is out of date
 bool BasicAbstractGame::has_any_collision(const std::shared_ptr<Entity> &e1, float margin) {
     for (int i = (int)(entities.size()) - 1; i >= 0; i--) {
-        auto ent = entities.at(i);
+        const auto &ent = entities[i];
 
         if (!ent->avoids_collisions && has_collision(e1, ent, margin)) {
             return true;
@@ -1169,7 +1323,7 @@ void BasicAbstractGame::write_entities(WriteBuffer *b, std::vector<std::shared_p
 void BasicAbstractGame::read_entities(ReadBuffer *b, std::vector<std::shared_ptr<Entity>> &ents) {
     ents.resize(b->read_int());
     for (size_t i = 0; i < ents.size(); i++) {
-        auto e = std::make_shared<Entity>();
+        auto e = entity_pool.make();
         e->deserialize(b);
         ents[i] = e;
     }
@@ -1231,9 +1385,10 @@ void BasicAbstractGame::deserialize(ReadBuffer *b) {
 
     read_entities(b, entities);
 
+    // games that remove the agent from the entity list (like miner when the agent is crushed)
+    // are responsible for restoring the agent in their own deserialize()
     int agent_idx = find_entity_index(PLAYER);
-    fassert(agent_idx >= 0);
-    agent = entities[agent_idx];
+    agent = agent_idx >= 0 ? entities[agent_idx] : nullptr;
 
     // we don't want to serialize a bunch of QImages
     // for now we only support games that don't require storing these assets
@@ -1278,3 +1433,79 @@ void BasicAbstractGame::deserialize(ReadBuffer *b) {
 
     grid.deserialize(b);
 }
+
+void BasicAbstractGame::serialize_carryover(WriteBuffer *b) {
+    Game::serialize_carryover(b);
+
+    // set by game_step()
+    b->write_int(last_move_action);
+    b->write_int(move_action);
+    b->write_int(special_action);
+    b->write_float(action_vx);
+    b->write_float(action_vy);
+    b->write_float(action_vrot);
+    b->write_int(step_rand_int);
+
+    // set when drawing
+    asset_rand_gen.serialize(b);
+    b->write_float(center_x);
+    b->write_float(center_y);
+    b->write_float(unit);
+    b->write_float(view_dim);
+    b->write_float(x_off);
+    b->write_float(y_off);
+    b->write_float(visibility);
+}
+
+void BasicAbstractGame::deserialize_carryover(ReadBuffer *b) {
+    Game::deserialize_carryover(b);
+
+    last_move_action = b->read_int();
+    move_action = b->read_int();
+    special_action = b->read_int();
+    action_vx = b->read_float();
+    action_vy = b->read_float();
+    action_vrot = b->read_float();
+    step_rand_int = b->read_int();
+
+    asset_rand_gen.deserialize(b);
+    center_x = b->read_float();
+    center_y = b->read_float();
+    unit = b->read_float();
+    view_dim = b->read_float();
+    x_off = b->read_float();
+    y_off = b->read_float();
+    visibility = b->read_float();
+}
+
+EntityCopier::EntityCopier(EntityPool &pool) : pool(pool) {
+}
+
+std::shared_ptr<Entity> EntityCopier::copy(const std::shared_ptr<Entity> &e) {
+    if (e == nullptr) {
+        return nullptr;
+    }
+    auto &copy = copies[e.get()];
+    if (copy == nullptr) {
+        copy = pool.make(*e);
+    }
+    return copy;
+}
+
+void BasicAbstractGame::detach_copy() {
+    Game::detach_copy();
+    EntityCopier copier(entity_pool);
+    copy_entities(copier);
+}
+
+void BasicAbstractGame::copy_entities(EntityCopier &copier) {
+    for (auto &e : entities) {
+        e = copier.copy(e);
+    }
+    // when miner's agent is crushed it is no longer in the list, but still used
+    agent = copier.copy(agent);
+}
+
+EntityPoolStats BasicAbstractGame::get_entity_pool_stats() const {
+    return entity_pool.get_stats();
+}
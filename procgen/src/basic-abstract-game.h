@@ -9,9 +9,58 @@ Base game class used by all currently existing games
 #include <string>
 #include <set>
 #include <queue>
+#include <unordered_map>
+#include <cstring>
 #include "game.h"
 #include "grid.h"
 #include "cpp-utils.h"
+#include "entitygrid.h"
+#include "entitypool.h"
+#if !defined(__CHEERP__)
+#include "distancefield.h"
+#endif
+
+// maps the entities of a game to their copies while detaching a copied game, so that an entity
+// that is referenced from several places is copied only once, the copies are made in pool
+class EntityCopier {
+  public:
+    explicit EntityCopier(EntityPool &pool);
+    std::shared_ptr<Entity> copy(const std::shared_ptr<Entity> &e);
+
+  private:
+    EntityPool &pool;
+    std::unordered_map<const Entity *, std::shared_ptr<Entity>> copies;
+};
+
+// an asset drawn into a w x h image, the edges of the rect it was drawn in are relative to the
+// first pixel it covers, so an asset that is drawn at the same fraction of a pixel in a different
+// place uses the same image
+struct ScaledAssetKey {
+    int img_idx = 0;
+    bool is_reflected = false;
+    int w = 0;
+    int h = 0;
+    qreal left = 0;
+    qreal top = 0;
+    qreal right = 0;
+    qreal bottom = 0;
+
+    bool operator==(const ScaledAssetKey &other) const {
+        return img_idx == other.img_idx && is_reflected == other.is_reflected && w == other.w && h == other.h && left == other.left && top == other.top && right == other.right && bottom == other.bottom;
+    }
+};
+
+struct ScaledAssetKeyHash {
+    size_t operator()(const ScaledAssetKey &k) const {
+        uint64_t h = (uint64_t)(k.img_idx) * 2 + k.is_reflected;
+        for (qreal v : {k.left, k.top, k.right, k.bottom}) {
+            uint64_t bits;
+            memcpy(&bits, &v, sizeof(bits));
+            h = (h ^ bits) * 0x9e3779b97f4a7c15ull;
+        }
+        return (size_t)(h ^ (h >> 32));
+    }
+};
 
 class BasicAbstractGame : public Game {
   public:
@@ -27,6 +76,9 @@ class BasicAbstractGame : public Game {
     void game_init() override;
     void serialize(WriteBuffer *b) override;
     void deserialize(ReadBuffer *b) override;
+    void serialize_carryover(WriteBuffer *b) override;
+    void deserialize_carryover(ReadBuffer *b) override;
+    void detach_copy() override;
 
     void write_entities(WriteBuffer *b, std::vector<std::shared_ptr<Entity>> &ents);
     void read_entities(ReadBuffer *b, std::vector<std::shared_ptr<Entity>> &ents);
@@ -113,7 +165,15 @@ class BasicAbstractGame : public Game {
     bool agent_has_collision();
     void reposition_agent();
 
+    // replace the entities of a copied game with copies, games that keep their own pointers to
+    // entities should override this and map those with the same copier
+    virtual void copy_entities(EntityCopier &copier);
+
+    EntityPoolStats get_entity_pool_stats() const;
+
   protected:
+    // every entity of the game should be created with entity_pool.make()
+    EntityPool entity_pool;
     std::shared_ptr<Entity> agent;
     std::vector<std::shared_ptr<Entity>> entities;
     std::vector<std::shared_ptr<QImage>> basic_assets;
@@ -160,10 +220,33 @@ class BasicAbstractGame : public Game {
     float visibility = 0.0f;
     float min_visibility = 0.0f;
 
+#if !defined(__CHEERP__)
+    // distances of every grid cell to the exit and to the nearest key, for games that can tell
+    // which cells the agent can walk through and where those are
+    DistanceField exit_dist_field;
+    DistanceField key_dist_field;
+
+    void write_distance_infos(const std::vector<bool> &passable, const std::vector<int> &exit_cells, const std::vector<int> &key_cells);
+#endif
+
   private:
     Grid<int> grid;
 
+    // assets resampled to the pixel size they are drawn at, so that drawing them in the
+    // observation is an integer aligned blit, a null image means the key was seen once
+    std::unordered_map<ScaledAssetKey, std::shared_ptr<QImage>, ScaledAssetKeyHash> scaled_assets;
+    int scaled_assets_pixels = 0;
+    float scaled_assets_unit = 0.0f;
+
+    // broadphase for the collisions between entities in game_step()
+    EntityGrid entity_grid;
+    std::vector<int> collision_candidates;
+
     QImage *lookup_asset(int img_idx, bool is_reflected = false);
+#if !defined(__CHEERP__)
+    QImage *lookup_scaled_asset(const ScaledAssetKey &key, const QRectF &rect, int x, int y);
+#endif
+    void draw_scaled_asset(QPainter &p, const QRectF &rect, int img_idx, bool is_reflected);
     void initialize_asset_if_necessary(int img_idx);
     void prepare_for_drawing(float rect_height);
     void draw_background(QPainter &p, const QRect &rect);
@@ -0,0 +1,260 @@
+#include "game-registry.h"
+#include "game.h"
+#include "resources.h"
+#include "vecoptions.h"
+#include <chrono>
+#include <cstring>
+#include <new>
+
+/*
+
+Micro-benchmark of the games without the python and libenv layers, timing reset, step and render
+separately for every game
+
+usage: bench-games <resource root> <atlas path or ""> [options] [game names...]
+
+    --steps N             steps per game (default 2000)
+    --resets N            resets per game (default 50)
+    --seed N              seed of the levels and actions (default 0)
+    --distribution-mode N distribution mode number, see DistributionMode in game.h (default 1)
+    --hires               also time rendering of the 512x512 antialiased image of render_mode="rgb_array"
+
+The games are created through globalGameRegistry and set up like VecGame does. Every game plays
+the same levels and actions for a given seed. Steps are simulation only: render_rgb is off while
+stepping, and the observation of every step is rendered afterwards and timed separately. Steps
+include the resets of episodes that end during the step, their number is printed as well.
+
+Allocations are the calls to operator new made during a phase, counted by the replacement operator
+new below.
+
+Build it with `cmake --build . --target bench-games` in a build directory of this project.
+
+*/
+
+// python creates every environment with this many actions, see get_combos() in env.py
+const int NUM_ACTIONS = 15;
+
+static int64_t num_allocs = 0;
+
+void *operator new(size_t size) {
+    num_allocs++;
+    void *p = malloc(size == 0 ? 1 : size);
+    if (p == nullptr) {
+        throw std::bad_alloc();
+    }
+    return p;
+}
+
+void *operator new[](size_t size) {
+    return operator new(size);
+}
+
+void operator delete(void *p) noexcept {
+    free(p);
+}
+
+void operator delete[](void *p) noexcept {
+    free(p);
+}
+
+void operator delete(void *p, size_t) noexcept {
+    free(p);
+}
+
+void operator delete[](void *p, size_t) noexcept {
+    free(p);
+}
+
+// we want system independent hashing. std::hash doesn't give this.
+inline uint32_t hash_str_uint32(const std::string &str) {
+    uint32_t hash = 0x811c9dc5;
+    uint32_t prime = 0x1000193;
+
+    for (size_t i = 0; i < str.size(); i++) {
+        uint8_t value = str[i];
+        hash = hash ^ value;
+        hash *= prime;
+    }
+
+    return hash;
+}
+
+// time and allocations of every call made in one phase
+struct PhaseStats {
+    int64_t count = 0;
+    int64_t ns = 0;
+    int64_t allocs = 0;
+
+    template <typename Func>
+    void measure(Func fn) {
+        int64_t allocs_before = num_allocs;
+        auto start = std::chrono::steady_clock::now();
+        fn();
+        auto end = std::chrono::steady_clock::now();
+        ns += std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+        allocs += num_allocs - allocs_before;
+        count++;
+    }
+
+    double ns_per_call() const {
+        return count > 0 ? (double)(ns) / count : 0;
+    }
+
+    double allocs_per_call() const {
+        return count > 0 ? (double)(allocs) / count : 0;
+    }
+};
+
+struct BenchOptions {
+    int num_steps = 2000;
+    int num_resets = 50;
+    int seed = 0;
+    int distribution_mode = HardMode;
+    bool hires = false;
+};
+
+// output buffers for a single game, large enough for every info that VecGame gives the games
+struct GameBuffers {
+    std::vector<uint8_t> ob;
+    std::vector<std::vector<int32_t>> infos;
+    float reward = 0;
+    uint8_t first = 0;
+
+    void attach(Game *game) {
+        const char *info_names[] = {"prev_level_seed", "prev_level_complete", "level_seed", "grid_size", "grid", "agent_pos", "exit_pos"};
+        ob.resize(RES_W * RES_H * 3);
+        game->obs_bufs = {ob.data()};
+        for (const char *name : info_names) {
+            game->info_name_to_offset[name] = (int)(infos.size());
+            infos.emplace_back(MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM);
+        }
+        for (auto &info : infos) {
+            game->info_bufs.push_back(info.data());
+        }
+        game->reward_ptr = &reward;
+        game->first_ptr = &first;
+    }
+};
+
+std::shared_ptr<Game> make_game(const std::string &name, const BenchOptions &bench_options, GameBuffers &buffers) {
+    struct libenv_option option;
+    strcpy(option.name, "distribution_mode");
+    option.dtype = LIBENV_DTYPE_INT32;
+    option.count = 1;
+    option.data = (void *)(&bench_options.distribution_mode);
+    struct libenv_options options;
+    options.items = &option;
+    options.count = 1;
+
+    auto game = std::shared_ptr<Game>(globalGameRegistry->at(name)());
+    fassert(game->game_name == name);
+    game->level_seed_rand_gen.seed(bench_options.seed);
+    game->level_seed_low = 0;
+    game->level_seed_high = INT32_MAX;
+    game->game_n = 0;
+    game->is_waiting_for_step = false;
+    game->parse_options(name, VecOptions(options));
+    game->fixed_asset_seed = int(hash_str_uint32(name));
+    game->game_init();
+    buffers.attach(game.get());
+    return game;
+}
+
+void bench_game(const std::string &name, const BenchOptions &bench_options) {
+    PhaseStats reset_stats;
+    PhaseStats step_stats;
+    PhaseStats render_stats;
+    PhaseStats hires_stats;
+    int num_episode_resets = 0;
+
+    {
+        GameBuffers buffers;
+        auto game = make_game(name, bench_options, buffers);
+        for (int i = 0; i < bench_options.num_resets; i++) {
+            reset_stats.measure([&game] { game->reset(); });
+        }
+    }
+
+    GameBuffers buffers;
+    auto game = make_game(name, bench_options, buffers);
+    game->reset();
+    game->observe();
+    game->initial_reset_complete = true;
+
+    RandGen action_rand_gen;
+    action_rand_gen.seed(bench_options.seed);
+    std::vector<uint32_t> hires_buf(RENDER_RES * RENDER_RES);
+    for (int i = 0; i < bench_options.num_steps; i++) {
+        game->action = action_rand_gen.randn(NUM_ACTIONS);
+        game->render_rgb = false;
+        step_stats.measure([&game] { game->step(); });
+        num_episode_resets += game->episode_done ? 1 : 0;
+        game->render_rgb = true;
+        render_stats.measure([&game] { game->observe(); });
+        if (bench_options.hires) {
+            hires_stats.measure([&game, &hires_buf] { game->render_to_buf(hires_buf.data(), RENDER_RES, RENDER_RES, true); });
+        }
+    }
+
+    printf("%-12s %12.0f %8.1f %12.0f %8.2f %8d %12.0f %8.2f", name.c_str(), reset_stats.ns_per_call(), reset_stats.allocs_per_call(), step_stats.ns_per_call(), step_stats.allocs_per_call(), num_episode_resets, render_stats.ns_per_call(), render_stats.allocs_per_call());
+    if (bench_options.hires) {
+        printf(" %12.0f %8.2f", hires_stats.ns_per_call(), hires_stats.allocs_per_call());
+    }
+    printf("\n");
+    fflush(stdout);
+}
+
+int main(int argc, char **argv) {
+    if (argc < 3) {
+        fprintf(stderr, "usage: %s <resource root> <atlas path or \"\"> [--steps N] [--resets N] [--seed N] [--distribution-mode N] [--hires] [game names...]\n", argv[0]);
+        return 1;
+    }
+
+    BenchOptions bench_options;
+    std::vector<std::string> names;
+    for (int i = 3; i < argc; i++) {
+        std::string arg = argv[i];
+        if (arg == "--hires") {
+            bench_options.hires = true;
+        } else if (arg.rfind("--", 0) == 0) {
+            fassert(i + 1 < argc);
+            int value = atoi(argv[++i]);
+            if (arg == "--steps") {
+                bench_options.num_steps = value;
+            } else if (arg == "--resets") {
+                bench_options.num_resets = value;
+            } else if (arg == "--seed") {
+                bench_options.seed = value;
+            } else if (arg == "--distribution-mode") {
+                bench_options.distribution_mode = value;
+            } else {
+                fprintf(stderr, "unknown option %s\n", arg.c_str());
+                return 1;
+            }
+        } else {
+            names.push_back(arg);
+        }
+    }
+    if (names.empty()) {
+        for (const auto &pair : *globalGameRegistry) {
+            // coinrun_old has its own global state and is not part of ENV_NAMES
+            if (pair.first != "coinrun_old") {
+                names.push_back(pair.first);
+            }
+        }
+    }
+
+    global_resource_root = argv[1];
+    images_load(std::string(argv[2]));
+
+    printf("%-12s %12s %8s %12s %8s %8s %12s %8s", "game", "reset ns", "allocs", "step ns", "allocs", "resets", "render ns", "allocs");
+    if (bench_options.hires) {
+        printf(" %12s %8s", "hires ns", "allocs");
+    }
+    printf("\n");
+
+    for (const auto &name : names) {
+        bench_game(name, bench_options);
+    }
+    return 0;
+}
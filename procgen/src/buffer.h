@@ -1,74 +1,165 @@
 #pragma once
 
 #include "cpp-utils.h"
+#include "lz.h"
 #include <vector>
 #include <string>
+#include <cstring>
+
+/*
+
+Buffers used to serialize game states
+
+Version 0 states store every int and bool as 4 bytes. Later versions store ints as zigzag
+varints, bools as single bytes, vectors of bools as bits, and use write_compressed_vector_int()
+for large vectors like grids. The version is the first int of a state and is always stored as
+4 bytes, Game::deserialize() reads it and sets it on the ReadBuffer so that old states are read
+with the fixed size encoding.
+
+*/
+
+// this should be updated whenever the state format or environments may have changed
+const int SERIALIZE_VERSION = 1;
+
+// largest serialized state, should match MAX_STATE_SIZE in env.py
+const int MAX_STATE_SIZE = 1 << 20;
+
+// encoded vectors at least this large are compressed, if that makes them smaller
+const size_t COMPRESSION_THRESHOLD = 256;
 
 struct ReadBuffer {
     char *data = nullptr;
     size_t offset = 0;
     size_t length = 0;
+    int version = SERIALIZE_VERSION;
 
     ReadBuffer(char *data, size_t length) : data(data), length(length) {
     };
 
+    void read_bytes(void *dst, size_t size) {
+        fassert(offset + size <= length);
+        memcpy(dst, &data[offset], size);
+        offset += size;
+    };
+
     bool read_bool() {
-        return read_int() > 0;
+        if (version == 0) {
+            return read_int() > 0;
+        }
+        fassert(offset < length);
+        return data[offset++] != 0;
     };
 
     std::vector<bool> read_vector_bool() {
         std::vector<bool> v;
         v.resize(read_int());
+        if (version == 0) {
+            for (size_t i = 0; i < v.size(); i++) {
+                v[i] = read_bool();
+            }
+            return v;
+        }
+        fassert(offset + (v.size() + 7) / 8 <= length);
         for (size_t i = 0; i < v.size(); i++) {
-            v[i] = read_bool();
+            v[i] = (data[offset + i / 8] >> (i % 8)) & 1;
         }
+        offset += (v.size() + 7) / 8;
         return v;
     };
 
-    int read_int() {
-        //fassert(offset + sizeof(int) <= length);
-        //auto d = (int*)(&data[offset]);
-        //offset += sizeof(int);
-        //return *d;
+    int read_fixed_int() {
+#if defined(__CHEERP__)
+        // cheerp can't reinterpret the bytes of the buffer, states are not supported in the browser
         return 0;
+#else
+        int d;
+        read_bytes(&d, sizeof(int));
+        return d;
+#endif
+    };
+
+    int read_int() {
+        if (version == 0) {
+            return read_fixed_int();
+        }
+        uint32_t v = 0;
+        for (int shift = 0;; shift += 7) {
+            fassert(offset < length && shift < 35);
+            uint8_t b = data[offset++];
+            v |= (uint32_t)(b & 0x7f) << shift;
+            if ((b & 0x80) == 0) {
+                break;
+            }
+        }
+        // undo the zigzag encoding
+        return (int)((v >> 1) ^ (~(v & 1) + 1));
     };
 
     std::vector<int> read_vector_int() {
         std::vector<int> v;
         v.resize(read_int());
+#if !defined(__CHEERP__)
+        if (version == 0) {
+            read_bytes(v.data(), v.size() * sizeof(int));
+            return v;
+        }
+#endif
         for (size_t i = 0; i < v.size(); i++) {
             v[i] = read_int();
         }
         return v;
     };
 
+    std::vector<int> read_compressed_vector_int() {
+        std::vector<int> v;
+        v.resize(read_int());
+        size_t encoded_size = read_int();
+        size_t compressed_size = read_int();
+
+        std::vector<char> encoded(encoded_size);
+        if (compressed_size == 0) {
+            read_bytes(encoded.data(), encoded_size);
+        } else {
+            fassert(offset + compressed_size <= length);
+            fassert(lz_decompress((const uint8_t *)(&data[offset]), compressed_size, (uint8_t *)(encoded.data()), encoded_size));
+            offset += compressed_size;
+        }
+
+        auto b = ReadBuffer(encoded.data(), encoded.size());
+        for (size_t i = 0; i < v.size(); i++) {
+            v[i] = b.read_int();
+        }
+        fassert(b.offset == b.length);
+        return v;
+    };
+
     float read_float() {
-        //fassert(offset + sizeof(float) <= length);
-        //auto d = (float*)(&data[offset]);
-        //offset += sizeof(float);
-        //return *d;
+#if defined(__CHEERP__)
         return 0;
+#else
+        float d;
+        read_bytes(&d, sizeof(float));
+        return d;
+#endif
     };
 
     std::vector<float> read_vector_float() {
         std::vector<float> v;
         v.resize(read_int());
+#if defined(__CHEERP__)
         for (size_t i = 0; i < v.size(); i++) {
             v[i] = read_float();
         }
+#else
+        read_bytes(v.data(), v.size() * sizeof(float));
+#endif
         return v;
     };
 
     std::string read_string() {
         int size = read_int();
         std::string s(size, '\x00');
-        fassert(offset + size <= length);
-        auto c = data + offset;
-        for (size_t i = 0; i < s.size(); i++) {
-            s[i] = *c;
-            c++;
-        }
-        offset += s.size();
+        read_bytes(&s[0], size);
         return s;
     };
 };
@@ -77,28 +168,53 @@ struct WriteBuffer {
     char *data = nullptr;
     size_t offset = 0;
     size_t length = 0;
+    // set to false to skip compression in write_compressed_vector_int(), trading size for speed
+    bool compress = true;
 
     WriteBuffer(char *data, size_t length) :  data(data), length(length) {
     };
 
+    void write_bytes(const void *src, size_t size) {
+        fassert(offset + size <= length);
+        memcpy(&data[offset], src, size);
+        offset += size;
+    };
+
     void write_bool(bool b) {
-        write_int(b ? 1 : 0);
+        fassert(offset < length);
+        data[offset++] = b ? 1 : 0;
     };
 
     void write_vector_bool(const std::vector<bool>& v) {
         write_int(v.size());
-        for (auto i : v) {
-            write_bool(i);
+        size_t num_bytes = (v.size() + 7) / 8;
+        fassert(offset + num_bytes <= length);
+        memset(&data[offset], 0, num_bytes);
+        for (size_t i = 0; i < v.size(); i++) {
+            if (v[i]) {
+                data[offset + i / 8] |= 1 << (i % 8);
+            }
         }
+        offset += num_bytes;
     };
 
-    void write_int(int i) {
-        //fassert(offset + sizeof(int) <= length);
-        //auto d = (int*)(&data[offset]);
-        //*d = i;
-        //offset += sizeof(int);
+    void write_fixed_int(int i) {
+#if !defined(__CHEERP__)
+        write_bytes(&i, sizeof(int));
+#endif
     };
 
+    void write_int(int i) {
+        // zigzag encode so that small negative numbers are also small
+        uint32_t v = ((uint32_t)(i) << 1) ^ (uint32_t)(i >> 31);
+        while (v >= 0x80) {
+            fassert(offset < length);
+            data[offset++] = (char)((v & 0x7f) | 0x80);
+            v >>= 7;
+        }
+        fassert(offset < length);
+        data[offset++] = (char)(v);
+    };
 
     void write_vector_int(const std::vector<int>& v) {
         write_int(v.size());
@@ -107,28 +223,48 @@ struct WriteBuffer {
         }
     };
 
+    void write_compressed_vector_int(const std::vector<int>& v) {
+        std::vector<char> encoded(v.size() * 5);
+        auto b = WriteBuffer(encoded.data(), encoded.size());
+        for (auto i : v) {
+            b.write_int(i);
+        }
+
+        write_int(v.size());
+        write_int(b.offset);
+        if (compress && b.offset >= COMPRESSION_THRESHOLD) {
+            std::vector<uint8_t> compressed(lz_compress_bound(b.offset));
+            size_t compressed_size = lz_compress((const uint8_t *)(encoded.data()), b.offset, compressed.data());
+            if (compressed_size < b.offset) {
+                write_int(compressed_size);
+                write_bytes(compressed.data(), compressed_size);
+                return;
+            }
+        }
+        // a compressed size of 0 means the encoded ints are stored as is
+        write_int(0);
+        write_bytes(encoded.data(), b.offset);
+    };
+
     void write_float(float f) {
-        //fassert(offset + sizeof(float) <= length);
-        //auto d = (float*)(&data[offset]);
-        //*d = f;
-        //offset += sizeof(float);
+#if !defined(__CHEERP__)
+        write_bytes(&f, sizeof(float));
+#endif
     };
 
     void write_vector_float(const std::vector<float>& v) {
         write_int(v.size());
+#if defined(__CHEERP__)
         for (auto i : v) {
             write_float(i);
         }
+#else
+        write_bytes(v.data(), v.size() * sizeof(float));
+#endif
     };
 
     void write_string(std::string s) {
-        fassert(offset + s.size() <= length);
         write_int(s.size());
-        auto c = data + offset;
-        for (size_t i = 0; i < s.size(); i++) {
-            *c = s[i];
-            c++;
-        }
-        offset += s.size();
+        write_bytes(s.data(), s.size());
     };
 };
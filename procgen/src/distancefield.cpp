@@ -0,0 +1,183 @@
+#include "distancefield.h"
+#include "cpp-utils.h"
+#include <functional>
+#include <queue>
+#include <utility>
+
+// cells ordered by distance, nearest first
+typedef std::priority_queue<std::pair<int, int>, std::vector<std::pair<int, int>>, std::greater<std::pair<int, int>>> CellQueue;
+
+const int DistanceField::UNREACHABLE;
+
+void DistanceField::update(int _w, int _h, const std::vector<bool> &_passable, const std::vector<int> &_targets) {
+    fassert((int)(_passable.size()) == _w * _h);
+
+    if (_w != w || _h != h || _targets != targets) {
+        w = _w;
+        h = _h;
+        passable = _passable;
+        targets = _targets;
+        is_target.assign(w * h, false);
+        for (int idx : targets) {
+            fassert(0 <= idx && idx < w * h);
+            is_target[idx] = true;
+        }
+        compute_all();
+        return;
+    }
+
+    std::vector<int> opened;
+    std::vector<int> closed;
+
+    for (int idx = 0; idx < w * h; idx++) {
+        if (_passable[idx] != passable[idx]) {
+            (_passable[idx] ? opened : closed).push_back(idx);
+        }
+    }
+
+    if (opened.size() > 0 || closed.size() > 0) {
+        passable = _passable;
+        update_changed(opened, closed);
+    }
+}
+
+int DistanceField::get_neighbors(int idx, int *neighbors) {
+    int x = idx % w;
+    int y = idx / w;
+    int num_neighbors = 0;
+
+    if (x > 0)
+        neighbors[num_neighbors++] = idx - 1;
+    if (x < w - 1)
+        neighbors[num_neighbors++] = idx + 1;
+    if (y > 0)
+        neighbors[num_neighbors++] = idx - w;
+    if (y < h - 1)
+        neighbors[num_neighbors++] = idx + w;
+
+    return num_neighbors;
+}
+
+// the distance of a cell through its nearest neighbor, cells that are not passable are always
+// UNREACHABLE so they are never used
+int DistanceField::best_neighbor_dist(int idx) {
+    int neighbors[4];
+    int num_neighbors = get_neighbors(idx, neighbors);
+    int best = UNREACHABLE;
+
+    for (int i = 0; i < num_neighbors; i++) {
+        int d = dist[neighbors[i]];
+        if (d != UNREACHABLE && (best == UNREACHABLE || d + 1 < best)) {
+            best = d + 1;
+        }
+    }
+
+    return best;
+}
+
+void DistanceField::compute_all() {
+    dist.assign(w * h, UNREACHABLE);
+
+    std::vector<int> expanded;
+    for (int idx : targets) {
+        if (passable[idx] && dist[idx] == UNREACHABLE) {
+            dist[idx] = 0;
+            expanded.push_back(idx);
+        }
+    }
+
+    int neighbors[4];
+
+    for (size_t search_idx = 0; search_idx < expanded.size(); search_idx++) {
+        int curr_idx = expanded[search_idx];
+        int num_neighbors = get_neighbors(curr_idx, neighbors);
+
+        for (int i = 0; i < num_neighbors; i++) {
+            int next_idx = neighbors[i];
+            if (passable[next_idx] && dist[next_idx] == UNREACHABLE) {
+                dist[next_idx] = dist[curr_idx] + 1;
+                expanded.push_back(next_idx);
+            }
+        }
+    }
+}
+
+void DistanceField::update_changed(const std::vector<int> &opened, const std::vector<int> &closed) {
+    int neighbors[4];
+
+    // a closed cell takes away the distance of every cell whose shortest paths all went through
+    // it, cells are looked at nearest first so that their neighbors one step closer are final
+    CellQueue invalid_queue;
+    std::vector<int> invalidated;
+
+    for (int idx : closed) {
+        int d = dist[idx];
+        if (d == UNREACHABLE)
+            continue;
+
+        dist[idx] = UNREACHABLE;
+
+        int num_neighbors = get_neighbors(idx, neighbors);
+        for (int i = 0; i < num_neighbors; i++) {
+            if (dist[neighbors[i]] == d + 1) {
+                invalid_queue.push(std::make_pair(d + 1, neighbors[i]));
+            }
+        }
+    }
+
+    while (!invalid_queue.empty()) {
+        int d = invalid_queue.top().first;
+        int idx = invalid_queue.top().second;
+        invalid_queue.pop();
+
+        // skip cells that were already invalidated or still have a neighbor one step closer
+        if (dist[idx] != d || best_neighbor_dist(idx) == d)
+            continue;
+
+        dist[idx] = UNREACHABLE;
+        invalidated.push_back(idx);
+
+        int num_neighbors = get_neighbors(idx, neighbors);
+        for (int i = 0; i < num_neighbors; i++) {
+            if (dist[neighbors[i]] == d + 1) {
+                invalid_queue.push(std::make_pair(d + 1, neighbors[i]));
+            }
+        }
+    }
+
+    // then relax outwards from the invalidated and opened cells, which only lowers distances
+    CellQueue queue;
+
+    for (int idx : invalidated) {
+        int d = best_neighbor_dist(idx);
+        if (d != UNREACHABLE) {
+            queue.push(std::make_pair(d, idx));
+        }
+    }
+
+    for (int idx : opened) {
+        int d = is_target[idx] ? 0 : best_neighbor_dist(idx);
+        if (d != UNREACHABLE) {
+            queue.push(std::make_pair(d, idx));
+        }
+    }
+
+    while (!queue.empty()) {
+        int d = queue.top().first;
+        int idx = queue.top().second;
+        queue.pop();
+
+        if (dist[idx] != UNREACHABLE && dist[idx] <= d)
+            continue;
+
+        dist[idx] = d;
+
+        int num_neighbors = get_neighbors(idx, neighbors);
+        for (int i = 0; i < num_neighbors; i++) {
+            int next_idx = neighbors[i];
+            if (passable[next_idx] && (dist[next_idx] == UNREACHABLE || dist[next_idx] > d + 1)) {
+                queue.push(std::make_pair(d + 1, next_idx));
+            }
+        }
+    }
+}
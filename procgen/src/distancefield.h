@@ -0,0 +1,40 @@
+#pragma once
+
+/*
+
+Shortest path distances on a grid to the nearest of a set of target cells, in moves between 4
+connected passable cells
+
+The field is updated incrementally: when only the passability of some cells changed since the
+last update, just the distances those cells affected are searched again. Cells that were closed
+first lose the distances that depended on them, then the distances around those cells and the
+cells that were opened are relaxed outwards, nearest first.
+
+*/
+
+#include <vector>
+
+class DistanceField {
+  public:
+    // the value of cells with no path to a target, and of cells that are not passable
+    static const int UNREACHABLE = -1;
+
+    // distance from every cell to the nearest target
+    std::vector<int> dist;
+
+    // set the passability of the w by h cells and the targets, targets on cells that are not
+    // passable are ignored
+    void update(int w, int h, const std::vector<bool> &passable, const std::vector<int> &targets);
+
+  private:
+    int w = 0;
+    int h = 0;
+    std::vector<bool> passable;
+    std::vector<int> targets;
+    std::vector<bool> is_target;
+
+    int get_neighbors(int idx, int *neighbors);
+    int best_neighbor_dist(int idx);
+    void compute_all();
+    void update_changed(const std::vector<int> &opened, const std::vector<int> &closed);
+};
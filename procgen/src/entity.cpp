@@ -87,6 +87,17 @@ void Entity::face_direction(float dx, float dy, float rotation_offset) {
     }
 }
 
+// flags are stored as the bits of a single int, in this order
+enum EntityFlag {
+    WILL_ERASE = 1 << 0,
+    COLLIDES_WITH_ENTITIES = 1 << 1,
+    IS_REFLECTED = 1 << 2,
+    USE_ABS_COORDS = 1 << 3,
+    SMART_STEP = 1 << 4,
+    AVOIDS_COLLISIONS = 1 << 5,
+    AUTO_ERASE = 1 << 6,
+};
+
 void Entity::serialize(WriteBuffer *b) {
     b->write_float(x);
     b->write_float(y);
@@ -103,24 +114,26 @@ void Entity::serialize(WriteBuffer *b) {
 
     b->write_int(render_z);
 
-    b->write_int(will_erase);
-    b->write_int(collides_with_entities);
+    int flags = 0;
+    flags |= will_erase ? WILL_ERASE : 0;
+    flags |= collides_with_entities ? COLLIDES_WITH_ENTITIES : 0;
+    flags |= is_reflected ? IS_REFLECTED : 0;
+    flags |= use_abs_coords ? USE_ABS_COORDS : 0;
+    flags |= smart_step ? SMART_STEP : 0;
+    flags |= avoids_collisions ? AVOIDS_COLLISIONS : 0;
+    flags |= auto_erase ? AUTO_ERASE : 0;
+    b->write_int(flags);
 
     b->write_float(collision_margin);
     b->write_float(rotation);
     b->write_float(vrot);
 
-    b->write_int(is_reflected);
     b->write_int(fire_time);
     b->write_int(spawn_time);
     b->write_int(life_time);
     b->write_int(expire_time);
-    b->write_int(use_abs_coords);
 
     b->write_float(friction);
-    b->write_int(smart_step);
-    b->write_int(avoids_collisions);
-    b->write_int(auto_erase);
 
     b->write_float(alpha);
     b->write_float(health);
@@ -134,6 +147,56 @@ void Entity::serialize(WriteBuffer *b) {
 }
 
 void Entity::deserialize(ReadBuffer *b) {
+    if (b->version == 0) {
+        deserialize_v0(b);
+        return;
+    }
+
+    x = b->read_float();
+    y = b->read_float();
+
+    vx = b->read_float();
+    vy = b->read_float();
+
+    rx = b->read_float();
+    ry = b->read_float();
+
+    type = b->read_int();
+    image_type = b->read_int();
+    image_theme = b->read_int();
+
+    render_z = b->read_int();
+
+    int flags = b->read_int();
+    will_erase = flags & WILL_ERASE;
+    collides_with_entities = flags & COLLIDES_WITH_ENTITIES;
+    is_reflected = flags & IS_REFLECTED;
+    use_abs_coords = flags & USE_ABS_COORDS;
+    smart_step = flags & SMART_STEP;
+    avoids_collisions = flags & AVOIDS_COLLISIONS;
+    auto_erase = flags & AUTO_ERASE;
+
+    collision_margin = b->read_float();
+    rotation = b->read_float();
+    vrot = b->read_float();
+
+    fire_time = b->read_int();
+    spawn_time = b->read_int();
+    life_time = b->read_int();
+    expire_time = b->read_int();
+
+    friction = b->read_float();
+
+    alpha = b->read_float();
+    health = b->read_float();
+    theta = b->read_float();
+    grow_rate = b->read_float();
+    alpha_decay = b->read_float();
+    climber_spawn_x = b->read_float();
+}
+
+// states before version 1 stored the flags as separate ints, interleaved with the other fields
+void Entity::deserialize_v0(ReadBuffer *b) {
     x = b->read_float();
     y = b->read_float();
 
@@ -56,4 +56,7 @@ class Entity {
     void face_direction(float dx, float dy, float rotation_offset = 0);
     void serialize(WriteBuffer *b);
     void deserialize(ReadBuffer *b);
+
+  private:
+    void deserialize_v0(ReadBuffer *b);
 };
@@ -0,0 +1,90 @@
+#include "entitygrid.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+
+// extra extent given to every box, so that rounding differences with the collision test can't
+// separate entities that collide
+const float CELL_RANGE_SLACK = 0.01f;
+
+static int clamp_cell(float v, int dim) {
+    // also maps NaN to cell 0
+    if (!(v > 0)) {
+        return 0;
+    }
+    if (v >= dim - 1) {
+        return dim - 1;
+    }
+    return (int)(v);
+}
+
+void EntityGrid::cell_range(float x, float y, float rx, float ry, int *x0, int *y0, int *x1, int *y1) {
+    *x0 = clamp_cell(floor(x - rx - CELL_RANGE_SLACK), w);
+    *x1 = clamp_cell(floor(x + rx + CELL_RANGE_SLACK), w);
+    *y0 = clamp_cell(floor(y - ry - CELL_RANGE_SLACK), h);
+    *y1 = clamp_cell(floor(y + ry + CELL_RANGE_SLACK), h);
+}
+
+void EntityGrid::build(int _w, int _h, const std::vector<std::shared_ptr<Entity>> &entities, int _num_indexed) {
+    if (_w != w || _h != h) {
+        w = _w;
+        h = _h;
+        cell_heads.assign(w * h, -1);
+        cell_builds.assign(w * h, -1);
+    }
+    num_indexed = _num_indexed;
+    build_num++;
+    entries.clear();
+
+    int x0, y0, x1, y1;
+    for (int i = 0; i < num_indexed; i++) {
+        const Entity &ent = *entities[i];
+        cell_range(ent.x, ent.y, ent.rx, ent.ry, &x0, &y0, &x1, &y1);
+        for (int y = y0; y <= y1; y++) {
+            for (int x = x0; x <= x1; x++) {
+                int c = y * w + x;
+                if (cell_builds[c] != build_num) {
+                    cell_builds[c] = build_num;
+                    cell_heads[c] = -1;
+                }
+                entries.push_back(CellEntry{i, cell_heads[c]});
+                cell_heads[c] = (int)(entries.size()) - 1;
+            }
+        }
+    }
+
+    query_marks.assign(num_indexed, -1);
+    query_num = 0;
+}
+
+void EntityGrid::query(const Entity &ent, float margin, int num_entities, std::vector<int> &candidates) {
+    candidates.clear();
+
+    for (int i = num_entities - 1; i >= num_indexed; i--) {
+        candidates.push_back(i);
+    }
+
+    size_t num_added = candidates.size();
+    query_num++;
+
+    int x0, y0, x1, y1;
+    cell_range(ent.x, ent.y, ent.rx + margin, ent.ry + margin, &x0, &y0, &x1, &y1);
+
+    for (int y = y0; y <= y1; y++) {
+        for (int x = x0; x <= x1; x++) {
+            int c = y * w + x;
+            if (cell_builds[c] != build_num) {
+                continue;
+            }
+            for (int k = cell_heads[c]; k >= 0; k = entries[k].next) {
+                int i = entries[k].entity_idx;
+                if (query_marks[i] != query_num) {
+                    query_marks[i] = query_num;
+                    candidates.push_back(i);
+                }
+            }
+        }
+    }
+
+    std::sort(candidates.begin() + num_added, candidates.end(), std::greater<int>());
+}
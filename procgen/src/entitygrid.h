@@ -0,0 +1,52 @@
+#pragma once
+
+/*
+
+Uniform grid over the unit cells of a game, used to find the entities that might collide with an
+entity without testing every other entity
+
+Each entity is listed in every cell its box overlaps, entities that are partly or completely
+outside of the grid are listed in the nearest cells at its edge. Two entities whose boxes overlap
+therefore always share a cell, so a query returns a superset of the entities that collide.
+
+The grid is a snapshot: entities that move after build() are not tracked, so it has to be built
+again after entities have moved.
+
+*/
+
+#include <memory>
+#include <vector>
+#include "entity.h"
+
+class EntityGrid {
+  public:
+    // list the first num_indexed entities, which must stay in place until the next build()
+    void build(int w, int h, const std::vector<std::shared_ptr<Entity>> &entities, int num_indexed);
+
+    // indices of the entities that may be within margin of ent, in decreasing order, including
+    // every index from num_indexed up to num_entities for entities added since build()
+    void query(const Entity &ent, float margin, int num_entities, std::vector<int> &candidates);
+
+  private:
+    int w = 0;
+    int h = 0;
+    int num_indexed = 0;
+
+    // every cell has a linked list of entries, cell_heads[c] is only valid when cell_builds[c]
+    // is the current build_num, so that building doesn't have to clear every cell
+    std::vector<int> cell_heads;
+    std::vector<int> cell_builds;
+    int build_num = 0;
+
+    struct CellEntry {
+        int entity_idx;
+        int next;
+    };
+    std::vector<CellEntry> entries;
+
+    // the query that last returned each entity, so that entities in several cells are returned once
+    std::vector<int> query_marks;
+    int query_num = 0;
+
+    void cell_range(float x, float y, float rx, float ry, int *x0, int *y0, int *x1, int *y1);
+};
@@ -0,0 +1,91 @@
+#include "entitypool.h"
+#include <algorithm>
+#include <new>
+
+// the first chunk of an arena has room for this many entities, every following chunk is twice as
+// large as the previous one up to MAX_CHUNK_SLOTS
+const size_t MIN_CHUNK_SLOTS = 16;
+const size_t MAX_CHUNK_SLOTS = 1024;
+
+// slots are aligned like the heap, and large enough to link them on the free list
+static size_t round_to_slot(size_t size) {
+    const size_t align = alignof(std::max_align_t);
+    return (std::max(size, sizeof(void *)) + align - 1) / align * align;
+}
+
+EntityArena::EntityArena() : next_chunk_slots(MIN_CHUNK_SLOTS) {
+}
+
+EntityArena::~EntityArena() {
+    for (char *chunk : chunks) {
+        ::operator delete(chunk);
+    }
+}
+
+void *EntityArena::allocate(size_t size) {
+#if defined(__CHEERP__)
+    return ::operator new(size);
+#else
+    if (slot_size == 0) {
+        slot_size = round_to_slot(size);
+    }
+
+    if (round_to_slot(size) != slot_size) {
+        return ::operator new(size);
+    }
+
+    stats.num_allocs++;
+    stats.num_live++;
+
+    if (free_slots != nullptr) {
+        void *p = free_slots;
+        free_slots = *static_cast<void **>(p);
+        stats.num_reuses++;
+        return p;
+    }
+
+    if (chunk_pos == chunk_end) {
+        size_t chunk_size = next_chunk_slots * slot_size;
+        char *chunk = static_cast<char *>(::operator new(chunk_size));
+        chunks.push_back(chunk);
+        chunk_pos = chunk;
+        chunk_end = chunk + chunk_size;
+        next_chunk_slots = std::min(next_chunk_slots * 2, MAX_CHUNK_SLOTS);
+        stats.num_chunks++;
+    }
+
+    void *p = chunk_pos;
+    chunk_pos += slot_size;
+    return p;
+#endif
+}
+
+void EntityArena::deallocate(void *p, size_t size) {
+#if defined(__CHEERP__)
+    ::operator delete(p);
+#else
+    if (round_to_slot(size) != slot_size) {
+        ::operator delete(p);
+        return;
+    }
+
+    stats.num_live--;
+    *static_cast<void **>(p) = free_slots;
+    free_slots = p;
+#endif
+}
+
+EntityPool::EntityPool() : arena(std::make_shared<EntityArena>()) {
+}
+
+EntityPool::EntityPool(const EntityPool &other) : arena(std::make_shared<EntityArena>()) {
+}
+
+EntityPool &EntityPool::operator=(const EntityPool &other) {
+    // the arena is never shared with another pool, see the copy constructor
+    return *this;
+}
+
+EntityPoolStats EntityPool::get_stats() const {
+    return arena->stats;
+}
@@ -0,0 +1,115 @@
+#pragma once
+
+/*
+
+Pool that the entities of a game are allocated from, so that spawning and erasing entities reuses
+memory instead of going to the heap for every entity
+
+Entities are still handed out as std::shared_ptr<Entity>, which stays their handle: games keep
+pointers to the agent and to other entities, and those stay valid for as long as they are held,
+also after the entity was erased from the list or the game was destroyed. Each entity is allocated
+together with its shared_ptr control block in one fixed size slot of an arena, the slot goes on a
+free list when the last handle is dropped and is reused by the next entity. The arena is owned by
+the allocators stored in the control blocks, so it lives until the last handle is gone.
+
+A pool is only used by one game, and a game is only stepped by one thread at a time, so the arena
+is not locked. Copying a pool (when a game is copied) gives the copy its own empty arena.
+
+*/
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <utility>
+#include <vector>
+#include "entity.h"
+
+struct EntityPoolStats {
+    // entities allocated from the pool
+    int64_t num_allocs = 0;
+    // allocations that reused the slot of an entity that was freed
+    int64_t num_reuses = 0;
+    // allocations the arena made from the heap, each one holding many slots
+    int64_t num_chunks = 0;
+    int64_t num_live = 0;
+};
+
+class EntityArena {
+  public:
+    EntityPoolStats stats;
+
+    EntityArena();
+    ~EntityArena();
+    EntityArena(const EntityArena &) = delete;
+    EntityArena &operator=(const EntityArena &) = delete;
+
+    // allocations of a different size than the first one are passed on to the heap
+    void *allocate(size_t size);
+    void deallocate(void *p, size_t size);
+
+  private:
+    size_t slot_size = 0;
+    size_t next_chunk_slots;
+    std::vector<char *> chunks;
+    char *chunk_pos = nullptr;
+    char *chunk_end = nullptr;
+
+    // freed slots, linked through their first bytes
+    void *free_slots = nullptr;
+};
+
+template <typename T>
+class EntityPoolAllocator {
+  public:
+    typedef T value_type;
+
+    std::shared_ptr<EntityArena> arena;
+
+    explicit EntityPoolAllocator(const std::shared_ptr<EntityArena> &arena) : arena(arena) {
+    }
+
+    template <typename U>
+    EntityPoolAllocator(const EntityPoolAllocator<U> &other) : arena(other.arena) {
+    }
+
+    T *allocate(size_t n) {
+        return static_cast<T *>(arena->allocate(n * sizeof(T)));
+    }
+
+    void deallocate(T *p, size_t n) {
+        arena->deallocate(p, n * sizeof(T));
+    }
+};
+
+template <typename T, typename U>
+bool operator==(const EntityPoolAllocator<T> &a, const EntityPoolAllocator<U> &b) {
+    return a.arena == b.arena;
+}
+
+template <typename T, typename U>
+bool operator!=(const EntityPoolAllocator<T> &a, const EntityPoolAllocator<U> &b) {
+    return a.arena != b.arena;
+}
+
+class EntityPool {
+  public:
+    EntityPool();
+    EntityPool(const EntityPool &other);
+    EntityPool &operator=(const EntityPool &other);
+
+    // create an entity, taking the same arguments as the Entity constructors
+    template <typename... Args>
+    std::shared_ptr<Entity> make(Args &&... args) {
+#if defined(__CHEERP__)
+        // cheerp can't place objects in raw memory, so the browser build uses the heap
+        return std::make_shared<Entity>(std::forward<Args>(args)...);
+#else
+        return std::allocate_shared<Entity>(EntityPoolAllocator<Entity>(arena), std::forward<Args>(args)...);
+#endif
+    }
+
+    EntityPoolStats get_stats() const;
+
+  private:
+    std::shared_ptr<EntityArena> arena;
+};
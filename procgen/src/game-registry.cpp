@@ -1,3 +1,4 @@
 #include "game-registry.h"
 
 std::map<std::string, std::function<Game*()>> *globalGameRegistry = nullptr;
+std::map<std::string, std::function<Game*(const Game &)>> *globalGameCopyRegistry = nullptr;
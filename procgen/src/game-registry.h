@@ -6,6 +6,9 @@ This is a way to register game classes without having to update a central index
 
 Each game should include "game-registry.h" and call REGISTER_GAME("name", GameSubClass)
 
+This also registers a function that copies a game with the copy constructor of its class, see
+Game::detach_copy() for what has to happen to the copy before it can be used.
+
 */
 
 #include <vector>
@@ -20,17 +23,22 @@ class Game;
 #define REGISTER_GAME(name, cls)                                         \
     static auto UNUSED_FUNCTION(_registration) = registerGame(name, [] { \
         return new cls();                                  \
+    }, [](const Game &other) -> Game * {                   \
+        return new cls(static_cast<const cls &>(other));   \
     })
 
 extern std::map<std::string, std::function<Game*()>> *globalGameRegistry;
+extern std::map<std::string, std::function<Game*(const Game &)>> *globalGameCopyRegistry;
 
-template <typename Func>
-int registerGame(std::string name, Func fn) {
+template <typename Func, typename CopyFunc>
+int registerGame(std::string name, Func fn, CopyFunc copy_fn) {
     if (globalGameRegistry == nullptr) {
         // because global initialization order is undefined in C++, supposedly
         // we have to set this here
         globalGameRegistry = new std::map<std::string, std::function<Game*()>>();
+        globalGameCopyRegistry = new std::map<std::string, std::function<Game*(const Game &)>>();
     }
     (*globalGameRegistry)[name] = fn;
+    (*globalGameCopyRegistry)[name] = copy_fn;
     return 0;
 }
@@ -2,9 +2,6 @@
 #include "game.h"
 #include "vecoptions.h"
 
-// this should be updated whenever the state format or environments may have changed
-const int SERIALIZE_VERSION = 0;
-
 void bgr32_to_rgb888(void *dst_rgb888, void *src_bgr32, int w, int h) {
     uint8_t *src = (uint8_t *)src_bgr32;
     uint8_t *dst = (uint8_t *)dst_rgb888;
@@ -22,6 +19,7 @@ void bgr32_to_rgb888(void *dst_rgb888, void *src_bgr32, int w, int h) {
     }
 }
 
+#if defined(__CHEERP__)
 void canvas_to_rgb888(client::Uint8Array *dst_rgb888, client::HTMLCanvasElement *c, int w, int h) {
     uint8_t *dst = &(*dst_rgb888)[0];
     auto *ctx = static_cast<client::CanvasRenderingContext2D *>(c->getContext("2d"));
@@ -40,6 +38,7 @@ void canvas_to_rgb888(client::Uint8Array *dst_rgb888, client::HTMLCanvasElement
         }
     }
 }
+#endif
 
 Game::Game(std::string name)
     : game_name(name) {
@@ -94,6 +93,7 @@ void Game::parse_options(std::string name, VecOptions opts) {
     opts.ensure_empty();
 }
 
+#if defined(__CHEERP__)
 void Game::render_to_canvas(client::HTMLCanvasElement *canvas, int w, int h, bool antialias) {
     QPainter p(canvas);
 
@@ -105,9 +105,37 @@ void Game::render_to_canvas(client::HTMLCanvasElement *canvas, int w, int h, boo
     QRect rect = QRect(0, 0, w, h);
     game_draw(p, rect);
 }
+#else
+void Game::render_to_buf(void *dst, int w, int h, bool antialias) {
+    // Qt focuses on RGB32 performance:
+    // https://doc.qt.io/qt-5/qpainter.html#performance
+    // so render to an RGB32 buffer and then convert it rather than render to RGB888 directly
+    QImage img((uchar *)dst, w, h, w * 4, QImage::Format_RGB32);
+    QPainter p(&img);
+
+#if defined(PROCGEN_QPAINTER_TRACE)
+    if (!qpainter_trace_dir.empty()) {
+        p.traceTo(qpainter_trace_dir);
+    }
+#endif
+
+    if (antialias) {
+        p.setRenderHint(QPainter::Antialiasing, true);
+        p.setRenderHint(QPainter::SmoothPixmapTransform, true);
+    }
+
+    QRect rect = QRect(0, 0, w, h);
+    game_draw(p, rect);
+}
+#endif
 
 void Game::reset() {
+    ProfileTimer timer(profile_phase(PROFILE_RESET));
     reset_count++;
+#if !defined(__CHEERP__)
+    push_obs_frame = true;
+    clear_obs_frames = true;
+#endif
 
     if (episodes_remaining == 0) {
         if (options.use_sequential_levels && step_data.level_complete) {
@@ -125,7 +153,15 @@ void Game::reset() {
     }
 
     rand_gen.seed(current_level_seed);
+#if defined(__CHEERP__)
     game_reset();
+#else
+    if (level_cache != nullptr) {
+        cached_game_reset();
+    } else {
+        game_reset();
+    }
+#endif
 
     cur_time = 0;
     total_reward = 0;
@@ -135,6 +171,9 @@ void Game::reset() {
 
 void Game::step() {
     cur_time += 1;
+#if !defined(__CHEERP__)
+    push_obs_frame = true;
+#endif
     bool will_force_reset = false;
 
     if (action == -1) {
@@ -145,7 +184,10 @@ void Game::step() {
     step_data.reward = 0;
     step_data.done = false;
     step_data.level_complete = false;
-    game_step();
+    {
+        ProfileTimer timer(profile_phase(PROFILE_STEP));
+        game_step();
+    }
 
     step_data.done = step_data.done || will_force_reset || (cur_time >= timeout);
     total_reward += step_data.reward;
@@ -171,7 +213,7 @@ void Game::step() {
 }
 
 void Game::observe() {
-    // bgr32_to_rgb888(obs_bufs[0], render_buf, RES_W, RES_H);
+#if defined(__CHEERP__)
     QImage img(RES_W, RES_H, QImage::Format_ARGB32);
     render_to_canvas(img.getCanvas(), RES_W, RES_H, false);
     // auto* rgb = new client::Uint8Array(RES_W*RES_H*3);
@@ -183,18 +225,125 @@ void Game::observe() {
     state->set_prev_level_complete(step_data.level_complete);
     state->set_level_seed(current_level_seed);
     state->set_done(step_data.done);
-    //*reward_ptr = step_data.reward;
-    //*first_ptr = (uint8_t)step_data.done;
-    //*(int32_t *)(info_bufs[info_name_to_offset.at("prev_level_seed")]) = (int32_t)(prev_level_seed);
-    //*(uint8_t *)(info_bufs[info_name_to_offset.at("prev_level_complete")]) = (uint8_t)(step_data.level_complete);
-    //*(int32_t *)(info_bufs[info_name_to_offset.at("level_seed")]) = (int32_t)(current_level_seed);
+#else
+    if (render_rgb) {
+        {
+            ProfileTimer timer(profile_phase(PROFILE_RENDER));
+            render_to_buf(render_buf, RES_W, RES_H, false);
+        }
+        ProfileTimer timer(profile_phase(PROFILE_CONVERT));
+        write_obs();
+    }
+    *reward_ptr = step_data.reward;
+    *first_ptr = (uint8_t)step_data.done;
+    *(int32_t *)(info_bufs[info_name_to_offset.at("prev_level_seed")]) = (int32_t)(prev_level_seed);
+    *(uint8_t *)(info_bufs[info_name_to_offset.at("prev_level_complete")]) = (uint8_t)(step_data.level_complete);
+    *(int32_t *)(info_bufs[info_name_to_offset.at("level_seed")]) = (int32_t)(current_level_seed);
+#endif
 }
 
 void Game::game_init() {
 }
 
+#if !defined(__CHEERP__)
+void Game::write_obs() {
+    if (obs_transform.is_identity()) {
+        bgr32_to_rgb888(obs_bufs[0], render_buf, RES_W, RES_H);
+    } else if (obs_transform.frame_stack == 1) {
+        transform_frame(obs_transform, (uint8_t *)(obs_bufs[0]), render_buf, RES_W, RES_H);
+    } else {
+        // the state can be observed again without stepping (forks, deferred renders), which must
+        // not add the same frame twice
+        if (clear_obs_frames) {
+            obs_frames.clear();
+            clear_obs_frames = false;
+        }
+        if (push_obs_frame) {
+            transform_frame(obs_transform, obs_frames.push(obs_transform, RES_W, RES_H), render_buf, RES_W, RES_H);
+            push_obs_frame = false;
+        }
+        obs_frames.write(obs_transform, (uint8_t *)(obs_bufs[0]), RES_W, RES_H);
+    }
+}
+#endif
+
+#if !defined(__CHEERP__)
+void Game::serialize_obs_frames(WriteBuffer *b) {
+    b->write_bool(obs_transform.grayscale);
+    b->write_int(obs_transform.downsample);
+    b->write_bool(obs_transform.chw);
+    b->write_int(obs_transform.frame_stack);
+    b->write_bool(push_obs_frame);
+    b->write_bool(clear_obs_frames);
+    obs_frames.serialize(b);
+}
+
+void Game::deserialize_obs_frames(ReadBuffer *b) {
+    ObsTransform transform;
+    transform.grayscale = b->read_bool();
+    transform.downsample = b->read_int();
+    transform.chw = b->read_bool();
+    transform.frame_stack = b->read_int();
+    bool push = b->read_bool();
+    bool clear = b->read_bool();
+    FrameStack frames;
+    frames.deserialize(b);
+
+    // frames stacked with another transform can't be used, the restored state starts a new stack
+    if (transform == obs_transform) {
+        push_obs_frame = push;
+        clear_obs_frames = clear;
+        obs_frames = std::move(frames);
+    }
+}
+
+std::string Game::level_cache_key() {
+    // everything that the level generated by game_reset() depends on
+    std::string key = game_name + " v" + std::to_string(SERIALIZE_VERSION);
+    for (int v : {(int)(options.paint_vel_info), (int)(options.use_generated_assets), (int)(options.use_monochrome_assets),
+                  (int)(options.restrict_themes), (int)(options.use_backgrounds), (int)(options.center_agent),
+                  options.debug_mode, (int)(options.distribution_mode), (int)(options.use_sequential_levels),
+                  (int)(options.use_easy_jump), options.plain_assets, options.physics_mode, game_type,
+                  fixed_asset_seed, current_level_seed}) {
+        key += " " + std::to_string(v);
+    }
+    return key;
+}
+
+// restore the level for current_level_seed from the level cache if it is there, otherwise call
+// game_reset() and add the level to the cache, the result is the same as calling game_reset()
+// as long as the level only depends on what's in level_cache_key() and serialize_carryover()
+void Game::cached_game_reset() {
+    // game_reset() may change options, so the key is made first
+    auto key = level_cache_key();
+    auto snapshot = level_cache->get(key);
+
+    if (snapshot == nullptr) {
+        game_reset();
+        thread_local std::vector<char> scratch(MAX_STATE_SIZE);
+        auto b = WriteBuffer(scratch.data(), scratch.size());
+        serialize(&b);
+        level_cache->put(key, scratch.data(), b.offset);
+        return;
+    }
+
+    // the snapshot replaces the whole state, keep the parts that don't belong to the level
+    thread_local std::vector<char> carryover(MAX_STATE_SIZE);
+    auto cb = WriteBuffer(carryover.data(), carryover.size());
+    serialize_carryover(&cb);
+
+    auto b = ReadBuffer((char *)(snapshot->data), snapshot->size);
+    deserialize(&b);
+    fassert(b.offset == b.length);
+
+    auto rb = ReadBuffer(carryover.data(), cb.offset);
+    deserialize_carryover(&rb);
+    fassert(rb.offset == rb.length);
+}
+#endif
+
 void Game::serialize(WriteBuffer *b) {
-    b->write_int(SERIALIZE_VERSION);
+    b->write_fixed_int(SERIALIZE_VERSION);
 
     b->write_string(game_name);
 
@@ -255,7 +404,9 @@ void Game::serialize(WriteBuffer *b) {
 }
 
 void Game::deserialize(ReadBuffer *b) {
-    fassert(SERIALIZE_VERSION == b->read_int());
+    // the version decides how the rest of the state is encoded, older versions are still readable
+    b->version = b->read_fixed_int();
+    fassert(b->version >= 0 && b->version <= SERIALIZE_VERSION);
     fassert(game_name == b->read_string());
 
     options.paint_vel_info = b->read_int();
@@ -301,7 +452,55 @@ void Game::deserialize(ReadBuffer *b) {
 
     cur_time = b->read_int();
     is_waiting_for_step = b->read_int();
+
+#if !defined(__CHEERP__)
+    // the stacked frames are an optional part of the state read by deserialize_obs_frames(),
+    // without them the restored state starts a new stack
+    push_obs_frame = true;
+    clear_obs_frames = true;
+#endif
+}
+
+void Game::serialize_carryover(WriteBuffer *b) {
+    b->write_int(level_seed_low);
+    b->write_int(level_seed_high);
+    b->write_int(game_n);
+    level_seed_rand_gen.serialize(b);
+
+    b->write_float(step_data.reward);
+    b->write_bool(step_data.done);
+    b->write_bool(step_data.level_complete);
+
+    b->write_int(prev_level_seed);
+    b->write_int(episodes_remaining);
+    b->write_bool(episode_done);
+    b->write_int(last_reward_timer);
+    b->write_float(last_reward);
+    b->write_bool(is_waiting_for_step);
 }
 
+void Game::deserialize_carryover(ReadBuffer *b) {
+    level_seed_low = b->read_int();
+    level_seed_high = b->read_int();
+    game_n = b->read_int();
+    level_seed_rand_gen.deserialize(b);
+
+    step_data.reward = b->read_float();
+    step_data.done = b->read_bool();
+    step_data.level_complete = b->read_bool();
+
+    prev_level_seed = b->read_int();
+    episodes_remaining = b->read_int();
+    episode_done = b->read_bool();
+    last_reward_timer = b->read_int();
+    last_reward = b->read_float();
+    is_waiting_for_step = b->read_bool();
+}
+
+void Game::detach_copy() {
+}
+
+#if defined(__CHEERP__)
 void Game::game_set_state(client::GameState *state) {
-}
\ No newline at end of file
+}
+#endif
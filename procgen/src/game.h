@@ -7,18 +7,26 @@ Base class used for all games, all games must inherit from this
 */
 
 #include <QtGui/QPainter>
+#include <cmath>
 #include <memory>
 #include <functional>
 #include <vector>
 #include <string>
-#include <cheerp/client.h>
 #include "entity.h"
 #include "randgen.h"
 #include "resources.h"
 #include "object-ids.h"
 #include "game-registry.h"
 #include "buffer.h"
+#include "profiler.h"
+#include "obstransform.h"
+
+#if defined(__CHEERP__)
+#include <cheerp/client.h>
 #include "state.h"
+#else
+#include "levelcache.h"
+#endif
 
 // We want all games to have same observation space. So all these
 // constants here related to observation space are constants forever.
@@ -27,6 +35,9 @@ const int RES_H = 64;
 
 const int RENDER_RES = 512;
 
+// largest grid reported through the grid info, smaller grids are padded with zeros
+const int MAX_LATENT_GRID_DIM = 35;
+
 void bgr32_to_rgb888(void *dst_rgb888, void *src_bgr32, int w, int h);
 
 class VecOptions;
@@ -94,24 +105,74 @@ class Game {
 
     int fixed_asset_seed = 0;
 
-    // uint32_t render_buf[RES_W * RES_H];
+    // when false, observe() leaves the rgb observation untouched and only writes the infos, for
+    // agents that only use the latent state some games export
+    bool render_rgb = true;
+
+    // when true, games that export their latent state also write the "exit_dist" and "key_dist"
+    // infos, see BasicAbstractGame::write_distance_infos()
+    bool distance_infos = false;
+
+    // when true, BasicAbstractGame::game_step() always finds colliding entities with the entity
+    // grid, which is otherwise only used with many entities, for tests
+    bool force_entity_grid = false;
+
+    // time spent in each phase of this game, owned by the VecGame, nullptr unless profiling is
+    // enabled with the profile option
+    GameProfile *profile = nullptr;
+
+#if defined(PROCGEN_QPAINTER_TRACE)
+    // directory the drawing of the observations is traced into, to compare it with Qt, see
+    // QPainter::traceTo()
+    std::string qpainter_trace_dir;
+#endif
+
+#if !defined(__CHEERP__)
+    uint32_t render_buf[RES_W * RES_H];
+
+    // how observe() transforms the rgb observation, see obstransform.h
+    ObsTransform obs_transform;
+    // the last frames of the episode when stacking frames
+    FrameStack obs_frames;
+    // whether the next observe() adds a frame to obs_frames, rather than writing the same frames
+    // again, and whether it starts a new episode
+    bool push_obs_frame = true;
+    bool clear_obs_frames = true;
+#endif
 
     int cur_time = 0;
 
     bool is_waiting_for_step = false;
 
-    // pointers to buffers
-    // int32_t *action_ptr;
-    // std::vector<void *> obs_bufs;
-    // std::vector<void *> info_bufs;
-    // float *reward_ptr = nullptr;
-    // uint8_t *first_ptr = nullptr;
+#if defined(__CHEERP__)
+    // javascript object the observation is written to
     client::GameState *state;
+#else
+    // pointers to buffers
+    int32_t *action_ptr;
+    std::vector<void *> obs_bufs;
+    std::vector<void *> info_bufs;
+    float *reward_ptr = nullptr;
+    uint8_t *first_ptr = nullptr;
+
+    // shared by the games of a VecGame, levels are generated without it if this is nullptr
+    std::shared_ptr<LevelCache> level_cache;
+#endif
 
     Game(std::string name);
     void step();
     void reset();
+#if defined(__CHEERP__)
     void render_to_canvas(client::HTMLCanvasElement *canvas, int w, int h, bool antialias);
+#else
+    void render_to_buf(void *buf, int w, int h, bool antialias);
+    // write render_buf to the rgb observation, transformed by obs_transform
+    void write_obs();
+    // the stacked frames of the observation, which states only hold when frames are stacked,
+    // see write_state() in vecgame.cpp
+    void serialize_obs_frames(WriteBuffer *b);
+    void deserialize_obs_frames(ReadBuffer *b);
+#endif
     void parse_options(std::string name, VecOptions opt_vec);
 
     // Pure virtual functions every game must implement for itself
@@ -122,13 +183,32 @@ class Game {
     virtual void game_step() = 0;
     virtual void game_draw(QPainter &p, const QRect &rect) = 0;
 
+#if defined(__CHEERP__)
     // game_set_state is not pure virtual because I don't want to write an implementation for all
     // games right now. This should be fixed in the future.
     virtual void game_set_state(client::GameState *state);
+#endif
     virtual void serialize(WriteBuffer *b);
     virtual void deserialize(ReadBuffer *b);
+    // the parts of the state that game_reset() leaves as they were in the previous episode, these
+    // are kept when a level is restored from the level cache, see cached_game_reset()
+    virtual void serialize_carryover(WriteBuffer *b);
+    virtual void deserialize_carryover(ReadBuffer *b);
+    // called on a game created with the copy constructor of another game, which copies pointers
+    // as they are, so that the copy gets its own version of anything the original may still modify
+    virtual void detach_copy();
+
+    // the profile of one phase of this game for a ProfileTimer, nullptr unless profiling
+    PhaseProfile *profile_phase(GameProfilePhase phase) {
+        return profile == nullptr ? nullptr : &profile->phases[phase];
+    }
 
   private:
     int reset_count = 0;
     float total_reward = 0.0f;
+
+#if !defined(__CHEERP__)
+    std::string level_cache_key();
+    void cached_game_reset();
+#endif
 };
@@ -21,12 +21,12 @@ const int MARKER = 1003;
 
 class CaveFlyerGame : public BasicAbstractGame {
   public:
-    std::unique_ptr<RoomGenerator> room_manager;
+    std::shared_ptr<RoomGenerator> room_manager;
 
     CaveFlyerGame()
         : BasicAbstractGame(NAME) {
         mixrate = 0.9f;
-        room_manager = std::make_unique<RoomGenerator>(this);
+        room_manager = std::make_shared<RoomGenerator>(this);
     }
 
     void load_background_images() override {
@@ -322,6 +322,18 @@ class CaveFlyerGame : public BasicAbstractGame {
 
         erase_if_needed();
     }
+
+    void detach_copy() override {
+        BasicAbstractGame::detach_copy();
+        room_manager = std::make_shared<RoomGenerator>(this);
+    }
+
+    void deserialize_carryover(ReadBuffer *b) override {
+        // visibility is chosen by game_reset() in this game, so it doesn't carry over
+        float level_visibility = visibility;
+        BasicAbstractGame::deserialize_carryover(b);
+        visibility = level_visibility;
+    }
 };
 
 REGISTER_GAME(NAME, CaveFlyerGame);
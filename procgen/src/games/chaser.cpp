@@ -410,6 +410,12 @@ class ChaserGame : public BasicAbstractGame {
         orbs_collected = b->read_int();
         maze_dim = b->read_int();
     }
+
+    void detach_copy() override {
+        BasicAbstractGame::detach_copy();
+        // the maze generator uses the rand_gen of the original, it is created again on reset
+        maze_gen = nullptr;
+    }
 };
 
 REGISTER_GAME(NAME, ChaserGame);
@@ -208,6 +208,72 @@ class HeistGame : public BasicAbstractGame {
         agent->face_direction(action_vx, action_vy);
     }
 
+    void observe() override {
+        Game::observe();
+
+#if !defined(__CHEERP__)
+        // the latent grid uses the maze generator's ids: doors and keys are DOOR_OBJ and KEY_OBJ
+        // plus 1 + their color, the exit is EXIT_OBJ
+        Grid<int> grid = get_grid();
+        int exit_x = 0;
+        int exit_y = 0;
+        for (const auto &ent : entities) {
+            int idx = grid.to_index(int(ent->x), int(ent->y));
+            if (ent->type == LOCKED_DOOR) {
+                grid.set_index(idx, DOOR_OBJ + 1 + ent->image_theme);
+            } else if (ent->type == KEY) {
+                grid.set_index(idx, KEY_OBJ + 1 + ent->image_theme);
+            } else if (ent->type == EXIT) {
+                grid.set_index(idx, EXIT_OBJ);
+                exit_x = int(ent->x);
+                exit_y = int(ent->y);
+            }
+        }
+
+        int32_t *grid_size_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid_size")]);
+        grid_size_buf[0] = grid.w;
+        grid_size_buf[1] = grid.h;
+
+        int32_t num_cells = grid.w * grid.h;
+        fassert(num_cells <= MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM);
+        int32_t *grid_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid")]);
+        std::copy(grid.data.begin(), grid.data.end(), grid_buf);
+        std::fill(grid_buf + num_cells, grid_buf + MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM, 0);
+
+        int32_t *agent_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("agent_pos")]);
+        agent_pos_buf[0] = int(agent->x);
+        agent_pos_buf[1] = int(agent->y);
+
+        int32_t *exit_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("exit_pos")]);
+        exit_pos_buf[0] = exit_x;
+        exit_pos_buf[1] = exit_y;
+
+        if (distance_infos) {
+            // doors only block the agent until it has their key
+            std::vector<bool> passable(num_cells);
+            std::vector<int> exit_cells;
+            std::vector<int> key_cells;
+            for (int idx = 0; idx < num_cells; idx++) {
+                passable[idx] = get_obj(idx) != WALL_OBJ;
+            }
+            for (const auto &ent : entities) {
+                if (ent->will_erase) {
+                    continue;
+                }
+                int idx = grid.to_index(int(ent->x), int(ent->y));
+                if (ent->type == LOCKED_DOOR && !has_keys[ent->image_theme]) {
+                    passable[idx] = false;
+                } else if (ent->type == KEY) {
+                    key_cells.push_back(idx);
+                } else if (ent->type == EXIT) {
+                    exit_cells.push_back(idx);
+                }
+            }
+            write_distance_infos(passable, exit_cells, key_cells);
+        }
+#endif
+    }
+
     void serialize(WriteBuffer *b) override {
         BasicAbstractGame::serialize(b);
         b->write_int(num_keys);
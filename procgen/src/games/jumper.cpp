@@ -36,11 +36,11 @@ class Jumper : public BasicAbstractGame {
     bool facing_right = false;
     int wall_theme = 0;
     float compass_dim = 0.0f;
-    std::unique_ptr<RoomGenerator> room_manager;
+    std::shared_ptr<RoomGenerator> room_manager;
 
     Jumper()
         : BasicAbstractGame(NAME) {
-        room_manager = std::make_unique<RoomGenerator>(this);
+        room_manager = std::make_shared<RoomGenerator>(this);
     }
 
     void load_background_images() override {
@@ -466,6 +466,23 @@ class Jumper : public BasicAbstractGame {
         fassert(goal_idx >= 0);
         goal = entities[goal_idx];
     }
+
+    void detach_copy() override {
+        BasicAbstractGame::detach_copy();
+        room_manager = std::make_shared<RoomGenerator>(this);
+    }
+
+    void copy_entities(EntityCopier &copier) override {
+        BasicAbstractGame::copy_entities(copier);
+        goal = copier.copy(goal);
+    }
+
+    void deserialize_carryover(ReadBuffer *b) override {
+        // visibility is chosen by game_reset() in this game, so it doesn't carry over
+        float level_visibility = visibility;
+        BasicAbstractGame::deserialize_carryover(b);
+        visibility = level_visibility;
+    }
 };
 
 REGISTER_GAME(NAME, Jumper);
@@ -189,7 +189,7 @@ class LeaperGame : public BasicAbstractGame {
             float spawn_prob = fabs(speed) / 6.0;
             if (rand_gen.rand01() < spawn_prob) {
                 float x = speed > 0 ? (-1 * MONSTER_RADIUS) : (main_width + MONSTER_RADIUS);
-                auto m = std::make_shared<Entity>(x, bottom_road_y + lane + 0.5, speed, 0, 2 * MONSTER_RADIUS, MONSTER_RADIUS, CAR);
+                auto m = entity_pool.make(x, bottom_road_y + lane + 0.5, speed, 0, 2 * MONSTER_RADIUS, MONSTER_RADIUS, CAR);
                 choose_random_theme(m);
                 if (speed < 0) {
                     m->rotation = PI;
@@ -206,7 +206,7 @@ class LeaperGame : public BasicAbstractGame {
             float spawn_prob = fabs(speed) / 2.0;
             if (rand_gen.rand01() < spawn_prob) {
                 float x = speed > 0 ? (-1 * LOG_RADIUS) : (main_width + LOG_RADIUS);
-                auto m = std::make_shared<Entity>(x, bottom_water_y + lane + 0.5, speed, 0, LOG_RADIUS, LOG);
+                auto m = entity_pool.make(x, bottom_water_y + lane + 0.5, speed, 0, LOG_RADIUS, LOG);
                 if (!has_any_collision(m)) {
                     entities.push_back(m);
                 }
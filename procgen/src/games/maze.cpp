@@ -169,6 +169,7 @@ class MazeGame : public BasicAbstractGame {
 
         auto latent_state = get_latent_state();
 
+#if defined(__CHEERP__)
         auto* js_state = static_cast<client::MazeState*>(this->state);
 
         js_state->set_grid_width(latent_state.grid_width);
@@ -184,7 +185,46 @@ class MazeGame : public BasicAbstractGame {
 
         js_state->set_agent_x(latent_state.agent_x);
         js_state->set_agent_y(latent_state.agent_y);
+#else
+        int32_t *grid_size_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid_size")]);
+        grid_size_buf[0] = latent_state.grid_width;
+        grid_size_buf[1] = latent_state.grid_height;
+
+        int32_t num_cells = latent_state.grid_width * latent_state.grid_height;
+        fassert(num_cells <= MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM);
+        int32_t *grid_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid")]);
+        std::copy(latent_state.grid.begin(), latent_state.grid.begin() + num_cells, grid_buf);
+        std::fill(grid_buf + num_cells, grid_buf + MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM, 0);
+
+        int32_t *agent_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("agent_pos")]);
+        agent_pos_buf[0] = latent_state.agent_x;
+        agent_pos_buf[1] = latent_state.agent_y;
+
+        // the exit of a maze is the goal cell
+        int32_t *exit_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("exit_pos")]);
+        exit_pos_buf[0] = 0;
+        exit_pos_buf[1] = 0;
+        for (int idx = 0; idx < num_cells; idx++) {
+            if (latent_state.grid[idx] == GOAL) {
+                exit_pos_buf[0] = idx % latent_state.grid_width;
+                exit_pos_buf[1] = idx / latent_state.grid_width;
+                break;
+            }
+        }
 
+        if (distance_infos) {
+            std::vector<bool> passable(num_cells);
+            std::vector<int> exit_cells;
+            for (int idx = 0; idx < num_cells; idx++) {
+                passable[idx] = latent_state.grid[idx] != WALL_OBJ;
+                if (latent_state.grid[idx] == GOAL) {
+                    exit_cells.push_back(idx);
+                }
+            }
+            // there are no keys in a maze
+            write_distance_infos(passable, exit_cells, {});
+        }
+#endif
     }
 };
 
@@ -1,6 +1,8 @@
 #include "../basic-abstract-game.h"
 #include "../assetgen.h"
+#if defined(__CHEERP__)
 #include "../cheerputils.cpp"
+#endif
 #include <set>
 #include <queue>
 #include <iterator>
@@ -56,10 +58,9 @@ class MinerGame : public BasicAbstractGame {
             names.push_back("misc_assets/gemBlue.png");
         } else if (type == EXIT) {
             names.push_back("misc_assets/window.png");
-        } else if (type == DIRT) {
+        } else if (type == DIRT || type == MUD) {
+            // mud is dug through like dirt and only differs in never holding up the exit
             names.push_back("misc_assets/dirt.png");
-        } else if (type == MUD) {
-            names.push_back("misc_assets/mud.png");
         } else if (type == OOB_WALL) {
             names.push_back("misc_assets/tile_bricksGrey.png");
         }
@@ -358,11 +359,22 @@ class MinerGame : public BasicAbstractGame {
     void serialize(WriteBuffer *b) override {
         BasicAbstractGame::serialize(b);
         b->write_int(diamonds_remaining);
+        b->write_int(died);
+        // a crushed agent is no longer in the entity list, but is still used until the next step
+        if (died) {
+            agent->serialize(b);
+        }
     }
 
     void deserialize(ReadBuffer *b) override {
         BasicAbstractGame::deserialize(b);
         diamonds_remaining = b->read_int();
+        died = b->read_int();
+        if (died) {
+            agent = entity_pool.make();
+            agent->deserialize(b);
+        }
+        fassert(agent != nullptr);
     }
 
     struct MinerState {
@@ -400,6 +412,7 @@ class MinerGame : public BasicAbstractGame {
 
         auto latent_state = get_latent_state();
 
+#if defined(__CHEERP__)
         auto *js_state = static_cast<client::MinerState *>(this->state);
 
         js_state->set_grid_width(latent_state.grid_width);
@@ -418,8 +431,43 @@ class MinerGame : public BasicAbstractGame {
 
         js_state->set_exit_x(latent_state.exit_x);
         js_state->set_exit_y(latent_state.exit_y);
+#else
+        int32_t *grid_size_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid_size")]);
+        grid_size_buf[0] = latent_state.grid_width;
+        grid_size_buf[1] = latent_state.grid_height;
+
+        int32_t num_cells = latent_state.grid_width * latent_state.grid_height;
+        fassert(num_cells <= MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM);
+        int32_t *grid_buf = (int32_t *)(info_bufs[info_name_to_offset.at("grid")]);
+        std::copy(latent_state.grid.begin(), latent_state.grid.begin() + num_cells, grid_buf);
+        std::fill(grid_buf + num_cells, grid_buf + MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM, 0);
+
+        int32_t *agent_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("agent_pos")]);
+        agent_pos_buf[0] = latent_state.agent_x;
+        agent_pos_buf[1] = latent_state.agent_y;
+
+        int32_t *exit_pos_buf = (int32_t *)(info_bufs[info_name_to_offset.at("exit_pos")]);
+        exit_pos_buf[0] = latent_state.exit_x;
+        exit_pos_buf[1] = latent_state.exit_y;
+
+        if (distance_infos) {
+            // the agent digs through dirt and mud, the diamonds play the part of keys since they
+            // all have to be collected before the exit opens
+            std::vector<bool> passable(num_cells);
+            std::vector<int> key_cells;
+            for (int idx = 0; idx < num_cells; idx++) {
+                int obj = latent_state.grid[idx];
+                passable[idx] = !(obj == BOULDER || obj == MOVING_BOULDER || obj == OOB_WALL || obj == WALL_OBJ);
+                if (get_stationary_type(obj) == DIAMOND) {
+                    key_cells.push_back(idx);
+                }
+            }
+            write_distance_infos(passable, {latent_state.exit_y * latent_state.grid_width + latent_state.exit_x}, key_cells);
+        }
+#endif
     }
 
+#if defined(__CHEERP__)
     void game_set_state(client::GameState *state) override {
         auto miner_state = static_cast<client::MinerState *>(state);
         auto grid_vals = miner_state->get_grid();
@@ -447,6 +495,17 @@ class MinerGame : public BasicAbstractGame {
         exit->x = miner_state->get_exit_x() + 0.5f;
         exit->y = miner_state->get_exit_y() + 0.5f;
     }
+#endif
+
+    void serialize_carryover(WriteBuffer *b) override {
+        BasicAbstractGame::serialize_carryover(b);
+        b->write_int(diamonds_remaining);
+    }
+
+    void deserialize_carryover(ReadBuffer *b) override {
+        BasicAbstractGame::deserialize_carryover(b);
+        diamonds_remaining = b->read_int();
+    }
 };
 
 REGISTER_GAME(NAME, MinerGame);
@@ -433,6 +433,13 @@ class Ninja : public BasicAbstractGame {
         jump_charge = b->read_float();
         jump_charge_inc = b->read_float();
     }
+
+    void deserialize_carryover(ReadBuffer *b) override {
+        // visibility is chosen by game_reset() in this game, so it doesn't carry over
+        float level_visibility = visibility;
+        BasicAbstractGame::deserialize_carryover(b);
+        visibility = level_visibility;
+    }
 };
 
 REGISTER_GAME(NAME, Ninja);
@@ -202,7 +202,7 @@ class PlunderGame : public BasicAbstractGame {
             float ent_y = (lane * .11 + .4) * (main_height / 2 - ent_r) + main_height / 2;
             float moves_right = lane_directions[lane];
             float ent_vx = lane_vels[lane] * (moves_right ? 1 : -1);
-            auto ent = std::make_shared<Entity>(0, ent_y, ent_vx, 0, ent_r, SHIP);
+            auto ent = entity_pool.make(0, ent_y, ent_vx, 0, ent_r, SHIP);
             ent->image_type = SHIP;
             ent->image_theme = image_permutation[rand_gen.randn(num_current_ship_types)];
             match_aspect_ratio(ent);
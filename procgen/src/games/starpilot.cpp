@@ -301,7 +301,7 @@ class StarPilotGame : public BasicAbstractGame {
                     vx *= -1;
                 }
 
-                auto spawner = std::make_shared<Entity>(x_pos, y_pos, vx, vy, r, type);
+                auto spawner = entity_pool.make(x_pos, y_pos, vx, vy, r, type);
                 spawner->fire_time = fire_time;
                 spawner->spawn_time = spawn_time;
                 spawner->health = health;
@@ -385,7 +385,7 @@ class StarPilotGame : public BasicAbstractGame {
                 b_vx = b_vx * bv_scale;
                 b_vy = b_vy * bv_scale;
 
-                std::shared_ptr<Entity> new_bullet(new Entity(m->x, m->y, b_vx, b_vy, bullet_r, bullet_type));
+                auto new_bullet = entity_pool.make(m->x, m->y, b_vx, b_vy, bullet_r, bullet_type);
                 new_bullet->face_direction(b_vx, b_vy, -1 * PI / 2);
                 entities.push_back(new_bullet);
             }
@@ -413,7 +413,7 @@ class StarPilotGame : public BasicAbstractGame {
             float vy = sin(theta) * v_scale;
             float x_off = agent->rx * cos(theta);
 
-            auto bullet = std::make_shared<Entity>(agent->x + x_off, agent->y, vx, vy, bullet_r, BULLET_PLAYER);
+            auto bullet = entity_pool.make(agent->x + x_off, agent->y, vx, vy, bullet_r, BULLET_PLAYER);
             bullet->collides_with_entities = true;
             bullet->face_direction(vx, vy);
             bullet->rotation -= PI / 2;
@@ -421,7 +421,7 @@ class StarPilotGame : public BasicAbstractGame {
         }
 
         if (cur_time == SHOOTER_WIN_TIME) {
-            auto finish = std::make_shared<Entity>(main_width, main_height / 2, -1 * hp_slow_v * V_SCALE, 0, 2, main_height / 2, FINISH_LINE);
+            auto finish = entity_pool.make(main_width, main_height / 2, -1 * hp_slow_v * V_SCALE, 0, 2, main_height / 2, FINISH_LINE);
             choose_random_theme(finish);
             match_aspect_ratio(finish, false);
             finish->x = main_width + finish->rx;
@@ -440,6 +440,13 @@ class StarPilotGame : public BasicAbstractGame {
 
         init_hps();
     }
+
+    void copy_entities(EntityCopier &copier) override {
+        BasicAbstractGame::copy_entities(copier);
+        for (auto &spawner : spawners) {
+            spawner = copier.copy(spawner);
+        }
+    }
 };
 
 REGISTER_GAME(NAME, StarPilotGame);
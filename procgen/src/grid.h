@@ -69,12 +69,12 @@ class Grid {
     void serialize(WriteBuffer *b) {
         b->write_int(w);
         b->write_int(h);
-        b->write_vector_int(data);
+        b->write_compressed_vector_int(data);
     };
 
     void deserialize(ReadBuffer *b) {
         w = b->read_int();
         h = b->read_int();
-        data = b->read_vector_int();
+        data = b->version == 0 ? b->read_vector_int() : b->read_compressed_vector_int();
     };
 };
@@ -0,0 +1,140 @@
+#include "levelcache.h"
+#include <atomic>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+
+#if defined(_WIN32)
+#include <process.h>
+#define getpid _getpid
+#else
+#include <unistd.h>
+#endif
+
+const char LEVEL_FILE_MAGIC[8] = {'P', 'G', 'L', 'E', 'V', 'E', 'L', '\0'};
+
+LevelCache::LevelCache(size_t max_bytes, const std::string &dir)
+    : max_bytes(max_bytes), dir(dir) {
+}
+
+std::shared_ptr<const LevelSnapshot> LevelCache::get(const std::string &key) {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        auto it = entries.find(key);
+        if (it != entries.end()) {
+            lru.splice(lru.begin(), lru, it->second.lru_it);
+            stats.hits++;
+            return it->second.snapshot;
+        }
+    }
+
+    // look on disk without holding the lock, other threads may be generating levels meanwhile
+    auto snapshot = load(key);
+
+    std::lock_guard<std::mutex> lock(mutex);
+    if (snapshot == nullptr) {
+        stats.misses++;
+        return nullptr;
+    }
+    stats.hits++;
+    stats.disk_hits++;
+    insert(key, snapshot);
+    return snapshot;
+}
+
+void LevelCache::put(const std::string &key, const char *data, size_t size) {
+    auto snapshot = std::make_shared<LevelSnapshot>();
+    snapshot->storage.assign(data, data + size);
+    snapshot->data = snapshot->storage.data();
+    snapshot->size = size;
+
+    if (dir != "") {
+        store(key, data, size);
+    }
+
+    std::lock_guard<std::mutex> lock(mutex);
+    insert(key, snapshot);
+}
+
+LevelCacheStats LevelCache::get_stats() {
+    std::lock_guard<std::mutex> lock(mutex);
+    return stats;
+}
+
+void LevelCache::insert(const std::string &key, const std::shared_ptr<const LevelSnapshot> &snapshot) {
+    if (entries.find(key) != entries.end() || snapshot->size > max_bytes) {
+        return;
+    }
+
+    lru.push_front(key);
+    entries[key] = Entry{snapshot, lru.begin()};
+    stats.num_snapshots++;
+    stats.num_bytes += snapshot->size;
+
+    while ((size_t)(stats.num_bytes) > max_bytes) {
+        auto &evicted = entries.at(lru.back());
+        stats.num_snapshots--;
+        stats.num_bytes -= evicted.snapshot->size;
+        stats.evictions++;
+        entries.erase(lru.back());
+        lru.pop_back();
+    }
+}
+
+std::string LevelCache::get_path(const std::string &key) {
+    // FNV-1a, the key is also stored in the file in case of collisions
+    uint64_t hash = 0xcbf29ce484222325;
+    for (unsigned char c : key) {
+        hash = (hash ^ c) * 0x100000001b3;
+    }
+    char name[32];
+    snprintf(name, sizeof(name), "%016llx.level", (unsigned long long)(hash));
+    return dir + "/" + name;
+}
+
+std::shared_ptr<const LevelSnapshot> LevelCache::load(const std::string &key) {
+    if (dir == "") {
+        return nullptr;
+    }
+
+    auto file = std::unique_ptr<MappedFile>(new MappedFile());
+    if (!file->open(get_path(key))) {
+        return nullptr;
+    }
+
+    size_t header_size = sizeof(LEVEL_FILE_MAGIC) + sizeof(uint32_t) + key.size();
+    uint32_t key_size;
+    if (file->size() < header_size || memcmp(file->data(), LEVEL_FILE_MAGIC, sizeof(LEVEL_FILE_MAGIC)) != 0) {
+        return nullptr;
+    }
+    memcpy(&key_size, file->data() + sizeof(LEVEL_FILE_MAGIC), sizeof(key_size));
+    if (key_size != key.size() || memcmp(file->data() + sizeof(LEVEL_FILE_MAGIC) + sizeof(key_size), key.data(), key.size()) != 0) {
+        return nullptr;
+    }
+
+    auto snapshot = std::make_shared<LevelSnapshot>();
+    snapshot->data = file->data() + header_size;
+    snapshot->size = file->size() - header_size;
+    snapshot->file = std::move(file);
+    return snapshot;
+}
+
+void LevelCache::store(const std::string &key, const char *data, size_t size) {
+    auto path = get_path(key);
+
+    // write to a file of our own and rename it into place, so readers never see a partial file
+    static std::atomic<uint64_t> tmp_counter(0);
+    auto tmp_path = path + ".tmp" + std::to_string(getpid()) + "-" + std::to_string(tmp_counter++);
+    std::ofstream f(tmp_path, std::ios::binary | std::ios::trunc);
+    uint32_t key_size = key.size();
+    f.write(LEVEL_FILE_MAGIC, sizeof(LEVEL_FILE_MAGIC));
+    f.write((const char *)(&key_size), sizeof(key_size));
+    f.write(key.data(), key.size());
+    f.write(data, size);
+    f.close();
+
+    // a level that can't be stored will just be generated again
+    if (!f || std::rename(tmp_path.c_str(), path.c_str()) != 0) {
+        std::remove(tmp_path.c_str());
+    }
+}
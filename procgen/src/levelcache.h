@@ -0,0 +1,76 @@
+#pragma once
+
+/*
+
+Cache of the states of games right after game_reset(), so that levels that are played again are
+restored instead of generated again, see Game::reset()
+
+Snapshots are serialized game states, keyed by a string naming the game, its options and the level
+seed (see Game::level_cache_key()). Up to max_bytes of snapshots are kept in memory, the least
+recently used ones are evicted first.
+
+If dir is not empty, every snapshot is also written to a file in dir, and snapshots that are not in
+memory are looked for there before a level is generated, so all processes on a machine share the
+levels generated by any of them. Snapshot files are mapped instead of read, so the processes also
+share the memory of the snapshots they load. A file starts with LEVEL_FILE_MAGIC, then the length of
+the key as a 4 byte int, the key, and the snapshot.
+
+*/
+
+#include "mappedfile.h"
+#include <cstdint>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+struct LevelSnapshot {
+    const char *data = nullptr;
+    size_t size = 0;
+    // data points into one of these
+    std::vector<char> storage;
+    std::unique_ptr<MappedFile> file;
+};
+
+struct LevelCacheStats {
+    int64_t num_snapshots = 0;
+    int64_t num_bytes = 0;
+    int64_t hits = 0;
+    // hits that had to load the snapshot from dir
+    int64_t disk_hits = 0;
+    int64_t misses = 0;
+    int64_t evictions = 0;
+};
+
+class LevelCache {
+  public:
+    LevelCache(size_t max_bytes, const std::string &dir);
+
+    // returns nullptr if there is no snapshot for key
+    std::shared_ptr<const LevelSnapshot> get(const std::string &key);
+    void put(const std::string &key, const char *data, size_t size);
+    LevelCacheStats get_stats();
+
+  private:
+    struct Entry {
+        std::shared_ptr<const LevelSnapshot> snapshot;
+        std::list<std::string>::iterator lru_it;
+    };
+
+    size_t max_bytes;
+    std::string dir;
+
+    std::mutex mutex;
+    // most recently used keys first
+    std::list<std::string> lru;
+    std::unordered_map<std::string, Entry> entries;
+    LevelCacheStats stats;
+
+    std::string get_path(const std::string &key);
+    std::shared_ptr<const LevelSnapshot> load(const std::string &key);
+    void store(const std::string &key, const char *data, size_t size);
+    // must be called with mutex held
+    void insert(const std::string &key, const std::shared_ptr<const LevelSnapshot> &snapshot);
+};
@@ -0,0 +1,148 @@
+#include "lz.h"
+#include <cstring>
+#include <vector>
+
+namespace {
+
+const int HASH_BITS = 12;
+const size_t MAX_OFFSET = 65535;
+const size_t NIBBLE_MAX = 15;
+
+inline uint32_t read_u32(const uint8_t *p) {
+    return p[0] | (p[1] << 8) | (p[2] << 16) | ((uint32_t)(p[3]) << 24);
+}
+
+inline uint32_t hash_u32(uint32_t v) {
+    return (v * 2654435761u) >> (32 - HASH_BITS);
+}
+
+uint8_t *write_count(uint8_t *op, size_t count) {
+    while (count >= 255) {
+        *op++ = 255;
+        count -= 255;
+    }
+    *op++ = (uint8_t)(count);
+    return op;
+}
+
+bool read_count(const uint8_t *&ip, const uint8_t *iend, size_t *count) {
+    uint8_t b;
+    do {
+        if (ip >= iend) {
+            return false;
+        }
+        b = *ip++;
+        *count += b;
+    } while (b == 255);
+    return true;
+}
+
+// a match_length of 0 means a sequence with literals only, which ends the block
+uint8_t *write_sequence(uint8_t *op, const uint8_t *literals, size_t num_literals, size_t offset, size_t match_length) {
+    size_t match_extra = match_length > 0 ? match_length - LZ_MIN_MATCH : 0;
+    size_t literal_nibble = num_literals < NIBBLE_MAX ? num_literals : NIBBLE_MAX;
+    size_t match_nibble = match_extra < NIBBLE_MAX ? match_extra : NIBBLE_MAX;
+    *op++ = (uint8_t)((literal_nibble << 4) | match_nibble);
+    if (num_literals >= NIBBLE_MAX) {
+        op = write_count(op, num_literals - NIBBLE_MAX);
+    }
+    memcpy(op, literals, num_literals);
+    op += num_literals;
+    if (match_length > 0) {
+        *op++ = (uint8_t)(offset & 0xff);
+        *op++ = (uint8_t)(offset >> 8);
+        if (match_extra >= NIBBLE_MAX) {
+            op = write_count(op, match_extra - NIBBLE_MAX);
+        }
+    }
+    return op;
+}
+
+} // namespace
+
+size_t lz_compress_bound(size_t src_size) {
+    return src_size + src_size / 255 + 16;
+}
+
+size_t lz_compress(const uint8_t *src, size_t src_size, uint8_t *dst) {
+    std::vector<int64_t> table(1 << HASH_BITS, -1);
+    uint8_t *op = dst;
+    size_t anchor = 0;
+    size_t i = 0;
+
+    // stop looking for matches when there are no longer LZ_MIN_MATCH bytes left to hash
+    while (i + LZ_MIN_MATCH < src_size) {
+        uint32_t v = read_u32(src + i);
+        uint32_t h = hash_u32(v);
+        int64_t candidate = table[h];
+        table[h] = i;
+
+        if (candidate >= 0 && i - candidate <= MAX_OFFSET && read_u32(src + candidate) == v) {
+            size_t length = LZ_MIN_MATCH;
+            while (i + length < src_size && src[candidate + length] == src[i + length]) {
+                length++;
+            }
+            op = write_sequence(op, src + anchor, i - anchor, i - candidate, length);
+            i += length;
+            anchor = i;
+        } else {
+            i++;
+        }
+    }
+
+    op = write_sequence(op, src + anchor, src_size - anchor, 0, 0);
+    return op - dst;
+}
+
+bool lz_decompress(const uint8_t *src, size_t src_size, uint8_t *dst, size_t dst_size) {
+    const uint8_t *ip = src;
+    const uint8_t *iend = src + src_size;
+    uint8_t *op = dst;
+    uint8_t *oend = dst + dst_size;
+
+    while (ip < iend) {
+        uint8_t token = *ip++;
+
+        size_t num_literals = token >> 4;
+        if (num_literals == NIBBLE_MAX && !read_count(ip, iend, &num_literals)) {
+            return false;
+        }
+        if (num_literals > (size_t)(iend - ip) || num_literals > (size_t)(oend - op)) {
+            return false;
+        }
+        memcpy(op, ip, num_literals);
+        ip += num_literals;
+        op += num_literals;
+
+        if (ip == iend) {
+            break;
+        }
+
+        if (iend - ip < 2) {
+            return false;
+        }
+        size_t offset = ip[0] | (ip[1] << 8);
+        ip += 2;
+        if (offset == 0 || offset > (size_t)(op - dst)) {
+            return false;
+        }
+
+        size_t length = token & 0xf;
+        if (length == NIBBLE_MAX && !read_count(ip, iend, &length)) {
+            return false;
+        }
+        length += LZ_MIN_MATCH;
+        if (length > (size_t)(oend - op)) {
+            return false;
+        }
+
+        // copy byte by byte, matches may overlap the bytes they produce
+        const uint8_t *match = op - offset;
+        for (size_t k = 0; k < length; k++) {
+            op[k] = match[k];
+        }
+        op += length;
+    }
+
+    return op == oend;
+}
@@ -0,0 +1,27 @@
+#pragma once
+
+/*
+
+Small LZ77 block compressor in the style of LZ4, used to shrink large grids in serialized states
+
+A block is a series of sequences, each one a token byte (literal count in the high nibble, match
+length - LZ_MIN_MATCH in the low nibble), extra literal count bytes, the literals, a 2 byte
+little endian match offset and extra match length bytes. A nibble of 15 means the count continues
+in the following bytes, each one added to it until a byte that is not 255. The last sequence of
+a block has literals only.
+
+*/
+
+#include <cstddef>
+#include <cstdint>
+
+const int LZ_MIN_MATCH = 4;
+
+// worst case size of the compressed form of src_size bytes
+size_t lz_compress_bound(size_t src_size);
+
+// returns the compressed size, dst must have room for lz_compress_bound(src_size) bytes
+size_t lz_compress(const uint8_t *src, size_t src_size, uint8_t *dst);
+
+// returns false if src is not a valid block that decompresses to exactly dst_size bytes
+bool lz_decompress(const uint8_t *src, size_t src_size, uint8_t *dst, size_t dst_size);
@@ -0,0 +1,53 @@
+#include "mappedfile.h"
+
+#if defined(_WIN32)
+#include <fstream>
+#include <iterator>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+MappedFile::~MappedFile() {
+#if !defined(_WIN32)
+    if (mapped_data != nullptr) {
+        munmap(mapped_data, mapped_size);
+    }
+#endif
+}
+
+bool MappedFile::open(const std::string &path) {
+#if defined(_WIN32)
+    std::ifstream f(path, std::ios::binary);
+    if (!f) {
+        return false;
+    }
+    contents.assign(std::istreambuf_iterator<char>(f), std::istreambuf_iterator<char>());
+    if (contents.empty()) {
+        return false;
+    }
+    mapped_data = contents.data();
+    mapped_size = contents.size();
+    return true;
+#else
+    int fd = ::open(path.c_str(), O_RDONLY);
+    if (fd < 0) {
+        return false;
+    }
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size == 0) {
+        close(fd);
+        return false;
+    }
+    void *data = mmap(nullptr, st.st_size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED) {
+        return false;
+    }
+    mapped_data = (char *)(data);
+    mapped_size = st.st_size;
+    return true;
+#endif
+}
@@ -0,0 +1,38 @@
+#pragma once
+
+/*
+
+Read only view of a whole file, mapped into memory where mmap is available
+
+The mapping is private, so the pages are shared with every other process mapping the same file
+and are only copied if they are written to.
+
+*/
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+class MappedFile {
+  public:
+    MappedFile() = default;
+    MappedFile(const MappedFile &) = delete;
+    MappedFile &operator=(const MappedFile &) = delete;
+    ~MappedFile();
+
+    // returns false if the file can't be opened or is empty
+    bool open(const std::string &path);
+
+    char *data() const {
+        return mapped_data;
+    }
+    size_t size() const {
+        return mapped_size;
+    }
+
+  private:
+    char *mapped_data = nullptr;
+    size_t mapped_size = 0;
+    // without mmap, the contents are read into this instead
+    std::vector<char> contents;
+};
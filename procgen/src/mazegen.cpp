@@ -1,6 +1,8 @@
 #include "mazegen.h"
 #include "object-ids.h"
 #include "cpp-utils.h"
+#include <algorithm>
+#include <numeric>
 
 struct Wall {
     int x1;
@@ -9,26 +11,93 @@ struct Wall {
     int y2;
 };
 
+namespace {
+
+// The walls that are left to look at, in their original order. generate_maze() picks the nth
+// remaining wall with randn(), so removing a wall must keep the order of the others for the same
+// draws to make the same maze. A fenwick tree over which walls remain finds the nth one in
+// O(log n) instead of erasing it from a vector in O(n).
+class RemainingWalls {
+  public:
+    explicit RemainingWalls(int num_walls) : counts(num_walls + 1) {
+        size = num_walls;
+        for (int i = 1; i <= num_walls; i++) {
+            // every node starts out counting the whole range it covers
+            counts[i] = i & -i;
+        }
+    }
+
+    // index of the nth remaining wall, which is removed
+    int remove_nth(int n) {
+        int idx = 0;
+        int remaining = n + 1;
+        for (int step = top_bit(); step > 0; step >>= 1) {
+            if (idx + step < (int)(counts.size()) && counts[idx + step] < remaining) {
+                idx += step;
+                remaining -= counts[idx];
+            }
+        }
+        for (int i = idx + 1; i < (int)(counts.size()); i += i & -i) {
+            counts[i] -= 1;
+        }
+        size -= 1;
+        return idx;
+    }
+
+    int size;
+
+  private:
+    std::vector<int> counts;
+
+    int top_bit() {
+        int bit = 1;
+        while (bit * 2 < (int)(counts.size())) {
+            bit *= 2;
+        }
+        return bit;
+    }
+};
+
+} // namespace
+
 MazeGen::MazeGen(RandGen *_rand_gen, int _maze_dim) {
     rand_gen = _rand_gen;
     maze_dim = _maze_dim;
     array_dim = maze_dim + 2;
-    cell_sets.resize(array_dim * array_dim);
-    cell_sets_idxs.resize(array_dim * array_dim);
+    set_parents.resize(array_dim * array_dim);
+    set_sizes.resize(array_dim * array_dim);
+    is_free_cell.resize(array_dim * array_dim);
     free_cells.resize(array_dim * array_dim);
     grid.resize(array_dim, array_dim);
 }
 
+int MazeGen::find_set(int cell) {
+    while (set_parents[cell] != cell) {
+        // path halving, point every other cell on the way at its grandparent
+        set_parents[cell] = set_parents[set_parents[cell]];
+        cell = set_parents[cell];
+    }
+    return cell;
+}
+
+void MazeGen::join_sets(int root0, int root1) {
+    if (set_sizes[root0] > set_sizes[root1]) {
+        std::swap(root0, root1);
+    }
+    set_parents[root0] = root1;
+    set_sizes[root1] += set_sizes[root0];
+}
+
 int MazeGen::lookup(int x, int y) {
-    return cell_sets_idxs[maze_dim * y + x];
+    return find_set(maze_dim * y + x);
 }
 
 void MazeGen::set_free_cell(int x, int y) {
     grid.set(x + MAZE_OFFSET, y + MAZE_OFFSET, SPACE);
     int cell = maze_dim * y + x;
-    if (free_cell_set.find(cell) == free_cell_set.end()) {
+    if (!is_free_cell[cell]) {
         free_cells[num_free_cells] = cell;
-        free_cell_set.insert(cell);
+        is_free_cell[cell] = true;
         num_free_cells += 1;
     }
 }
@@ -66,23 +135,31 @@ void MazeGen::get_neighbors(int idx, int type, std::vector<int> &neighbors) {
     }
 }
 
-int MazeGen::expand_to_type(std::set<int> &s0, std::set<int> &s1, int type) {
-    std::set<int> curr = s0;
+// s0 and s1 are bitsets over the cell indices, each step of the search visits its cells in index
+// order, which decides the cell that is returned when several are found in the same step
+int MazeGen::expand_to_type(const std::vector<bool> &s0, std::vector<bool> &s1, int type) {
+    std::vector<int> curr;
+    for (int i = 0; i < (int)(s0.size()); i++) {
+        if (s0[i]) {
+            curr.push_back(i);
+        }
+    }
 
+    std::vector<int> next;
     std::vector<int> target_elems;
     std::vector<int> adj_space;
 
     while (curr.size() > 0) {
-        std::set<int> next;
+        next.clear();
 
         for (int elem : curr) {
             get_neighbors(elem, type, target_elems);
             get_neighbors(elem, SPACE, adj_space);
 
             for (int j : adj_space) {
-                if (!set_contains(s0, j) && !set_contains(s1, j)) {
-                    next.insert(j);
-                    s1.insert(j);
+                if (!s0[j] && !s1[j]) {
+                    next.push_back(j);
+                    s1[j] = true;
                 }
             }
 
@@ -91,7 +168,8 @@ int MazeGen::expand_to_type(std::set<int> &s0, std::set<int> &s1, int type) {
             }
         }
 
-        curr = next;
+        std::sort(next.begin(), next.end());
+        curr.swap(next);
     }
 
     return -1;
@@ -121,19 +199,11 @@ void MazeGen::generate_maze() {
     std::vector<Wall> walls;
 
     num_free_cells = 0;
-    free_cell_set.clear();
-
-    std::set<int> *s0 = &cell_sets[0];
-    s0->clear();
-    s0->insert(0);
-    cell_sets_idxs[0] = 0;
-
-    for (int i = 1; i < maze_dim * maze_dim; i++) {
-        std::set<int> *s1 = &cell_sets[i];
-        s1->clear();
-        s1->insert(i);
-        cell_sets_idxs[i] = i;
-    }
+    std::fill(is_free_cell.begin(), is_free_cell.end(), false);
+
+    // every cell starts out in a set of its own
+    std::iota(set_parents.begin(), set_parents.end(), 0);
+    std::fill(set_sizes.begin(), set_sizes.end(), 1);
 
     for (int i = 1; i < maze_dim; i += 2) {
         for (int j = 0; j < maze_dim; j += 2) {
@@ -151,38 +221,30 @@ void MazeGen::generate_maze() {
         }
     }
 
-    while (walls.size() > 0) {
-        int n = rand_gen->randn((int)(walls.size()));
-        Wall wall = walls[n];
+    RemainingWalls remaining_walls((int)(walls.size()));
+
+    while (remaining_walls.size > 0) {
+        int n = rand_gen->randn(remaining_walls.size);
+        Wall wall = walls[remaining_walls.remove_nth(n)];
 
         int s0_idx = lookup(wall.x1, wall.y1);
-        s0 = &cell_sets[s0_idx];
         int s1_idx = lookup(wall.x2, wall.y2);
-        std::set<int> *s1 = &cell_sets[s1_idx];
 
         int x0 = (wall.x1 + wall.x2) / 2;
         int y0 = (wall.y1 + wall.y2) / 2;
-        int center = maze_dim * y0 + x0;
 
         bool can_remove =
             (grid.get(x0 + MAZE_OFFSET, y0 + MAZE_OFFSET) == WALL_OBJ) &&
             (s0_idx != s1_idx);
 
+        // the cell in the middle of a wall is never looked up, so only the two sides are joined
         if (can_remove) {
             set_free_cell(wall.x1, wall.y1);
             set_free_cell(x0, y0);
             set_free_cell(wall.x2, wall.y2);
 
-            s1->insert(s0->begin(), s0->end());
-            s1->insert(center);
-
-            std::set<int>::iterator it;
-            for (it = s1->begin(); it != s1->end(); ++it) {
-                cell_sets_idxs[*it] = s1_idx;
-            }
+            join_sets(s0_idx, s1_idx);
         }
-
-        walls.erase(walls.begin() + n);
     }
 }
 
@@ -216,12 +278,10 @@ void MazeGen::generate_maze_with_doors(int num_doors) {
     std::vector<int> forks;
 
     std::vector<int> adj_space;
-    std::vector<int> adj_wall;
 
     for (int i = 0; i < array_dim * array_dim; i++) {
         if (get_obj(i) == SPACE) {
             get_neighbors(i, SPACE, adj_space);
-            get_neighbors(i, WALL_OBJ, adj_wall);
 
             if (adj_space.size() > 2) {
                 forks.push_back(i);
@@ -253,25 +313,34 @@ void MazeGen::generate_maze_with_doors(int num_doors) {
         grid.set_index(agent_cell, AGENT_OBJ);
     }
 
-    std::set<int> s0;
-    s0.insert(agent_cell);
+    int num_cells = array_dim * array_dim;
+
+    // s0 holds the cells reachable without the remaining doors, s1 the ones added behind a door
+    std::vector<bool> s0(num_cells);
+    s0[agent_cell] = true;
+
+    std::vector<int> space_cells;
 
     for (int door_num = 0; door_num < num_doors + 1; door_num++) {
-        std::set<int> s1;
+        std::vector<bool> s1(num_cells);
         int found_door = -1;
 
         if (door_num < num_doors) {
             found_door = expand_to_type(s0, s1, DOOR_OBJ);
             grid.set_index(found_door, DOOR_OBJ + door_num + 1);
-            s0.insert(s1.begin(), s1.end());
+            for (int i = 0; i < num_cells; i++) {
+                s0[i] = s0[i] || s1[i];
+            }
         }
 
         expand_to_type(s0, s1, -999);
 
-        std::vector<int> space_cells;
+        space_cells.clear();
 
-        for (int x : s1) {
-            space_cells.push_back(x);
+        for (int i = 0; i < num_cells; i++) {
+            if (s1[i]) {
+                space_cells.push_back(i);
+            }
         }
 
         fassert(space_cells.size() > 0);
@@ -281,10 +350,12 @@ void MazeGen::generate_maze_with_doors(int num_doors) {
                                      ? EXIT_OBJ
                                      : (KEY_OBJ + door_num + 1));
 
-        s0.insert(s1.begin(), s1.end());
+        for (int i = 0; i < num_cells; i++) {
+            s0[i] = s0[i] || s1[i];
+        }
 
         if (found_door >= 0) {
-            s0.insert(found_door);
+            s0[found_door] = true;
         }
     }
 }
@@ -7,7 +7,7 @@ Generate a maze using kruskal's algorithm
 */
 
 #include <memory>
-#include <set>
+#include <vector>
 #include "grid.h"
 #include "randgen.h"
 
@@ -29,17 +29,20 @@ class MazeGen {
     int array_dim;
 
     int num_free_cells;
-    std::vector<std::set<int>> cell_sets;
-    std::vector<int> cell_sets_idxs;
-    std::set<int> free_cell_set;
+    // disjoint set forest of the maze cells that have been joined by removing walls
+    std::vector<int> set_parents;
+    std::vector<int> set_sizes;
+    std::vector<bool> is_free_cell;
     std::vector<int> free_cells;
 
     void get_neighbors(int idx, int type, std::vector<int> &neighbors);
+    int find_set(int cell);
+    void join_sets(int root0, int root1);
     int lookup(int x, int y);
     void set_free_cell(int x, int y);
     void set_obj(int idx, int type);
     int to_index(int x, int y);
     int get_obj(int idx);
     std::vector<int> filter_cells(int type);
-    int expand_to_type(std::set<int> &s0, std::set<int> &s1, int type);
+    int expand_to_type(const std::vector<bool> &s0, std::vector<bool> &s1, int type);
 };
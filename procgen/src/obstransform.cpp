@@ -0,0 +1,117 @@
+#include "obstransform.h"
+
+#include <algorithm>
+#include <cstring>
+
+int ObsTransform::get_shape(int w, int h, int *shape) const {
+    int c = channels() * frame_stack;
+    if (chw) {
+        shape[0] = c;
+        shape[1] = h / downsample;
+        shape[2] = w / downsample;
+    } else {
+        shape[0] = h / downsample;
+        shape[1] = w / downsample;
+        shape[2] = c;
+    }
+    return 3;
+}
+
+void transform_frame(const ObsTransform &transform, uint8_t *dst, const uint32_t *src, int w, int h) {
+    const uint8_t *src_bytes = (const uint8_t *)src;
+    int d = transform.downsample;
+    int out_w = w / d;
+    int out_h = h / d;
+    int num_pixels = out_w * out_h;
+    int block = d * d;
+
+    for (int y = 0; y < out_h; y++) {
+        for (int x = 0; x < out_w; x++) {
+            int r = 0;
+            int g = 0;
+            int b = 0;
+            for (int dy = 0; dy < d; dy++) {
+                const uint8_t *s = src_bytes + ((y * d + dy) * w + x * d) * 4;
+                for (int dx = 0; dx < d; dx++) {
+                    b += s[0];
+                    g += s[1];
+                    r += s[2];
+                    s += 4;
+                }
+            }
+            if (block > 1) {
+                r = (r + block / 2) / block;
+                g = (g + block / 2) / block;
+                b = (b + block / 2) / block;
+            }
+
+            int p = y * out_w + x;
+            if (transform.grayscale) {
+                dst[p] = (uint8_t)((77 * r + 150 * g + 29 * b + 128) >> 8);
+            } else if (transform.chw) {
+                dst[p] = (uint8_t)r;
+                dst[num_pixels + p] = (uint8_t)g;
+                dst[2 * num_pixels + p] = (uint8_t)b;
+            } else {
+                dst[3 * p] = (uint8_t)r;
+                dst[3 * p + 1] = (uint8_t)g;
+                dst[3 * p + 2] = (uint8_t)b;
+            }
+        }
+    }
+}
+
+void FrameStack::clear() {
+    std::fill(frames.begin(), frames.end(), 0);
+}
+
+uint8_t *FrameStack::push(const ObsTransform &transform, int w, int h) {
+    size_t frame_size = transform.frame_size(w, h);
+    if (frames.size() != frame_size * transform.frame_stack) {
+        frames.assign(frame_size * transform.frame_stack, 0);
+        newest = 0;
+    }
+    newest = (newest + 1) % transform.frame_stack;
+    return frames.data() + newest * frame_size;
+}
+
+void FrameStack::write(const ObsTransform &transform, uint8_t *dst, int w, int h) const {
+    int k = transform.frame_stack;
+    int frame_size = transform.frame_size(w, h);
+
+    if (transform.chw) {
+        // the frames are whole planes, one after the other
+        for (int j = 0; j < k; j++) {
+            int idx = (newest + 1 + j) % k;
+            memcpy(dst + j * frame_size, frames.data() + idx * frame_size, frame_size);
+        }
+        return;
+    }
+
+    // the channels of the frames are interleaved for every pixel
+    int c = transform.channels();
+    int num_pixels = frame_size / c;
+    for (int j = 0; j < k; j++) {
+        const uint8_t *src = frames.data() + ((newest + 1 + j) % k) * frame_size;
+        uint8_t *d = dst + j * c;
+        for (int p = 0; p < num_pixels; p++) {
+            for (int ch = 0; ch < c; ch++) {
+                d[ch] = src[ch];
+            }
+            src += c;
+            d += c * k;
+        }
+    }
+}
+
+void FrameStack::serialize(WriteBuffer *b) const {
+    b->write_int(newest);
+    b->write_int((int)(frames.size()));
+    b->write_bytes(frames.data(), frames.size());
+}
+
+void FrameStack::deserialize(ReadBuffer *b) {
+    newest = b->read_int();
+    frames.resize(b->read_int());
+    b->read_bytes(frames.data(), frames.size());
+}
@@ -0,0 +1,75 @@
+#pragma once
+
+/*
+
+Transforms of the rgb observation done by the stepping threads right after rendering, instead of
+by wrappers on the python thread: grayscale, downsampling, channels first (CHW) layout and
+stacking of the last frames
+
+Each frame is first downsampled by averaging blocks of downsample by downsample pixels of every
+channel, then converted to grayscale with the ITU-R 601 luma weights in 8 bit fixed point, and
+laid out as (height, width, channels) or (channels, height, width).
+
+Stacked frames are kept in a ring of the last frame_stack transformed frames of each game, since
+the observation buffers of a game change between steps (pipelining, rollout buffers). The
+observation has the frames oldest first, concatenated along the channels, so it is
+(height, width, channels * frame_stack) or (channels * frame_stack, height, width). Frames from
+before the start of an episode are zeros.
+
+*/
+
+#include <cstdint>
+#include <vector>
+
+#include "buffer.h"
+
+struct ObsTransform {
+    bool grayscale = false;
+    int downsample = 1;
+    bool chw = false;
+    int frame_stack = 1;
+
+    bool operator==(const ObsTransform &other) const {
+        return grayscale == other.grayscale && downsample == other.downsample && chw == other.chw &&
+               frame_stack == other.frame_stack;
+    }
+
+    bool is_identity() const {
+        return !grayscale && downsample == 1 && !chw && frame_stack == 1;
+    }
+
+    int channels() const {
+        return grayscale ? 1 : 3;
+    }
+
+    // size in bytes of one transformed frame of a w by h observation
+    int frame_size(int w, int h) const {
+        return (w / downsample) * (h / downsample) * channels();
+    }
+
+    // write the shape of the observation of a w by h image into shape, returns the number of
+    // dimensions
+    int get_shape(int w, int h, int *shape) const;
+};
+
+// transform the w by h bgr32 image src into one frame at dst
+void transform_frame(const ObsTransform &transform, uint8_t *dst, const uint32_t *src, int w, int h);
+
+// the last frame_stack transformed frames of a game, see write() for the observation
+class FrameStack {
+  public:
+    // forget the previous frames, the next push() starts a new episode
+    void clear();
+    // the frame to transform the newest image into, the oldest frame is dropped
+    uint8_t *push(const ObsTransform &transform, int w, int h);
+    // write the stacked frames of a w by h observation to dst, oldest first
+    void write(const ObsTransform &transform, uint8_t *dst, int w, int h) const;
+
+    void serialize(WriteBuffer *b) const;
+    void deserialize(ReadBuffer *b);
+
+  private:
+    std::vector<uint8_t> frames;
+    // the ring position of the newest frame
+    int newest = 0;
+};
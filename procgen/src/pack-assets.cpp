@@ -0,0 +1,22 @@
+#include "resources.h"
+#include "cpp-utils.h"
+
+/*
+
+Build time tool that decodes every asset in a resource root and packs them into an asset atlas,
+see resources.h for the format
+
+usage: pack-assets <resource root> <atlas path>
+
+*/
+
+int main(int argc, char **argv) {
+    if (argc != 3) {
+        fprintf(stderr, "usage: %s <resource root> <atlas path>\n", argv[0]);
+        return 1;
+    }
+
+    global_resource_root = argv[1];
+    write_asset_atlas(argv[2]);
+    return 0;
+}
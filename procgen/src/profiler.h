@@ -0,0 +1,134 @@
+#pragma once
+
+/*
+
+Counters used to profile where the time of the environments goes, enabled with the profile option
+
+Every phase that is profiled (a part of a game step, the work of a stepping thread, ...) has a
+PhaseProfile with the number of times it ran, its total time, and a histogram of its latencies in
+power of two buckets: bucket b counts the latencies from 2^b up to 2^(b+1) nanoseconds, with
+latencies below 2 ns in bucket 0 and the ones above the last bucket in the last bucket.
+
+A ProfileTimer measures the time until it goes out of scope and adds it to a PhaseProfile, it does
+nothing when it is given nullptr, which is how profiling is disabled: the cost is then one branch
+per phase. Each PhaseProfile is only written by one thread at a time, so there is no locking.
+
+The layout returned by get_profile() in vecgame.cpp should match get_profile() in env.py.
+
+*/
+
+#include <cstdint>
+#if !defined(__CHEERP__)
+#include <chrono>
+#endif
+
+const int NUM_PROFILE_BUCKETS = 40;
+
+struct PhaseProfile {
+    int64_t count = 0;
+    int64_t total_ns = 0;
+    int64_t buckets[NUM_PROFILE_BUCKETS] = {};
+
+    void add(int64_t ns) {
+        int bucket = 0;
+        while (bucket < NUM_PROFILE_BUCKETS - 1 && (ns >> (bucket + 1)) > 0) {
+            bucket++;
+        }
+        count++;
+        total_ns += ns;
+        buckets[bucket]++;
+    }
+
+    // copy the count, total time and buckets into dst, which has room for PROFILE_STRIDE ints
+    void write(int64_t *dst) const {
+        dst[0] = count;
+        dst[1] = total_ns;
+        for (int b = 0; b < NUM_PROFILE_BUCKETS; b++) {
+            dst[2 + b] = buckets[b];
+        }
+    }
+};
+
+const int PROFILE_STRIDE = 2 + NUM_PROFILE_BUCKETS;
+
+// the phases of a game, see where they are measured in game.cpp and vecgame.cpp
+enum GameProfilePhase {
+    // Game::reset(), mostly level generation
+    PROFILE_RESET = 0,
+    // game_step() without the resets of episodes that end
+    PROFILE_STEP = 1,
+    // drawing the observation
+    PROFILE_RENDER = 2,
+    // converting the drawn observation to rgb
+    PROFILE_CONVERT = 3,
+    // drawing and converting the image of render_mode="rgb_array"
+    PROFILE_RENDER_HIRES = 4,
+    NUM_GAME_PROFILE_PHASES = 5,
+};
+
+// the phases of a thread that runs batches, the stepping threads and the python thread
+enum ThreadProfilePhase {
+    // running a chunk of a batch
+    PROFILE_BUSY = 0,
+    // waiting for the next batch after running out of chunks, stepping threads only
+    PROFILE_IDLE = 1,
+    NUM_THREAD_PROFILE_PHASES = 2,
+};
+
+// the phases of the batch scheduler
+enum SchedulerProfilePhase {
+    // the python thread in wait_for_stepping_threads() while a batch is running, including the
+    // chunks it runs itself
+    PROFILE_WAIT = 0,
+    // from the first thread running out of chunks to the end of the batch
+    PROFILE_STRAGGLER = 1,
+    NUM_SCHEDULER_PROFILE_PHASES = 2,
+};
+
+struct GameProfile {
+    PhaseProfile phases[NUM_GAME_PROFILE_PHASES];
+};
+
+struct ThreadProfile {
+    PhaseProfile phases[NUM_THREAD_PROFILE_PHASES];
+    // when the thread last ran out of chunks, 0 while it is busy
+    int64_t idle_since_ns = 0;
+};
+
+struct SchedulerProfile {
+    PhaseProfile phases[NUM_SCHEDULER_PROFILE_PHASES];
+};
+
+#if defined(__CHEERP__)
+class ProfileTimer {
+  public:
+    explicit ProfileTimer(PhaseProfile *) {
+    }
+};
+#else
+inline int64_t profile_now_ns() {
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+class ProfileTimer {
+  public:
+    explicit ProfileTimer(PhaseProfile *phase) : phase(phase) {
+        if (phase != nullptr) {
+            start_ns = profile_now_ns();
+        }
+    }
+
+    ~ProfileTimer() {
+        if (phase != nullptr) {
+            phase->add(profile_now_ns() - start_ns);
+        }
+    }
+
+    ProfileTimer(const ProfileTimer &) = delete;
+    ProfileTimer &operator=(const ProfileTimer &) = delete;
+
+  private:
+    PhaseProfile *phase;
+    int64_t start_ns = 0;
+};
+#endif
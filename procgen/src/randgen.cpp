@@ -1,7 +1,7 @@
 #include "randgen.h"
 #include "cpp-utils.h"
 #include <set>
-#include <sstream>
+#include <cstdlib>
 
 int RandGen::randint(int low, int high) {
     fassert(is_seeded);
@@ -99,16 +99,37 @@ void RandGen::seed(int seed) {
 
 void RandGen::serialize(WriteBuffer *b) {
     b->write_int(is_seeded);
-    std::ostringstream ostream;
-    ostream << stdgen;
-    auto str = ostream.str();
-    b->write_string(str);
+    // the state words followed by the index, the same words as the text form of std::mt19937 has
+    // with libstdc++, which older versions of this function wrote
+    b->write_int(MersenneTwister::N + 1);
+    for (int i = 0; i < MersenneTwister::N; i++) {
+        b->write_fixed_int(stdgen.state[i]);
+    }
+    b->write_fixed_int(stdgen.index);
 }
 
 void RandGen::deserialize(ReadBuffer *b) {
     is_seeded = b->read_int();
-    auto str = b->read_string();
-    std::istringstream istream;
-    istream.str(str);
-    istream >> stdgen;
+    std::vector<uint32_t> words;
+    if (b->version == 0) {
+        // version 0 stores the text form
+        auto str = b->read_string();
+        const char *c = str.c_str();
+        char *end;
+        for (uint32_t word = strtoul(c, &end, 10); end != c; word = strtoul(c, &end, 10)) {
+            words.push_back(word);
+            c = end;
+        }
+    } else {
+        words.resize(b->read_int());
+        for (size_t i = 0; i < words.size(); i++) {
+            words[i] = b->read_fixed_int();
+        }
+    }
+    fassert(words.size() == MersenneTwister::N + 1);
+    for (int i = 0; i < MersenneTwister::N; i++) {
+        stdgen.state[i] = words[i];
+    }
+    stdgen.index = words[MersenneTwister::N];
+    fassert(stdgen.index <= MersenneTwister::N);
 }
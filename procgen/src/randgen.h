@@ -7,11 +7,60 @@ Random number generator with consistent behavior across platforms
 */
 
 #include "buffer.h"
-#include <random>
+#include <cstdint>
+
+// the 32 bit Mersenne Twister, producing the same numbers as std::mt19937, with its state exposed
+// so that it can be serialized without going through the text form of std::mt19937
+class MersenneTwister {
+  public:
+    static const int N = 624;
+    static const int M = 397;
+
+    // same as in libstdc++'s text form of std::mt19937, the index of the next word in state
+    uint32_t state[N];
+    uint32_t index = N;
+
+    MersenneTwister() {
+        seed(5489u);
+    }
+
+    void seed(uint32_t s) {
+        state[0] = s;
+        for (int i = 1; i < N; i++) {
+            state[i] = 1812433253u * (state[i - 1] ^ (state[i - 1] >> 30)) + i;
+        }
+        index = N;
+    }
+
+    static uint32_t max() {
+        return 0xffffffffu;
+    }
+
+    uint32_t operator()() {
+        if (index >= (uint32_t)(N)) {
+            twist();
+        }
+        uint32_t z = state[index++];
+        z ^= z >> 11;
+        z ^= (z << 7) & 0x9d2c5680u;
+        z ^= (z << 15) & 0xefc60000u;
+        z ^= z >> 18;
+        return z;
+    }
+
+  private:
+    void twist() {
+        for (int i = 0; i < N; i++) {
+            uint32_t y = (state[i] & 0x80000000u) | (state[(i + 1) % N] & 0x7fffffffu);
+            state[i] = state[(i + M) % N] ^ (y >> 1) ^ ((y & 1) ? 0x9908b0dfu : 0);
+        }
+        index = 0;
+    }
+};
 
 class RandGen {
   public:
-    std::mt19937 stdgen;
+    MersenneTwister stdgen;
     int randint(int low, int high);
     int randn(int high);
     float rand01();
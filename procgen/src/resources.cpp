@@ -1,6 +1,15 @@
 #include "resources.h"
 #include "cpp-utils.h"
+
+#if defined(__CHEERP__)
 #include "loadinghelper.h"
+#else
+#include "mappedfile.h"
+#include <mutex>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+#endif
 
 std::string global_resource_root;
 
@@ -18,6 +27,53 @@ std::shared_ptr<QImage> get_asset_ptr(std::string relpath) {
     return sprites.at(relpath);
 }
 
+std::map<std::string, std::shared_ptr<const SharedAsset>> shared_assets;
+SharedAssetStats shared_asset_stats;
+#if !defined(__CHEERP__)
+std::mutex shared_assets_mutex;
+#endif
+
+// the images are 32 bits per pixel, the browser build has no bytesPerLine()
+static int64_t image_num_bytes(const QImage &image) {
+    return (int64_t)(image.width()) * image.height() * 4;
+}
+
+std::shared_ptr<const SharedAsset> get_shared_asset(const std::string &key, const std::function<std::shared_ptr<SharedAsset>()> &make) {
+    {
+#if !defined(__CHEERP__)
+        std::lock_guard<std::mutex> lock(shared_assets_mutex);
+#endif
+        auto it = shared_assets.find(key);
+        if (it != shared_assets.end()) {
+            shared_asset_stats.hits++;
+            return it->second;
+        }
+    }
+
+    std::shared_ptr<const SharedAsset> asset = make();
+
+#if !defined(__CHEERP__)
+    std::lock_guard<std::mutex> lock(shared_assets_mutex);
+#endif
+    shared_asset_stats.misses++;
+    auto inserted = shared_assets.insert({key, asset});
+    if (inserted.second) {
+        shared_asset_stats.num_assets++;
+        shared_asset_stats.num_bytes += image_num_bytes(*asset->reflection);
+        if (asset->is_generated) {
+            shared_asset_stats.num_bytes += image_num_bytes(*asset->image);
+        }
+    }
+    return inserted.first->second;
+}
+
+SharedAssetStats get_shared_asset_stats() {
+#if !defined(__CHEERP__)
+    std::lock_guard<std::mutex> lock(shared_assets_mutex);
+#endif
+    return shared_asset_stats;
+}
+
 std::shared_ptr<QImage> load_resource_ptr(std::string relpath, QImage::Format format) {
     auto path = global_resource_root + relpath;
     auto asset = QImage(path).convertToFormat(format);
@@ -29,19 +85,8 @@ std::shared_ptr<QImage> load_resource_ptr(std::string relpath, QImage::Format fo
     return asset_ptr;
 }
 
-static client::Promise *promiseAll(client::TArray<client::Promise> *arr) {
-    client::Promise *ret;
-    __asm__("Promise.all(%1)"
-            : "=r"(ret)
-            : "r"(arr));
-    return ret;
-}
-
-client::Promise *images_load(const std::string &resource_root) {
-    loadingHelper.setRoot(resource_root);
-    auto *promises = new client::TArray<client::Promise>();
-
-    auto sprite_paths = std::vector<std::string>{
+static std::vector<std::string> get_sprite_paths() {
+    return std::vector<std::string>{
         "kenney/Ground/Planet/planetCorner_left.png",
         "kenney/Ground/Planet/planetHill_left.png",
         "kenney/Ground/Planet/planetHalf_right.png",
@@ -508,7 +553,6 @@ client::Promise *images_load(const std::string &resource_root) {
         "misc_assets/fruit4.png",
         "misc_assets/ladder_small.png",
         "misc_assets/groundB.png",
-        "misc_assets/mud.png",
         "misc_assets/fire_2.png",
         "misc_assets/car_black_3.png",
         "misc_assets/playerShip1_green.png",
@@ -823,18 +867,10 @@ client::Promise *images_load(const std::string &resource_root) {
         "platformer/playerRed_swim1.png",
         "platformer/playerGrey_duck.png",
     };
-    promises->push(loadingHelper.load(sprite_paths));
-
-    auto group_to_vector = std::map<std::string, std::vector<std::shared_ptr<QImage>> *>{
-        {"space_backgrounds", &space_backgrounds},
-        {"platform_backgrounds", &platform_backgrounds},
-        {"topdown_backgrounds", &topdown_backgrounds},
-        {"topdown_simple_backgrounds", &topdown_simple_backgrounds},
-        {"water_backgrounds", &water_backgrounds},
-        {"water_surface_backgrounds", &water_surface_backgrounds},
-    };
+}
 
-    auto group_to_paths = std::map<std::string, std::vector<std::string>>{
+static std::map<std::string, std::vector<std::string>> get_group_to_paths() {
+    return std::map<std::string, std::vector<std::string>>{
         {
             "space_backgrounds",
             {
@@ -950,32 +986,200 @@ client::Promise *images_load(const std::string &resource_root) {
             },
         },
     };
+}
+
+typedef std::function<std::shared_ptr<QImage>(const std::string &relpath, QImage::Format format)> ImageLoader;
+
+// decode all images with load_image(), which is load_resource_ptr() unless they come from an asset atlas
+static void store_images(const std::vector<std::string> &sprite_paths, const std::map<std::string, std::vector<std::string>> &group_to_paths, const ImageLoader &load_image) {
+    auto group_to_vector = std::map<std::string, std::vector<std::shared_ptr<QImage>> *>{
+        {"space_backgrounds", &space_backgrounds},
+        {"platform_backgrounds", &platform_backgrounds},
+        {"topdown_backgrounds", &topdown_backgrounds},
+        {"topdown_simple_backgrounds", &topdown_simple_backgrounds},
+        {"water_backgrounds", &water_backgrounds},
+        {"water_surface_backgrounds", &water_surface_backgrounds},
+    };
+
+    for (auto const &pair : group_to_paths) {
+        auto vec = group_to_vector.at(pair.first);
+        for (const auto &path : pair.second) {
+            vec->push_back(load_image(path, QImage::Format_RGB32));
+        }
+    }
 
+    for (const auto &sprite_path : sprite_paths) {
+        sprites[sprite_path] = load_image(sprite_path, QImage::Format_ARGB32_Premultiplied);
+    }
+
+    // also add all space backgrounds as platform backgrounds
+    for (auto bg : space_backgrounds) {
+        platform_backgrounds.push_back(bg);
+    }
+
+    caves.push_back(platform_backgrounds[2]);
+    caves.push_back(platform_backgrounds[3]);
+    caves.push_back(platform_backgrounds[13]);
+}
+
+#if defined(__CHEERP__)
+
+static client::Promise *promiseAll(client::TArray<client::Promise> *arr) {
+    client::Promise *ret;
+    __asm__("Promise.all(%1)"
+            : "=r"(ret)
+            : "r"(arr));
+    return ret;
+}
+
+// the browser fetches images asynchronously, the returned promise resolves once every image is loaded
+client::Promise *images_load(const std::string &resource_root) {
+    loadingHelper.setRoot(resource_root);
+    auto *promises = new client::TArray<client::Promise>();
+
+    auto sprite_paths = get_sprite_paths();
+    promises->push(loadingHelper.load(sprite_paths));
+
+    auto group_to_paths = get_group_to_paths();
     for (auto const &pair : group_to_paths) {
         promises->push(loadingHelper.load(pair.second));
     }
 
     return promiseAll(promises)->then(cheerp::Callback([sprite_paths = std::move(sprite_paths),
-                                                        group_to_paths = std::move(group_to_paths),
-                                                        group_to_vector = std::move(group_to_vector)]() {
-        for (auto const &pair : group_to_paths) {
-            auto vec = group_to_vector.at(pair.first);
-            for (const auto &path : pair.second) {
-                vec->push_back(load_resource_ptr(path, QImage::Format_RGB32));
-            }
-        }
+                                                        group_to_paths = std::move(group_to_paths)]() {
+        store_images(sprite_paths, group_to_paths, load_resource_ptr);
+    }));
+}
 
-        for (const auto &sprite_path : sprite_paths) {
-            sprites[sprite_path] = load_resource_ptr(sprite_path, QImage::Format_ARGB32_Premultiplied);
-        }
+#else
+
+struct AtlasHeader {
+    char magic[8];
+    uint32_t version;
+    uint32_t num_entries;
+};
 
-        // also add all space backgrounds as platform backgrounds
-        for (auto bg : space_backgrounds) {
-            platform_backgrounds.push_back(bg);
+struct AtlasEntry {
+    uint64_t name_offset;
+    uint64_t pixels_offset;
+    uint32_t name_length;
+    int32_t width;
+    int32_t height;
+    int32_t format;
+};
+
+const char ATLAS_MAGIC[8] = {'P', 'G', 'A', 'T', 'L', 'A', 'S', '\0'};
+const uint32_t ATLAS_VERSION = 1;
+// pixel data of each image starts on a cache line
+const uint64_t ATLAS_ALIGNMENT = 64;
+
+static std::string atlas_key(const std::string &relpath, QImage::Format format) {
+    return std::to_string((int)(format)) + " " + relpath;
+}
+
+// the atlas file stays mapped for the lifetime of the process since the images point into it, it
+// is never unmapped so that games still running during shutdown can't see it disappear
+static MappedFile *atlas_file = new MappedFile();
+
+static void load_atlas(const std::string &path) {
+    if (!atlas_file->open(path)) {
+        fatal("failed to open asset atlas %s\n", path.c_str());
+    }
+    const char *atlas_data = atlas_file->data();
+    size_t atlas_size = atlas_file->size();
+
+    AtlasHeader header;
+    fassert(atlas_size >= sizeof(header));
+    memcpy(&header, atlas_data, sizeof(header));
+    if (memcmp(header.magic, ATLAS_MAGIC, sizeof(ATLAS_MAGIC)) != 0 || header.version != ATLAS_VERSION) {
+        fatal("%s is not a version %d asset atlas\n", path.c_str(), ATLAS_VERSION);
+    }
+    fassert(sizeof(header) + (uint64_t)(header.num_entries) * sizeof(AtlasEntry) <= atlas_size);
+
+    std::map<std::string, AtlasEntry> entries;
+    for (uint32_t i = 0; i < header.num_entries; i++) {
+        AtlasEntry e;
+        memcpy(&e, atlas_data + sizeof(header) + i * sizeof(AtlasEntry), sizeof(e));
+        fassert(e.name_offset + e.name_length <= atlas_size);
+        fassert(e.pixels_offset % 4 == 0 && e.pixels_offset + (uint64_t)(e.width) * e.height * 4 <= atlas_size);
+        entries[std::string(atlas_data + e.name_offset, e.name_length)] = e;
+    }
+
+    auto load_image = [&entries, &path, atlas_data](const std::string &relpath, QImage::Format format) {
+        auto it = entries.find(atlas_key(relpath, format));
+        if (it == entries.end()) {
+            fatal("image %s is missing from asset atlas %s\n", relpath.c_str(), path.c_str());
         }
+        const AtlasEntry &e = it->second;
+        // the image wraps the mapped pixels instead of copying them
+        return std::make_shared<QImage>((uchar *)(atlas_data + e.pixels_offset), e.width, e.height, e.width * 4, (QImage::Format)(e.format));
+    };
+    store_images(get_sprite_paths(), get_group_to_paths(), load_image);
+}
 
-        caves.push_back(platform_backgrounds[2]);
-        caves.push_back(platform_backgrounds[3]);
-        caves.push_back(platform_backgrounds[13]);
-    }));
+// images are read from the asset atlas if there is one, otherwise from the image files in global_resource_root
+void images_load(const std::string &atlas_path) {
+    if (atlas_path != "") {
+        load_atlas(atlas_path);
+    } else {
+        store_images(get_sprite_paths(), get_group_to_paths(), load_resource_ptr);
+    }
 }
+
+void write_asset_atlas(const std::string &path) {
+    // every image is stored in each format it is loaded as
+    std::map<std::string, std::shared_ptr<QImage>> images;
+    auto load_image = [&images](const std::string &relpath, QImage::Format format) {
+        auto image = load_resource_ptr(relpath, format);
+        images[atlas_key(relpath, format)] = image;
+        return image;
+    };
+    store_images(get_sprite_paths(), get_group_to_paths(), load_image);
+
+    std::vector<AtlasEntry> entries;
+    std::string names;
+    uint64_t offset = sizeof(AtlasHeader) + images.size() * sizeof(AtlasEntry);
+    for (const auto &pair : images) {
+        AtlasEntry e;
+        e.name_offset = offset + names.size();
+        e.name_length = pair.first.size();
+        e.width = pair.second->width();
+        e.height = pair.second->height();
+        e.format = (int32_t)(pair.second->format());
+        names += pair.first;
+        entries.push_back(e);
+    }
+    offset += names.size();
+    for (auto &e : entries) {
+        offset = (offset + ATLAS_ALIGNMENT - 1) / ATLAS_ALIGNMENT * ATLAS_ALIGNMENT;
+        e.pixels_offset = offset;
+        offset += (uint64_t)(e.width) * e.height * 4;
+    }
+
+    // write to a temporary file first so that a partially written atlas is never used
+    auto tmp_path = path + ".tmp";
+    std::ofstream f(tmp_path, std::ios::binary | std::ios::trunc);
+    AtlasHeader header;
+    memcpy(header.magic, ATLAS_MAGIC, sizeof(ATLAS_MAGIC));
+    header.version = ATLAS_VERSION;
+    header.num_entries = entries.size();
+    f.write((const char *)(&header), sizeof(header));
+    f.write((const char *)(entries.data()), entries.size() * sizeof(AtlasEntry));
+    f.write(names.data(), names.size());
+    size_t i = 0;
+    for (const auto &pair : images) {
+        const auto &image = pair.second;
+        const auto &e = entries[i++];
+        std::vector<char> padding(e.pixels_offset - (uint64_t)(f.tellp()), 0);
+        f.write(padding.data(), padding.size());
+        for (int y = 0; y < image->height(); y++) {
+            f.write((const char *)(image->constScanLine(y)), (size_t)(image->width()) * 4);
+        }
+    }
+    f.close();
+    if (!f || std::rename(tmp_path.c_str(), path.c_str()) != 0) {
+        fatal("failed to write asset atlas %s\n", path.c_str());
+    }
+}
+
+#endif
\ No newline at end of file
@@ -2,19 +2,36 @@
 
 /*
 
-Load assets stored as individual image files
+Load assets stored as individual image files or packed into an asset atlas, and keep the assets
+prepared by games so that every game in the process can share them
+
+The asset atlas is made by the pack-assets tool at build time. It holds every image already decoded
+and converted to the format it is used in, so loading it only maps the file into memory. The file
+starts with an AtlasHeader, followed by an AtlasEntry for each image, the entry names, then the
+pixels of each image, with rows stored without padding. Integers are stored in native byte order.
 
 */
 
 #include <QtGui/QPainter>
 #include <iostream>
 #include <memory>
+#include <functional>
+#include "randgen.h"
+
+#if defined(__CHEERP__)
 #include <cheerp/client.h>
+#endif
 
 std::shared_ptr<QImage> get_asset_ptr(std::string relpath);
 
 extern std::string global_resource_root;
+#if defined(__CHEERP__)
 extern client::Promise *images_load(const std::string &resource_root);
+#else
+// atlas_path may be empty, in which case the image files are decoded
+extern void images_load(const std::string &atlas_path);
+extern void write_asset_atlas(const std::string &path);
+#endif
 extern std::vector<std::shared_ptr<QImage>> topdown_backgrounds;
 extern std::vector<std::shared_ptr<QImage>> topdown_simple_backgrounds;
 extern std::vector<std::shared_ptr<QImage>> platform_backgrounds;
@@ -22,3 +39,28 @@ extern std::vector<std::shared_ptr<QImage>> space_backgrounds;
 extern std::vector<std::shared_ptr<QImage>> water_backgrounds;
 extern std::vector<std::shared_ptr<QImage>> water_surface_backgrounds;
 extern std::vector<std::shared_ptr<QImage>> caves;
+
+// an asset of a BasicAbstractGame and its reflection, see BasicAbstractGame::initialize_asset_if_necessary()
+struct SharedAsset {
+    std::shared_ptr<QImage> image;
+    std::shared_ptr<QImage> reflection;
+    float aspect_ratio = 0.0f;
+    int num_themes = 0;
+    // generated assets also keep the state of the generator after generating image
+    bool is_generated = false;
+    RandGen rand_gen;
+};
+
+struct SharedAssetStats {
+    int64_t num_assets = 0;
+    // pixel data created for the shared assets, images loaded from files are not included
+    int64_t num_bytes = 0;
+    int64_t hits = 0;
+    int64_t misses = 0;
+};
+
+// returns the asset stored under key, calling make() to create it the first time a key is used
+// make() runs without holding the lock, if several threads create the same asset at once the
+// first one stored is returned to all of them, so make() must always create the same asset for a key
+std::shared_ptr<const SharedAsset> get_shared_asset(const std::string &key, const std::function<std::shared_ptr<SharedAsset>()> &make);
+SharedAssetStats get_shared_asset_stats();
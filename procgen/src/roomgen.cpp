@@ -69,7 +69,7 @@ void RoomGenerator::build_room(int idx, std::set<int> &room) {
 }
 
 void RoomGenerator::find_path(int src, int dst, std::vector<int> &path) {
-    std::set<int> covered;
+    std::vector<bool> covered(game->grid_size);
     std::vector<int> expanded;
     std::vector<int> parents;
 
@@ -97,10 +97,10 @@ void RoomGenerator::find_path(int src, int dst, std::vector<int> &path) {
                 if ((i == 0 || j == 0) && (i + j != 0)) {
                     int next_idx = game->to_grid_idx(x + i, y + j);
 
-                    if (!set_contains(covered, next_idx) && game->get_obj(next_idx) == SPACE) {
+                    if (next_idx != INVALID_IDX && !covered[next_idx] && game->get_obj(next_idx) == SPACE) {
                         expanded.push_back(next_idx);
                         parents.push_back(search_idx);
-                        covered.insert(next_idx);
+                        covered[next_idx] = true;
                     }
                 }
             }
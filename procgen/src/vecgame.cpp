@@ -2,13 +2,40 @@
 #include "cpp-utils.h"
 #include "vecoptions.h"
 #include "game.h"
+#include "basic-abstract-game.h"
+#include "distancefield.h"
+#include <algorithm>
 
 const int32_t END_OF_BUFFER = 0xCAFECAFE;
+// marks the optional section of a state with the stacked frames of the observation, states made
+// without frame stacking end right after the game
+const int32_t OBS_FRAMES_SECTION = 0x0B5F0B5F;
 
 extern void coinrun_old_init(int rand_seed);
 
 static std::once_flag global_init_flag;
 
+// serialize the state of a game, followed by the optional sections and END_OF_BUFFER
+static void write_state(Game *game, WriteBuffer *b) {
+    game->serialize(b);
+    if (game->obs_transform.frame_stack > 1) {
+        b->write_int(OBS_FRAMES_SECTION);
+        game->serialize_obs_frames(b);
+    }
+    b->write_int(END_OF_BUFFER);
+}
+
+// deserialize a state written by write_state(), or by older versions without the optional sections
+static void read_state(Game *game, ReadBuffer *b) {
+    game->deserialize(b);
+    int32_t tag = b->read_int();
+    if (tag == OBS_FRAMES_SECTION) {
+        game->deserialize_obs_frames(b);
+        tag = b->read_int();
+    }
+    fassert(tag == END_OF_BUFFER);
+}
+
 std::vector<std::string> split(std::string s, std::string delimiter) {
     std::vector<std::string> env_names;
 
@@ -82,6 +109,37 @@ void libenv_set_buffers(libenv_env *handle, struct libenv_buffers *bufs) {
     venv->set_buffers(ac, ob, info, bufs->rew, bufs->first);
 }
 
+// register an additional set of output buffers for pipelined stepping, returns its index
+LIBENV_API int add_buffers(libenv_env *handle, struct libenv_buffers *bufs) {
+    auto venv = (VecGame *)(handle);
+    auto ob = convert_bufs(bufs->ob, venv->num_envs,
+                           venv->observation_types.size());
+    auto info =
+        convert_bufs(bufs->info, venv->num_envs, venv->info_types.size());
+    return venv->add_buffers(ob, info, bufs->rew, bufs->first);
+}
+
+LIBENV_API void remove_buffers(libenv_env *handle, int buffer_idx) {
+    auto venv = (VecGame *)(handle);
+    venv->remove_buffers(buffer_idx);
+}
+
+LIBENV_API void act_into(libenv_env *handle, int buffer_idx) {
+    auto venv = (VecGame *)(handle);
+    venv->act_into(buffer_idx);
+}
+
+// write into buffer set buffer_idx from now on, starting with the current observations
+LIBENV_API void select_buffers(libenv_env *handle, int buffer_idx) {
+    auto venv = (VecGame *)(handle);
+    venv->select_buffers(buffer_idx);
+}
+
+LIBENV_API void set_hires_envs(libenv_env *handle, int num_idxs, const int *env_idxs, int interval) {
+    auto venv = (VecGame *)(handle);
+    venv->set_hires_envs(std::vector<int>(env_idxs, env_idxs + num_idxs), interval);
+}
+
 void libenv_observe(libenv_env *handle) {
     auto venv = (VecGame *)(handle);
     venv->observe();
@@ -100,52 +158,15 @@ void libenv_close(libenv_env *handle) {
 
 // end libenv api
 
-static void stepping_worker(std::mutex &stepping_thread_mutex,
-                            std::list<std::shared_ptr<Game>> &pending_games,
-                            std::condition_variable &pending_games_added,
-                            std::condition_variable &pending_game_complete, bool &time_to_die) {
-    while (1) {
-        std::shared_ptr<Game> game;
-
-        {
-            std::unique_lock<std::mutex> lock(stepping_thread_mutex);
-            while (1) {
-                if (time_to_die) {
-                    return;
-                }
-                if (!pending_games.empty()) {
-                    game = pending_games.front();
-                    pending_games.pop_front();
-                    break;
-                }
-
-                pending_games_added.wait(lock);
-            }
-        }
-
-        // the first time the threads are activated is before any step, just to initialize
-        // the environment and produce the initial observation
-        if (!game->initial_reset_complete) {
-            game->reset();
-            game->observe();
-            game->initial_reset_complete = true;
-        } else {
-            game->step();
-        }
-
-        {
-            std::unique_lock<std::mutex> lock(stepping_thread_mutex);
-            game->is_waiting_for_step = false;
-            pending_game_complete.notify_all();
-        }
-    }
-}
+// chunks per stepping thread, more chunks make work stealing finer grained but cost more
+// synchronization per batch
+const int CHUNKS_PER_THREAD = 4;
 
-void global_init(int rand_seed, std::string resource_root) {
+void global_init(int rand_seed, std::string resource_root, std::string asset_atlas) {
     global_resource_root = resource_root;
 
     try {
-        images_load();
+        images_load(asset_atlas);
         coinrun_old_init(rand_seed);
     } catch (const std::exception &e) {
         fatal("failed to load images %s\n", e.what());
@@ -178,7 +199,15 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
 
     int rand_seed = 0;
     int num_threads = 4;
+    int env_offset = 0;
+    bool render_rgb = true;
+    bool distance_infos = false;
+    bool force_entity_grid = false;
+    ObsTransform obs_transform;
     std::string resource_root;
+    std::string asset_atlas;
+    int level_cache_mb = 0;
+    std::string level_cache_dir;
 
     opts.consume_string("env_name", &env_name);
     opts.consume_int("num_levels", &num_levels);
@@ -186,22 +215,53 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
     opts.consume_int("num_actions", &num_actions);
     opts.consume_int("rand_seed", &rand_seed);
     opts.consume_int("num_threads", &num_threads);
+    opts.consume_int("env_offset", &env_offset);
     opts.consume_string("resource_root", &resource_root);
+    opts.consume_string("asset_atlas", &asset_atlas);
     opts.consume_bool("render_human", &render_human);
+    opts.consume_bool("render_rgb", &render_rgb);
+    opts.consume_bool("distance_infos", &distance_infos);
+    opts.consume_bool("force_entity_grid", &force_entity_grid);
+    opts.consume_bool("obs_grayscale", &obs_transform.grayscale);
+    opts.consume_int("obs_downsample", &obs_transform.downsample);
+    opts.consume_bool("obs_channels_first", &obs_transform.chw);
+    opts.consume_int("obs_frame_stack", &obs_transform.frame_stack);
+    opts.consume_int("level_cache_mb", &level_cache_mb);
+    opts.consume_string("level_cache_dir", &level_cache_dir);
+    opts.consume_bool("profile", &profile);
+#if defined(PROCGEN_QPAINTER_TRACE)
+    std::string qpainter_trace_dir;
+    opts.consume_string("qpainter_trace_dir", &qpainter_trace_dir);
+#endif
 
     std::call_once(global_init_flag, global_init, rand_seed,
-                   resource_root);
+                   resource_root, asset_atlas);
 
     fassert(num_threads >= 0);
-    threads.resize(num_threads);
+    fassert(level_cache_mb >= 0);
+    fassert(obs_transform.downsample > 0 && RES_W % obs_transform.downsample == 0 && RES_H % obs_transform.downsample == 0);
+    fassert(obs_transform.frame_stack > 0);
+#if defined(PROCGEN_QPAINTER_TRACE)
+    // the painters of all the games append to the same trace, one after the other
+    fassert(qpainter_trace_dir.empty() || num_threads == 0);
+#endif
+    if (level_cache_mb > 0 || level_cache_dir != "") {
+        level_cache = std::make_shared<LevelCache>((size_t)(level_cache_mb) << 20, level_cache_dir);
+    }
+
+    pending_chunks = 0;
+    first_out_of_work_ns = 0;
+    last_chunk_end_ns = 0;
+    if (profile) {
+        game_profiles.resize(num_envs);
+        // the last one is for the python thread
+        thread_profiles.resize(num_threads + 1);
+    }
+    for (int t = 0; t < num_threads; t++) {
+        worker_queues.emplace_back(new WorkerQueue());
+    }
     for (int t = 0; t < num_threads; t++) {
-        threads[t] = std::thread(
-            stepping_worker,
-            std::ref(stepping_thread_mutex),
-            std::ref(pending_games),
-            std::ref(pending_games_added),
-            std::ref(pending_game_complete),
-            std::ref(time_to_die));
+        threads.emplace_back(&VecGame::stepping_worker, this, t);
     }
 
     fassert(env_name != "");
@@ -214,10 +274,7 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         strcpy(s.name, "rgb");
         s.scalar_type = LIBENV_SCALAR_TYPE_DISCRETE;
         s.dtype = LIBENV_DTYPE_UINT8;
-        s.shape[0] = RES_W;
-        s.shape[1] = RES_H;
-        s.shape[2] = 3;
-        s.ndim = 3;
+        s.ndim = obs_transform.get_shape(RES_W, RES_H, s.shape);
         s.low.uint8 = 0;
         s.high.uint8 = 255;
         observation_types.push_back(s);
@@ -275,7 +332,7 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         s.shape[0] = 2;
         s.ndim = 1;
         s.low.int32 = 0;
-        s.high.int32 = 35;
+        s.high.int32 = MAX_LATENT_GRID_DIM;
         info_types.push_back(s);
     }
 
@@ -284,7 +341,7 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         strcpy(s.name, "grid");
         s.scalar_type = LIBENV_SCALAR_TYPE_DISCRETE;
         s.dtype = LIBENV_DTYPE_INT32;
-        s.shape[0] = 35 * 35;
+        s.shape[0] = MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM;
         s.ndim = 1,
         s.low.int32 = 0;
         s.high.int32 = INT32_MAX;
@@ -299,7 +356,7 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         s.shape[0] = 2;
         s.ndim = 1;
         s.low.int32 = 0;
-        s.high.int32 = 35;
+        s.high.int32 = MAX_LATENT_GRID_DIM;
         info_types.push_back(s);
     }
 
@@ -311,10 +368,26 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         s.shape[0] = 2;
         s.ndim = 1;
         s.low.int32 = 0;
-        s.high.int32 = 35;
+        s.high.int32 = MAX_LATENT_GRID_DIM;
         info_types.push_back(s);
     }
 
+    if (distance_infos) {
+        for (auto name : {"exit_dist", "key_dist"}) {
+            struct libenv_tensortype s;
+            strcpy(s.name, name);
+            s.scalar_type = LIBENV_SCALAR_TYPE_DISCRETE;
+            s.dtype = LIBENV_DTYPE_INT32;
+            s.shape[0] = MAX_LATENT_GRID_DIM * MAX_LATENT_GRID_DIM;
+            s.ndim = 1;
+            // gym3 needs discrete tensors to start at 0, but cells without a path are
+            // DistanceField::UNREACHABLE
+            s.low.int32 = 0;
+            s.high.int32 = INT32_MAX;
+            info_types.push_back(s);
+        }
+    }
+
     if (render_human) {
         struct libenv_tensortype s;
         strcpy(s.name, "rgb");
@@ -345,27 +418,49 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
     num_joint_games = (int)(env_names.size());
 
     fassert(num_envs % num_joint_games == 0);
+    fassert(env_offset >= 0 && env_offset % num_joint_games == 0);
 
+    // with env_offset, these games are the ones at env_offset onwards of a VecGame with more games
     RandGen game_level_seed_gen;
     game_level_seed_gen.seed(rand_seed);
+    for (int n = 0; n < env_offset; n++) {
+        game_level_seed_gen.randint();
+    }
 
     std::map<std::string, int> info_name_to_offset;
     for (size_t i = 0; i < info_types.size(); i++) {
         info_name_to_offset[info_types[i].name] = i;
     }
 
+    all_env_idxs.resize(num_envs);
+    for (int n = 0; n < num_envs; n++) {
+        all_env_idxs[n] = n;
+    }
+    hires_env_idxs = all_env_idxs;
+    is_hires_env.assign(num_envs, true);
+
     for (int n = 0; n < num_envs; n++) {
         auto name = env_names[n % num_joint_games];
 
-        games[n] = globalGameRegistry->at(name)();
+        games[n] = std::shared_ptr<Game>(globalGameRegistry->at(name)());
         fassert(games[n]->game_name == name);
         games[n]->level_seed_rand_gen.seed(game_level_seed_gen.randint());
         games[n]->level_seed_high = level_seed_high;
         games[n]->level_seed_low = level_seed_low;
-        games[n]->game_n = n;
+        games[n]->game_n = env_offset + n;
         games[n]->is_waiting_for_step = false;
         games[n]->parse_options(name, opts);
         games[n]->info_name_to_offset = info_name_to_offset;
+        games[n]->render_rgb = render_rgb;
+        games[n]->distance_infos = distance_infos;
+        games[n]->force_entity_grid = force_entity_grid;
+        games[n]->obs_transform = obs_transform;
+#if defined(PROCGEN_QPAINTER_TRACE)
+        games[n]->qpainter_trace_dir = qpainter_trace_dir;
+#endif
+        if (profile) {
+            games[n]->profile = &game_profiles[n];
+        }
 
         // Auto-selected a fixed_asset_seed if one wasn't specified on
         // construction
@@ -375,120 +470,588 @@ VecGame::VecGame(int _nenvs, VecOptions opts) {
         }
 
         games[n]->game_init();
+
+        // games with generated assets can't be serialized, so their levels can't be cached
+        if (!games[n]->options.use_generated_assets) {
+            games[n]->level_cache = level_cache;
+        }
     }
 }
 
 void VecGame::set_buffers(const std::vector<std::vector<void *>> &ac, const std::vector<std::vector<void *>> &ob, const std::vector<std::vector<void *>> &info, float *rew, uint8_t *first) {
-    {
-        std::unique_lock<std::mutex> lock(stepping_thread_mutex);
-
-        for (int e = 0; e < num_envs; e++) {
-            const auto &game = games[e];
-            // we only ever have one action
-            game->action_ptr = (int32_t *)(ac[e][0]);
-            game->obs_bufs = ob[e];
-            game->info_bufs = info[e];
-            game->reward_ptr = &rew[e];
-            game->first_ptr = &first[e];
-
-            // render the initial state so we don't see a black screen on the first frame
-            fassert(!game->is_waiting_for_step);
-            fassert(!game->initial_reset_complete);
-            if (threads.size() == 0) {
-                // special case for no threads
-                game->reset();
-                game->observe();
-                game->initial_reset_complete = true;
-            } else {
-                game->is_waiting_for_step = true;
-                pending_games.push_back(game);
-            }
+    wait_for_stepping_threads();
+
+    fassert(buffer_sets.size() == 0);
+    add_buffers(ob, info, rew, first);
+
+    for (int e = 0; e < num_envs; e++) {
+        const auto &game = games[e];
+        // we only ever have one action
+        game->action_ptr = (int32_t *)(ac[e][0]);
+        fassert(!game->initial_reset_complete);
+    }
+    use_buffer_set(0);
+
+    // render the initial state so we don't see a black screen on the first frame
+    submit_batch(all_env_idxs, [this](int e) {
+        const auto &game = games[e];
+        game->reset();
+        game->observe();
+        game->initial_reset_complete = true;
+    });
+}
+
+int VecGame::add_buffers(const std::vector<std::vector<void *>> &ob, const std::vector<std::vector<void *>> &info, float *rew, uint8_t *first) {
+    BufferSet buffer_set;
+    buffer_set.ob = ob;
+    buffer_set.info = info;
+    buffer_set.rew = rew;
+    buffer_set.first = first;
+    for (size_t i = 1; i < buffer_sets.size(); i++) {
+        if (buffer_sets[i].rew == nullptr) {
+            buffer_sets[i] = buffer_set;
+            return (int)(i);
+        }
+    }
+    buffer_sets.push_back(buffer_set);
+    return (int)(buffer_sets.size()) - 1;
+}
+
+void VecGame::remove_buffers(int buffer_idx) {
+    wait_for_stepping_threads();
+
+    fassert(buffer_idx > 0 && buffer_idx < (int)(buffer_sets.size()));
+    fassert(buffer_idx != current_buffer_set);
+    fassert(buffer_sets[buffer_idx].rew != nullptr);
+    buffer_sets[buffer_idx] = BufferSet();
+}
+
+void VecGame::use_buffer_set(int buffer_idx) {
+    const auto &buffer_set = buffer_sets.at(buffer_idx);
+    fassert(buffer_set.rew != nullptr);
+    for (int e = 0; e < num_envs; e++) {
+        const auto &game = games[e];
+        game->obs_bufs = buffer_set.ob[e];
+        game->info_bufs = buffer_set.info[e];
+        game->reward_ptr = &buffer_set.rew[e];
+        game->first_ptr = &buffer_set.first[e];
+    }
+    current_buffer_set = buffer_idx;
+    hires_rendered = false;
+}
+
+void VecGame::select_buffers(int buffer_idx) {
+    wait_for_stepping_threads();
+
+    use_buffer_set(buffer_idx);
+    unobserved_env_idxs.clear();
+    bool render = hires_due();
+    submit_batch(all_env_idxs, [this, render](int e) {
+        games[e]->observe();
+        if (render && is_hires_env[e]) {
+            render_hires(e);
+        }
+    });
+    wait_for_stepping_threads();
+    hires_rendered = true;
+}
+
+void VecGame::render_hires(int env_idx) {
+    const auto &game = games[env_idx];
+    ProfileTimer timer(game->profile_phase(PROFILE_RENDER_HIRES));
+    // RENDER_RES * RENDER_RES pixels are too many for the stack, and allocating them for every
+    // render is slow, so every thread keeps its own
+    thread_local std::vector<uint32_t> render_hires_buf(RENDER_RES * RENDER_RES);
+    game->render_to_buf(render_hires_buf.data(), RENDER_RES, RENDER_RES, true);
+    bgr32_to_rgb888(game->info_bufs[game->info_name_to_offset.at("rgb")], render_hires_buf.data(), RENDER_RES, RENDER_RES);
+}
+
+bool VecGame::hires_due() const {
+    return render_human && !hires_env_idxs.empty() && hires_step % hires_interval == 0;
+}
+
+void VecGame::set_hires_envs(const std::vector<int> &env_idxs, int interval) {
+    wait_for_stepping_threads();
+    fassert(interval > 0);
+
+    hires_env_idxs.clear();
+    is_hires_env.assign(num_envs, false);
+    for (int e : env_idxs) {
+        fassert(e >= 0 && e < num_envs);
+        if (!is_hires_env[e]) {
+            is_hires_env[e] = true;
+            hires_env_idxs.push_back(e);
         }
     }
-    pending_games_added.notify_all();
+    hires_interval = interval;
+    // render the newly selected envs on the next observe() if the current step is due
+    hires_rendered = false;
 }
 
 void VecGame::observe() {
     wait_for_stepping_threads();
     // at this point all games belong to the python thread
 
-    if (render_human) {
-        uint8_t render_hires_buf[RENDER_RES * RENDER_RES * 4];
+    if (!unobserved_env_idxs.empty()) {
+        std::sort(unobserved_env_idxs.begin(), unobserved_env_idxs.end());
+        unobserved_env_idxs.erase(std::unique(unobserved_env_idxs.begin(), unobserved_env_idxs.end()), unobserved_env_idxs.end());
+        submit_batch(unobserved_env_idxs, [this](int e) {
+            games[e]->observe();
+        });
+        wait_for_stepping_threads();
+        unobserved_env_idxs.clear();
+    }
 
-        for (int e = 0; e < num_envs; e++) {
-            const auto &game = games[e];
-            game->render_to_buf(render_hires_buf, RENDER_RES, RENDER_RES, true);
-            bgr32_to_rgb888(game->info_bufs[game->info_name_to_offset.at("rgb")], render_hires_buf, RENDER_RES, RENDER_RES);
+    if (!hires_rendered) {
+        if (hires_due()) {
+            submit_batch(hires_env_idxs, [this](int e) {
+                render_hires(e);
+            });
+            wait_for_stepping_threads();
         }
+        hires_rendered = true;
     }
 }
 
 void VecGame::act() {
     wait_for_stepping_threads();
 
-    {
-        std::unique_lock<std::mutex> lock(stepping_thread_mutex);
-
-        for (int e = 0; e < num_envs; e++) {
-            const auto &game = games[e];
-            fassert(!game->is_waiting_for_step);
-            // save the action since it's only valid for the duration of this call
-            game->action = *game->action_ptr;
-            if (threads.size() == 0) {
-                // special case for no threads
-                game->step();
-            } else {
-                game->is_waiting_for_step = true;
-                pending_games.push_back(game);
-            }
-        }
+    for (int e = 0; e < num_envs; e++) {
+        const auto &game = games[e];
+        // save the action since it's only valid for the duration of this call
+        game->action = *game->action_ptr;
     }
+    // every game writes its observation at the end of a step
+    unobserved_env_idxs.clear();
+    // the "rgb" infos are only rendered if the step is observed
+    hires_step++;
+    hires_rendered = false;
+
+    submit_batch(all_env_idxs, [this](int e) {
+        games[e]->step();
+    });
     // at this point all games belong to the stepping threads
+}
+
+void VecGame::act_into(int buffer_idx) {
+    wait_for_stepping_threads();
 
-    pending_games_added.notify_all();
+    use_buffer_set(buffer_idx);
+    for (int e = 0; e < num_envs; e++) {
+        const auto &game = games[e];
+        game->action = *game->action_ptr;
+    }
+    unobserved_env_idxs.clear();
+
+    // the python thread won't call observe() on this buffer set until the step is complete, so the
+    // human render has to be done on the stepping threads along with the step
+    hires_step++;
+    bool render = hires_due();
+    submit_batch(all_env_idxs, [this, render](int e) {
+        games[e]->step();
+        if (render && is_hires_env[e]) {
+            render_hires(e);
+        }
+    });
+    hires_rendered = true;
 }
 
 VecGame::~VecGame() {
     wait_for_stepping_threads();
     {
-        std::unique_lock<std::mutex> lock(stepping_thread_mutex);
+        std::unique_lock<std::mutex> lock(batch_mutex);
         time_to_die = true;
     }
-    pending_games_added.notify_all();
+    batch_started.notify_all();
 
     for (auto &t : threads) {
         t.join();
     }
 }
 
-void VecGame::wait_for_stepping_threads() {
+void VecGame::submit_batch(const std::vector<int> &env_idxs, std::function<void(int)> fn) {
+    fassert(pending_chunks == 0);
+
     if (threads.size() == 0) {
+        // special case for no threads
+        ProfileTimer timer(profile ? &thread_profiles.back().phases[PROFILE_BUSY] : nullptr);
+        for (int e : env_idxs) {
+            fn(e);
+        }
+        return;
+    }
+
+    if (env_idxs.size() == 0) {
         return;
     }
 
-    std::unique_lock<std::mutex> lock(stepping_thread_mutex);
+    batch_env_idxs = env_idxs;
+    batch_fn = std::move(fn);
+
+    int num_threads = (int)(threads.size());
+    int num_items = (int)(batch_env_idxs.size());
+    int num_chunks = std::min(num_items, num_threads * CHUNKS_PER_THREAD);
+    pending_chunks = num_chunks;
+
+    if (profile) {
+        batch_start_ns = profile_now_ns();
+        first_out_of_work_ns = 0;
+        last_chunk_end_ns = 0;
+        batch_needs_profile = true;
+    }
+
+    // give each thread a contiguous run of chunks, so that with no stealing a thread always steps
+    // the same neighbouring envs
+    for (int c = 0; c < num_chunks; c++) {
+        Chunk chunk;
+        chunk.start = (int)((int64_t)num_items * c / num_chunks);
+        chunk.end = (int)((int64_t)num_items * (c + 1) / num_chunks);
+        auto &queue = worker_queues[(int64_t)c * num_threads / num_chunks];
+        std::unique_lock<std::mutex> lock(queue->mutex);
+        queue->chunks.push_back(chunk);
+    }
+
+    {
+        std::unique_lock<std::mutex> lock(batch_mutex);
+        batch_generation++;
+    }
+    batch_started.notify_all();
+}
+
+bool VecGame::run_chunk(int thread_idx, ThreadProfile *thread_profile) {
+    int num_threads = (int)(worker_queues.size());
+    Chunk chunk;
+    bool found = false;
+
+    // take work from the front of our own queue first, then steal from the back of the others
+    for (int i = 0; i < num_threads && !found; i++) {
+        int victim = (thread_idx + i) % num_threads;
+        auto &queue = worker_queues[victim];
+        std::unique_lock<std::mutex> lock(queue->mutex);
+        if (queue->chunks.empty()) {
+            continue;
+        }
+        if (i == 0) {
+            chunk = queue->chunks.front();
+            queue->chunks.pop_front();
+        } else {
+            chunk = queue->chunks.back();
+            queue->chunks.pop_back();
+        }
+        found = true;
+    }
+
+    if (!found) {
+        return false;
+    }
+
+    // everything recorded here happens before pending_chunks is decremented, so it is complete
+    // once the python thread sees the batch finish
+    int64_t start_ns = 0;
+    if (thread_profile != nullptr) {
+        start_ns = profile_now_ns();
+        if (thread_profile->idle_since_ns != 0) {
+            thread_profile->phases[PROFILE_IDLE].add(start_ns - thread_profile->idle_since_ns);
+            thread_profile->idle_since_ns = 0;
+        }
+    }
+
+    for (int i = chunk.start; i < chunk.end; i++) {
+        batch_fn(batch_env_idxs[i]);
+    }
+
+    if (thread_profile != nullptr) {
+        int64_t end_ns = profile_now_ns();
+        thread_profile->phases[PROFILE_BUSY].add(end_ns - start_ns);
+        int64_t last_ns = last_chunk_end_ns;
+        while (last_ns < end_ns && !last_chunk_end_ns.compare_exchange_weak(last_ns, end_ns)) {
+        }
+    }
+
+    if (pending_chunks.fetch_sub(1) == 1) {
+        std::unique_lock<std::mutex> lock(batch_mutex);
+        batch_finished.notify_all();
+    }
+    return true;
+}
+
+void VecGame::stepping_worker(int thread_idx) {
+    uint64_t seen_generation = 0;
     while (1) {
-        bool all_steps_completed = true;
+        {
+            std::unique_lock<std::mutex> lock(batch_mutex);
+            batch_started.wait(lock, [&] { return time_to_die || batch_generation != seen_generation; });
+            if (time_to_die) {
+                return;
+            }
+            seen_generation = batch_generation;
+        }
+
+        ThreadProfile *thread_profile = profile ? &thread_profiles[thread_idx] : nullptr;
+        while (run_chunk(thread_idx, thread_profile)) {
+        }
+        if (thread_profile != nullptr) {
+            mark_out_of_work();
+            if (thread_profile->idle_since_ns == 0) {
+                thread_profile->idle_since_ns = profile_now_ns();
+            }
+        }
+    }
+}
+
+// record when the first thread ran out of chunks for the straggler time of the batch, a thread
+// that only gets here after the batch finished may store a time from before the next batch
+// started, which wait_for_stepping_threads() ignores
+void VecGame::mark_out_of_work() {
+    if (pending_chunks == 0) {
+        return;
+    }
+    int64_t expected = 0;
+    first_out_of_work_ns.compare_exchange_strong(expected, profile_now_ns());
+}
+
+void VecGame::wait_for_stepping_threads() {
+    if (threads.size() == 0) {
+        return;
+    }
+
+    if (!profile) {
+        // help with any chunks that haven't been started yet rather than sleeping
+        while (pending_chunks > 0 && run_chunk(0, nullptr)) {
+        }
+
+        std::unique_lock<std::mutex> lock(batch_mutex);
+        batch_finished.wait(lock, [&] { return pending_chunks == 0; });
+        return;
+    }
+
+    {
+        ProfileTimer timer(pending_chunks > 0 ? &scheduler_profile.phases[PROFILE_WAIT] : nullptr);
+        while (pending_chunks > 0 && run_chunk(0, &thread_profiles.back())) {
+        }
+        mark_out_of_work();
 
-        for (int e = 0; e < num_envs; e++) {
-            const auto &game = games[e];
-            all_steps_completed &= !game->is_waiting_for_step;
+        std::unique_lock<std::mutex> lock(batch_mutex);
+        batch_finished.wait(lock, [&] { return pending_chunks == 0; });
+    }
+
+    if (batch_needs_profile) {
+        int64_t first_ns = first_out_of_work_ns;
+        int64_t last_ns = last_chunk_end_ns;
+        if (first_ns >= batch_start_ns && last_ns >= first_ns) {
+            scheduler_profile.phases[PROFILE_STRAGGLER].add(last_ns - first_ns);
         }
+        batch_needs_profile = false;
+    }
+}
 
-        if (all_steps_completed)
-            break;
+void VecGame::get_profile(int64_t *data) {
+    wait_for_stepping_threads();
+    fassert(profile);
 
-        pending_game_complete.wait(lock);
+    for (const auto &game_profile : game_profiles) {
+        for (const auto &phase : game_profile.phases) {
+            phase.write(data);
+            data += PROFILE_STRIDE;
+        }
+    }
+    for (const auto &thread_profile : thread_profiles) {
+        for (const auto &phase : thread_profile.phases) {
+            phase.write(data);
+            data += PROFILE_STRIDE;
+        }
+    }
+    for (const auto &phase : scheduler_profile.phases) {
+        phase.write(data);
+        data += PROFILE_STRIDE;
+    }
+}
+
+int64_t VecGame::serialize_states(const std::vector<int> &env_idxs) {
+    wait_for_stepping_threads();
+
+    serialized_env_idxs = env_idxs;
+    serialized_states.resize(env_idxs.size());
+    std::vector<int> positions(env_idxs.size());
+    for (size_t i = 0; i < env_idxs.size(); i++) {
+        fassert(env_idxs[i] >= 0 && env_idxs[i] < num_envs);
+        positions[i] = (int)(i);
+    }
+
+    submit_batch(positions, [this](int i) {
+        // serialize into a scratch buffer first since the size of a state isn't known up front
+        thread_local std::vector<char> scratch(MAX_STATE_SIZE);
+        auto b = WriteBuffer(scratch.data(), scratch.size());
+        write_state(games[serialized_env_idxs[i]].get(), &b);
+        serialized_states[i].assign(scratch.data(), scratch.data() + b.offset);
+    });
+    wait_for_stepping_threads();
+
+    int64_t total = 0;
+    for (const auto &state : serialized_states) {
+        total += state.size();
+    }
+    return total;
+}
+
+void VecGame::copy_states(char *arena, int64_t *offsets) {
+    offsets[0] = 0;
+    for (size_t i = 0; i < serialized_states.size(); i++) {
+        offsets[i + 1] = offsets[i] + serialized_states[i].size();
+    }
+
+    std::vector<int> positions(serialized_states.size());
+    for (size_t i = 0; i < positions.size(); i++) {
+        positions[i] = (int)(i);
+    }
+    submit_batch(positions, [this, arena, offsets](int i) {
+        memcpy(arena + offsets[i], serialized_states[i].data(), serialized_states[i].size());
+    });
+    wait_for_stepping_threads();
+}
+
+void VecGame::deserialize_states(const std::vector<int> &env_idxs, const char *arena, const int64_t *offsets) {
+    wait_for_stepping_threads();
+
+    std::vector<int> positions(env_idxs.size());
+    for (size_t i = 0; i < env_idxs.size(); i++) {
+        fassert(env_idxs[i] >= 0 && env_idxs[i] < num_envs);
+        positions[i] = (int)(i);
+    }
+
+    submit_batch(positions, [this, &env_idxs, arena, offsets](int i) {
+        auto b = ReadBuffer((char *)(arena + offsets[i]), offsets[i + 1] - offsets[i]);
+        const auto &game = games[env_idxs[i]];
+        read_state(game.get(), &b);
+        // update the observation and info buffers, same as set_state()
+        game->observe();
+    });
+    wait_for_stepping_threads();
+    hires_rendered = false;
+}
+
+void VecGame::fork(const std::vector<int> &src_env_idxs, const std::vector<int> &dst_env_idxs, bool defer_render) {
+    wait_for_stepping_threads();
+    hires_rendered = false;
+
+    fassert(src_env_idxs.size() == dst_env_idxs.size());
+    std::vector<bool> is_dst(num_envs);
+    std::vector<int> positions(src_env_idxs.size());
+    for (size_t i = 0; i < src_env_idxs.size(); i++) {
+        fassert(src_env_idxs[i] >= 0 && src_env_idxs[i] < num_envs);
+        fassert(dst_env_idxs[i] >= 0 && dst_env_idxs[i] < num_envs);
+        fassert(!is_dst[dst_env_idxs[i]]);
+        is_dst[dst_env_idxs[i]] = true;
+        positions[i] = (int)(i);
+    }
+
+    // make all the copies before replacing any game, so an env can be both a source and a destination
+    std::vector<std::shared_ptr<Game>> copies(src_env_idxs.size());
+    submit_batch(positions, [this, &src_env_idxs, &copies](int i) {
+        const auto &src = games[src_env_idxs[i]];
+        auto copy = std::shared_ptr<Game>(globalGameCopyRegistry->at(src->game_name)(*src));
+        copy->detach_copy();
+        copies[i] = copy;
+    });
+    wait_for_stepping_threads();
+
+    for (size_t i = 0; i < copies.size(); i++) {
+        const auto &copy = copies[i];
+        const auto &dst = games[dst_env_idxs[i]];
+        // the copy writes into the buffers of the game it replaces
+        copy->action_ptr = dst->action_ptr;
+        copy->obs_bufs = dst->obs_bufs;
+        copy->info_bufs = dst->info_bufs;
+        copy->reward_ptr = dst->reward_ptr;
+        copy->first_ptr = dst->first_ptr;
+        copy->profile = dst->profile;
+        games[dst_env_idxs[i]] = copy;
+    }
+
+    if (defer_render) {
+        unobserved_env_idxs.insert(unobserved_env_idxs.end(), dst_env_idxs.begin(), dst_env_idxs.end());
+    } else {
+        submit_batch(dst_env_idxs, [this](int e) {
+            games[e]->observe();
+        });
+        wait_for_stepping_threads();
     }
 }
 
 extern "C" {
+LIBENV_API int64_t serialize_states(libenv_env *handle, int num_idxs, const int *env_idxs) {
+    auto venv = (VecGame *)(handle);
+    return venv->serialize_states(std::vector<int>(env_idxs, env_idxs + num_idxs));
+}
+
+LIBENV_API void copy_states(libenv_env *handle, char *arena, int64_t *offsets) {
+    auto venv = (VecGame *)(handle);
+    venv->copy_states(arena, offsets);
+}
+
+LIBENV_API void deserialize_states(libenv_env *handle, int num_idxs, const int *env_idxs, const char *arena, const int64_t *offsets) {
+    auto venv = (VecGame *)(handle);
+    venv->deserialize_states(std::vector<int>(env_idxs, env_idxs + num_idxs), arena, offsets);
+}
+
+LIBENV_API void fork_games(libenv_env *handle, int num_idxs, const int *src_env_idxs, const int *dst_env_idxs, int defer_render) {
+    auto venv = (VecGame *)(handle);
+    venv->fork(std::vector<int>(src_env_idxs, src_env_idxs + num_idxs), std::vector<int>(dst_env_idxs, dst_env_idxs + num_idxs), defer_render);
+}
+
+LIBENV_API void get_asset_cache_stats(libenv_env *handle, int64_t *stats) {
+    auto s = get_shared_asset_stats();
+    stats[0] = s.num_assets;
+    stats[1] = s.num_bytes;
+    stats[2] = s.hits;
+    stats[3] = s.misses;
+}
+
+LIBENV_API void get_level_cache_stats(libenv_env *handle, int64_t *stats) {
+    auto venv = (VecGame *)(handle);
+    LevelCacheStats s;
+    if (venv->level_cache != nullptr) {
+        s = venv->level_cache->get_stats();
+    }
+    stats[0] = s.num_snapshots;
+    stats[1] = s.num_bytes;
+    stats[2] = s.hits;
+    stats[3] = s.disk_hits;
+    stats[4] = s.misses;
+    stats[5] = s.evictions;
+}
+
+LIBENV_API void get_profile(libenv_env *handle, int64_t *data) {
+    auto venv = (VecGame *)(handle);
+    venv->get_profile(data);
+}
+
+LIBENV_API void get_entity_pool_stats(libenv_env *handle, int64_t *stats) {
+    auto venv = (VecGame *)(handle);
+    venv->wait_for_stepping_threads();
+    EntityPoolStats total;
+    for (const auto &game : venv->games) {
+        auto basic_game = dynamic_cast<BasicAbstractGame *>(game.get());
+        if (basic_game == nullptr) {
+            continue;
+        }
+        auto s = basic_game->get_entity_pool_stats();
+        total.num_allocs += s.num_allocs;
+        total.num_reuses += s.num_reuses;
+        total.num_chunks += s.num_chunks;
+        total.num_live += s.num_live;
+    }
+    stats[0] = total.num_allocs;
+    stats[1] = total.num_reuses;
+    stats[2] = total.num_chunks;
+    stats[3] = total.num_live;
+}
+
 LIBENV_API int get_state(libenv_env *handle, int env_idx, char *data, int length) {
     auto venv = (VecGame *)(handle);
     venv->wait_for_stepping_threads();
     auto b = WriteBuffer(data, length);
-    venv->games.at(env_idx)->serialize(&b);
-    b.write_int(END_OF_BUFFER);
+    write_state(venv->games.at(env_idx).get(), &b);
     return b.offset;
 }
 
@@ -496,10 +1059,10 @@ LIBENV_API void set_state(libenv_env *handle, int env_idx, char *data, int lengt
     auto venv = (VecGame *)(handle);
     venv->wait_for_stepping_threads();
     auto b = ReadBuffer(data, length);
-    venv->games.at(env_idx)->deserialize(&b);
-    fassert(b.read_int() == END_OF_BUFFER);
+    read_state(venv->games.at(env_idx).get(), &b);
     // after deserializing, we need to update the observation and info buffers so that the
     // next time VecGame::observe() is called, the correct data will be in the buffers
     venv->games.at(env_idx)->observe();
+    venv->hires_rendered = false;
 }
 }
\ No newline at end of file
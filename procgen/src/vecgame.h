@@ -6,16 +6,20 @@ This implements the libenv interface and manages a vector of Game instances
 
 */
 
+#include <atomic>
 #include <memory>
 #include <vector>
 #include <mutex>
 #include <string>
 #include <condition_variable>
 #include <thread>
-#include <list>
+#include <deque>
+#include <functional>
+#include "profiler.h"
 
 class VecOptions;
 class Game;
+class LevelCache;
 
 class VecGame {
   public:
@@ -27,26 +31,136 @@ class VecGame {
     int num_joint_games;
     int num_actions;
     bool render_human;
+    // whether the "rgb" infos of the current buffer set show the games as they are now, so that
+    // observe() doesn't render them again, anything that changes the games or the buffer set
+    // clears this
+    bool hires_rendered = false;
+    // the "rgb" infos are only rendered for hires_env_idxs, on the steps that are multiples of
+    // hires_interval, see set_hires_envs()
+    std::vector<int> hires_env_idxs;
+    std::vector<bool> is_hires_env;
+    int hires_interval = 1;
+    int64_t hires_step = 0;
 
     std::vector<std::shared_ptr<Game>> games;
+    // post reset states of the levels played by games, nullptr unless enabled with the level_cache_mb
+    // or level_cache_dir options
+    std::shared_ptr<LevelCache> level_cache;
 
     VecGame(int _nenvs, VecOptions opt_vec);
     ~VecGame();
 
     void set_buffers(const std::vector<std::vector<void *>> &ac, const std::vector<std::vector<void *>> &ob, const std::vector<std::vector<void *>> &info, float *rew, uint8_t *first);
+    // returns the index of the new buffer set, reusing those of removed sets
+    int add_buffers(const std::vector<std::vector<void *>> &ob, const std::vector<std::vector<void *>> &info, float *rew, uint8_t *first);
+    // forget buffer set buffer_idx, which the games must not be writing into
+    void remove_buffers(int buffer_idx);
     void observe();
     void act();
+    // pipelined act, steps all games writing their output into buffer set buffer_idx
+    void act_into(int buffer_idx);
+    // make the games write into buffer set buffer_idx, and write their current observations there
+    void select_buffers(int buffer_idx);
     void wait_for_stepping_threads();
 
+    // batched state serialization, done in parallel on the stepping threads
+    // serialize_states() returns the total size of the states of env_idxs, copy_states() then packs
+    // them into a single arena, with offsets[i]:offsets[i + 1] being the state of env_idxs[i]
+    int64_t serialize_states(const std::vector<int> &env_idxs);
+    void copy_states(char *arena, int64_t *offsets);
+    void deserialize_states(const std::vector<int> &env_idxs, const char *arena, const int64_t *offsets);
+
+    // replace the games in dst_env_idxs with copies of the games in src_env_idxs, made in parallel on
+    // the stepping threads without serializing them, with defer_render the copies only render their
+    // observations on the next observe()
+    void fork(const std::vector<int> &src_env_idxs, const std::vector<int> &dst_env_idxs, bool defer_render);
+
+    // render the "rgb" infos of render_human only for env_idxs, and only every interval steps,
+    // counting the steps since the environment was created, the infos of the other envs and steps
+    // are left as they are
+    void set_hires_envs(const std::vector<int> &env_idxs, int interval);
+
+    // copy the profiles of the games, then of the threads (the stepping threads followed by the
+    // python thread), then of the scheduler into data, PROFILE_STRIDE ints per phase, see
+    // profiler.h, only valid when profiling is enabled with the profile option
+    void get_profile(int64_t *data);
+
+    // run fn(env_idx) for each of env_idxs on the stepping threads, returns without waiting for
+    // the work to complete, call wait_for_stepping_threads() for that
+    void submit_batch(const std::vector<int> &env_idxs, std::function<void(int)> fn);
+
   private:
-    // this mutex synchronizes access to pending_games and game->is_waiting_for_step
-    // when game->is_waiting_for_step is set to true
-    // ownership of game objects is transferred to the stepping thread until
-    // game->is_waiting_for_step is set to false
-    std::mutex stepping_thread_mutex;
-    std::list<std::shared_ptr<Game>> pending_games;
-    std::condition_variable pending_games_added;
-    std::condition_variable pending_game_complete;
+    // output buffers that the games can be pointed at, set 0 is the one passed to set_buffers(),
+    // removed sets have rew set to nullptr
+    struct BufferSet {
+        std::vector<std::vector<void *>> ob;
+        std::vector<std::vector<void *>> info;
+        float *rew = nullptr;
+        uint8_t *first = nullptr;
+    };
+    std::vector<BufferSet> buffer_sets;
+    int current_buffer_set = 0;
+
+    // states produced by the last serialize_states() call, in the order of serialized_env_idxs
+    std::vector<int> serialized_env_idxs;
+    std::vector<std::vector<char>> serialized_states;
+
+    // games that were forked with defer_render and have not been observed since
+    std::vector<int> unobserved_env_idxs;
+
+    // profiling, the vectors are empty unless enabled with the profile option, game_profiles is
+    // indexed by env and stays with the env when its game is replaced
+    bool profile = false;
+    std::vector<GameProfile> game_profiles;
+    std::vector<ThreadProfile> thread_profiles;
+    SchedulerProfile scheduler_profile;
+
+    void use_buffer_set(int buffer_idx);
+    void render_hires(int env_idx);
+    // whether the "rgb" infos are rendered for the current step
+    bool hires_due() const;
+
+    // A batch is split into contiguous chunks of env indices, each stepping thread starts with
+    // its own run of neighbouring chunks in its deque and steals from the back of other threads'
+    // deques once it runs out, so stragglers (e.g. envs that are resetting) get spread out.
+    // pending_chunks is the only thing the python thread waits on.
+    struct Chunk {
+        int start;
+        int end;
+    };
+
+    struct WorkerQueue {
+        std::mutex mutex;
+        std::deque<Chunk> chunks;
+    };
+
     std::vector<std::thread> threads;
+    std::vector<std::unique_ptr<WorkerQueue>> worker_queues;
+    std::vector<int> all_env_idxs;
+
+    // the current batch, only modified by the python thread while no chunks are pending
+    std::vector<int> batch_env_idxs;
+    std::function<void(int)> batch_fn;
+    std::atomic<int> pending_chunks;
+
+    // batch_mutex protects batch_generation and time_to_die, and is used with batch_finished
+    // so that the completion notification can't be missed
+    std::mutex batch_mutex;
+    std::condition_variable batch_started;
+    std::condition_variable batch_finished;
+    uint64_t batch_generation = 0;
     bool time_to_die = false;
+
+    // for the straggler time of the current batch when profiling, the time it was submitted, the
+    // time the first thread ran out of chunks and the time the last chunk finished, in ns
+    int64_t batch_start_ns = 0;
+    std::atomic<int64_t> first_out_of_work_ns;
+    std::atomic<int64_t> last_chunk_end_ns;
+    bool batch_needs_profile = false;
+
+    void stepping_worker(int thread_idx);
+    // run a chunk of the current batch queued for thread_idx or stolen from another thread, the
+    // time is added to thread_profile unless it is nullptr, returns false if there was none
+    bool run_chunk(int thread_idx, ThreadProfile *thread_profile);
+    void mark_out_of_work();
 };
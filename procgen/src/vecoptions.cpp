@@ -3,6 +3,7 @@
 #include <cstring>
 #include <string>
 
+#if defined(__CHEERP__)
 VecOptions::VecOptions(client::Object* opts) {
     auto* keys = client::Object::keys(opts);
     auto* values = client::Object::values(opts);
@@ -43,6 +44,11 @@ VecOptions::VecOptions(client::Object* opts) {
         m_options.push_back(o);
     }
 }
+#else
+VecOptions::VecOptions(const struct libenv_options options) {
+    m_options = std::vector<libenv_option>(options.items, options.items + options.count);
+}
+#endif
 
 void VecOptions::consume_string(std::string name, std::string *value) {
     auto opt = find_option(name, LIBENV_DTYPE_UINT8);
@@ -10,8 +10,11 @@ There is no error if an option is missing, the passed value is not changed in th
 
 #include <string>
 #include <vector>
+
+#if defined(__CHEERP__)
 #include <cheerp/client.h>
 
+// libenv.h is not available in the browser build, so declare the parts of it that are used here
 enum libenv_dtype {
     LIBENV_DTYPE_UNUSED = 0,
     LIBENV_DTYPE_UINT8 = 1,
@@ -26,10 +29,17 @@ struct libenv_option {
     int count;
     void *data;
 };
+#else
+#include "libenv.h"
+#endif
 
 class VecOptions {
   public:
+#if defined(__CHEERP__)
     VecOptions(client::Object* options);
+#else
+    VecOptions(const struct libenv_options options);
+#endif
     void consume_string(std::string name, std::string *value);
     void consume_int(std::string name, int32_t *value);
     void consume_bool(std::string name, bool *value);
@@ -4,10 +4,16 @@ from procgen import ProcgenGym3Env
 from .env import ENV_NAMES
 import gym3
 import multiprocessing as mp
+import os
 
 
 NUM_STEPS = 10000
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# states written with the version 0 format (every int stored as 4 bytes), along with the frames
+# observed when stepping from them, see test_read_v0_state()
+V0_STATES_PATH = os.path.join(SCRIPT_DIR, "testdata", "states_v0.npz")
+
 
 def gather_rollouts(
     env_kwargs, actions, state=None, get_state=False, set_state_every_step=False
@@ -47,10 +53,18 @@ def run_in_subproc(fn, **kwargs):
     return result
 
 
+def assert_infos_identical(a_info, b_info):
+    assert len(a_info) == len(b_info)
+    for a, b in zip(a_info, b_info):
+        assert sorted(a.keys()) == sorted(b.keys())
+        for k in sorted(a.keys()):
+            assert np.array_equal(a[k], b[k])
+
+
 def assert_rollouts_identical(a_rollout, b_rollout):
     assert len(a_rollout) == len(b_rollout)
     for a, b in zip(a_rollout, b_rollout):
-        assert a["info"] == b["info"]
+        assert_infos_identical(a["info"], b["info"])
         a_rew, a_ob, a_first = a["ob"]
         b_rew, b_ob, b_first = b["ob"]
         assert np.array_equal(a_rew, b_rew)
@@ -122,3 +136,161 @@ def run_state_test(env_name):
     )
     assert_rollouts_identical(ref_rollouts[offset:], state_restore_rollouts)
     assert_rollouts_identical(state_rollouts[offset:], state_restore_rollouts)
+
+
+@pytest.mark.parametrize("env_name", ["coinrun", "miner", "starpilot"])
+def test_packed_state(env_name):
+    env_kwargs = dict(num=8, env_name=env_name, rand_seed=0)
+    env = ProcgenGym3Env(**env_kwargs)
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        env.act(gym3.types_np.sample(env.ac_space, bshape=(env.num,), rng=rng))
+
+    states, offsets = env.get_packed_state()
+    assert states.dtype == np.uint8 and offsets.dtype == np.int64
+    assert len(offsets) == env.num + 1 and offsets[-1] == len(states)
+    per_env_states = env.get_state()
+    for i, state in enumerate(per_env_states):
+        assert bytes(states[offsets[i] : offsets[i + 1]]) == state
+
+    env_idxs = [5, 2, 7]
+    sub_states, sub_offsets = env.get_packed_state(env_idxs)
+    for i, env_idx in enumerate(env_idxs):
+        assert (
+            bytes(sub_states[sub_offsets[i] : sub_offsets[i + 1]])
+            == per_env_states[env_idx]
+        )
+
+    # restore the subset into different environments of a fresh vector env
+    restored = ProcgenGym3Env(**{**env_kwargs, "rand_seed": 1})
+    restored.set_packed_state(sub_states, sub_offsets, env_idxs=[0, 1, 2])
+    _, ob, _ = env.observe()
+    _, restored_ob, _ = restored.observe()
+    assert np.array_equal(restored_ob["rgb"][:3], ob["rgb"][env_idxs])
+    assert restored.get_state()[:3] == [per_env_states[i] for i in env_idxs]
+
+    # both environments continue identically after the restore
+    restored.set_packed_state(states, offsets)
+    acts = gym3.types_np.sample(env.ac_space, bshape=(env.num,), rng=rng)
+    env.act(acts)
+    restored.act(acts)
+    assert_rollouts_identical(
+        [dict(ob=env.observe(), info=env.get_info())],
+        [dict(ob=restored.observe(), info=restored.get_info())],
+    )
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_packed_state_speed(benchmark, packed):
+    env = ProcgenGym3Env(num=256, env_name="coinrun", rand_seed=0)
+
+    def roundtrip():
+        if packed:
+            env.set_packed_state(*env.get_packed_state())
+        else:
+            env.set_state(env.get_state())
+
+    benchmark(roundtrip)
+
+
+@pytest.mark.parametrize("env_name", ["coinrun", "chaser", "heist", "leaper", "maze", "miner"])
+def test_read_v0_state(env_name):
+    # the states were saved after 20 random actions from a RandomState(0), the frames are the
+    # observations for the next 10 actions
+    fixtures = np.load(V0_STATES_PATH)
+    state = fixtures[env_name + "_state"].tobytes()
+    frames = fixtures[env_name + "_frames"]
+
+    env = ProcgenGym3Env(
+        num=1,
+        env_name=env_name,
+        num_levels=1,
+        start_level=0,
+        distribution_mode="hard",
+        rand_seed=1,
+        num_threads=0,
+    )
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        rng.randint(0, env.ac_space.eltype.n, size=(1,), dtype=np.int32)
+    env.set_state([state])
+
+    # states are always written with the current version, which must be smaller
+    assert len(env.get_state()[0]) < len(state)
+
+    for frame in frames:
+        assert np.array_equal(env.observe()[1]["rgb"][0], frame)
+        env.act(rng.randint(0, env.ac_space.eltype.n, size=(1,), dtype=np.int32))
+
+
+@pytest.mark.parametrize("op", ["encode", "decode"])
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_state_codec_speed(benchmark, env_name, op):
+    env = ProcgenGym3Env(num=64, env_name=env_name, rand_seed=0, num_threads=0)
+    rng = np.random.RandomState(0)
+    for _ in range(20):
+        env.act(gym3.types_np.sample(env.ac_space, bshape=(env.num,), rng=rng))
+    states, offsets = env.get_packed_state()
+
+    if op == "encode":
+        benchmark(env.get_packed_state)
+    else:
+        benchmark(env.set_packed_state, states, offsets)
+    benchmark.extra_info["state_bytes"] = len(states) / env.num
+    benchmark.extra_info["megabytes_per_second"] = (
+        len(states) / benchmark.stats.stats.mean / 1e6
+    )
+
+
+@pytest.mark.parametrize("defer_render", [False, True])
+@pytest.mark.parametrize("env_name", ENV_NAMES)
+def test_fork(env_name, defer_render):
+    env_kwargs = dict(num=6, env_name=env_name, rand_seed=0)
+    env = ProcgenGym3Env(**env_kwargs)
+    ref = ProcgenGym3Env(**env_kwargs)
+    rng = np.random.RandomState(0)
+    for _ in range(30):
+        acts = gym3.types_np.sample(env.ac_space, bshape=(env.num,), rng=rng)
+        env.act(acts)
+        ref.act(acts)
+
+    # the same as restoring the state of each source into its destination, the sources are
+    # copied before any of the destinations are replaced
+    src_env_idxs = [0, 0, 3, 2]
+    dst_env_idxs = [1, 2, 5, 3]
+    states = ref.get_state()
+    forked_states = list(states)
+    for src, dst in zip(src_env_idxs, dst_env_idxs):
+        forked_states[dst] = states[src]
+    ref.set_state(forked_states)
+    env.fork(src_env_idxs, dst_env_idxs, defer_render=defer_render)
+    assert env.get_state() == ref.get_state()
+
+    # the copies don't share anything with the originals, so all envs can take different actions
+    for _ in range(30):
+        acts = gym3.types_np.sample(env.ac_space, bshape=(env.num,), rng=rng)
+        assert_rollouts_identical(
+            [dict(ob=env.observe(), info=env.get_info())],
+            [dict(ob=ref.observe(), info=ref.get_info())],
+        )
+        env.act(acts)
+        ref.act(acts)
+    assert env.get_state() == ref.get_state()
+
+
+@pytest.mark.parametrize("method", ["state", "fork"])
+def test_fork_speed(benchmark, method):
+    env = ProcgenGym3Env(num=64, env_name="coinrun", rand_seed=0)
+    src_env_idxs = np.zeros(env.num - 1, dtype=np.int32)
+    dst_env_idxs = np.arange(1, env.num, dtype=np.int32)
+
+    def clone():
+        if method == "state":
+            states, offsets = env.get_packed_state(src_env_idxs[:1])
+            offsets = np.zeros(len(dst_env_idxs) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum(np.full(len(dst_env_idxs), len(states)))
+            env.set_packed_state(np.tile(states, len(dst_env_idxs)), offsets, dst_env_idxs)
+        else:
+            env.fork(src_env_idxs, dst_env_idxs, defer_render=True)
+
+    benchmark(clone)
@@ -0,0 +1,441 @@
+"""
+Compact recordings of trajectories, replayed deterministically to regenerate their frames
+"""
+
+import json
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import gym3
+import numpy as np
+
+from .env import ProcgenGym3Env, create_random_seed
+
+TRAJECTORY_VERSION = 1
+
+# the files of a recording, see TrajectoryRecorder
+METADATA_NAME = "trajectory.json"
+ACTIONS_NAME = "actions.i32"
+EPISODES_NAME = "episodes.i64"
+CHECKPOINTS_NAME = "checkpoints.bin"
+CHECKPOINT_INDEX_NAME = "checkpoints.idx"
+
+
+class TrajectoryRecorder(gym3.Wrapper):
+    """
+    ProcgenGym3Env that records what is needed to replay its trajectories into a directory,
+    instead of the frames: the games are deterministic given their arguments, `rand_seed` and
+    the actions. Use `replay_frames()` to regenerate frames from the recording.
+
+    Step t of the recording is the state after t calls to `act()`, frame t is what `observe()`
+    returned in that state. The directory holds:
+
+    * trajectory.json: the arguments of the environment, including `rand_seed`
+    * actions.i32: the actions passed to every `act()`, num int32 per step
+    * episodes.i64: (step, env index, level seed) for every episode that starts, including the
+      first one of every environment at step 0
+    * checkpoints.bin: the states of all the environments in the format of `get_packed_state()`
+      at step 0, every `checkpoint_interval` steps and after every `set_state()`
+    * checkpoints.idx: for every checkpoint, its step, whether it was made by `set_state()`, and
+      the num + 1 offsets of its states into checkpoints.bin
+
+    All but trajectory.json are only ever appended to, so a recording cut short is still
+    readable up to its last complete step. Call `close()` to write out everything.
+
+    :param directory: directory to record into, created if missing, which must not already
+        contain a recording
+    :param num: number of environments
+    :param env_name: name of the game, or comma separated names of games, like ProcgenGym3Env
+    :param rand_seed: seed of the levels, when None one is made with `create_random_seed()` so
+        that it can be recorded
+    :param checkpoint_interval: number of steps between checkpoints, which is at most how many
+        steps a replay has to run before reaching the frames it was asked for
+    :param kwargs: arguments of ProcgenGym3Env, except `pipelined`, they are recorded too so
+        they have to be serializable to JSON
+    """
+
+    def __init__(
+        self, directory, num, env_name, rand_seed=None, checkpoint_interval=1000, **kwargs
+    ):
+        assert not kwargs.get("pipelined"), "pipelined environments can't be recorded"
+        assert checkpoint_interval > 0
+        if rand_seed is None:
+            rand_seed = create_random_seed()
+        env_kwargs = dict(num=num, env_name=env_name, rand_seed=rand_seed, **kwargs)
+        env = ProcgenGym3Env(**env_kwargs)
+        super().__init__(env)
+
+        os.makedirs(directory, exist_ok=True)
+        metadata_path = os.path.join(directory, METADATA_NAME)
+        assert not os.path.exists(metadata_path), f"{directory} already contains a recording"
+        with open(metadata_path, "w") as f:
+            json.dump(
+                dict(
+                    version=TRAJECTORY_VERSION,
+                    env_kwargs=env_kwargs,
+                    checkpoint_interval=checkpoint_interval,
+                ),
+                f,
+                indent=2,
+            )
+
+        self.directory = directory
+        self.checkpoint_interval = checkpoint_interval
+        self.step = 0
+        self.closed = False
+        self._actions_file = open(os.path.join(directory, ACTIONS_NAME), "wb")
+        self._episodes_file = open(os.path.join(directory, EPISODES_NAME), "wb")
+        self._checkpoints_file = open(os.path.join(directory, CHECKPOINTS_NAME), "wb")
+        self._index_file = open(os.path.join(directory, CHECKPOINT_INDEX_NAME), "wb")
+        self._checkpoints_size = 0
+        # whether the episodes that start at the current step still have to be recorded, they
+        # are recorded lazily so that act() doesn't have to wait for the step
+        self._episodes_pending = False
+        self._record_episodes(np.arange(num))
+        self._record_checkpoint(restored=False)
+
+    def _record_episodes(self, env_idxs):
+        level_seeds = self.env.get_info_views()["level_seed"][env_idxs]
+        records = np.empty((len(env_idxs), 3), dtype=np.int64)
+        records[:, 0] = self.step
+        records[:, 1] = env_idxs
+        records[:, 2] = level_seeds
+        self._episodes_file.write(records.tobytes())
+
+    def _record_pending_episodes(self):
+        if not self._episodes_pending:
+            return
+        _, _, first = self.env.observe_views()
+        self._record_episodes(np.flatnonzero(first))
+        self._episodes_pending = False
+
+    def _record_checkpoint(self, restored):
+        states, offsets = self.env.get_packed_state()
+        self._checkpoints_file.write(states.tobytes())
+        record = np.empty(self.num + 3, dtype=np.int64)
+        record[0] = self.step
+        record[1] = int(restored)
+        record[2:] = offsets + self._checkpoints_size
+        self._checkpoints_size += len(states)
+        # the states have to be complete before the index points at them
+        self._checkpoints_file.flush()
+        self._episodes_file.flush()
+        self._actions_file.flush()
+        self._index_file.write(record.tobytes())
+        self._index_file.flush()
+
+    def act(self, ac):
+        assert not self.closed
+        self._record_pending_episodes()
+        ac = np.asarray(ac, dtype=np.int32)
+        assert ac.shape == (self.num,), f"expected actions of shape {(self.num,)}"
+        self._actions_file.write(ac.tobytes())
+        self.env.act(ac)
+        self.step += 1
+        self._episodes_pending = True
+        if self.step % self.checkpoint_interval == 0:
+            self._record_pending_episodes()
+            self._record_checkpoint(restored=False)
+
+    def get_state(self):
+        return self.env.get_state()
+
+    def set_state(self, states):
+        """
+        Restore states like ProcgenGym3Env.set_state(), which is recorded as a checkpoint that
+        replays restore when they reach its step
+        """
+        assert not self.closed
+        self._record_pending_episodes()
+        self.env.set_state(states)
+        self._record_episodes(np.arange(self.num))
+        self._record_checkpoint(restored=True)
+
+    def close(self):
+        """
+        Write out the recording and close the environment
+        """
+        if self.closed:
+            return
+        self._record_pending_episodes()
+        self.closed = True
+        for f in [
+            self._actions_file,
+            self._episodes_file,
+            self._checkpoints_file,
+            self._index_file,
+        ]:
+            f.close()
+        self.env.close()
+
+    def __del__(self):
+        if hasattr(self, "closed"):
+            self.close()
+
+
+class Trajectory:
+    """
+    A recording made by TrajectoryRecorder
+
+    :param directory: directory of the recording
+    """
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, METADATA_NAME)) as f:
+            metadata = json.load(f)
+        assert (
+            metadata["version"] == TRAJECTORY_VERSION
+        ), f"unsupported trajectory version {metadata['version']}"
+        self.directory = directory
+        self.env_kwargs = metadata["env_kwargs"]
+        self.num = self.env_kwargs["num"]
+        self.checkpoint_interval = metadata["checkpoint_interval"]
+
+        # only what the last checkpoint covers is used, anything after it may be incomplete
+        index = read_records(os.path.join(directory, CHECKPOINT_INDEX_NAME), self.num + 3)
+        assert len(index) > 0, "the recording has no checkpoints"
+        self.checkpoint_steps = index[:, 0]
+        self.checkpoint_restored = index[:, 1].astype(bool)
+        self._checkpoint_offsets = index[:, 2:]
+
+        actions = read_records(os.path.join(directory, ACTIONS_NAME), self.num, dtype=np.int32)
+        # the number of steps, the recording has the frames of steps 0 to num_steps included
+        self.num_steps = len(actions)
+        self.actions = actions
+        # episodes.i64 is flushed with every checkpoint but may be behind the actions
+        self.episodes = read_records(os.path.join(directory, EPISODES_NAME), 3)
+
+    def get_checkpoint(self, step):
+        """
+        The latest checkpoint at or before step, returns its step and its states in the format
+        of get_packed_state()
+        """
+        checkpoint_idx = np.searchsorted(self.checkpoint_steps, step, side="right") - 1
+        assert checkpoint_idx >= 0
+        return self.read_checkpoint(checkpoint_idx)
+
+    def read_checkpoint(self, checkpoint_idx):
+        """
+        The step and the states of the checkpoint_idx-th checkpoint
+        """
+        offsets = self._checkpoint_offsets[checkpoint_idx]
+        with open(os.path.join(self.directory, CHECKPOINTS_NAME), "rb") as f:
+            f.seek(offsets[0])
+            states = np.frombuffer(f.read(offsets[-1] - offsets[0]), dtype=np.uint8)
+        return int(self.checkpoint_steps[checkpoint_idx]), states, offsets - offsets[0]
+
+    def get_restored_checkpoints(self, start, end):
+        """
+        The indices of the checkpoints made by set_state() at steps start+1 to end, in order,
+        the last one of each step
+        """
+        idxs = []
+        for checkpoint_idx in np.flatnonzero(self.checkpoint_restored):
+            step = self.checkpoint_steps[checkpoint_idx]
+            if start < step <= end:
+                if idxs and self.checkpoint_steps[idxs[-1]] == step:
+                    idxs.pop()
+                idxs.append(int(checkpoint_idx))
+        return idxs
+
+
+def read_records(path, record_size, dtype=np.int64):
+    """
+    The complete records of record_size elements of dtype in a file, as an array with one row
+    per record
+    """
+    data = np.fromfile(path, dtype=dtype)
+    num_records = len(data) // record_size
+    return data[: num_records * record_size].reshape(num_records, record_size)
+
+
+def make_replay_env(trajectory, env_idxs, env_kwargs):
+    """
+    An environment to replay the environments env_idxs of a recording, and the indices of those
+    environments in it
+    """
+    kwargs = dict(trajectory.env_kwargs)
+    kwargs.update(env_kwargs)
+    if len(kwargs["env_name"].split(",")) == 1:
+        # the environments are independent once their states are restored, only replay those
+        kwargs["num"] = len(env_idxs)
+        return ProcgenGym3Env(**kwargs), np.arange(len(env_idxs)), env_idxs
+    # the games of every environment are set by its index, replay them all
+    return ProcgenGym3Env(**kwargs), env_idxs, np.arange(trajectory.num)
+
+
+def set_checkpoint_states(env, states, offsets, state_idxs):
+    """
+    Restore the states state_idxs of a checkpoint into the environments of env
+    """
+    if len(state_idxs) == len(offsets) - 1:
+        env.set_packed_state(states, offsets)
+        return
+    lengths = offsets[state_idxs + 1] - offsets[state_idxs]
+    sub_offsets = np.zeros(len(state_idxs) + 1, dtype=np.int64)
+    sub_offsets[1:] = np.cumsum(lengths)
+    sub_states = np.concatenate([states[offsets[i] : offsets[i + 1]] for i in state_idxs])
+    env.set_packed_state(sub_states, sub_offsets)
+
+
+def replay_range(trajectory, env, local_idxs, state_idxs, start, end, get_frame, out):
+    """
+    Replay frames start:end of the recording into out from the nearest checkpoint, with
+    get_frame() reading the frames of all the environments of env
+    """
+    step, states, offsets = trajectory.get_checkpoint(start)
+    restored = {
+        int(trajectory.checkpoint_steps[checkpoint_idx]): checkpoint_idx
+        for checkpoint_idx in trajectory.get_restored_checkpoints(step, end - 1)
+    }
+    set_checkpoint_states(env, states, offsets, state_idxs)
+    while True:
+        if step >= start:
+            out[step - start] = get_frame(env)[local_idxs]
+        if step == end - 1:
+            break
+        env.act(trajectory.actions[step][state_idxs])
+        step += 1
+        if step in restored:
+            _, states, offsets = trajectory.read_checkpoint(restored[step])
+            set_checkpoint_states(env, states, offsets, state_idxs)
+
+
+def frame_getter(ob_key, info_key):
+    if info_key is not None:
+        return lambda env: env.get_info_views()[info_key]
+    return lambda env: env.observe_views()[1][ob_key]
+
+
+def replay_worker(
+    directory, env_idxs, start, end, ob_key, info_key, env_kwargs, shm_name, shape, dtype, first
+):
+    """
+    Replay frames start:end of a recording into the frames of replay_frames() in shared memory,
+    which start at frame first
+    """
+    trajectory = Trajectory(directory)
+    env, local_idxs, state_idxs = make_replay_env(trajectory, env_idxs, env_kwargs)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    replay_range(
+        trajectory,
+        env,
+        local_idxs,
+        state_idxs,
+        start,
+        end,
+        frame_getter(ob_key, info_key),
+        frames[start - first : end - first],
+    )
+    env.close()
+    del frames
+    shm.close()
+
+
+def replay_frames(
+    directory,
+    start,
+    end,
+    env_idxs=None,
+    ob_key="rgb",
+    info_key=None,
+    num_workers=None,
+    start_method="spawn",
+    **env_kwargs,
+):
+    """
+    Regenerate frames start:end of a recording made by TrajectoryRecorder, frame t being what
+    `observe()` returned after t calls to `act()`
+
+    The frames are split into num_workers contiguous ranges that are replayed in parallel, one
+    by this process and the others by worker processes, each from the nearest checkpoint at or
+    before the start of its range.
+
+    :param directory: directory of the recording
+    :param start: first frame, from 0
+    :param end: frame after the last one, at most the number of steps of the recording plus one
+    :param env_idxs: the environments to replay, all of them when None
+    :param ob_key: key of the observation that is the frame
+    :param info_key: key of the info that is the frame instead of an observation, for instance
+        "rgb" with render_mode="rgb_array"
+    :param num_workers: number of ranges replayed in parallel, by default as many as there are
+        cpus this process may run on, but no more than one per checkpoint interval, 1 to replay
+        everything in this process
+    :param start_method: multiprocessing start method of the worker processes
+    :param env_kwargs: arguments of ProcgenGym3Env that replace the recorded ones, like
+        render_mode or num_threads
+    :returns: array of the frames, indexed by frame then by environment
+    """
+    trajectory = Trajectory(directory)
+    assert 0 <= start < end <= trajectory.num_steps + 1, "invalid range of frames"
+    if env_idxs is None:
+        env_idxs = np.arange(trajectory.num)
+    env_idxs = np.asarray(env_idxs, dtype=np.int64)
+    assert np.all((env_idxs >= 0) & (env_idxs < trajectory.num)), "invalid env index"
+    if num_workers is None:
+        num_workers = min(
+            len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+            -(-(end - start) // trajectory.checkpoint_interval),
+        )
+    num_workers = max(1, min(num_workers, end - start))
+
+    env, local_idxs, state_idxs = make_replay_env(trajectory, env_idxs, env_kwargs)
+    get_frame = frame_getter(ob_key, info_key)
+    frame = get_frame(env)
+    shape = (end - start, len(env_idxs)) + frame.shape[1:]
+    bounds = [start + (end - start) * i // num_workers for i in range(num_workers + 1)]
+
+    if num_workers == 1:
+        frames = np.empty(shape, dtype=frame.dtype)
+        replay_range(trajectory, env, local_idxs, state_idxs, start, end, get_frame, frames)
+        env.close()
+        return frames
+
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(shape)) * frame.dtype.itemsize)
+    )
+    try:
+        frames = np.ndarray(shape, dtype=frame.dtype, buffer=shm.buf)
+        ctx = multiprocessing.get_context(start_method)
+        with ctx.Pool(num_workers - 1) as pool:
+            results = [
+                pool.apply_async(
+                    replay_worker,
+                    (
+                        directory,
+                        env_idxs,
+                        bounds[i],
+                        bounds[i + 1],
+                        ob_key,
+                        info_key,
+                        env_kwargs,
+                        shm.name,
+                        shape,
+                        frame.dtype.str,
+                        start,
+                    ),
+                )
+                for i in range(1, num_workers)
+            ]
+            # the first range is replayed here while the workers replay the others
+            replay_range(
+                trajectory,
+                env,
+                local_idxs,
+                state_idxs,
+                bounds[0],
+                bounds[1],
+                get_frame,
+                frames[: bounds[1] - start],
+            )
+            env.close()
+            for result in results:
+                result.get()
+        result_frames = frames.copy()
+        del frames
+    finally:
+        shm.close()
+        shm.unlink()
+    return result_frames
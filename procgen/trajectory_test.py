@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pytest
+
+from .env import ProcgenGym3Env
+from .trajectory import Trajectory, TrajectoryRecorder, replay_frames
+
+
+def record(directory, num_envs, num_steps, env_name="coinrun", restore_step=None, **kwargs):
+    """
+    Record random actions, returns the observed frames and the "rgb" infos
+    """
+    recorder = TrajectoryRecorder(
+        directory, num=num_envs, env_name=env_name, rand_seed=3, checkpoint_interval=8, **kwargs
+    )
+    rng = np.random.RandomState(0)
+    frames = []
+    infos = []
+    saved_states = None
+    for step in range(num_steps + 1):
+        if step == 5:
+            saved_states = recorder.get_state()
+        if step == restore_step:
+            recorder.set_state(saved_states)
+        _, ob, _ = recorder.observe()
+        frames.append(ob["rgb"])
+        if "render_mode" in kwargs:
+            infos.append(np.stack([info["rgb"] for info in recorder.get_info()]))
+        if step < num_steps:
+            recorder.act(
+                rng.randint(low=0, high=recorder.ac_space.eltype.n, size=num_envs, dtype=np.int32)
+            )
+    recorder.close()
+    return np.stack(frames), infos and np.stack(infos)
+
+
+@pytest.mark.parametrize("env_name", ["coinrun", "coinrun,miner"])
+def test_replay_frames(env_name, tmpdir):
+    num_envs = 4
+    num_steps = 30
+    directory = str(tmpdir.join("trajectory"))
+    frames, _ = record(directory, num_envs, num_steps, env_name=env_name, restore_step=19)
+
+    trajectory = Trajectory(directory)
+    assert trajectory.num_steps == num_steps
+    assert list(trajectory.checkpoint_steps) == [0, 8, 16, 19, 24]
+    assert list(trajectory.checkpoint_restored) == [False, False, False, True, False]
+    assert trajectory.actions.shape == (num_steps, num_envs)
+    assert np.array_equal(trajectory.episodes[:num_envs, 0], np.zeros(num_envs))
+
+    for start, end, env_idxs, num_workers in [
+        (0, num_steps + 1, None, 1),
+        (3, 22, None, 3),
+        (10, 11, [2], 1),
+        (12, 28, [3, 0], 2),
+    ]:
+        replayed = replay_frames(
+            directory, start, end, env_idxs=env_idxs, num_workers=num_workers, num_threads=0
+        )
+        expected = frames[start:end]
+        if env_idxs is not None:
+            expected = expected[:, env_idxs]
+        assert np.array_equal(replayed, expected)
+
+
+def test_replay_hires_frames(tmpdir):
+    directory = str(tmpdir.join("trajectory"))
+    _, infos = record(directory, 2, 12, render_mode="rgb_array")
+    replayed = replay_frames(directory, 4, 10, info_key="rgb", num_workers=1)
+    assert np.array_equal(replayed, infos[4:10])
+
+
+def test_replay_stacked_frames(tmpdir):
+    directory = str(tmpdir.join("trajectory"))
+    frames, _ = record(directory, 3, 20, restore_step=11, obs_grayscale=True, obs_frame_stack=4)
+    replayed = replay_frames(directory, 9, 21, env_idxs=[1, 2], num_workers=1)
+    assert np.array_equal(replayed, frames[9:21, [1, 2]])
+
+
+def test_recording_size(tmpdir):
+    num_envs = 8
+    num_steps = 200
+    directory = str(tmpdir.join("trajectory"))
+    frames, _ = record(directory, num_envs, num_steps)
+    size = sum(
+        os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory)
+    )
+    assert size * 10 < frames.nbytes
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_replay_speed(num_workers, tmpdir, benchmark):
+    num_envs = 16
+    num_steps = 200
+    directory = str(tmpdir.join("trajectory"))
+    recorder = TrajectoryRecorder(
+        directory, num=num_envs, env_name="coinrun", rand_seed=0, checkpoint_interval=50
+    )
+    actions = np.zeros(num_envs, dtype=np.int32)
+    for _ in range(num_steps):
+        recorder.act(actions)
+    recorder.close()
+
+    def replay():
+        replay_frames(directory, 0, num_steps + 1, num_workers=num_workers)
+
+    benchmark(replay)
+    benchmark.extra_info["steps_per_second"] = (
+        num_envs * num_steps / benchmark.stats.stats.mean
+    )
@@ -70,7 +70,7 @@ class custom_build_ext(build_ext):
         # can be included in the package
         # we will also check for this file at runtime to avoid doing
         # the on-demand build
-        for filename in ["libenv.so", "libenv.dylib", "env.dll"]:
+        for filename in ["libenv.so", "libenv.dylib", "env.dll", "assets.atlas"]:
             src = os.path.join(lib_dir, filename)
             dst = os.path.join(self.build_lib, "procgen", "data", "prebuilt", filename)
             if os.path.exists(src):